@@ -0,0 +1,41 @@
+import importlib
+from typing import Callable, Dict, List, Optional, Union
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group resolving its subcommands on demand.
+
+    Args:
+        lazy_commands: Dict[str, str], the import path, `module:attribute`,
+            of each subcommand, or a callable returning them,
+            e.g. to only resolve the commands of the current service on demand.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: Optional[
+            Union[Dict[str, str], Callable[[], Dict[str, str]]]
+        ] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._lazy_commands = lazy_commands or {}
+
+    def get_lazy_commands(self) -> Dict[str, str]:
+        if callable(self._lazy_commands):
+            self._lazy_commands = self._lazy_commands()
+        return self._lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.get_lazy_commands()))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        lazy_commands = self.get_lazy_commands()
+        if cmd_name not in self.commands and cmd_name in lazy_commands:
+            module_name, attr = lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import sys
-from typing import Any
+from typing import Any, Callable, List
 
 import click
 from urllib3.exceptions import HTTPError
@@ -1830,7 +1831,7 @@ def artifacts(
         Printer.header("Downloading all run's artifacts")
         try:
             download_path = client.download_artifacts(
-                path="", path_to=path_to, untar=not no_untar
+                path="", path_to=path_to, untar=not no_untar, stream_untar=True
             )
             Printer.success(
                 "All run's artifacts downloaded. Path: {}".format(download_path)
@@ -1867,7 +1868,7 @@ def artifacts(
         Printer.header(f"Downloading dir path {f} ...")
         try:
             download_path = client.download_artifacts(
-                path=f, path_to=path_to, untar=not no_untar
+                path=f, path_to=path_to, untar=not no_untar, stream_untar=True
             )
             Printer.success("Dir path {} downloaded to {}".format(f, download_path))
         except (ApiException, HTTPError) as e:
@@ -2283,6 +2284,53 @@ def service(ctx, project, uid, yes, external, url):
     click.launch(run_url)
 
 
+def _process_runs_concurrently(
+    action: str, run_uuids: List[str], process_run: Callable, workers: int
+):
+    """Processes runs using a bounded pool of workers.
+
+    Shows a single progress status for all runs and a summary of the failed runs.
+    """
+    failures = {}
+    num_done = 0
+
+    def _get_status():
+        status = "{} runs: {}/{} done".format(action, num_done, len(run_uuids))
+        if failures:
+            status += ", {} failed".format(len(failures))
+        return status
+
+    with Printer.console.status(_get_status()) as live_update:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_run, run_uuid): run_uuid
+                for run_uuid in run_uuids
+            }
+            for future in as_completed(futures):
+                run_uuid = futures[future]
+                try:
+                    Printer.success(future.result())
+                except Exception as e:
+                    failures[run_uuid] = e
+                    Printer.error("{} run `{}` failed.".format(action, run_uuid))
+                num_done += 1
+                live_update.update(_get_status())
+
+    if not failures:
+        Printer.success("{} runs finished: {} runs.".format(action, len(run_uuids)))
+        return
+    Printer.error(
+        "{} runs finished, {}/{} runs failed:".format(
+            action, len(failures), len(run_uuids)
+        )
+    )
+    table = Printer.get_table("Run", "Error")
+    for run_uuid, e in failures.items():
+        table.add_row(run_uuid, str(e) or repr(e))
+    Printer.print(table)
+    sys.exit(1)
+
+
 @ops.command()
 @click.option(*OPTIONS_PROJECT["args"], **OPTIONS_PROJECT["kwargs"])
 @click.option(*OPTIONS_RUN_UID["args"], **OPTIONS_RUN_UID["kwargs"])
@@ -2309,6 +2357,12 @@ def service(ctx, project, uid, yes, external, url):
 @click.option(
     *OPTIONS_RUN_OFFLINE_PATH_TO["args"], **OPTIONS_RUN_OFFLINE_PATH_TO["kwargs"]
 )
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Optional, number of runs to pull concurrently, default: 1.",
+)
 @click.pass_context
 @clean_outputs
 def pull(
@@ -2321,6 +2375,7 @@ def pull(
     offset,
     no_artifacts,
     path,
+    workers,
 ):
     """Pull a remote run or multiple remote runs to a local path.
 
@@ -2342,26 +2397,32 @@ def pull(
 
     \b
     $ polyaxon ops pull -a
+
+    \b
+    $ polyaxon ops pull -a --workers 8
     """
     owner, _, project_name = get_project_or_local(
         project or ctx.obj.get("project"), is_cli=True
     )
 
-    def _pull(run_uuid: str):
+    def _pull_run(run_uuid: str, show_progress: bool = True) -> str:
         client = RunClient(
             owner=owner,
             project=project_name,
             run_uuid=run_uuid,
             manual_exceptions_handling=True,
         )
+        run_path = client.pull_remote_run(
+            path=path,
+            download_artifacts=not no_artifacts,
+            show_progress=show_progress,
+        )
+        return f"Finished pulling run {run_uuid} to {run_path}"
 
+    def _pull(run_uuid: str):
         try:
             Printer.header(f"Pulling remote run {run_uuid}")
-            run_path = client.pull_remote_run(
-                path=path,
-                download_artifacts=not no_artifacts,
-            )
-            Printer.success(f"Finished pulling run {run_uuid} to {run_path}")
+            Printer.success(_pull_run(run_uuid))
         except (
             ApiException,
             HTTPError,
@@ -2388,6 +2449,14 @@ def pull(
             )
             sys.exit(1)
         Printer.header(f"Pulling remote runs (total: {len(runs)})...")
+        if workers and workers > 1:
+            _process_runs_concurrently(
+                action="Pulling",
+                run_uuids=[run.uuid for run in runs],
+                process_run=lambda run_uuid: _pull_run(run_uuid, show_progress=False),
+                workers=workers,
+            )
+            return
         for idx, run in enumerate(runs):
             Printer.heading(f"Pulling run {idx + 1}/{len(runs)} ...")
             _pull(run.uuid)
@@ -2458,6 +2527,12 @@ def pull(
     help="Optional, to ignore the store information of the run and use the default store of the server.",
 )
 @click.option("--name", "-n", type=str, help="Optional, a new name to set for the run.")
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    help="Optional, number of runs to push concurrently, default: 1.",
+)
 @click.pass_context
 @clean_outputs
 def push(
@@ -2474,6 +2549,7 @@ def push(
     ignore_agent_host,
     ignore_store,
     name,
+    workers,
 ):
     """Push a local run (or all runs) to a remove server.
 
@@ -2484,6 +2560,9 @@ def push(
     \b
     $ polyaxon ops push -a --clean
 
+    \b
+    $ polyaxon ops push -a --workers 8
+
     \b
     $ polyaxon ops push --path /tmp/experiments --clean
 
@@ -2510,8 +2589,7 @@ def push(
         entity_kind=V1ProjectFeature.RUNTIME, path=path
     )
 
-    def _push(run_uuid: str):
-        Printer.header(f"Pushing offline run {run_uuid}")
+    def _load_run(run_uuid: str) -> RunClient:
         client = RunClient(
             owner=owner,
             project=project_name,
@@ -2519,16 +2597,32 @@ def push(
             is_offline=True,
             manual_exceptions_handling=True,
         )
-        artifacts_path = "{}/{}".format(offline_path, run_uuid)
+        client.load_offline_run(
+            path="{}/{}".format(offline_path, run_uuid),
+            run_client=client,
+            reset_project=reset_project,
+            name=name,
+            reset_uuid=reset_uuid,
+            raise_if_not_found=True,
+        )
+        return client
+
+    def _push_run(client: RunClient, run_uuid: str, show_progress: bool = True):
+        client.push_offline_run(
+            path="{}/{}".format(offline_path, run_uuid),
+            upload_artifacts=not no_artifacts,
+            clean=clean,
+            agent=agent,
+            ignore_agent_host=ignore_agent_host,
+            ignore_store=ignore_store,
+            show_progress=show_progress,
+        )
+        return f"Finished pushing offline run {run_uuid} to {client.owner}/{client.project}"
+
+    def _push(run_uuid: str):
+        Printer.header(f"Pushing offline run {run_uuid}")
         try:
-            client.load_offline_run(
-                path=artifacts_path,
-                run_client=client,
-                reset_project=reset_project,
-                name=name,
-                reset_uuid=reset_uuid,
-                raise_if_not_found=True,
-            )
+            client = _load_run(run_uuid)
         except Exception as e:
             handle_cli_error(
                 e, message="Could not load offline run `{}`.".format(run_uuid)
@@ -2536,20 +2630,10 @@ def push(
             return
 
         Printer.success(
-            f"Offline run {uid} loaded, start pushing to {client.owner}/{client.project} ..."
+            f"Offline run {run_uuid} loaded, start pushing to {client.owner}/{client.project} ..."
         )
         try:
-            client.push_offline_run(
-                path=artifacts_path,
-                upload_artifacts=not no_artifacts,
-                clean=clean,
-                agent=agent,
-                ignore_agent_host=ignore_agent_host,
-                ignore_store=ignore_store,
-            )
-            Printer.success(
-                f"Finished pushing offline run {uid} to {client.owner}/{client.project}"
-            )
+            Printer.success(_push_run(client, run_uuid))
         except (
             ApiException,
             HTTPError,
@@ -2575,6 +2659,16 @@ def push(
             sys.exit(1)
         run_paths = os.listdir(offline_path)
         Printer.header(f"Pushing local runs (total: {len(run_paths)}) ...")
+        if workers and workers > 1:
+            _process_runs_concurrently(
+                action="Pushing",
+                run_uuids=run_paths,
+                process_run=lambda run_uuid: _push_run(
+                    _load_run(run_uuid), run_uuid, show_progress=False
+                ),
+                workers=workers,
+            )
+            return
         for idx, uid in enumerate(run_paths):
             Printer.heading(f"Pushing run {idx + 1}/{len(run_paths)} ...")
             _push(uid)
@@ -78,7 +78,11 @@ def file(file_context, filepath, copy_path, track):
 @click.option("--revision", help="The revision(commit/branch/treeish) to pull.")
 @click.option("--repo-path", help="The path to where to pull the repos.")
 @click.option("--connection", help="The connection used for pulling this repo.")
-@click.option("--flags", help="Additional flags for pulling this repo.")
+@click.option(
+    "--flags",
+    help="Additional flags for pulling this repo, "
+    "e.g. `--shallow`, `--partial=blob`, or `--sparse-paths=path1,path2`.",
+)
 def git(url, repo_path, revision, connection, flags):
     """Create auth context."""
     from polyaxon._init.git import create_code_repo
@@ -125,7 +129,21 @@ def git(url, repo_path, revision, connection, flags):
     default=False,
     help="whether or not to sync file watcher after initialization.",
 )
-def s3(connection_name, path_from, path_to, is_file, check_path, raise_errors, sync_fw):
+@click.option(
+    "--max-concurrency",
+    type=int,
+    help="The max number of concurrent requests to download the data.",
+)
+def s3(
+    connection_name,
+    path_from,
+    path_to,
+    is_file,
+    check_path,
+    raise_errors,
+    sync_fw,
+    max_concurrency,
+):
     """Create s3 path context."""
     from polyaxon._init.artifacts import download_artifact
 
@@ -138,6 +156,7 @@ def s3(connection_name, path_from, path_to, is_file, check_path, raise_errors, s
         raise_errors=raise_errors,
         sync_fw=sync_fw,
         check_path=check_path,
+        max_concurrency=max_concurrency,
     )
 
 
@@ -169,8 +188,20 @@ def s3(connection_name, path_from, path_to, is_file, check_path, raise_errors, s
     default=False,
     help="whether or not to sync file watcher after initialization.",
 )
+@click.option(
+    "--max-concurrency",
+    type=int,
+    help="The max number of concurrent requests to download the data.",
+)
 def gcs(
-    connection_name, path_from, path_to, is_file, check_path, raise_errors, sync_fw
+    connection_name,
+    path_from,
+    path_to,
+    is_file,
+    check_path,
+    raise_errors,
+    sync_fw,
+    max_concurrency,
 ):
     """Create gcs path context."""
     from polyaxon._init.artifacts import download_artifact
@@ -184,6 +215,7 @@ def gcs(
         raise_errors=raise_errors,
         sync_fw=sync_fw,
         check_path=check_path,
+        max_concurrency=max_concurrency,
     )
 
 
@@ -215,8 +247,20 @@ def gcs(
     default=False,
     help="whether or not to sync file watcher after initialization.",
 )
+@click.option(
+    "--max-concurrency",
+    type=int,
+    help="The max number of concurrent requests to download the data.",
+)
 def wasb(
-    connection_name, path_from, path_to, is_file, check_path, raise_errors, sync_fw
+    connection_name,
+    path_from,
+    path_to,
+    is_file,
+    check_path,
+    raise_errors,
+    sync_fw,
+    max_concurrency,
 ):
     """Create wasb path context."""
     from polyaxon._init.artifacts import download_artifact
@@ -230,6 +274,7 @@ def wasb(
         raise_errors=raise_errors,
         sync_fw=sync_fw,
         check_path=check_path,
+        max_concurrency=max_concurrency,
     )
 
 
@@ -262,6 +307,11 @@ def wasb(
     default=False,
     help="whether or not to sync file watcher after initialization.",
 )
+@click.option(
+    "--max-concurrency",
+    type=int,
+    help="The max number of concurrent requests to download the data.",
+)
 def path(
     connection_kind,
     connection_name,
@@ -271,6 +321,7 @@ def path(
     check_path,
     raise_errors,
     sync_fw,
+    max_concurrency,
 ):
     """Create path context."""
     from polyaxon._init.artifacts import download_artifact
@@ -284,6 +335,7 @@ def path(
         raise_errors=raise_errors,
         sync_fw=sync_fw,
         check_path=check_path,
+        max_concurrency=max_concurrency,
     )
 
 
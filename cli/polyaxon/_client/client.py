@@ -2,26 +2,6 @@ from typing import TYPE_CHECKING, Optional
 
 from polyaxon import settings
 from polyaxon._constants.globals import NO_AUTH
-from polyaxon._sdk.api import (
-    AgentsV1Api,
-    AuthV1Api,
-    ConnectionsV1Api,
-    DashboardsV1Api,
-    OrganizationsV1Api,
-    PresetsV1Api,
-    ProjectDashboardsV1Api,
-    ProjectSearchesV1Api,
-    ProjectsV1Api,
-    QueuesV1Api,
-    RunsV1Api,
-    SandboxV1Api,
-    SearchesV1Api,
-    ServiceAccountsV1Api,
-    TagsV1Api,
-    TeamsV1Api,
-    UsersV1Api,
-    VersionsV1Api,
-)
 from polyaxon._sdk.async_client.api_client import AsyncApiClient
 from polyaxon._sdk.sync_client.api_client import ApiClient
 from polyaxon.exceptions import PolyaxonClientException
@@ -173,108 +153,144 @@ class PolyaxonClient:
     @property
     def projects_v1(self):
         if not self._projects_v1:
+            from polyaxon._sdk.api import ProjectsV1Api
+
             self._projects_v1 = ProjectsV1Api(self.api_client)
         return self._projects_v1
 
     @property
     def runs_v1(self):
         if not self._runs_v1:
+            from polyaxon._sdk.api import RunsV1Api
+
             self._runs_v1 = RunsV1Api(self.api_client)
         return self._runs_v1
 
     @property
     def sandbox_v1(self):
         if not self._sandbox_v1:
+            from polyaxon._sdk.api import SandboxV1Api
+
             self._sandbox_v1 = SandboxV1Api(self.api_client)
         return self._sandbox_v1
 
     @property
     def auth_v1(self):
         if not self._auth_v1:
+            from polyaxon._sdk.api import AuthV1Api
+
             self._auth_v1 = AuthV1Api(self.api_client)
         return self._auth_v1
 
     @property
     def users_v1(self):
         if not self._users_v1:
+            from polyaxon._sdk.api import UsersV1Api
+
             self._users_v1 = UsersV1Api(self.api_client)
         return self._users_v1
 
     @property
     def versions_v1(self):
         if not self._versions_v1:
+            from polyaxon._sdk.api import VersionsV1Api
+
             self._versions_v1 = VersionsV1Api(self.api_client)
         return self._versions_v1
 
     @property
     def agents_v1(self):
         if not self._agents_v1:
+            from polyaxon._sdk.api import AgentsV1Api
+
             self._agents_v1 = AgentsV1Api(self.api_client)
         return self._agents_v1
 
     @property
     def queues_v1(self):
         if not self._queues_v1:
+            from polyaxon._sdk.api import QueuesV1Api
+
             self._queues_v1 = QueuesV1Api(self.api_client)
         return self._queues_v1
 
     @property
     def service_accounts_v1(self):
         if not self._service_accounts_v1:
+            from polyaxon._sdk.api import ServiceAccountsV1Api
+
             self._service_accounts_v1 = ServiceAccountsV1Api(self.api_client)
         return self._service_accounts_v1
 
     @property
     def tags_v1(self):
         if not self._tags_v1:
+            from polyaxon._sdk.api import TagsV1Api
+
             self._tags_v1 = TagsV1Api(self.api_client)
         return self._tags_v1
 
     @property
     def teams_v1(self):
         if not self._teams_v1:
+            from polyaxon._sdk.api import TeamsV1Api
+
             self._teams_v1 = TeamsV1Api(self.api_client)
         return self._teams_v1
 
     @property
     def connections_v1(self):
         if not self._connections_v1:
+            from polyaxon._sdk.api import ConnectionsV1Api
+
             self._connections_v1 = ConnectionsV1Api(self.api_client)
         return self._connections_v1
 
     @property
     def project_dashboards_v1(self):
         if not self._project_dashboards_v1:
+            from polyaxon._sdk.api import ProjectDashboardsV1Api
+
             self._project_dashboards_v1 = ProjectDashboardsV1Api(self.api_client)
         return self._project_dashboards_v1
 
     @property
     def project_searches_v1(self):
         if not self._project_searches_v1:
+            from polyaxon._sdk.api import ProjectSearchesV1Api
+
             self._project_searches_v1 = ProjectSearchesV1Api(self.api_client)
         return self._project_searches_v1
 
     @property
     def dashboards_v1(self):
         if not self._dashboards_v1:
+            from polyaxon._sdk.api import DashboardsV1Api
+
             self._dashboards_v1 = DashboardsV1Api(self.api_client)
         return self._dashboards_v1
 
     @property
     def searches_v1(self):
         if not self._searches_v1:
+            from polyaxon._sdk.api import SearchesV1Api
+
             self._searches_v1 = SearchesV1Api(self.api_client)
         return self._searches_v1
 
     @property
     def presets_v1(self):
         if not self._presets_v1:
+            from polyaxon._sdk.api import PresetsV1Api
+
             self._presets_v1 = PresetsV1Api(self.api_client)
         return self._presets_v1
 
     @property
     def organizations_v1(self):
         if not self._organizations_v1:
+            from polyaxon._sdk.api import OrganizationsV1Api
+
             self._organizations_v1 = OrganizationsV1Api(self.api_client)
         return self._organizations_v1
 
@@ -210,6 +210,10 @@ def get_global_or_inline_config(
 ) -> Optional[bool]:
     if config_value is not None:
         return config_value
-    if client and client.config and getattr(client.config, config_key) is not None:
+    if (
+        client
+        and client.config
+        and getattr(client.config, config_key, None) is not None
+    ):
         return getattr(client.config, config_key)
     return getattr(settings.CLIENT_CONFIG, config_key, None)
@@ -0,0 +1,189 @@
+import os
+import threading
+from time import time
+from typing import Any, Dict, List, Optional
+
+from clipped.utils.enums import PEnum
+from clipped.utils.json import orjson_dumps, orjson_loads
+from clipped.utils.paths import check_or_create_path
+from polyaxon.logger import logger
+
+
+class JournalEntryKind(str, PEnum):
+    RUN = "run"
+    UPDATE = "update"
+    STATUS = "status"
+    LINEAGE = "lineage"
+
+
+def merge_journal_values(current: Any, value: Any) -> Any:
+    """Merges a value the same way the API merges patches with `merge=True`."""
+    if isinstance(current, dict) and isinstance(value, dict):
+        return {**current, **value}
+    if isinstance(current, list) and isinstance(value, list):
+        return current + [v for v in value if v not in current]
+    return value
+
+
+def get_status_key(condition: Dict) -> tuple:
+    return condition.get("type"), condition.get("last_transition_time")
+
+
+class RunJournal:
+    """Append-only journal of a run's updates, statuses, and lineage.
+
+    Every entry is flushed to the OS once appended,
+    so that it survives the process being killed,
+    and the file is fsynced at most every `sync_interval` seconds.
+    The journal compacts itself once it holds more than `compact_entries` entries,
+    folding updates and deduplicating statuses and lineage.
+
+    Args:
+        path: str, path of the journal file.
+        sync_interval: float, optional, interval in seconds between two fsyncs.
+        compact_entries: int, optional, number of entries before compacting the journal.
+    """
+
+    SYNC_INTERVAL = 1
+    COMPACT_ENTRIES = 1000
+
+    def __init__(
+        self,
+        path: str,
+        sync_interval: Optional[float] = None,
+        compact_entries: Optional[int] = None,
+    ):
+        self.path = path
+        self._sync_interval = (
+            sync_interval if sync_interval is not None else self.SYNC_INTERVAL
+        )
+        self._compact_entries = compact_entries or self.COMPACT_ENTRIES
+        self._lock = threading.Lock()
+        self._file = None
+        self._last_sync = time()
+        self._num_entries = len(self.read())
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def _open(self):
+        if self._file is None:
+            check_or_create_path(self.path, is_dir=False)
+            self._file = open(self.path, "a")
+        return self._file
+
+    def _sync(self):
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time()
+
+    def append(self, kind: str, data: Any):
+        line = orjson_dumps({"kind": kind, "data": data})
+        with self._lock:
+            journal_file = self._open()
+            journal_file.write(line + "\n")
+            journal_file.flush()
+            self._num_entries += 1
+            if time() - self._last_sync >= self._sync_interval:
+                self._sync()
+        if self._num_entries > self._compact_entries:
+            self.compact()
+
+    def read(self) -> List[Dict]:
+        if not self.exists():
+            return []
+        entries = []
+        with open(self.path, "r") as journal_file:
+            for line in journal_file:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(orjson_loads(line))
+                except ValueError:
+                    # A partially written entry, the process was killed while writing
+                    logger.debug("Skipping corrupted journal entry: %s", line)
+        return entries
+
+    @staticmethod
+    def fold(entries: List[Dict]) -> List[Dict]:
+        """Folds entries into an equivalent, minimal, list of entries."""
+        run = None
+        resets: Dict[str, Any] = {}
+        merges: Dict[str, Any] = {}
+        statuses: Dict[tuple, Dict] = {}
+        lineages: Dict[str, Dict] = {}
+        for entry in entries:
+            kind, data = entry.get("kind"), entry.get("data") or {}
+            if kind == JournalEntryKind.RUN:
+                run = data
+            elif kind == JournalEntryKind.UPDATE:
+                merge = data.get("merge")
+                for k, v in data.items():
+                    if k == "merge":
+                        continue
+                    if not merge:
+                        merges.pop(k, None)
+                        resets[k] = v
+                    elif k in resets:
+                        resets[k] = merge_journal_values(resets[k], v)
+                    else:
+                        merges[k] = merge_journal_values(merges.get(k), v)
+            elif kind == JournalEntryKind.STATUS:
+                statuses[get_status_key(data)] = data
+            elif kind == JournalEntryKind.LINEAGE:
+                for artifact in data.get("artifacts") or []:
+                    lineages[artifact.get("name")] = artifact
+
+        folded = []
+        if run is not None:
+            folded.append({"kind": JournalEntryKind.RUN, "data": run})
+        if resets:
+            folded.append({"kind": JournalEntryKind.UPDATE, "data": resets})
+        if merges:
+            folded.append(
+                {"kind": JournalEntryKind.UPDATE, "data": {**merges, "merge": True}}
+            )
+        folded += [
+            {"kind": JournalEntryKind.STATUS, "data": s} for s in statuses.values()
+        ]
+        if lineages:
+            folded.append(
+                {
+                    "kind": JournalEntryKind.LINEAGE,
+                    "data": {"artifacts": list(lineages.values())},
+                }
+            )
+        return folded
+
+    def compact(self):
+        with self._lock:
+            entries = self.fold(self.read())
+            tmp_path = "{}.tmp".format(self.path)
+            with open(tmp_path, "w") as tmp_file:
+                for entry in entries:
+                    tmp_file.write(orjson_dumps(entry) + "\n")
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(tmp_path, self.path)
+            self._num_entries = len(entries)
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.exists():
+                os.remove(self.path)
+            self._num_entries = 0
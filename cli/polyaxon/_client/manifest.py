@@ -0,0 +1,104 @@
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+from clipped.utils.hashing import hash_file
+from clipped.utils.json import orjson_dumps, orjson_loads
+from clipped.utils.paths import check_or_create_path
+from polyaxon.logger import logger
+
+
+def get_artifact_relpath(filepath: str, relative_to: Optional[str] = None) -> str:
+    """Returns the path of a file in the uploaded tar, see `create_tarfile`."""
+    if relative_to:
+        return os.path.relpath(filepath, relative_to)
+    return os.path.normpath(filepath).lstrip(os.sep)
+
+
+class ArtifactsManifest:
+    """Local manifest of the files uploaded to an artifacts path.
+
+    Every entry records the hash, size, and modification time of an uploaded file,
+    the modification time is only used to avoid rehashing files that did not change.
+    A file is considered already uploaded if the artifacts tree has a file
+    with the same path and size, and the manifest has the same hash for it.
+
+    Args:
+        path: str, path of the manifest file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = self.read()
+
+    def read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as manifest_file:
+                return orjson_loads(manifest_file.read()) or {}
+        except (OSError, ValueError):
+            logger.debug("Could not read artifacts manifest %s", self.path)
+            return {}
+
+    def save(self):
+        check_or_create_path(self.path, is_dir=False)
+        tmp_path = "{}.tmp".format(self.path)
+        with open(tmp_path, "w") as manifest_file:
+            manifest_file.write(orjson_dumps(self.entries))
+        os.replace(tmp_path, self.path)
+
+    def get_entry(self, filepath: str, relpath: str) -> Dict:
+        stat = os.stat(filepath)
+        entry = self.entries.get(relpath) or {}
+        if entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime:
+            return entry
+        return {
+            "hash": hash_file(filepath, hash_length=None),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+
+    @staticmethod
+    def get_remote_files(get_tree: Callable, path: str = "") -> Dict[str, int]:
+        """Walks the artifacts tree under a path and returns the size of every file."""
+        remote_files = {}
+        subpaths = [""]
+        while subpaths:
+            subpath = subpaths.pop()
+            try:
+                tree = get_tree(os.path.join(path, subpath) if subpath else path)
+            except Exception as e:
+                logger.debug("Could not get the artifacts tree of %s: %s", subpath, e)
+                continue
+            if not tree:
+                continue
+            for name, size in (tree.files or {}).items():
+                remote_files[os.path.join(subpath, os.path.basename(name))] = size
+            for name in tree.dirs or []:
+                subpaths.append(os.path.join(subpath, os.path.basename(name)))
+        return remote_files
+
+    def get_changed_files(
+        self,
+        files: List[str],
+        remote_files: Dict[str, int],
+        relative_to: Optional[str] = None,
+    ) -> Tuple[List[str], Dict[str, Dict]]:
+        """Returns the files to upload and the manifest entries of all files."""
+        changed_files = []
+        entries = {}
+        for filepath in files:
+            relpath = get_artifact_relpath(filepath, relative_to)
+            entry = self.get_entry(filepath, relpath)
+            entries[relpath] = entry
+            previous_entry = self.entries.get(relpath) or {}
+            if (
+                remote_files.get(relpath) != entry["size"]
+                or previous_entry.get("hash") != entry["hash"]
+            ):
+                changed_files.append(filepath)
+        return changed_files, entries
+
+    def update(self, entries: Dict[str, Dict]):
+        self.entries.update(entries)
+        self.save()
@@ -40,6 +40,12 @@ from polyaxon._client.decorators import (
     client_handler,
     get_global_or_inline_config,
 )
+from polyaxon._client.journal import (
+    JournalEntryKind,
+    RunJournal,
+    merge_journal_values,
+)
+from polyaxon._client.manifest import ArtifactsManifest
 from polyaxon._client.mixin import ClientMixin
 from polyaxon._client.store import AsyncPolyaxonStore, PolyaxonStore
 from polyaxon._constants.metadata import META_COPY_ARTIFACTS, META_RECOMPILE, META_TMUX
@@ -162,6 +168,10 @@ class RunClient(ClientMixin):
         self._no_op = get_global_or_inline_config(
             config_key="no_op", config_value=no_op, client=client
         )
+        self._use_journal = get_global_or_inline_config(
+            config_key="run_journal", config_value=None, client=client
+        )
+        self._journal: Optional[RunJournal] = None
 
         if self._no_op:
             return
@@ -353,9 +363,106 @@ class RunClient(ClientMixin):
         self._last_update = (current_time, updates + 1)
         return False
 
+    def _get_journal_path(self, path: Optional[str] = None) -> str:
+        path = path or ctx_paths.get_offline_path(
+            entity_value=self.run_uuid, entity_kind=V1ProjectFeature.RUNTIME
+        )
+        return os.path.join(path, ctx_paths.CONTEXT_LOCAL_JOURNAL)
+
+    def _journal_append(self, kind: JournalEntryKind, data: Any):
+        if not self._use_journal or not self.run_uuid:
+            return
+        try:
+            if self._journal is None:
+                self._journal = RunJournal(self._get_journal_path())
+            if not self._journal.exists():
+                self._journal.append(
+                    JournalEntryKind.RUN,
+                    self.client.sanitize_for_serialization(
+                        {
+                            "owner": self.owner,
+                            "project": self.project,
+                            "uuid": self.run_uuid,
+                            "name": self._run_data.name,
+                            "kind": self._run_data.kind,
+                            "runtime": self._run_data.runtime,
+                            "is_managed": self._run_data.is_managed,
+                            "managed_by": self._run_data.managed_by,
+                        }
+                    ),
+                )
+            self._journal.append(kind, self.client.sanitize_for_serialization(data))
+        except Exception as e:
+            logger.debug("Could not write run journal entry: %s", e)
+
+    def _apply_journal_entries(self, entries: List[Dict]):
+        """Applies journal entries to the run's local state, this is idempotent."""
+        for entry in entries:
+            kind, data = entry.get("kind"), entry.get("data") or {}
+            if kind == JournalEntryKind.UPDATE:
+                merge = data.get("merge")
+                for k, v in data.items():
+                    if k == "merge" or k not in V1Run.model_fields:
+                        continue
+                    if merge:
+                        v = merge_journal_values(getattr(self._run_data, k, None), v)
+                    setattr(self._run_data, k, v)
+            elif kind == JournalEntryKind.STATUS:
+                status_condition = V1StatusCondition.from_dict(data)
+                current_keys = {
+                    (c.type, c.last_transition_time)
+                    for c in self._run_data.status_conditions or []
+                }
+                if (
+                    status_condition.type,
+                    status_condition.last_transition_time,
+                ) in current_keys:
+                    continue
+                self._run_data.status = status_condition.type
+                self._apply_offline_status(
+                    status=status_condition.type,
+                    current_date=status_condition.last_transition_time,
+                    status_condition=status_condition,
+                )
+            elif kind == JournalEntryKind.LINEAGE:
+                self._cache_offline_artifact_lineage(data.get("artifacts") or [])
+
+    @property
+    def _updates_transport(self):
+        if getattr(self, "_transport", None) is None:
+            from polyaxon._client.transport import Transport
+
+            self._transport = Transport(config=self.client.config)
+        return self._transport
+
+    def _patch_run(self, json_data: Dict):
+        self.client.runs_v1.patch_run(
+            owner=self.owner,
+            project=self.project,
+            run_uuid=self.run_uuid,
+            body=json_data,
+        )
+
+    def _queue_update(self, data: Dict):
+        """Queues an update, pending updates of the run are merged into fewer requests."""
+        key = "{}/{}/runs/{}".format(self.owner, self.project, self.run_uuid)
+        self._updates_transport.worker.queue_batch(
+            key, key, True, self._patch_run, json_data=data
+        )
+
+    def _wait_for_updates(self):
+        """Waits for the queued updates, e.g. before a sync update or the end status."""
+        if getattr(self, "_transport", None) is not None:
+            self._transport.worker.wait()
+
     def _update(self, data: Union[Dict, V1Run], async_req: bool = True) -> V1Run:
+        self._journal_append(JournalEntryKind.UPDATE, data)
         if self._is_offline:
             return self.run_data
+        if async_req and isinstance(data, Mapping):
+            self._queue_update(dict(data))
+            return self.run_data
+        self._wait_for_updates()
         response = self.client.runs_v1.patch_run(
             owner=self.owner,
             project=self.project,
@@ -958,6 +1065,7 @@ class RunClient(ClientMixin):
             last_transition_time=last_transition_time,
             last_update_time=last_update_time,
         )
+        self._journal_append(JournalEntryKind.STATUS, status_condition)
         if self._is_offline:
             self._apply_offline_status(
                 status=status,
@@ -1662,6 +1770,8 @@ class RunClient(ClientMixin):
         delete_tar: bool = True,
         extract_path: Optional[str] = None,
         check_path: bool = False,
+        show_progress: bool = True,
+        stream_untar: bool = False,
     ):
         """Downloads a subpath containing multiple run artifacts.
 
@@ -1673,6 +1783,9 @@ class RunClient(ClientMixin):
             extract_path: str, optional.
             check_path: bool, optional, default: false.
                  To force the API to check if the path is file or dir.
+            show_progress: bool, optional, to show a progress bar.
+            stream_untar: bool, optional, default: false.
+                 To extract the archive while it's downloaded, without writing it.
         Returns:
             str.
         """
@@ -1701,6 +1814,8 @@ class RunClient(ClientMixin):
             delete_tar=delete_tar and untar,
             extract_path=extract_path,
             params=params,
+            show_progress=show_progress,
+            stream_untar=stream_untar,
         )
 
     @client_handler(check_no_op=True, check_offline=True)
@@ -1766,6 +1881,10 @@ class RunClient(ClientMixin):
         agent: Optional[str] = None,
         ignore_agent_host: bool = False,
         ignore_store: Optional[bool] = None,
+        chunked: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        show_progress: bool = True,
+        dedup: bool = False,
     ):
         """Uploads a full directory to the run's artifacts store path.
 
@@ -1781,6 +1900,14 @@ class RunClient(ClientMixin):
             agent: str, optional, uuid reference of an agent to use.
             ignore_agent_host: bool, optional, flag to ignore agent host
             ignore_store: bool, optional, flag to ignore the ignore store and upload all files under the dirpath.
+            chunked: bool, optional, flag to upload the files in several parts sent concurrently,
+                 by default files larger than `POLYAXON_UPLOAD_PART_SIZE` are uploaded in parts.
+                 An interrupted chunked upload resumes from the last uploaded part.
+            max_workers: int, optional, number of parts to upload concurrently.
+            show_progress: bool, optional, to show a progress bar.
+            dedup: bool, optional, flag to only upload new or changed files,
+                 files are compared with the run's artifacts tree
+                 using a local manifest of the files previously uploaded.
         Returns:
             str.
         """
@@ -1803,6 +1930,10 @@ class RunClient(ClientMixin):
             agent=agent,
             ignore_agent_host=ignore_agent_host,
             ignore_store=ignore_store,
+            chunked=chunked,
+            max_workers=max_workers,
+            show_progress=show_progress,
+            dedup=dedup,
         )
 
     @client_handler(check_no_op=True, check_offline=True)
@@ -1815,6 +1946,10 @@ class RunClient(ClientMixin):
         agent: Optional[str] = None,
         ignore_agent_host: bool = False,
         ignore_store: Optional[bool] = None,
+        chunked: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        show_progress: bool = True,
+        dedup: bool = False,
     ):
         """Uploads multiple artifacts to the run's artifacts store path.
 
@@ -1827,6 +1962,16 @@ class RunClient(ClientMixin):
             agent: str, optional, uuid reference of an agent to use.
             ignore_agent_host: bool, optional, flag to ignore agent host
             ignore_store: bool, optional, flag to ignore the ignore store and upload all files under the dirpath.
+            chunked: bool, optional, flag to upload the files in several parts sent concurrently,
+                 by default files larger than `POLYAXON_UPLOAD_PART_SIZE` are uploaded in parts.
+                 An interrupted chunked upload resumes from the last uploaded part.
+            max_workers: int, optional, number of parts to upload concurrently.
+            show_progress: bool, optional, to show a progress bar.
+            dedup: bool, optional, flag to only upload new or changed files,
+                 files are compared with the run's artifacts tree
+                 using a local manifest of the files previously uploaded to the run.
+                 The skipped files are kept on the artifacts store,
+                 `overwrite` only replaces the files uploaded.
         Returns:
             str.
         """
@@ -1855,14 +2000,55 @@ class RunClient(ClientMixin):
         )
         url = absolute_uri(url=url, host=self.client.config.host)
 
-        return self.store.upload_dir(
+        manifest = None
+        if dedup:
+            manifest = ArtifactsManifest(
+                self._get_artifacts_manifest_path(path=path, **params)
+            )
+            remote_files = manifest.get_remote_files(self.get_artifacts_tree, path)
+            files, entries = manifest.get_changed_files(
+                files=files, remote_files=remote_files, relative_to=relative_to
+            )
+            if not files:
+                logger.info("All files under %s are already uploaded.", path or "/")
+                return
+            logger.info(
+                "Uploading %s new or changed files out of %s.",
+                len(files),
+                len(entries),
+            )
+
+        response = self.store.upload_dir(
             url=url,
             path=path,
             files=files,
             overwrite=overwrite,
             relative_to=relative_to,
+            chunked=chunked,
+            max_workers=max_workers,
+            show_progress=show_progress,
             **params,
         )
+        if manifest and response is not None and 200 <= response.status_code < 300:
+            manifest.update(entries)
+        return response
+
+    def _get_artifacts_manifest_path(
+        self, path: str = "", connection: Optional[str] = None
+    ) -> str:
+        # The files are uploaded to the run's artifacts path, so the manifest is per run,
+        # a manifest shared by several runs would skip files another run uploaded.
+        key = hash_value(
+            "{}/{}/{}/{}/{}".format(
+                self.owner, self.project, self.run_uuid, path, connection
+            ),
+            hash_length=None,
+        )
+        return os.path.join(
+            ctx_paths.CONTEXT_TMP_POLYAXON_PATH,
+            "manifests",
+            ctx_paths.CONTEXT_LOCAL_ARTIFACTS_MANIFEST_FORMAT.format(key),
+        )
 
     @client_handler(check_no_op=True, check_offline=True)
     def delete_artifact(self, path: str):
@@ -2199,6 +2385,7 @@ class RunClient(ClientMixin):
         """
         if self.status in LifeCycle.DONE_VALUES:
             return
+        self._wait_for_updates()
         self.log_status(status=status, reason=reason, message=message)
         self.end()
         time.sleep(
@@ -2737,6 +2924,9 @@ class RunClient(ClientMixin):
             body: dict or List[dict] or V1RunArtifact or List[V1RunArtifact], body of the lineage.
             async_req: bool, optional, default: False, execute request asynchronously.
         """
+        self._journal_append(
+            JournalEntryKind.LINEAGE, self._build_artifact_lineage_body(body)
+        )
         if self._is_offline:
             self._cache_offline_artifact_lineage(body)
             return
@@ -3064,6 +3254,7 @@ class RunClient(ClientMixin):
 
         if not self._artifacts_lineage:
             logger.debug("Persist offline run call did not find any lineage data. ")
+            self._clear_journal(path)
             return
 
         lineages_path = "{}/{}".format(path, ctx_paths.CONTEXT_LOCAL_LINEAGES)
@@ -3077,6 +3268,15 @@ class RunClient(ClientMixin):
                 )
             )
         set_permissions(lineages_path)
+        self._clear_journal(path)
+
+    def _clear_journal(self, path: str):
+        """Clears the journal under path, its entries are covered by the persisted run."""
+        journal_path = self._get_journal_path(path)
+        if self._journal and self._journal.path == journal_path:
+            self._journal.clear()
+        elif os.path.isfile(journal_path):
+            RunJournal(journal_path).clear()
 
     @classmethod
     @client_handler(check_no_op=True)
@@ -3107,48 +3307,65 @@ class RunClient(ClientMixin):
             name: str, optional, a name to set for the run.
         """
         run_path = "{}/{}".format(path, ctx_paths.CONTEXT_LOCAL_RUN)
-        if not os.path.isfile(run_path):
+        journal_entries = RunJournal.fold(
+            RunJournal(os.path.join(path, ctx_paths.CONTEXT_LOCAL_JOURNAL)).read()
+        )
+        journal_run = next(
+            (e["data"] for e in journal_entries if e["kind"] == JournalEntryKind.RUN),
+            None,
+        )
+        if not os.path.isfile(run_path) and not journal_run:
             if raise_if_not_found:
                 raise PolyaxonClientException(f"Offline data was not found: {run_path}")
             else:
                 logger.info(f"Offline data was not found: {run_path}")
                 return None
 
-        with open(run_path, "r") as config_file:
-            config_str = config_file.read()
-            run_config = V1Run(**orjson_loads(config_str))
-            owner = run_config.owner
-            project = run_config.project
-            if reset_uuid:
-                run_config.uuid = uuid.uuid4().hex
-            if name:
-                run_config.name = name
-            if run_client:
-                if reset_project or not owner:
-                    owner = run_client.owner
-                if reset_project or not project:
-                    project = run_client.project
-                run_client._owner = owner
-                run_client._project = project
-                run_client._run_uuid = run_config.uuid
-            else:
-                run_client = cls(
-                    owner=owner,
-                    project=project,
-                    run_uuid=run_config.uuid,
-                )
-            run_client._run_data = run_config  # type: ignore
-            logger.info(f"Offline data loaded from: {run_path}")
+        if os.path.isfile(run_path):
+            with open(run_path, "r") as config_file:
+                config_str = config_file.read()
+                run_config = V1Run(**orjson_loads(config_str))
+                logger.info(f"Offline data loaded from: {run_path}")
+        else:
+            # The run was not persisted, e.g. the process was killed
+            run_config = V1Run(**journal_run)
+        owner = run_config.owner
+        project = run_config.project
+        if reset_uuid:
+            run_config.uuid = uuid.uuid4().hex
+        if name:
+            run_config.name = name
+        if run_client:
+            if reset_project or not owner:
+                owner = run_client.owner
+            if reset_project or not project:
+                project = run_client.project
+            run_client._owner = owner
+            run_client._project = project
+            run_client._run_uuid = run_config.uuid
+        else:
+            run_client = cls(
+                owner=owner,
+                project=project,
+                run_uuid=run_config.uuid,
+            )
+        run_client._run_data = run_config  # type: ignore
 
         lineages_path = "{}/{}".format(path, ctx_paths.CONTEXT_LOCAL_LINEAGES)
-        if not os.path.isfile(lineages_path):
+        if os.path.isfile(lineages_path):
+            with open(lineages_path, "r") as config_file:
+                config_str = config_file.read()
+                lineages = [
+                    V1RunArtifact.from_dict(l) for l in orjson_loads(config_str)
+                ]
+                run_client._artifacts_lineage = {l.name: l for l in lineages}  # type: ignore
+                logger.info(f"Offline lineage data loaded from: {lineages_path}")
+        else:
             logger.info(f"Offline lineage data was not found: {lineages_path}")
-            return run_client
-        with open(lineages_path, "r") as config_file:
-            config_str = config_file.read()
-            lineages = [V1RunArtifact.from_dict(l) for l in orjson_loads(config_str)]
-            run_client._artifacts_lineage = {l.name: l for l in lineages}  # type: ignore
-            logger.info(f"Offline lineage data loaded from: {lineages_path}")
+
+        if journal_entries:
+            run_client._apply_journal_entries(journal_entries)  # type: ignore
+            logger.info(f"Offline journal replayed from: {path}")
 
         return run_client
 
@@ -3157,6 +3374,7 @@ class RunClient(ClientMixin):
         self,
         path: Optional[str] = None,
         download_artifacts: bool = True,
+        show_progress: bool = True,
     ):
         """Download a run on Polyaxon's API and artifacts store to local path.
 
@@ -3164,6 +3382,7 @@ class RunClient(ClientMixin):
             path: str, optional, defaults to the offline root path,
                  path where the run's metadata & artifacts will be stored.
             download_artifacts: bool, optional, flag to trigger artifacts download.
+            show_progress: bool, optional, to show a progress bar.
         """
         path = ctx_paths.get_offline_path(
             entity_value=self.run_uuid, entity_kind=V1ProjectFeature.RUNTIME, path=path
@@ -3171,7 +3390,7 @@ class RunClient(ClientMixin):
         delete_path(path)
         self.refresh_data(load_artifacts_lineage=True, load_conditions=True)
         if download_artifacts:
-            self.download_artifacts(path_to=path)
+            self.download_artifacts(path_to=path, show_progress=show_progress)
         self.persist_run(path)
         return path
 
@@ -3184,6 +3403,8 @@ class RunClient(ClientMixin):
         agent: Optional[str] = None,
         ignore_agent_host: bool = False,
         ignore_store: bool = False,
+        show_progress: bool = True,
+        dedup: bool = False,
     ):
         """Syncs an offline run to Polyaxon's API and artifacts store.
 
@@ -3195,11 +3416,21 @@ class RunClient(ClientMixin):
             agent: str, optional, uuid reference of an agent to use.
             ignore_agent_host: bool, optional, flag to ignore agent host
             ignore_store: bool, optional, flag to ignore artifacts store and only push the run metadata and lineage.
+            show_progress: bool, optional, to show a progress bar.
+            dedup: bool, optional, flag to only upload artifacts that are new or changed
+                 since the last push.
         """
         # We ensure that the is_offline is False
         is_offline = self._is_offline
         self._is_offline = False
 
+        if path:
+            # Replaying is idempotent, entries already loaded are skipped
+            journal_entries = RunJournal.fold(
+                RunJournal(self._get_journal_path(path)).read()
+            )
+            self._apply_journal_entries(journal_entries)
+
         if not self.run_data:
             logger.warning(
                 "Push offline run failed. Make sure that run_data is provided."
@@ -3230,6 +3461,8 @@ class RunClient(ClientMixin):
                 agent=agent,
                 ignore_agent_host=ignore_agent_host,
                 ignore_store=ignore_store,
+                show_progress=show_progress,
+                dedup=dedup,
             )
             logger.info(f"Offline artifacts for run {self.run_data.uuid} uploaded")
 
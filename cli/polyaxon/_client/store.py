@@ -1,14 +1,23 @@
 import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+import hashlib
 import os
 import requests
-from typing import Dict, List
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 import aiofiles
 import aiohttp
 from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
 
 from clipped.formatting import Printer
-from clipped.utils.json import orjson_dumps
+from clipped.utils.json import orjson_dumps, orjson_loads
 from clipped.utils.lists import to_list
 from clipped.utils.paths import (
     check_or_create_path,
@@ -18,7 +27,9 @@ from clipped.utils.paths import (
 )
 from clipped.utils.units import format_sizeof
 from polyaxon import settings
+from polyaxon._client.transport.pool_manager import create_session
 from polyaxon._constants.globals import DEFAULT_UPLOADS_PATH
+from polyaxon._contexts import paths as ctx_paths
 from polyaxon._env_vars.keys import ENV_KEYS_UPLOAD_SIZE
 from polyaxon.exceptions import (
     HTTP_ERROR_MESSAGES_MAPPING,
@@ -37,6 +48,15 @@ class PolyaxonStore:
     By default, this store requires a valid run.
     """
 
+    UPLOAD_PART_SIZE = 1024 * 1024 * 100
+    UPLOAD_THREADS = 4
+    UPLOAD_PART_RETRIES = 3
+    DOWNLOAD_SEGMENT_SIZE = 1024 * 1024 * 32
+    DOWNLOAD_THREADS = 4
+    DOWNLOAD_RETRIES = 3
+    DOWNLOAD_CHUNK_SIZE_MIN = 1024 * 64
+    DOWNLOAD_CHUNK_SIZE_MAX = 1024 * 1024 * 4
+
     def __init__(self, client: "RunClient"):  # noqa
         self._client = client
 
@@ -67,6 +87,26 @@ class PolyaxonStore:
             HTTP_ERROR_MESSAGES_MAPPING.get(response.status_code)
         )
 
+    @staticmethod
+    def get_upload_size_max() -> int:
+        upload_size_max = os.environ.get(ENV_KEYS_UPLOAD_SIZE)
+        if not upload_size_max:
+            # Backwards compatibility
+            upload_size_max = os.environ.get("POLYAXON_UPLOAD_SIZE_MAX")
+        if not upload_size_max:
+            upload_size_max = 1024 * 1024 * 500
+        try:
+            return int(upload_size_max)
+        except Exception as e:
+            raise PolyaxonClientException("Could not parse max upload size") from e
+
+    def get_upload_part_size(self) -> int:
+        part_size = (
+            getattr(self._client.client.config, "upload_part_size", None)
+            or self.UPLOAD_PART_SIZE
+        )
+        return min(part_size, self.get_upload_size_max())
+
     def upload(
         self,
         url,
@@ -78,17 +118,9 @@ class PolyaxonStore:
         headers=None,
         session=None,
         show_progress=True,
+        progress_callback=None,
     ):
-        upload_size_max = os.environ.get(ENV_KEYS_UPLOAD_SIZE)
-        if not upload_size_max:
-            # Backwards compatibility
-            upload_size_max = os.environ.get("POLYAXON_UPLOAD_SIZE_MAX")
-        if not upload_size_max:
-            upload_size_max = 1024 * 1024 * 500
-        try:
-            upload_size_max = int(upload_size_max)
-        except Exception as e:
-            raise PolyaxonClientException("Could not parse max upload size") from e
+        upload_size_max = self.get_upload_size_max()
 
         if files_size > 1024 * 1024 * 50:
             logger.warning(
@@ -121,7 +153,7 @@ class PolyaxonStore:
 
         timeout = timeout if timeout is not None else settings.LONG_REQUEST_TIMEOUT
 
-        session = session or requests.Session()
+        session = session or create_session(config=self._client.client.config)
 
         def _upload_impl(callback=None):
             multipart_encoder_monitor = MultipartEncoderMonitor(
@@ -135,6 +167,9 @@ class PolyaxonStore:
                 timeout=timeout,
             )
 
+        if progress_callback:
+            return _upload_impl(progress_callback)
+
         if not show_progress:
             return _upload_impl()
 
@@ -154,6 +189,326 @@ class PolyaxonStore:
                 return headers.get(k, "")
         return ""
 
+    @classmethod
+    def get_download_chunk_size(cls, content_length: Optional[int] = None) -> int:
+        """Returns a read buffer size adapted to the size of the content."""
+        if not content_length:
+            return cls.DOWNLOAD_CHUNK_SIZE_MIN
+        return int(
+            min(
+                max(content_length // 100, cls.DOWNLOAD_CHUNK_SIZE_MIN),
+                cls.DOWNLOAD_CHUNK_SIZE_MAX,
+            )
+        )
+
+    def get_response_digest(self, headers: Dict) -> Optional[Tuple[str, str]]:
+        """Returns the algorithm and hex digest sent by the server, if any."""
+        content_md5 = self._get_header_value(headers=headers, key="content-md5")
+        if content_md5:
+            try:
+                return "md5", base64.b64decode(content_md5).hex()
+            except ValueError:
+                return None
+        digest = self._get_header_value(headers=headers, key="digest")
+        for value in digest.split(","):
+            algorithm, _, encoded = value.strip().partition("=")
+            algorithm = algorithm.lower().replace("-", "")
+            if algorithm in {"md5", "sha256"} and encoded:
+                try:
+                    return algorithm, base64.b64decode(encoded).hex()
+                except ValueError:
+                    return None
+        return None
+
+    @staticmethod
+    def check_download_integrity(
+        url: str,
+        part_path: str,
+        content_length: Optional[int] = None,
+        digest: Optional[Tuple[str, str]] = None,
+    ):
+        def _corrupted(reason):
+            os.remove(part_path)
+            raise PolyaxonClientException(
+                "The content downloaded from `{}` is corrupted, {}.".format(url, reason)
+            )
+
+        if content_length is not None:
+            size = os.path.getsize(part_path)
+            if size != content_length:
+                _corrupted("expected {} bytes, got {}".format(content_length, size))
+        if digest:
+            algorithm, expected = digest
+            file_hash = hashlib.new(algorithm)
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    file_hash.update(chunk)
+            if file_hash.hexdigest() != expected:
+                _corrupted("the {} digest does not match".format(algorithm))
+
+    @staticmethod
+    def get_safe_stream_members(tar: tarfile.TarFile, extract_path: str):
+        """Yields the members of a streamed tar, rejecting members escaping the path."""
+        abs_dest = os.path.realpath(extract_path)
+
+        def _is_safe(path):
+            return path == abs_dest or path.startswith(abs_dest + os.sep)
+
+        for member in tar:
+            member_path = os.path.realpath(os.path.join(extract_path, member.name))
+            if not _is_safe(member_path):
+                raise ValueError(
+                    "Tar member '{}' would be extracted to '{}', "
+                    "which is outside the destination.".format(member.name, member_path)
+                )
+            if member.issym() or member.islnk():
+                link_base = os.path.dirname(member_path) if member.issym() else abs_dest
+                link_path = os.path.realpath(os.path.join(link_base, member.linkname))
+                if not _is_safe(link_path):
+                    raise ValueError(
+                        "Tar member '{}' links to '{}', "
+                        "which is outside the destination.".format(
+                            member.name, link_path
+                        )
+                    )
+            yield member
+
+    @staticmethod
+    def _move_extracted(staging_path: str, extract_path: str):
+        """Moves the extracted content to its destination, merging existing folders."""
+        for root, dirs, files in os.walk(staging_path):
+            dest_root = os.path.join(extract_path, os.path.relpath(root, staging_path))
+            for name in list(dirs):
+                src = os.path.join(root, name)
+                dst = os.path.join(dest_root, name)
+                if os.path.islink(src) or not os.path.lexists(dst):
+                    os.replace(src, dst)
+                    dirs.remove(name)
+            for name in files:
+                os.replace(os.path.join(root, name), os.path.join(dest_root, name))
+
+    def stream_untar(
+        self,
+        url: str,
+        response,
+        extract_path: str,
+        content_length: Optional[int] = None,
+        digest: Optional[Tuple[str, str]] = None,
+        on_progress=None,
+    ):
+        """Extracts a tar response while it's downloaded.
+
+        The response body is piped to a tar extractor running in its own thread,
+        the archive is never written to disk.
+        The content is extracted to a staging folder,
+        and only moved to `extract_path` once the whole archive is validated.
+        """
+        check_or_create_path(extract_path, is_dir=True)
+        staging_path = tempfile.mkdtemp(prefix=".untar-", dir=extract_path)
+        read_fd, write_fd = os.pipe()
+        errors = []
+
+        def _extract():
+            try:
+                with os.fdopen(read_fd, "rb") as reader:
+                    with tarfile.open(fileobj=reader, mode="r|*") as tar:
+                        kwargs = {}
+                        if hasattr(tarfile, "data_filter"):
+                            kwargs["filter"] = "data"
+                        tar.extractall(
+                            staging_path,
+                            members=self.get_safe_stream_members(tar, staging_path),
+                            **kwargs,
+                        )
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            thread = threading.Thread(target=_extract, name="polyaxon.StreamUntar")
+            thread.daemon = True
+            thread.start()
+            size = 0
+            file_hash = hashlib.new(digest[0]) if digest else None
+            writer = os.fdopen(write_fd, "wb")
+
+            def _close_writer():
+                try:
+                    writer.close()
+                except BrokenPipeError:
+                    pass
+
+            try:
+                chunk_size = self.get_download_chunk_size(content_length)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    size += len(chunk)
+                    if file_hash:
+                        file_hash.update(chunk)
+                    if on_progress:
+                        on_progress(len(chunk))
+                    if writer is None:
+                        continue
+                    try:
+                        writer.write(chunk)
+                    except BrokenPipeError:
+                        _close_writer()
+                        writer = None
+                        thread.join()
+                        if errors:
+                            # The extractor failed, the rest of the body is not needed
+                            response.close()
+                            break
+                        # The extractor reached the end of the archive,
+                        # the rest is only read for the checks
+            finally:
+                if writer is not None:
+                    _close_writer()
+                thread.join()
+            if errors:
+                raise PolyaxonClientException(
+                    "Could not extract the content downloaded from `{}`: {}".format(
+                        url, errors[0]
+                    )
+                ) from errors[0]
+            if content_length is not None and size != content_length:
+                raise PolyaxonClientException(
+                    "The content downloaded from `{}` is corrupted, "
+                    "expected {} bytes, got {}.".format(url, content_length, size)
+                )
+            if file_hash and file_hash.hexdigest() != digest[1]:
+                raise PolyaxonClientException(
+                    "The content downloaded from `{}` is corrupted, "
+                    "the {} digest does not match.".format(url, digest[0])
+                )
+            self._move_extracted(staging_path, extract_path)
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+    def _download_segments(
+        self,
+        session,
+        url: str,
+        part_path: str,
+        content_length: int,
+        validator: str,
+        params=None,
+        request_headers=None,
+        timeout=None,
+        on_progress=None,
+    ):
+        """Downloads the content in segments using ranged requests.
+
+        The downloaded segments are recorded next to the `.part` file,
+        so that a later call resumes the download.
+        Without an ETag or a Last-Modified validator,
+        the content can't be matched, and the download restarts from zero.
+        """
+        config = self._client.client.config
+        segment_size = (
+            getattr(config, "download_segment_size", None) or self.DOWNLOAD_SEGMENT_SIZE
+        )
+        max_workers = getattr(config, "download_threads", None) or self.DOWNLOAD_THREADS
+        num_segments = max(-(-content_length // segment_size), 1)
+        chunk_size = self.get_download_chunk_size(content_length)
+        state_path = "{}.json".format(part_path)
+        lock = threading.Lock()
+
+        state = {}
+        if os.path.exists(part_path) and os.path.exists(state_path):
+            try:
+                with open(state_path, "r") as state_file:
+                    state = orjson_loads(state_file.read())
+            except (OSError, ValueError):
+                state = {}
+        if (
+            not validator
+            or state.get("length") != content_length
+            or state.get("validator") != validator
+            or state.get("segment_size") != segment_size
+        ):
+            # The content changed, can't be validated, or nothing was downloaded yet
+            state = {
+                "length": content_length,
+                "validator": validator,
+                "segment_size": segment_size,
+                "segments": [],
+            }
+            with open(part_path, "wb") as f:
+                f.truncate(content_length)
+        done = set(state["segments"])
+        if done:
+            logger.info(
+                "Resuming download, %s/%s segments already downloaded.",
+                len(done),
+                num_segments,
+            )
+        if on_progress:
+            on_progress(
+                sum(min(segment_size, content_length - i * segment_size) for i in done)
+            )
+
+        def _download_segment(index):
+            offset = index * segment_size
+            end = min(offset + segment_size, content_length) - 1
+            for attempt in range(self.DOWNLOAD_RETRIES + 1):
+                try:
+                    segment_headers = dict(request_headers or {})
+                    segment_headers["Range"] = "bytes={}-{}".format(offset, end)
+                    with session.get(
+                        url=url,
+                        params=params,
+                        headers=segment_headers,
+                        timeout=timeout,
+                        stream=True,
+                    ) as response:
+                        self.check_response_status(response, url)
+                        if response.status_code != 206:
+                            raise PolyaxonClientException(
+                                "The server did not return the requested range."
+                            )
+                        with open(part_path, "r+b") as f:
+                            f.seek(offset)
+                            for chunk in response.iter_content(chunk_size=chunk_size):
+                                if chunk:
+                                    f.write(chunk)
+                                    offset += len(chunk)
+                                    if on_progress:
+                                        on_progress(len(chunk))
+                    if offset <= end:
+                        raise PolyaxonClientException(
+                            "Connection closed before the end of the segment."
+                        )
+                    break
+                except (
+                    PolyaxonClientException,
+                    requests.exceptions.RequestException,
+                ) as e:
+                    if attempt >= self.DOWNLOAD_RETRIES:
+                        raise
+                    logger.warning(
+                        "Failed downloading segment %s/%s, retrying: %s",
+                        index + 1,
+                        num_segments,
+                        e,
+                    )
+                    time.sleep(2**attempt)
+
+            with lock:
+                state["segments"].append(index)
+                tmp_path = "{}.tmp".format(state_path)
+                with open(tmp_path, "w") as state_file:
+                    state_file.write(orjson_dumps(state))
+                os.replace(tmp_path, state_path)
+
+        pending = [i for i in range(num_segments) if i not in done]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for future in [executor.submit(_download_segment, i) for i in pending]:
+                future.result()
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+
     def download(
         self,
         url,
@@ -167,19 +522,34 @@ class PolyaxonStore:
         extract_path=None,
         use_filepath=True,
         show_progress=True,
+        stream_untar=False,
     ):
         """
         Download the file from the given url at the current path
+
+        The content is written to a `.part` file, renamed once complete and verified.
+        If the server accepts ranged requests and sends a content length,
+        the content is downloaded in parallel segments,
+        and an interrupted download resumes from the segments already downloaded.
+
+        If a tar archive should be extracted and not kept, and `stream_untar` is enabled,
+        the content is extracted while it's downloaded without writing the archive,
+        such downloads can't be resumed.
         """
         # pylint:disable=too-many-branches
         logger.debug("Downloading files from url: %s", url)
 
         request_headers = self._client.client.config.get_full_headers(headers=headers)
         timeout = timeout if timeout is not None else settings.LONG_REQUEST_TIMEOUT
-        session = session or requests.Session()
+        session = session or create_session(config=self._client.client.config)
 
         try:
-            with Printer.console.status("Loading content ..."):
+            loading_status = (
+                Printer.console.status("Loading content ...")
+                if show_progress
+                else nullcontext()
+            )
+            with loading_status:
                 response = session.get(
                     url=url,
                     params=params,
@@ -200,32 +570,103 @@ class PolyaxonStore:
                 untar = has_tar
 
             self.check_response_status(response, url)
-            with open(filename, "wb") as f:
-                content_length = self._get_header_value(
-                    headers=response.headers,
-                    key="content-length",
-                )
-                content_length = float(content_length) if content_length else None
-                chunk_size = 1024 * 10
+            content_length = self._get_header_value(
+                headers=response.headers,
+                key="content-length",
+            )
+            content_length = int(content_length) if content_length else None
+            content_encoding = self._get_header_value(
+                headers=response.headers,
+                key="content-encoding",
+            )
+            accept_ranges = self._get_header_value(
+                headers=response.headers,
+                key="accept-ranges",
+            )
+            # Ranges and lengths apply to the encoded content, which is decoded on read
+            use_ranges = (
+                bool(content_length)
+                and accept_ranges.lower() == "bytes"
+                and content_encoding.lower() in {"", "identity"}
+            )
+            digest = self.get_response_digest(response.headers)
+            validator = self._get_header_value(
+                headers=response.headers, key="etag"
+            ) or self._get_header_value(headers=response.headers, key="last-modified")
+            part_path = "{}.part".format(filename)
 
-                def _download_impl():
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if progress:
-                            progress.update(
-                                task,
-                                advance=len(chunk),
-                            )
-                        if chunk:
-                            f.write(chunk)
+            if untar and stream_untar and delete_tar:
+                extract_path = extract_path or "."
+                if use_filepath:
+                    extract_path = os.path.join(
+                        extract_path, filename.split(".tar.gz")[0]
+                    )
+
+                def _stream_impl(on_progress=None):
+                    self.stream_untar(
+                        url=url,
+                        response=response,
+                        extract_path=extract_path,
+                        content_length=(
+                            content_length
+                            if content_encoding.lower() in {"", "identity"}
+                            else None
+                        ),
+                        digest=digest,
+                        on_progress=on_progress,
+                    )
 
                 if show_progress:
                     with Printer.get_progress() as progress:
                         task = progress.add_task(
-                            "Writing content:", total=content_length
+                            "Extracting content:", total=content_length
                         )
-                        _download_impl()
+                        _stream_impl(lambda n: progress.update(task, advance=n))
                 else:
-                    _download_impl()
+                    _stream_impl()
+                return extract_path
+
+            def _download_impl(on_progress=None):
+                if use_ranges:
+                    response.close()
+                    self._download_segments(
+                        session=session,
+                        url=url,
+                        part_path=part_path,
+                        content_length=content_length,
+                        validator=validator,
+                        params=params,
+                        request_headers=request_headers,
+                        timeout=timeout,
+                        on_progress=on_progress,
+                    )
+                    return
+                chunk_size = self.get_download_chunk_size(content_length)
+                with open(part_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            if on_progress:
+                                on_progress(len(chunk))
+
+            if show_progress:
+                with Printer.get_progress() as progress:
+                    task = progress.add_task("Writing content:", total=content_length)
+                    _download_impl(lambda n: progress.update(task, advance=n))
+            else:
+                _download_impl()
+
+            self.check_download_integrity(
+                url=url,
+                part_path=part_path,
+                content_length=(
+                    content_length
+                    if content_encoding.lower() in {"", "identity"}
+                    else None
+                ),
+                digest=digest,
+            )
+            os.replace(part_path, filename)
 
             if untar:
                 filename = untar_file(
@@ -281,15 +722,33 @@ class PolyaxonStore:
         filepath: str,
         show_progress: bool = True,
         connection: str = None,
+        chunked: Optional[bool] = None,
+        max_workers: Optional[int] = None,
         **kwargs,
     ):
         """This function uploads a single file or several files compressed in tar.gz.
 
         If the untar args is provided the server will decompress
         the uploaded file as a tar on the artifacts store.
+        Files larger than a part are uploaded in byte ranges, unless they must be untarred.
         """
+        untar = kwargs.get("untar", False)
+        if chunked is None:
+            chunked = os.path.getsize(filepath) > self.get_upload_part_size()
+        # A tar decompressed on the artifacts store can't be sent in ranges
+        if chunked and not untar:
+            return self.upload_parts(
+                url,
+                files=[filepath],
+                path=kwargs.get("path", ""),
+                overwrite=kwargs.get("overwrite", True),
+                relative_to=os.path.dirname(filepath),
+                connection=connection,
+                max_workers=max_workers,
+                show_progress=show_progress,
+            )
         json_data = {
-            "untar": kwargs.get("untar", False),
+            "untar": untar,
             "path": kwargs.get("path", ""),
             "overwrite": kwargs.get("overwrite", True),
         }
@@ -304,8 +763,31 @@ class PolyaxonStore:
                 show_progress=show_progress,
             )
 
-    def upload_dir(self, url: str, files: List[str], connection: str = None, **kwargs):
+    def upload_dir(
+        self,
+        url: str,
+        files: List[str],
+        connection: str = None,
+        chunked: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        show_progress: bool = True,
+        **kwargs,
+    ):
         path = kwargs.get("path", "")
+        if chunked is None:
+            files_size = sum(os.path.getsize(f) for f in files)
+            chunked = files_size > self.get_upload_part_size()
+        if chunked:
+            return self.upload_parts(
+                url,
+                files=files,
+                path=path,
+                overwrite=kwargs.get("overwrite", True),
+                relative_to=kwargs.get("relative_to", None),
+                connection=connection,
+                max_workers=max_workers,
+                show_progress=show_progress,
+            )
         json_data = {
             "untar": True,
             "path": path,
@@ -319,9 +801,326 @@ class PolyaxonStore:
         ) as filepath:
             with get_files_by_paths("upload_file", [filepath]) as (files, files_size):
                 return self.upload(
-                    url, files=files, files_size=files_size, json_data=json_data
+                    url,
+                    files=files,
+                    files_size=files_size,
+                    json_data=json_data,
+                    show_progress=show_progress,
                 )
 
+    @staticmethod
+    def get_upload_parts(files: List[str], part_size: int) -> List[List]:
+        """Groups files into parts of at most `part_size` bytes.
+
+        A file larger than `part_size` is split in byte ranges,
+        every range `(filepath, offset, size)` is uploaded in a part of its own.
+        """
+        parts = []
+        part = []
+        current_size = 0
+        for filepath in files:
+            file_size = os.path.getsize(filepath)
+            if file_size > part_size:
+                parts += [
+                    [(filepath, offset, min(part_size, file_size - offset))]
+                    for offset in range(0, file_size, part_size)
+                ]
+                continue
+            if part and current_size + file_size > part_size:
+                parts.append(part)
+                part = []
+                current_size = 0
+            part.append(filepath)
+            current_size += file_size
+        if part:
+            parts.append(part)
+        return parts
+
+    @staticmethod
+    def get_upload_part_range(part: List) -> Optional[Tuple[str, int, int]]:
+        if len(part) == 1 and isinstance(part[0], (tuple, list)):
+            return tuple(part[0])
+        return None
+
+    @classmethod
+    def get_upload_part_files_size(cls, part: List) -> int:
+        part_range = cls.get_upload_part_range(part)
+        if part_range:
+            return part_range[2]
+        return sum(os.path.getsize(f) for f in part)
+
+    @classmethod
+    def get_upload_part_key(cls, url: str, path: str, part: List) -> str:
+        key = hashlib.md5("{}:{}".format(url, path).encode())
+        part_range = cls.get_upload_part_range(part)
+        if part_range:
+            filepath, offset, size = part_range
+            stat = os.stat(filepath)
+            key.update(
+                "{}:{}:{}:{}:{}".format(
+                    filepath, stat.st_size, stat.st_mtime_ns, offset, size
+                ).encode()
+            )
+            return key.hexdigest()
+        for filepath in part:
+            stat = os.stat(filepath)
+            key.update(
+                "{}:{}:{}".format(filepath, stat.st_size, stat.st_mtime_ns).encode()
+            )
+        return key.hexdigest()
+
+    @staticmethod
+    @contextmanager
+    def _get_range_file(filepath: str, offset: int, size: int):
+        """Copies a byte range of a file to a temporary file to upload it."""
+        fd, range_path = tempfile.mkstemp(prefix="upload-", suffix=".part")
+        try:
+            with open(filepath, "rb") as src, os.fdopen(fd, "wb") as dst:
+                src.seek(offset)
+                remaining = size
+                while remaining > 0:
+                    chunk = src.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+            with open(range_path, "rb") as range_file:
+                yield range_file
+        finally:
+            os.remove(range_path)
+
+    @staticmethod
+    def get_upload_state_path(part_keys: List[str]) -> str:
+        key = hashlib.md5(":".join(part_keys).encode()).hexdigest()
+        return os.path.join(
+            ctx_paths.CONTEXT_TMP_POLYAXON_PATH,
+            "uploads",
+            ctx_paths.CONTEXT_LOCAL_UPLOAD_STATE_FORMAT.format(key),
+        )
+
+    @staticmethod
+    def _read_upload_state(state_path: str) -> List[str]:
+        if not os.path.exists(state_path):
+            return []
+        try:
+            with open(state_path, "r") as state_file:
+                return orjson_loads(state_file.read()).get("parts") or []
+        except (OSError, ValueError):
+            logger.debug("Could not read upload state %s", state_path)
+            return []
+
+    @staticmethod
+    def _write_upload_state(state_path: str, part_keys: List[str]):
+        check_or_create_path(state_path, is_dir=False)
+        tmp_path = "{}.tmp".format(state_path)
+        with open(tmp_path, "w") as state_file:
+            state_file.write(orjson_dumps({"parts": part_keys}))
+        os.replace(tmp_path, state_path)
+
+    def upload_parts(
+        self,
+        url: str,
+        files: List[str],
+        path: str = "",
+        overwrite: bool = True,
+        relative_to: Optional[str] = None,
+        connection: Optional[str] = None,
+        part_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        show_progress: bool = True,
+        state_path: Optional[str] = None,
+    ):
+        """Uploads files in several tar parts, sent concurrently.
+
+        Files larger than a part are uploaded in byte ranges,
+        the streams service writes every range at its offset in the file.
+        Every part is retried on failure, and the uploaded parts are recorded
+        in a state file, so that an interrupted upload can be resumed
+        by calling this function again with the same files.
+
+        Args:
+            url: str, the upload url.
+            files: List[str], list of files to upload.
+            path: str, optional, the path to upload to.
+            overwrite: bool, optional, if the upload should overwrite any previous content.
+            relative_to: str, optional, the path to cancel from the files' paths.
+            connection: str, optional, the connection to upload to.
+            part_size: int, optional, the maximum size in bytes of a part.
+            max_workers: int, optional, the number of parts to upload concurrently.
+            show_progress: bool, optional, to show a progress bar.
+            state_path: str, optional, path of the file recording the uploaded parts.
+        Returns:
+            the response of the last part uploaded.
+        """
+        config = self._client.client.config
+        part_size = min(
+            part_size or self.get_upload_part_size(), self.get_upload_size_max()
+        )
+        max_workers = (
+            max_workers
+            or getattr(config, "upload_threads", None)
+            or self.UPLOAD_THREADS
+        )
+        parts = self.get_upload_parts(files, part_size)
+        part_keys = [self.get_upload_part_key(url, path, part) for part in parts]
+        state_path = state_path or self.get_upload_state_path(part_keys)
+        uploaded_keys = [
+            k for k in self._read_upload_state(state_path) if k in part_keys
+        ]
+        part_sizes = [self.get_upload_part_files_size(part) for part in parts]
+        part_progress = {
+            i: part_sizes[i] for i, k in enumerate(part_keys) if k in uploaded_keys
+        }
+        pending = [i for i, k in enumerate(part_keys) if k not in uploaded_keys]
+        if uploaded_keys:
+            logger.info(
+                "Resuming upload, %s/%s parts already uploaded.",
+                len(uploaded_keys),
+                len(parts),
+            )
+
+        lock = threading.Lock()
+        session = create_session(config=config, max_retries=0)
+        dirname = os.path.basename(path) if path else DEFAULT_UPLOADS_PATH
+        responses = []
+
+        def _update_progress(index, value, on_progress=None):
+            with lock:
+                part_progress[index] = value
+                if on_progress:
+                    on_progress(sum(part_progress.values()))
+
+        def _get_range_json_data(part_range):
+            filepath, offset, _ = part_range
+            arcname = (
+                os.path.relpath(filepath, relative_to)
+                if relative_to
+                else filepath.lstrip("/")
+            )
+            arcdir = os.path.dirname(arcname)
+            return {
+                "untar": False,
+                "path": os.path.join(path, arcdir) if arcdir else path,
+                "offset": offset,
+                "total_size": os.path.getsize(filepath),
+            }, os.path.basename(arcname)
+
+        @contextmanager
+        def _get_part_files(part, json_data):
+            part_range = self.get_upload_part_range(part)
+            if part_range:
+                range_json_data, filename = _get_range_json_data(part_range)
+                json_data.update(range_json_data)
+                with self._get_range_file(*part_range) as range_file:
+                    yield (
+                        [("upload_file", (filename, range_file, "text/plain"))],
+                        part_range[2],
+                    )
+                return
+            with create_tarfile_from_path(
+                part, dirname, relative_to=relative_to
+            ) as filepath:
+                with get_files_by_paths("upload_file", [filepath]) as (
+                    tar_files,
+                    tar_size,
+                ):
+                    yield tar_files, tar_size
+
+        def _upload_part(index, on_progress=None):
+            json_data = {
+                "untar": True,
+                "path": path,
+                # Only the first part can conflict with previous content,
+                # the next parts add files to the path uploaded by the first one
+                "overwrite": overwrite if index == 0 else True,
+            }
+            if connection:
+                json_data["connection"] = connection
+
+            def _callback(monitor):
+                _update_progress(
+                    index,
+                    part_sizes[index] * monitor.bytes_read / max(monitor.len, 1),
+                    on_progress,
+                )
+
+            for attempt in range(self.UPLOAD_PART_RETRIES + 1):
+                try:
+                    with _get_part_files(parts[index], json_data) as (
+                        part_files,
+                        part_files_size,
+                    ):
+                        response = self.upload(
+                            url,
+                            files=part_files,
+                            files_size=part_files_size,
+                            json_data=json_data,
+                            session=session,
+                            progress_callback=_callback,
+                        )
+                    self.check_response_status(response, url)
+                    break
+                except PolyaxonShouldExitError:
+                    raise
+                except (
+                    PolyaxonClientException,
+                    requests.exceptions.RequestException,
+                ) as e:
+                    if attempt >= self.UPLOAD_PART_RETRIES:
+                        raise
+                    logger.warning(
+                        "Failed uploading part %s/%s, retrying: %s",
+                        index + 1,
+                        len(parts),
+                        e,
+                    )
+                    _update_progress(index, 0, on_progress)
+                    time.sleep(2**attempt)
+
+            _update_progress(index, part_sizes[index], on_progress)
+            with lock:
+                uploaded_keys.append(part_keys[index])
+                self._write_upload_state(state_path, uploaded_keys)
+                responses.append(response)
+
+        def _is_next_range(index):
+            part_range = self.get_upload_part_range(parts[index])
+            return part_range is not None and part_range[1] > 0
+
+        def _upload_impl(on_progress=None):
+            remaining = pending
+            # The first part is sent alone to create the path before the next parts
+            if remaining and remaining[0] == 0:
+                _upload_part(0, on_progress)
+                remaining = remaining[1:]
+            # The first range of a file creates it before its next ranges are written
+            stages = [
+                [i for i in remaining if not _is_next_range(i)],
+                [i for i in remaining if _is_next_range(i)],
+            ]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for stage in stages:
+                    futures = [
+                        executor.submit(_upload_part, i, on_progress) for i in stage
+                    ]
+                    for future in futures:
+                        future.result()
+
+        if show_progress:
+            with Printer.get_progress() as progress:
+                task = progress.add_task(
+                    "[cyan]Uploading {} parts:".format(len(parts)),
+                    total=sum(part_sizes),
+                    completed=sum(part_progress.values()),
+                )
+                _upload_impl(lambda c: progress.update(task, completed=c))
+        else:
+            _upload_impl()
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return responses[-1] if responses else None
+
     def download_dir(
         self, path_from, local_path, use_basename=True, workers=0, **kwargs
     ):
@@ -1,6 +1,7 @@
 import requests
 
 from polyaxon import settings
+from polyaxon._client.transport.pool_manager import create_session
 from polyaxon.exceptions import (
     HTTP_ERROR_MESSAGES_MAPPING,
     PolyaxonClientException,
@@ -15,7 +16,7 @@ class HttpTransportMixin:
     @property
     def session(self):
         if not hasattr(self, "_session"):
-            self._session = requests.Session()
+            self._session = create_session(config=self.config)
         return self._session
 
     def request(
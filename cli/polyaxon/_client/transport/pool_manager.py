@@ -0,0 +1,197 @@
+import multiprocessing
+import os
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import urllib3
+
+
+DEFAULT_NUM_POOLS = 10
+# Same default as the sdk configuration, so that both get the same pools
+DEFAULT_MAXSIZE = multiprocessing.cpu_count() * 5
+
+_POOL_MANAGERS: Dict[Tuple, List] = {}
+_POOL_MANAGERS_LOCK = threading.Lock()
+
+
+def get_pool_options(config=None) -> Dict:
+    """Returns the normalized connection pool options of a client config.
+
+    The sdk clients and the sessions created with the same config
+    get the same options, and therefore the same pool manager.
+
+    Args:
+        config: ClientConfig or sdk Configuration, optional, the config with the pool options.
+    """
+    options = {
+        "num_pools": getattr(config, "connection_pools", None) or DEFAULT_NUM_POOLS,
+        "maxsize": getattr(config, "connection_pool_maxsize", None) or DEFAULT_MAXSIZE,
+        "cert_reqs": (
+            "CERT_REQUIRED" if getattr(config, "verify_ssl", None) else "CERT_NONE"
+        ),
+        "ca_certs": getattr(config, "ssl_ca_cert", None),
+        "cert_file": getattr(config, "cert_file", None),
+        "key_file": getattr(config, "key_file", None),
+    }
+    for option in ["assert_hostname", "retries", "socket_options"]:
+        value = getattr(config, option, None)
+        if value is not None:
+            options[option] = value
+    return options
+
+
+def get_pool_manager(
+    num_pools: Optional[int] = None,
+    maxsize: Optional[int] = None,
+    proxy_url: Optional[str] = None,
+    proxy_headers: Optional[Dict] = None,
+    **pool_kwargs,
+) -> urllib3.PoolManager:
+    """Returns a process-wide pool manager.
+
+    Callers requesting the same options get the same pool manager,
+    so that connections to a host are kept alive and reused
+    instead of paying a new TCP and TLS handshake for every client or session.
+
+    The pool manager is reference counted,
+    callers must call `release_pool_manager` once they are done with it.
+
+    Args:
+        num_pools: int, optional, number of host pools to keep.
+        maxsize: int, optional, maximum number of connections kept per host.
+        proxy_url: str, optional, a proxy to use.
+        proxy_headers: dict, optional, headers to send to the proxy.
+        pool_kwargs: extra connection pool options, e.g. tls options.
+    """
+    num_pools = num_pools or DEFAULT_NUM_POOLS
+    maxsize = maxsize or DEFAULT_MAXSIZE
+    key = (
+        os.getpid(),
+        num_pools,
+        maxsize,
+        proxy_url,
+        repr(proxy_headers),
+        repr(sorted(pool_kwargs.items())),
+    )
+    with _POOL_MANAGERS_LOCK:
+        entry = _POOL_MANAGERS.get(key)
+        if entry is None:
+            if proxy_url:
+                pool_manager = urllib3.ProxyManager(
+                    proxy_url=proxy_url,
+                    proxy_headers=proxy_headers,
+                    num_pools=num_pools,
+                    maxsize=maxsize,
+                    **pool_kwargs,
+                )
+            else:
+                pool_manager = urllib3.PoolManager(
+                    num_pools=num_pools, maxsize=maxsize, **pool_kwargs
+                )
+            entry = [pool_manager, 0]
+            _POOL_MANAGERS[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def release_pool_manager(pool_manager: urllib3.PoolManager):
+    """Releases a process-wide pool manager, its connections are closed with its last user."""
+    with _POOL_MANAGERS_LOCK:
+        for key, entry in _POOL_MANAGERS.items():
+            if entry[0] is pool_manager:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                _POOL_MANAGERS.pop(key)
+                break
+    pool_manager.clear()
+
+
+def clear_pool_managers():
+    """Closes all connections of the process-wide pool managers."""
+    with _POOL_MANAGERS_LOCK:
+        for pool_manager, _ in _POOL_MANAGERS.values():
+            pool_manager.clear()
+        _POOL_MANAGERS.clear()
+
+
+class SharedPoolAdapter(HTTPAdapter):
+    """Requests adapter backed by the process-wide pool manager of a client config.
+
+    Requests verified like the config reuse the same connections as the sdk clients,
+    other requests get their own host pools from the same pool manager.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_pool_options"]
+
+    def __init__(self, config=None, **kwargs):
+        self._pool_options = get_pool_options(config)
+        super().__init__(
+            pool_connections=self._pool_options["num_pools"],
+            pool_maxsize=self._pool_options["maxsize"],
+            **kwargs,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self._released = False
+        self.poolmanager = get_pool_manager(**self._pool_options)
+
+    def _uses_pool_options(self, verify, cert) -> bool:
+        if cert is not None:
+            return False
+        if self._pool_options["cert_reqs"] == "CERT_NONE":
+            return verify is False
+        return verify is True or (
+            isinstance(verify, str) and verify == self._pool_options["ca_certs"]
+        )
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        if self._uses_pool_options(verify, cert):
+            # Use the host pool of the config's tls options
+            pool_kwargs = {}
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        # The shared host pools already have the config's tls options
+        if not self._uses_pool_options(verify, cert):
+            super().cert_verify(conn, url, verify, cert)
+
+    def close(self):
+        # The pool manager is shared with other clients, only proxies are owned
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+        # The same adapter is mounted for several prefixes and closed for each of them
+        if not self._released:
+            self._released = True
+            release_pool_manager(self.poolmanager)
+
+
+def create_session(config=None, max_retries=None) -> requests.Session:
+    """Creates a requests session, sharing connections with other sessions.
+
+    Args:
+        config: ClientConfig, optional, the client config with the pool options.
+        max_retries: int or urllib3.Retry, optional, retries for the session's requests.
+    """
+    session = requests.Session()
+    max_retries = max_retries if max_retries is not None else 0
+    if getattr(config, "connection_pool_shared", None) is not False:
+        adapter = SharedPoolAdapter(config=config, max_retries=max_retries)
+    else:
+        pool_options = get_pool_options(config)
+        adapter = HTTPAdapter(
+            pool_connections=pool_options["num_pools"],
+            pool_maxsize=pool_options["maxsize"],
+            max_retries=max_retries,
+        )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -1,8 +1,7 @@
-import requests
-from requests.adapters import HTTPAdapter
-
 from urllib3 import Retry
 
+from polyaxon._client.transport.pool_manager import create_session
+
 
 class RetryTransportMixin:
     """Threads operations transport."""
@@ -10,7 +9,6 @@ class RetryTransportMixin:
     @property
     def retry_session(self):
         if not hasattr(self, "_retry_session"):
-            self._retry_session = requests.Session()
             retry = Retry(
                 total=3,
                 read=3,
@@ -18,9 +16,9 @@ class RetryTransportMixin:
                 backoff_factor=2,
                 status_forcelist=[429, 500, 502, 503, 504],
             )
-            adapter = HTTPAdapter(max_retries=retry)
-            self._retry_session.mount("http://", adapter)
-            self._retry_session.mount("https://", adapter)
+            self._retry_session = create_session(
+                config=getattr(self, "config", None), max_retries=retry
+            )
             self._threaded_done = 0
             self._threaded_exceptions = 0
             self._periodic_http_done = 0
@@ -1,11 +1,25 @@
+import os
+
 from polyaxon import settings
 from polyaxon._client.transport.retry_transport import RetryTransportMixin
-from polyaxon._client.workers.queue_worker import QueueWorker
+from polyaxon._client.workers.batch_worker import BatchWorker
+from polyaxon._contexts import paths as ctx_paths
+from polyaxon._env_vars.getters import get_run_info
+from polyaxon._schemas.client import QueuePolicy
+from polyaxon._schemas.lifecycle import V1ProjectFeature
+from polyaxon.exceptions import PolyaxonClientException
 from polyaxon.logger import logger
 
 
 class ThreadedTransportMixin(RetryTransportMixin):
-    """Threads operations transport."""
+    """Threads operations transport.
+
+    The async requests are batched by the transport's worker,
+    requests sharing a `group` are sent in order, by default the requests to a url share a group.
+
+    > **Note**: `RunClient` queues its async updates, e.g. `log_outputs`,
+    > in the worker of its transport, one group per run.
+    """
 
     @property
     def threaded_done(self):
@@ -20,6 +34,9 @@ class ThreadedTransportMixin(RetryTransportMixin):
         return None
 
     def queue_request(self, request, url, **kwargs):
+        if isinstance(request, str):
+            # Requests are queued by name to allow spilling them to disk
+            request = getattr(self, request)
         try:
             request(url=url, session=self.retry_session, **kwargs)
         except Exception as e:
@@ -33,10 +50,35 @@ class ThreadedTransportMixin(RetryTransportMixin):
         finally:
             self._threaded_done += 1
 
+    def get_worker_spill_path(self):
+        try:
+            _, _, run_uuid = get_run_info()
+            path = ctx_paths.get_offline_path(
+                entity_value=run_uuid, entity_kind=V1ProjectFeature.RUNTIME
+            )
+        except PolyaxonClientException:
+            path = ctx_paths.get_offline_base_path(entity_kind=V1ProjectFeature.RUNTIME)
+        return os.path.join(
+            path, ctx_paths.CONTEXT_LOCAL_QUEUE_SPILL_FORMAT.format(os.getpid())
+        )
+
     @property
     def worker(self):
         if not hasattr(self, "_worker") or not self._worker.is_alive():
-            self._worker = QueueWorker(timeout=settings.CLIENT_CONFIG.timeout)
+            queue_policy = settings.CLIENT_CONFIG.worker_queue_policy
+            spill_path = None
+            if queue_policy == QueuePolicy.SPILL:
+                spill_path = self.get_worker_spill_path()
+            self._worker = BatchWorker(
+                timeout=settings.CLIENT_CONFIG.timeout,
+                queue_size=settings.CLIENT_CONFIG.worker_queue_size,
+                queue_policy=queue_policy,
+                spill_path=spill_path,
+                spill_callback=self.queue_request,
+                batch_size=settings.CLIENT_CONFIG.worker_batch_size,
+                batch_interval=settings.CLIENT_CONFIG.worker_batch_interval,
+                num_threads=settings.CLIENT_CONFIG.worker_threads,
+            )
             self._worker.start()
         return self._worker
 
@@ -49,11 +91,15 @@ class ThreadedTransportMixin(RetryTransportMixin):
         json_data=None,
         timeout=None,
         headers=None,
+        group=None,
     ):
         """Async Call request with a post."""
-        return self.worker.queue(
+        return self.worker.queue_batch(
+            group if group is not None else url,
+            url,
+            False,
             self.queue_request,
-            request=self.post,
+            request="post",
             url=url,
             params=params,
             data=data,
@@ -72,11 +118,18 @@ class ThreadedTransportMixin(RetryTransportMixin):
         json_data=None,
         timeout=None,
         headers=None,
+        group=None,
     ):
-        """Async Call request with a patch."""
-        return self.worker.queue(
+        """Async Call request with a patch.
+
+        Consecutive patches to the same url in a group are merged before being sent.
+        """
+        return self.worker.queue_batch(
+            group if group is not None else url,
+            url,
+            True,
             self.queue_request,
-            request=self.patch,
+            request="patch",
             url=url,
             params=params,
             data=data,
@@ -95,11 +148,15 @@ class ThreadedTransportMixin(RetryTransportMixin):
         json_data=None,
         timeout=None,
         headers=None,
+        group=None,
     ):
         """Async Call request with a delete."""
-        return self.worker.queue(
+        return self.worker.queue_batch(
+            group if group is not None else url,
+            url,
+            False,
             self.queue_request,
-            request=self.delete,
+            request="delete",
             url=url,
             params=params,
             data=data,
@@ -118,11 +175,15 @@ class ThreadedTransportMixin(RetryTransportMixin):
         json_data=None,
         timeout=None,
         headers=None,
+        group=None,
     ):
         """Async Call request with a put."""
-        return self.worker.queue(
+        return self.worker.queue_batch(
+            group if group is not None else url,
+            url,
+            False,
             self.queue_request,
-            request=self.put,
+            request="put",
             url=url,
             params=params,
             data=data,
@@ -141,10 +202,14 @@ class ThreadedTransportMixin(RetryTransportMixin):
         json_data=None,
         timeout=3600,
         headers=None,
+        group=None,
     ):
-        return self.worker.queue(
+        return self.worker.queue_batch(
+            group if group is not None else url,
+            url,
+            False,
             self.queue_request,
-            request=self.upload,
+            request="upload",
             url=url,
             files=files,
             files_size=files_size,
@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from queue import Empty
+from time import sleep, time
+
+from polyaxon._client.workers.queue_worker import QueueWorker
+from polyaxon.logger import logger
+
+
+class BatchWorker(QueueWorker):
+    """Queue worker that coalesces pending requests before sending them.
+
+    Records are collected into a batch until `batch_size` records are pending,
+    or the oldest record is older than `batch_interval`,
+    by default the batch is flushed as soon as the queue is drained.
+    Requests sharing a group (e.g. the requests of a run) are sent in order,
+    consecutive mergeable requests to the same key (e.g. patches to the same url)
+    are merged into a single request, last write wins per key.
+    Requests of different groups are sent concurrently using a pool of `num_threads`,
+    and batches are flushed one after the other.
+    """
+
+    BATCH_SIZE = 100
+    BATCH_INTERVAL = 0
+    NUM_THREADS = 4
+    NAME = "polyaxon.BatchWorker"
+
+    def __init__(
+        self,
+        timeout=None,
+        queue_size=None,
+        queue_policy=None,
+        spill_path=None,
+        spill_callback=None,
+        batch_size=None,
+        batch_interval=None,
+        num_threads=None,
+    ):
+        super().__init__(
+            timeout=timeout,
+            queue_size=queue_size,
+            queue_policy=queue_policy,
+            spill_path=spill_path,
+            spill_callback=spill_callback,
+        )
+        self._batch_size = batch_size or self.BATCH_SIZE
+        self._batch_interval = (
+            batch_interval if batch_interval is not None else self.BATCH_INTERVAL
+        )
+        self._num_threads = num_threads or self.NUM_THREADS
+
+    def queue(self, callback, *args, **kwargs):
+        self.queue_batch(None, None, False, callback, *args, **kwargs)
+
+    def queue_batch(self, group, key, mergeable, callback, *args, **kwargs):
+        self.is_running()
+        self._put((callback, args, kwargs, group, key, mergeable))
+
+    @staticmethod
+    def _merge_json_data(current, new):
+        if not isinstance(current, dict) or not isinstance(new, dict):
+            return None
+        # Merge and reset patches can't be combined
+        if current.get("merge") != new.get("merge"):
+            return None
+        merged = dict(current)
+        for k, v in new.items():
+            if not current.get("merge"):
+                merged[k] = v
+            elif isinstance(v, dict) and isinstance(merged.get(k), dict):
+                merged[k] = {**merged[k], **v}
+            elif isinstance(v, list) and isinstance(merged.get(k), list):
+                # e.g. tags, merged values are appended
+                merged[k] = merged[k] + [i for i in v if i not in merged[k]]
+            else:
+                merged[k] = v
+        return merged
+
+    def _merge_record(self, current, record):
+        callback, args, kwargs, _, key, mergeable = record
+        if not (mergeable and current[4] and key == current[3]):
+            return False
+        current_callback, current_args, current_kwargs = current[:3]
+        other_kwargs = {k: v for k, v in kwargs.items() if k != "json_data"}
+        current_other_kwargs = {
+            k: v for k, v in current_kwargs.items() if k != "json_data"
+        }
+        if (
+            current_callback != callback
+            or current_args != args
+            or current_other_kwargs != other_kwargs
+        ):
+            return False
+        json_data = self._merge_json_data(
+            current_kwargs.get("json_data"), kwargs.get("json_data")
+        )
+        if json_data is None:
+            return False
+        current_kwargs["json_data"] = json_data
+        return True
+
+    def _coalesce(self, records):
+        """Returns chains of requests, requests sharing a group are kept in order."""
+        chains = {}
+        for record in records:
+            callback, args, kwargs, group, key, mergeable = record
+            chain = chains.setdefault(group, [])
+            if key is not None and chain and self._merge_record(chain[-1], record):
+                continue
+            chain.append((callback, args, dict(kwargs), key, mergeable))
+
+        return [
+            [(callback, args, kwargs) for callback, args, kwargs, _, _ in chain]
+            for chain in chains.values()
+        ]
+
+    def _call_chain(self, chain):
+        for callback, args, kwargs in chain:
+            try:
+                callback(*args, **kwargs)
+            except Exception:
+                logger.error("Failed processing job", exc_info=True)
+
+    def _flush(self, executor, records):
+        if not records:
+            return
+        chains = self._coalesce(records)
+        if len(chains) == 1 or self._num_threads == 1:
+            for chain in chains:
+                self._call_chain(chain)
+            return
+        wait([executor.submit(self._call_chain, chain) for chain in chains])
+
+    def _get_batch(self):
+        batch = [self._get()]
+        if batch[0] is self.END_EVENT:
+            return batch
+        started_at = time()
+        while len(batch) < self._batch_size:
+            timeout = started_at + self._batch_interval - time()
+            if self._batch_interval and timeout <= 0:
+                break
+            try:
+                record = self._queue.get(timeout=max(timeout, 0))
+            except Empty:
+                break
+            batch.append(record)
+            if record is self.END_EVENT:
+                break
+        return batch
+
+    def _target(self):
+        executor = ThreadPoolExecutor(
+            max_workers=self._num_threads, thread_name_prefix=self.NAME
+        )
+        try:
+            while True:
+                batch = self._get_batch()
+                try:
+                    self._flush(executor, [r for r in batch if r is not self.END_EVENT])
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+                if batch[-1] is self.END_EVENT:
+                    self._replay_spilled()
+                    break
+
+                sleep(0)
+        finally:
+            executor.shutdown(wait=True)
@@ -1,9 +1,13 @@
 import os
-from queue import Queue
+from queue import Empty, Full, Queue
+import threading
 from time import sleep, time
 
+from clipped.utils.json import orjson_dumps, orjson_loads
+from clipped.utils.paths import check_or_create_path
 from polyaxon import settings
 from polyaxon._client.workers.base_worker import BaseWorker
+from polyaxon._schemas.client import QueuePolicy
 from polyaxon.logger import logger
 
 
@@ -13,40 +17,172 @@ class QueueWorker(BaseWorker):
     END_EVENT = object()
     NAME = "polyaxon.QueueWorker"
 
-    def __init__(self, timeout=None, queue_size=None):
+    def __init__(
+        self,
+        timeout=None,
+        queue_size=None,
+        queue_policy=None,
+        spill_path=None,
+        spill_callback=None,
+    ):
         super().__init__()
         self._queue = Queue(queue_size or self.QUEUE_SIZE)
         self._timeout = (
             timeout if timeout is not None else settings.CLIENT_CONFIG.timeout
         )
+        self._queue_policy = queue_policy or QueuePolicy.BLOCK
+        if self._queue_policy not in QueuePolicy.to_set():
+            raise ValueError(
+                "Worker `{}` received an unsupported queue policy `{}`.".format(
+                    self.NAME, self._queue_policy
+                )
+            )
+        if self._queue_policy == QueuePolicy.SPILL and not (
+            spill_path and spill_callback
+        ):
+            raise ValueError(
+                "Worker `{}` requires a spill path and a spill callback "
+                "to use the spill policy.".format(self.NAME)
+            )
+        self._spill_path = spill_path
+        self._spill_callback = spill_callback
+        # Guards the non blocking policies, their counters, and the spill file
+        self._put_lock = threading.Lock()
+        self._spill_pending = False
+        self._dropped = 0
+        self._spilled = 0
 
-    def atexit(self):
-        with self._lock:
-            if not self.is_alive():
+    @property
+    def dropped(self):
+        return self._dropped
+
+    @property
+    def spilled(self):
+        return self._spilled
+
+    def _put(self, record):
+        """Puts a record in the queue, applying the queue policy when it's full."""
+        if self._queue_policy == QueuePolicy.BLOCK:
+            self._queue.put(record)
+            return
+
+        with self._put_lock:
+            if self._queue_policy == QueuePolicy.DROP_OLDEST:
+                self._put_drop_oldest(record)
+                return
+
+            if self._spill_pending:
+                # Keep spilling until the spilled records are replayed to keep the order
+                self._spill(record)
+                return
+
+            try:
+                self._queue.put_nowait(record)
+            except Full:
+                if self._queue_policy == QueuePolicy.SPILL:
+                    self._spill(record)
+                else:
+                    self._dropped += 1
+
+    def _put_drop_oldest(self, record):
+        while True:
+            try:
+                self._queue.put_nowait(record)
+                return
+            except Full:
+                pass
+            try:
+                oldest = self._queue.get_nowait()
+            except Empty:
+                continue
+            self._queue.task_done()
+            self._dropped += 1
+            if oldest is self.END_EVENT:
+                # Never drop the end event, drop the new record instead
+                self._queue.put(oldest)
                 return
 
-            self._queue.put_nowait(self.END_EVENT)
+    def _spill(self, record):
+        callback, args, kwargs = record[:3]
+        if callback != self._spill_callback:
+            self._dropped += 1
+            return
+        try:
+            line = orjson_dumps({"args": args, "kwargs": kwargs})
+        except TypeError:
+            logger.debug("Could not spill a record, it's not serializable.")
+            self._dropped += 1
+            return
+        check_or_create_path(self._spill_path, is_dir=False)
+        with open(self._spill_path, "a") as spill_file:
+            spill_file.write(line + "\n")
+        self._spilled += 1
+        self._spill_pending = True
 
-            def timeout_join(timeout, queue):
-                end = time() + timeout
-                queue.all_tasks_done.acquire()
+    def _replay_spilled(self):
+        """Replays the spilled records, called by the worker once the queue is drained.
+
+        The records put after the spilled ones are only queued again after
+        the spill file is moved, so they are processed after the replay.
+        """
+        with self._put_lock:
+            if not self._spill_pending:
+                return
+            replay_path = "{}.replay".format(self._spill_path)
+            os.replace(self._spill_path, replay_path)
+            self._spill_pending = False
+        with open(replay_path, "r") as spill_file:
+            for line in spill_file:
+                if not line.strip():
+                    continue
                 try:
-                    while queue.unfinished_tasks:
-                        current_timeout = end - time()
-                        if current_timeout <= 0:
-                            # timed out
-                            return False
+                    record = orjson_loads(line)
+                    self._spill_callback(*record["args"], **record["kwargs"])
+                except Exception:
+                    logger.error("Failed processing spilled job", exc_info=True)
+        os.remove(replay_path)
+
+    def _get(self):
+        """Gets the next record, replaying the spilled ones once the queue is drained."""
+        while True:
+            if not self._spill_pending:
+                return self._queue.get()
+            try:
+                return self._queue.get_nowait()
+            except Empty:
+                self._replay_spilled()
 
-                        queue.all_tasks_done.wait(timeout=current_timeout)
+    def _put_end_event(self, timeout=None) -> bool:
+        try:
+            self._queue.put(self.END_EVENT, timeout=timeout or self._timeout)
+            return True
+        except Full:
+            logger.debug("Worker `%s` could not queue the end event.", self.NAME)
+            return False
 
-                    return True
+    def wait(self, timeout=None) -> bool:
+        """Waits until the queued records are processed, returns `False` on timeout."""
+        timeout = timeout if timeout is not None else self._timeout
+        end = time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                current_timeout = end - time()
+                if current_timeout <= 0:
+                    # timed out
+                    return False
+                self._queue.all_tasks_done.wait(timeout=current_timeout)
+            return True
+
+    def atexit(self):
+        with self._lock:
+            if not self.is_alive():
+                return
 
-                finally:
-                    queue.all_tasks_done.release()
+            self._put_end_event()
 
             # ensure wait
             timeout = min(settings.MIN_TIMEOUT, self._timeout / self.TIMEOUT_ATTEMPTS)
-            if timeout_join(timeout=timeout, queue=self._queue):
+            if self.wait(timeout=timeout):
                 timeout = 0
             else:
                 # Queue still has message, try another time
@@ -64,7 +200,7 @@ class QueueWorker(BaseWorker):
                         print("Press Ctrl-C to quit")
 
             sleep(settings.MIN_TIMEOUT)  # Allow tasks to get executed
-            while timeout > 0 and not timeout_join(timeout=timeout, queue=self._queue):
+            while timeout > 0 and not self.wait(timeout=timeout):
                 timeout = min(
                     timeout + self._timeout / self.TIMEOUT_ATTEMPTS,
                     self._timeout - timeout,
@@ -77,25 +213,37 @@ class QueueWorker(BaseWorker):
                     % (self.NAME, size)
                 )
 
+            if self._spill_pending:
+                print(
+                    "Polyaxon %s did not manage to replay the messages spilled to %s"
+                    % (self.NAME, self._spill_path)
+                )
+            if self._dropped > 0:
+                print(
+                    "Polyaxon %s dropped %i messages because its queue was full"
+                    % (self.NAME, self._dropped)
+                )
+
             self._thread = None
 
     def stop(self, timeout=None):
         with self._lock:
             if self._thread:
-                self._queue.put_nowait(self.END_EVENT)
+                self._put_end_event(timeout=timeout)
                 self._thread.join(timeout=timeout)
                 self._thread = None
                 self._thread_for_pid = None
 
     def queue(self, callback, *args, **kwargs):
         self.is_running()
-        self._queue.put_nowait((callback, args, kwargs))
+        self._put((callback, args, kwargs))
 
     def _target(self):
         while True:
-            record = self._queue.get()
+            record = self._get()
             try:
                 if record is self.END_EVENT:
+                    self._replay_spilled()
                     break
                 callback, args, kwargs = record
                 try:
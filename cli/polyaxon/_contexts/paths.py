@@ -21,6 +21,10 @@ CONTEXT_LOCAL_POLYAXONFILE = "polyaxonfile.plx.json"
 CONTEXT_LOCAL_PROJECT = "project.plx.json"
 CONTEXT_LOCAL_RUN = "run.plx.json"
 CONTEXT_LOCAL_VERSION = "version.plx.json"
+CONTEXT_LOCAL_QUEUE_SPILL_FORMAT = "queue-{}.plx.jsonl"
+CONTEXT_LOCAL_JOURNAL = "journal.plx.jsonl"
+CONTEXT_LOCAL_UPLOAD_STATE_FORMAT = "upload-{}.plx.json"
+CONTEXT_LOCAL_ARTIFACTS_MANIFEST_FORMAT = "manifest-{}.plx.json"
 
 CONTEXT_ROOT = os.environ.get(ENV_KEYS_CONTEXT_ROOT, "/plx-context")
 CONTEXT_MOUNT_CONFIGS = "{}/.configs".format(CONTEXT_ROOT)
@@ -30,6 +30,8 @@ ENV_KEYS_CERT_FILE = "POLYAXON_CERT_FILE"
 ENV_KEYS_KEY_FILE = "POLYAXON_KEY_FILE"
 ENV_KEYS_ASSERT_HOSTNAME = "POLYAXON_ASSERT_HOSTNAME"
 ENV_KEYS_CONNECTION_POOL_MAXSIZE = "POLYAXON_CONNECTION_POOL_MAXSIZE"
+ENV_KEYS_CONNECTION_POOLS = "POLYAXON_CONNECTION_POOLS"
+ENV_KEYS_CONNECTION_POOL_SHARED = "POLYAXON_CONNECTION_POOL_SHARED"
 ENV_KEYS_LOGS_ROOT = "POLYAXON_LOG_ROOT"
 ENV_KEYS_ARCHIVES_ROOT = "POLYAXON_ARCHIVES_ROOT"
 ENV_KEYS_ARTIFACTS_ROOT = "POLYAXON_ARTIFACTS_ROOT"
@@ -40,8 +42,21 @@ ENV_KEYS_DISABLE_ERRORS_REPORTING = "POLYAXON_DISABLE_ERRORS_REPORTING"
 ENV_KEYS_INTERVALS_COMPATIBILITY_CHECK = "POLYAXON_INTERVALS_COMPATIBILITY_CHECK"
 ENV_KEYS_RETRIES = "POLYAXON_RETRIES"
 ENV_KEYS_UPLOAD_SIZE = "POLYAXON_UPLOAD_SIZE"
+ENV_KEYS_UPLOAD_PART_SIZE = "POLYAXON_UPLOAD_PART_SIZE"
+ENV_KEYS_UPLOAD_THREADS = "POLYAXON_UPLOAD_THREADS"
+ENV_KEYS_DOWNLOAD_SEGMENT_SIZE = "POLYAXON_DOWNLOAD_SEGMENT_SIZE"
+ENV_KEYS_DOWNLOAD_THREADS = "POLYAXON_DOWNLOAD_THREADS"
+ENV_KEYS_ARTIFACTS_CACHE_PATH = "POLYAXON_ARTIFACTS_CACHE_PATH"
+ENV_KEYS_ARTIFACTS_CACHE_SIZE = "POLYAXON_ARTIFACTS_CACHE_SIZE"
+ENV_KEYS_ARTIFACTS_CACHE_HARDLINKS = "POLYAXON_ARTIFACTS_CACHE_HARDLINKS"
 ENV_KEYS_MAX_CONCURRENCY = "POLYAXON_MAX_CONCURRENCY"
 ENV_KEYS_HAS_PROCESS_SIDECAR = "POLYAXON_HAS_PROCESS_SIDECAR"
+ENV_KEYS_WORKER_BATCH_SIZE = "POLYAXON_WORKER_BATCH_SIZE"
+ENV_KEYS_WORKER_BATCH_INTERVAL = "POLYAXON_WORKER_BATCH_INTERVAL"
+ENV_KEYS_WORKER_THREADS = "POLYAXON_WORKER_THREADS"
+ENV_KEYS_WORKER_QUEUE_SIZE = "POLYAXON_WORKER_QUEUE_SIZE"
+ENV_KEYS_WORKER_QUEUE_POLICY = "POLYAXON_WORKER_QUEUE_POLICY"
+ENV_KEYS_RUN_JOURNAL = "POLYAXON_RUN_JOURNAL"
 
 # Secrets
 ENV_KEYS_SECRET_KEY = "POLYAXON_SECRET_KEY"  # noqa
@@ -85,7 +100,11 @@ ENV_KEYS_AGENT_SECRET_NAME = "POLYAXON_AGENT_SECRET_NAME"  # noqa
 ENV_KEYS_AGENT_RUNS_SA = "POLYAXON_AGENT_RUNS_SA"
 ENV_KEYS_AGENT_ENABLE_HEALTH_CHECKS = "POLYAXON_AGENT_ENABLE_HEALTH_CHECKS"
 ENV_KEYS_AGENT_EXECUTOR_REFRESH_INTERVAL = "POLYAXON_AGENT_EXECUTOR_REFRESH_INTERVAL"
+ENV_KEYS_AGENT_MAX_CONCURRENCY = "POLYAXON_AGENT_MAX_CONCURRENCY"
+ENV_KEYS_AGENT_CONVERSION_POOL = "POLYAXON_AGENT_CONVERSION_POOL"
+ENV_KEYS_AGENT_CONVERSION_WORKERS = "POLYAXON_AGENT_CONVERSION_WORKERS"
 ENV_KEYS_AGENT_USE_PROXY_ENV_VARS_IN_OPS = "POLYAXON_AGENT_USE_PROXY_ENV_VARS_IN_OPS"
+ENV_KEYS_AGENT_PARTIAL_RECONCILE = "POLYAXON_AGENT_PARTIAL_RECONCILE"
 
 # Connections
 ENV_KEYS_COLLECT_ARTIFACTS = "POLYAXON_COLLECT_ARTIFACTS"
@@ -93,6 +112,7 @@ ENV_KEYS_COLLECT_RESOURCES = "POLYAXON_COLLECT_RESOURCES"
 ENV_KEYS_ARTIFACTS_STORE_NAME = "POLYAXON_ARTIFACTS_STORE_NAME"
 ENV_KEYS_GIT_CREDENTIALS = "POLYAXON_GIT_CREDENTIALS"
 ENV_KEYS_GIT_CREDENTIALS_STORE = "POLYAXON_GIT_CREDENTIALS_STORE"
+ENV_KEYS_GIT_CACHE_PATH = "POLYAXON_GIT_CACHE_PATH"
 ENV_KEYS_SSH_PATH = "POLYAXON_SSH_PATH"
 ENV_KEYS_SSH_PRIVATE_KEY = "POLYAXON_SSH_PRIVATE_KEY"
 
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 from typing import Any, Dict, List, Optional, Union
 
 import aiofiles
@@ -245,6 +247,108 @@ async def download_dir(
         return None
 
 
+DOWNLOAD_MAX_CONCURRENCY = 16
+DOWNLOAD_PART_SIZE = 32 * 1024 * 1024
+
+
+def _write_part(lpath: str, start: int, data: bytes):
+    with open(lpath, "r+b") as f:
+        f.seek(start)
+        f.write(data)
+
+
+async def _download_file_parts(
+    fs: FSSystem,
+    rpath: str,
+    lpath: str,
+    size: int,
+    part_size: int,
+    semaphore: asyncio.Semaphore,
+):
+    with open(lpath, "wb") as f:
+        f.truncate(size)
+
+    async def download_part(start: int):
+        async with semaphore:
+            data = await fs._cat_file(
+                rpath, start=start, end=min(start + part_size, size)
+            )
+        await run_sync(_write_part, lpath, start, data)
+
+    await asyncio.gather(*[download_part(start) for start in range(0, size, part_size)])
+
+
+async def download_paths(
+    fs: FSSystem,
+    path_from: str,
+    path_to: str,
+    is_file: bool,
+    check_path: bool,
+    max_concurrency: Optional[int] = None,
+    part_size: Optional[int] = None,
+) -> Dict:
+    """Downloads a file or the files of a directory concurrently.
+
+    Files larger than `part_size` are downloaded with concurrent byte-range requests
+    if the filesystem is async.
+
+    Returns:
+        The number of files, the size in bytes, and the duration in seconds.
+    """
+    started_at = time.monotonic()
+    is_async = getattr(fs, "async_impl", False)
+    part_size = part_size or DOWNLOAD_PART_SIZE
+    if check_path:
+        is_file = await ensure_async_execution(
+            fs=fs, fct="isfile", is_async=is_async, path=path_from
+        )
+    if is_file:
+        info = await ensure_async_execution(
+            fs=fs, fct="info", is_async=is_async, path=path_from
+        )
+        files = [(path_from, path_to, info.get("size") or 0)]
+    else:
+        check_or_create_path(path_to, is_dir=True)
+        listing = await ensure_async_execution(
+            fs=fs, fct="find", is_async=is_async, path=path_from, detail=True
+        )
+        base_path = fs._strip_protocol(path_from).rstrip("/")
+        files = [
+            (
+                rpath,
+                os.path.join(path_to, rpath[len(base_path) :].lstrip("/")),
+                info.get("size") or 0,
+            )
+            for rpath, info in listing.items()
+            if info.get("type") != "directory"
+        ]
+
+    semaphore = asyncio.Semaphore(max_concurrency or DOWNLOAD_MAX_CONCURRENCY)
+
+    async def download(rpath: str, lpath: str, size: int):
+        check_or_create_path(lpath, is_dir=False)
+        if is_async and size > part_size:
+            await _download_file_parts(
+                fs=fs,
+                rpath=rpath,
+                lpath=lpath,
+                size=size,
+                part_size=part_size,
+                semaphore=semaphore,
+            )
+            return
+        async with semaphore:
+            # Positional, the sync local filesystem names them `path1` and `path2`
+            await ensure_async_execution(fs, "get_file", is_async, rpath, lpath)
+
+    await asyncio.gather(*[download(*f) for f in files])
+    return {
+        "files": len(files),
+        "size": sum(f[2] for f in files),
+        "duration": time.monotonic() - started_at,
+    }
+
+
 async def download_dirs(
     fs: FSSystem,
     store_path: str,
@@ -0,0 +1,304 @@
+from contextlib import contextmanager
+from functools import partial
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from fsspec import AbstractFileSystem
+
+from clipped.utils.bools import to_bool
+from clipped.utils.paths import check_or_create_path
+from polyaxon._env_vars.keys import (
+    ENV_KEYS_ARTIFACTS_CACHE_HARDLINKS,
+    ENV_KEYS_ARTIFACTS_CACHE_PATH,
+    ENV_KEYS_ARTIFACTS_CACHE_SIZE,
+)
+from polyaxon._fs.manager import download_file_or_dir
+from polyaxon.logger import logger
+
+
+# Linux ioctl cloning a file on filesystems supporting reflinks, e.g. btrfs or xfs
+FICLONE = 0x40049409
+
+
+def _is_linked(f, path: str) -> bool:
+    try:
+        return os.path.samestat(os.fstat(f.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def file_lock(path: str, blocking: bool = True, shared: bool = False) -> Iterator[bool]:
+    """Locks a file shared by several processes, yields `False` if not acquired.
+
+    The holder of the exclusive lock can remove the lock file,
+    processes waiting on the removed file lock the new file instead.
+    """
+    import fcntl
+
+    flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+    if not blocking:
+        flags |= fcntl.LOCK_NB
+    while True:
+        with open(path, "a") as f:
+            try:
+                fcntl.flock(f, flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                if not _is_linked(f, path):
+                    continue
+                yield True
+                return
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class ArtifactsCache:
+    """Content keyed cache of artifacts shared by the runs of a node.
+
+    An entry is keyed by the connection, the path, and the remote metadata
+    (size, etag or modification time) of every file, so it's invalidated
+    if the remote content changes.
+    Entries are filled once, under an exclusive lock file,
+    and materialized in each run with writable copies,
+    cloned without copying the data on filesystems supporting reflinks.
+    The least recently used entries are evicted above `max_size`.
+
+    With `hardlinks`, entries are materialized with hardlinks instead,
+    or copies if the run's path is on a different device.
+    Cached files are read-only, so the runs get read-only inputs,
+    and a run executing as root can still alter the content shared with the other runs.
+
+    Args:
+        path: str, the cache path, e.g. a hostPath or a shared volume.
+        max_size: int, optional, the max size of the cache in bytes.
+        hardlinks: bool, optional, to materialize the entries with hardlinks.
+    """
+
+    MAX_SIZE = 50 * 1024 * 1024 * 1024
+    STALE_FILL_TIME = 24 * 60 * 60
+    VERSION_KEYS = (
+        "ETag",
+        "etag",
+        "md5Hash",
+        "generation",
+        "LastModified",
+        "last_modified",
+        "updated",
+        "mtime",
+    )
+    DATA = "data"
+    META = "meta.json"
+
+    def __init__(
+        self, path: str, max_size: Optional[int] = None, hardlinks: bool = False
+    ):
+        self.path = path
+        self.max_size = max_size or self.MAX_SIZE
+        self.hardlinks = hardlinks
+
+    @classmethod
+    def from_env(cls) -> Optional["ArtifactsCache"]:
+        path = os.environ.get(ENV_KEYS_ARTIFACTS_CACHE_PATH)
+        if not path:
+            return None
+        max_size = os.environ.get(ENV_KEYS_ARTIFACTS_CACHE_SIZE)
+        return cls(
+            path=path,
+            max_size=int(max_size) if max_size else None,
+            hardlinks=to_bool(
+                os.environ.get(ENV_KEYS_ARTIFACTS_CACHE_HARDLINKS, False)
+            ),
+        )
+
+    @classmethod
+    def _get_version(cls, info: Dict) -> Optional[str]:
+        for key in cls.VERSION_KEYS:
+            if info.get(key) is not None:
+                return str(info[key])
+        return None
+
+    def get_key(
+        self,
+        fs: AbstractFileSystem,
+        connection_name: str,
+        path_from: str,
+        is_file: bool,
+    ) -> str:
+        if is_file:
+            files = {path_from: fs.info(path_from)}
+        else:
+            files = fs.find(path_from, detail=True)
+        content = [
+            (name, info.get("size"), self._get_version(info))
+            for name, info in sorted(files.items())
+        ]
+        data = json.dumps(
+            [fs.protocol, connection_name, path_from, is_file, content], default=str
+        )
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def _lock(self, key: str, blocking: bool = True):
+        return file_lock(self._get_entry_path(key) + ".lock", blocking=blocking)
+
+    def _fill(
+        self, key: str, path_from: str, is_file: bool, downloader: Callable
+    ) -> int:
+        entry_path = self._get_entry_path(key)
+        fill_path = "{}.fill{}".format(entry_path, os.getpid())
+        shutil.rmtree(fill_path, ignore_errors=True)
+        data_path = os.path.join(fill_path, self.DATA)
+        downloader(
+            path_from=path_from, path_to=data_path, is_file=is_file, check_path=False
+        )
+        size = 0
+        for file_path in _walk_files(data_path):
+            size += os.path.getsize(file_path)
+            os.chmod(file_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        with open(os.path.join(fill_path, self.META), "w") as f:
+            json.dump({"path": path_from, "is_file": is_file, "size": size}, f)
+        # An incomplete entry, without metadata, might be left by a failed fill
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.rename(fill_path, entry_path)
+        return size
+
+    @staticmethod
+    def _link(src: str, dst: str):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    @staticmethod
+    def _copy(src: str, dst: str):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                import fcntl
+
+                # Reflink, the copy shares the data until one of them is modified
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except (ImportError, OSError):
+                pass
+            shutil.copyfileobj(fsrc, fdst)
+
+    def _materialize_file(self, src: str, dst: str):
+        if os.path.lexists(dst):
+            os.remove(dst)
+        if self.hardlinks:
+            self._link(src, dst)
+        else:
+            self._copy(src, dst)
+
+    def _materialize(self, key: str, path_to: str, is_file: bool):
+        data_path = os.path.join(self._get_entry_path(key), self.DATA)
+        if is_file:
+            check_or_create_path(path_to, is_dir=False)
+            self._materialize_file(data_path, path_to)
+            return
+        check_or_create_path(path_to, is_dir=True)
+        for file_path in _walk_files(data_path):
+            dst = os.path.join(path_to, os.path.relpath(file_path, data_path))
+            check_or_create_path(dst, is_dir=False)
+            self._materialize_file(file_path, dst)
+
+    def download(
+        self,
+        fs: AbstractFileSystem,
+        connection_name: str,
+        path_from: str,
+        path_to: str,
+        is_file: bool,
+        check_path: bool,
+        downloader: Optional[Callable] = None,
+    ) -> bool:
+        """Downloads the artifacts through the cache.
+
+        `downloader` fills the missing entries,
+        defaults to `download_file_or_dir` with the filesystem.
+
+        Returns `False` if the cache could not be used.
+        """
+        downloader = downloader or partial(download_file_or_dir, fs=fs)
+        try:
+            if check_path:
+                is_file = fs.isfile(path_from)
+            key = self.get_key(
+                fs=fs,
+                connection_name=connection_name,
+                path_from=path_from,
+                is_file=is_file,
+            )
+            os.makedirs(self.path, exist_ok=True)
+            with self._lock(key):
+                meta_path = os.path.join(self._get_entry_path(key), self.META)
+                if os.path.exists(meta_path):
+                    logger.debug("Artifacts cache hit for path: {}".format(path_from))
+                    os.utime(meta_path)
+                else:
+                    self._fill(
+                        key=key,
+                        path_from=path_from,
+                        is_file=is_file,
+                        downloader=downloader,
+                    )
+                self._materialize(key=key, path_to=path_to, is_file=is_file)
+        except Exception as e:
+            logger.warning(
+                "Artifacts cache failed for path: {}.\nError: {}".format(path_from, e)
+            )
+            return False
+        try:
+            self.evict()
+        except Exception as e:
+            logger.warning("Artifacts cache eviction failed.\nError: {}".format(e))
+        return True
+
+    def _get_entries(self) -> List[Tuple[float, str, int]]:
+        entries = []
+        for name in os.listdir(self.path):
+            entry_path = self._get_entry_path(name)
+            meta_path = os.path.join(entry_path, self.META)
+            if os.path.isfile(meta_path):
+                with open(meta_path) as f:
+                    size = json.load(f).get("size") or 0
+                entries.append((os.path.getmtime(meta_path), name, size))
+            elif (
+                ".fill" in name
+                and time.time() - os.path.getmtime(entry_path) > self.STALE_FILL_TIME
+            ):
+                shutil.rmtree(entry_path, ignore_errors=True)
+        return entries
+
+    def evict(self):
+        """Evicts the least recently used entries not in use above the max size."""
+        entries = self._get_entries()
+        total_size = sum(entry[2] for entry in entries)
+        for _, key, size in sorted(entries):
+            if total_size <= self.max_size:
+                return
+            with self._lock(key, blocking=False) as locked:
+                if not locked:
+                    continue
+                # Materialized hardlinks are kept by the runs
+                shutil.rmtree(self._get_entry_path(key), ignore_errors=True)
+            total_size -= size
+
+
+def _walk_files(path: str) -> Iterator[str]:
+    if os.path.isfile(path):
+        yield path
+        return
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            yield os.path.join(root, file_name)
@@ -0,0 +1,204 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Set
+
+from clipped.utils.lists import to_list
+from polyaxon.logger import logger
+
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+_EVENT = struct.Struct("iIII")
+
+
+def _get_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        # Only available on linux
+        libc.inotify_init1  # noqa
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class PathsMonitor:
+    """Collects the paths changed under watched directories using inotify.
+
+    A path returned by `get_changes` is either a file or a directory
+    that was created, modified, moved, or deleted since the previous call.
+    `get_changes` returns `None` when the changes are unknown,
+    e.g. the path is watched for the first time, or the events queue overflowed,
+    and the caller should fallback to a full scan of the path.
+
+    If inotify is not available, or the watches limit is reached,
+    the monitor is disabled and `get_changes` always returns `None`.
+
+    Args:
+        exclude: List[str], optional, names of directories to ignore.
+    """
+
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, exclude: Optional[List[str]] = None):
+        self._exclude = set(to_list(exclude, check_none=True))
+        self._lock = threading.Lock()
+        self._wds: Dict[int, str] = {}
+        self._roots: Set[str] = set()
+        self._rescan: Set[str] = set()
+        self._changes: Set[str] = set()
+        self._fd = None
+        self._libc = _get_libc()
+        if self._libc is None:
+            logger.debug("inotify is not available, using full scans.")
+            return
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            logger.debug(
+                "Could not initialize inotify, using full scans: %s",
+                os.strerror(ctypes.get_errno()),
+            )
+            return
+        self._fd = fd
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._fd is not None
+
+    def _is_excluded(self, path: str) -> bool:
+        return bool(self._exclude) and bool(
+            self._exclude.intersection(path.split(os.sep))
+        )
+
+    def _add_watch(self, path: str) -> bool:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if not os.path.isdir(path):
+                # Removed in the meantime
+                return True
+            logger.warning(
+                "Could not watch %s, using full scans: %s", path, os.strerror(error)
+            )
+            self.close()
+            return False
+        self._wds[wd] = path
+        return True
+
+    def _add_watches(self, path: str) -> bool:
+        for root, dirs, _ in os.walk(path, topdown=True):
+            dirs[:] = [d for d in dirs if d not in self._exclude]
+            if not self._add_watch(root):
+                return False
+        return True
+
+    def watch(self, path: str):
+        """Starts watching a path, the first changes of a new path are unknown."""
+        path = os.path.normpath(path)
+        with self._lock:
+            if not self.is_enabled or path in self._roots:
+                return
+            if not os.path.isdir(path):
+                return
+            if self._add_watches(path):
+                self._roots.add(path)
+                self._rescan.add(path)
+
+    def _read_events(self):
+        while self.is_enabled:
+            try:
+                data = os.read(self._fd, self.READ_SIZE)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logger.warning("Could not read inotify events: %s", e)
+                self._rescan.update(self._roots)
+                return
+            if not data:
+                return
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                wd, mask, _, name_len = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                self._process_event(wd, mask, os.fsdecode(name))
+
+    def _process_event(self, wd: int, mask: int, name: str):
+        if mask & IN_Q_OVERFLOW:
+            logger.debug("inotify queue overflowed, rescanning all paths.")
+            self._rescan.update(self._roots)
+            return
+        dir_path = self._wds.get(wd)
+        if dir_path is None:
+            return
+        if mask & IN_IGNORED:
+            self._wds.pop(wd, None)
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            self._changes.add(dir_path)
+            return
+        path = os.path.join(dir_path, name) if name else dir_path
+        if self._is_excluded(path):
+            return
+        self._changes.add(path)
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            self._add_watches(path)
+
+    def get_changes(self, path: str) -> Optional[Set[str]]:
+        """Returns the paths changed under a path since the last call."""
+        path = os.path.normpath(path)
+        with self._lock:
+            if not self.is_enabled or path not in self._roots:
+                return None
+            self._read_events()
+            if not self.is_enabled or path in self._rescan:
+                self._rescan.discard(path)
+                self._changes = {
+                    p for p in self._changes if not self._is_under(p, path)
+                }
+                return None
+            changes = {p for p in self._changes if self._is_under(p, path)}
+            self._changes -= changes
+            return changes
+
+    @staticmethod
+    def _is_under(path: str, root: str) -> bool:
+        return path == root or path.startswith(root + os.sep)
+
+    def close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+        self._fd = None
+        self._wds = {}
+        self._roots = set()
+        self._rescan = set()
+        self._changes = set()
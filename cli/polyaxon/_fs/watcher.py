@@ -97,17 +97,87 @@ class FSWatcher(BaseSchemaModel):
             p: PathData.make((d.base, d.ts, self._RM)) for p, d in self.files_mp.items()
         }
 
-    def sync(self, path: str, exclude: Optional[List[str]] = None):
+    def init_changes(self):
+        """Acknowledges the previous operations without resetting all paths.
+
+        Used instead of `init` when only the changed paths are synced.
+        """
+        for mapping in [self.dirs_mp, self.files_mp]:
+            for p, d in mapping.items():
+                if d.op == self._PUT:
+                    mapping[p] = PathData.make((d.base, d.ts, self._NOOP))
+
+    def _init_path(self, path: str, base_path: str):
+        """Marks all known paths under a path for removal, until they are synced."""
+        rel_path = os.path.relpath(path, base_path)
+        for mapping in [self.dirs_mp, self.files_mp]:
+            for p, d in mapping.items():
+                if d.base == base_path and p.startswith(rel_path + os.sep):
+                    mapping[p] = PathData.make((d.base, d.ts, self._RM))
+
+    def sync(
+        self,
+        path: str,
+        exclude: Optional[List[str]] = None,
+        base_path: Optional[str] = None,
+    ):
         files, dirs = get_files_and_dirs_in_path(
             path, exclude=exclude, collect_dirs=True
         )
-        base_path, prefix_path = os.path.split(path)
+        if base_path:
+            prefix_path = ""
+        else:
+            base_path, prefix_path = os.path.split(path)
         for file_path in files:
             self.sync_file(os.path.join(prefix_path, file_path), base_path=base_path)
 
         for dir_path in dirs:
             self.sync_dir(os.path.join(prefix_path, dir_path), base_path=base_path)
 
+    def resync(
+        self,
+        path: str,
+        exclude: Optional[List[str]] = None,
+        base_path: Optional[str] = None,
+    ):
+        """Syncs all files under a path, including the paths removed under it."""
+        base_path = base_path or os.path.split(path)[0]
+        self._init_path(path, base_path=base_path)
+        self.sync(path, exclude=exclude, base_path=base_path)
+
+    def sync_changes(
+        self, path: str, changes: Set[str], exclude: Optional[List[str]] = None
+    ):
+        """Syncs only the changed paths under a path, e.g. reported by inotify."""
+        base_path, _ = os.path.split(path)
+        exclude = set(exclude or [])
+        for changed_path in changes:
+            rel_path = os.path.relpath(changed_path, base_path)
+            if exclude and exclude.intersection(rel_path.split(os.sep)):
+                continue
+            if os.path.isfile(changed_path):
+                self.sync_file(changed_path, base_path=base_path)
+            elif os.path.isdir(changed_path):
+                if changed_path != path:
+                    self.sync_dir(changed_path, base_path=base_path)
+                # A created or moved directory can already have content
+                self.resync(changed_path, exclude=list(exclude), base_path=base_path)
+            else:
+                self._remove_path(rel_path)
+
+    def _remove_path(self, rel_path: str):
+        for mapping in [self.dirs_mp, self.files_mp]:
+            for p, d in mapping.items():
+                if p == rel_path or p.startswith(rel_path + os.sep):
+                    mapping[p] = PathData.make((d.base, d.ts, self._RM))
+
+    def has_changes(self) -> bool:
+        return any(
+            d.op in {self._PUT, self._RM}
+            for mapping in [self.dirs_mp, self.files_mp]
+            for d in mapping.values()
+        )
+
     def _get_mapping_by_op(self, mapping: Dict, op: str) -> Set:
         return {(p.base, k) for k, p in mapping.items() if p.op == op}
 
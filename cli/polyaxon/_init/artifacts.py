@@ -1,7 +1,10 @@
-from typing import TYPE_CHECKING, Union
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Optional, Union
 
 from clipped.formatting import Printer
 from clipped.utils.enums import get_enum_value
+from clipped.utils.units import format_sizeof
 from polyaxon._contexts import paths as ctx_paths
 from polyaxon._fs.watcher import FSWatcher
 from polyaxon.logger import logger
@@ -22,6 +25,51 @@ def sync_file_watcher(path: str):
         )
 
 
+def is_local_fs(fs) -> bool:
+    protocols = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol,)
+    return "file" in protocols
+
+
+def download_artifact_paths(
+    connection_name: str,
+    path_from: str,
+    path_to: str,
+    is_file: bool,
+    check_path: bool,
+    max_concurrency: Optional[int] = None,
+):
+    """Downloads the paths with the async filesystem and concurrent requests."""
+    from polyaxon._connections import CONNECTION_CONFIG
+    from polyaxon._fs.async_manager import download_paths
+    from polyaxon._fs.fs import close_fs, get_async_fs_from_connection
+
+    async def download():
+        connection = CONNECTION_CONFIG.get_connection_for(connection_name)
+        fs = await get_async_fs_from_connection(connection=connection)
+        try:
+            return await download_paths(
+                fs=fs,
+                path_from=path_from,
+                path_to=path_to,
+                is_file=is_file,
+                check_path=check_path,
+                max_concurrency=max_concurrency,
+            )
+        finally:
+            await close_fs(fs)
+
+    stats = asyncio.run(download())
+    duration = max(stats["duration"], 0.001)
+    Printer.print(
+        "Downloaded {} files, {} in {:.2f}s ({}/s)".format(
+            stats["files"],
+            format_sizeof(stats["size"]),
+            duration,
+            format_sizeof(stats["size"] / duration),
+        )
+    )
+
+
 def download_artifact(
     connection_name: str,
     connection_kind: Union[str, "V1ConnectionKind"],
@@ -31,19 +79,36 @@ def download_artifact(
     raise_errors: bool,
     sync_fw: bool,
     check_path: bool,
+    max_concurrency: Optional[int] = None,
 ):
+    from polyaxon._fs.cache import ArtifactsCache
     from polyaxon._fs.fs import get_fs_from_name
-    from polyaxon._fs.manager import download_file_or_dir
 
     fs = get_fs_from_name(connection_name=connection_name)
+    # The node's shared cache is only used for remote stores, if configured
+    cache = None if is_local_fs(fs) else ArtifactsCache.from_env()
+    # Local filesystems are also copied concurrently, their calls run in threads
+    download = partial(
+        download_artifact_paths,
+        connection_name=connection_name,
+        max_concurrency=max_concurrency,
+    )
     try:
-        download_file_or_dir(
+        if not cache or not cache.download(
             fs=fs,
+            connection_name=connection_name,
             path_from=path_from,
             path_to=path_to,
             is_file=is_file,
             check_path=check_path,
-        )
+            downloader=download,
+        ):
+            download(
+                path_from=path_from,
+                path_to=path_to,
+                is_file=is_file,
+                check_path=check_path,
+            )
         if sync_fw:
             sync_file_watcher(path_to)
         Printer.success(
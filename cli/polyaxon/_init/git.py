@@ -1,8 +1,13 @@
+from contextlib import nullcontext
+import hashlib
 import os
-from typing import List, Optional
+import shlex
+import shutil
+from typing import List, NamedTuple, Optional
 
 from git import Repo as GitRepo
 
+from clipped.utils.cmd import run_command
 from clipped.utils.git import (
     add_remote,
     checkout_revision,
@@ -15,16 +20,63 @@ from clipped.utils.git import (
 from clipped.utils.paths import check_or_create_path
 from polyaxon._client.init import get_client_or_raise
 from polyaxon._env_vars.keys import (
+    ENV_KEYS_GIT_CACHE_PATH,
     ENV_KEYS_GIT_CREDENTIALS,
     ENV_KEYS_GIT_CREDENTIALS_STORE,
     ENV_KEYS_SSH_PATH,
     ENV_KEYS_SSH_PRIVATE_KEY,
 )
+from polyaxon._fs.cache import file_lock
 from polyaxon._schemas.lifecycle import V1Statuses
 from polyaxon.exceptions import PolyaxonContainerException
+from polyaxon.logger import logger
 from traceml.artifacts import V1ArtifactKind, V1RunArtifact
 
 
+PARTIAL_FILTERS = {"blob": "--filter=blob:none", "tree": "--filter=tree:0"}
+
+
+class GitCloneOptions(NamedTuple):
+    """The initializer options passed with the git flags.
+
+    * `--experimental-fetch`: fetches the revision instead of cloning the repo.
+    * `--shallow`: fetches only the revision's commit, with `--depth=1`.
+    * `--partial=blob|tree`: partial clone without the blobs or the trees,
+        they are fetched on demand.
+    * `--sparse-paths=path1,path2`: only checks out the paths (cone mode).
+    """
+
+    flags: List[str]
+    fetch: bool = False
+    shallow: bool = False
+    sparse_paths: Optional[List[str]] = None
+
+
+def get_clone_options(flags: Optional[List[str]]) -> GitCloneOptions:
+    git_flags = []
+    fetch, shallow, sparse_paths = False, False, None
+    for flag in flags or []:
+        if flag == "--experimental-fetch":
+            fetch = True
+        elif flag == "--shallow":
+            fetch, shallow = True, True
+        elif flag.startswith("--partial="):
+            value = flag.split("=", 1)[1]
+            if value not in PARTIAL_FILTERS:
+                raise PolyaxonContainerException(
+                    "Git initializer received an unsupported partial clone `{}`, "
+                    "options: {}.".format(value, list(PARTIAL_FILTERS.keys()))
+                )
+            git_flags.append(PARTIAL_FILTERS[value])
+        elif flag.startswith("--sparse-paths="):
+            sparse_paths = [p for p in flag.split("=", 1)[1].split(",") if p]
+        else:
+            git_flags.append(flag)
+    return GitCloneOptions(
+        flags=git_flags, fetch=fetch, shallow=shallow, sparse_paths=sparse_paths
+    )
+
+
 def has_cred_access() -> bool:
     return os.environ.get(ENV_KEYS_GIT_CREDENTIALS) is not None
 
@@ -90,30 +142,116 @@ def get_clone_url(url: str) -> str:
     return url
 
 
+def get_git_env():
+    if has_ssh_access():
+        return {"GIT_SSH_COMMAND": get_ssh_cmd()}
+    return None
+
+
 def clone_git_repo(
     repo_path: str, url: str, flags: Optional[List[str]] = None
 ) -> GitRepo:
-    if has_ssh_access():
+    env = get_git_env()
+    if env:
         return GitRepo.clone_from(
-            url=url,
-            to_path=repo_path,
-            multi_options=flags,
-            env={"GIT_SSH_COMMAND": get_ssh_cmd()},
+            url=url, to_path=repo_path, multi_options=flags, env=env
         )
     return GitRepo.clone_from(url=url, to_path=repo_path, multi_options=flags)
 
 
+def set_sparse_checkout(repo_path: str, paths: List[str]):
+    run_command(
+        cmd="git sparse-checkout set --cone {}".format(
+            " ".join(shlex.quote(p) for p in paths)
+        ),
+        data=None,
+        location=repo_path,
+        chw=True,
+    )
+
+
+def get_git_mirror_path(cache_path: str, url: str) -> str:
+    return os.path.join(
+        cache_path, "{}.git".format(hashlib.sha256(url.encode()).hexdigest())
+    )
+
+
+def get_git_mirror_lock(mirror_path: str, shared: bool = False):
+    return file_lock(mirror_path + ".lock", shared=shared)
+
+
+def update_git_mirror(cache_path: str, url: str, clone_url: str) -> str:
+    """Creates or updates the node's bare mirror of a repo.
+
+    The mirror is created in a temporary path and renamed once complete,
+    and updated under an exclusive lock, clones and fetches using it hold a shared lock.
+    The lock file is kept next to the mirror, and removed if the mirror can't be created.
+    The credentials are not persisted in the mirror's config.
+    """
+    os.makedirs(cache_path, exist_ok=True)
+    mirror_path = get_git_mirror_path(cache_path=cache_path, url=url)
+    env = get_git_env()
+    with get_git_mirror_lock(mirror_path):
+        if os.path.exists(mirror_path):
+            GitRepo(mirror_path).git.fetch(
+                clone_url, "+refs/*:refs/*", "--prune", env=env
+            )
+            return mirror_path
+        tmp_path = mirror_path + ".tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        try:
+            mirror = GitRepo.clone_from(
+                url=clone_url, to_path=tmp_path, mirror=True, env=env
+            )
+            mirror.git.remote("set-url", "origin", url)
+            # Objects are never pruned, repos referencing the mirror are dissociated
+            mirror.git.config("gc.auto", "0")
+            os.rename(tmp_path, mirror_path)
+        except Exception:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            os.remove(mirror_path + ".lock")
+            raise
+    return mirror_path
+
+
+def set_git_alternates(repo_path: str, reference: str):
+    """Borrows the missing objects of a repo from the mirror."""
+    with open(
+        os.path.join(repo_path, ".git", "objects", "info", "alternates"), "w"
+    ) as f:
+        f.write(os.path.join(os.path.abspath(reference), "objects") + "\n")
+
+
+def dissociate_git_repo(repo_path: str):
+    """Copies the objects borrowed from the mirror, like `git clone --dissociate`."""
+    run_command(cmd="git repack -a -d -q", data=None, location=repo_path, chw=True)
+    os.remove(os.path.join(repo_path, ".git", "objects", "info", "alternates"))
+
+
 def clone_and_checkout_git_repo(
     repo_path: str,
     clone_url: str,
     revision: str,
     flags: Optional[List[str]] = None,
+    sparse_paths: Optional[List[str]] = None,
+    reference: Optional[str] = None,
 ):
-    clone_git_repo(repo_path=repo_path, url=clone_url, flags=flags)
-    if revision:
+    clone_flags = list(flags or [])
+    if sparse_paths:
+        clone_flags.append("--no-checkout")
+    if reference:
+        # Objects are copied from the mirror, the repo does not depend on it
+        clone_flags += ["--reference={}".format(reference), "--dissociate"]
+    lock = get_git_mirror_lock(reference, shared=True) if reference else nullcontext()
+    with lock:
+        clone_git_repo(repo_path=repo_path, url=clone_url, flags=clone_flags)
+    if sparse_paths:
+        set_sparse_checkout(repo_path=repo_path, paths=sparse_paths)
+        checkout_revision(repo_path=repo_path, revision=revision or "HEAD")
+    elif revision:
         checkout_revision(repo_path=repo_path, revision=revision)
-        if flags and "--recurse-submodules" in flags:
-            update_submodules(repo_path=repo_path)
+    if (revision or sparse_paths) and flags and "--recurse-submodules" in flags:
+        update_submodules(repo_path=repo_path)
 
 
 def fetch_git_repo(
@@ -121,18 +259,53 @@ def fetch_git_repo(
     clone_url: str,
     revision: str,
     flags: Optional[List[str]] = None,
+    shallow: bool = False,
+    sparse_paths: Optional[List[str]] = None,
+    reference: Optional[str] = None,
 ):
     check_or_create_path(repo_path, is_dir=True)
     git_init(repo_path)
     add_remote(repo_path, clone_url)
-    env = None
-    if has_ssh_access():
-        env = {"GIT_SSH_COMMAND": get_ssh_cmd()}
-    git_fetch(repo_path=repo_path, revision=revision, flags=flags, env=env)
-    if flags and "--recurse-submodules" in flags:
+    flags = list(flags or [])
+    for flag in flags:
+        if flag.startswith("--filter="):
+            # Missing objects are fetched on demand from the promisor remote
+            for cmd in [
+                "git config remote.origin.promisor true",
+                "git config remote.origin.partialclonefilter {}".format(
+                    flag.split("=", 1)[1]
+                ),
+            ]:
+                run_command(cmd=cmd, data=None, location=repo_path, chw=True)
+    if sparse_paths:
+        set_sparse_checkout(repo_path=repo_path, paths=sparse_paths)
+    if shallow:
+        flags.append("--depth=1")
+    lock = get_git_mirror_lock(reference, shared=True) if reference else nullcontext()
+    with lock:
+        if reference:
+            set_git_alternates(repo_path=repo_path, reference=reference)
+        git_fetch(
+            repo_path=repo_path, revision=revision, flags=flags, env=get_git_env()
+        )
+        if reference:
+            dissociate_git_repo(repo_path=repo_path)
+    if "--recurse-submodules" in flags:
         update_submodules(repo_path=repo_path)
 
 
+def get_git_reference(url: str, clone_url: str) -> Optional[str]:
+    """Returns the node's mirror of the repo if a git cache is configured."""
+    cache_path = os.environ.get(ENV_KEYS_GIT_CACHE_PATH)
+    if not cache_path:
+        return None
+    try:
+        return update_git_mirror(cache_path=cache_path, url=url, clone_url=clone_url)
+    except Exception as e:  # The cache should not prevent cloning the repo
+        logger.warning("Git cache failed updating the mirror of {}: {}".format(url, e))
+        return None
+
+
 def create_code_repo(
     repo_path: str,
     url: str,
@@ -155,14 +328,26 @@ def create_code_repo(
         raise PolyaxonContainerException("Error parsing url: {}.".format(url)) from e
 
     try:
-        if flags and "--experimental-fetch" in flags:
-            flags.remove("--experimental-fetch")
+        options = get_clone_options(flags)
+        reference = get_git_reference(url=url, clone_url=clone_url)
+        if options.fetch:
             fetch_git_repo(
-                repo_path=repo_path, clone_url=clone_url, revision=revision, flags=flags
+                repo_path=repo_path,
+                clone_url=clone_url,
+                revision=revision,
+                flags=options.flags,
+                shallow=options.shallow,
+                sparse_paths=options.sparse_paths,
+                reference=reference,
             )
         else:
             clone_and_checkout_git_repo(
-                repo_path=repo_path, clone_url=clone_url, revision=revision, flags=flags
+                repo_path=repo_path,
+                clone_url=clone_url,
+                revision=revision,
+                flags=options.flags,
+                sparse_paths=options.sparse_paths,
+                reference=reference,
             )
     except Exception as e:
         if run_client:
@@ -1,11 +1,18 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from clipped.utils.coroutine import run_sync
 from polyaxon._k8s.executor.base import BaseExecutor
+from polyaxon._k8s.executor.informer import OpsInformer
 from polyaxon._k8s.manager.async_manager import AsyncK8sManager
+from polyaxon._runner.pool import arun_in_pool, get_conversion_pool
+from polyaxon.logger import logger
 
 
 class AsyncExecutor(BaseExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ops_informer = None
+
     def _get_manager(self):
         return AsyncK8sManager(
             namespace=self.namespace,
@@ -19,15 +26,65 @@ class AsyncExecutor(BaseExecutor):
         await manager.setup()
         return manager
 
-    async def list_ops(self, namespace: str = None):
-        ops = []
+    async def start_ops_informer(self, namespaces: List[str]):
+        if self._ops_informer is None:
+            self._ops_informer = OpsInformer(executor=self, namespaces=namespaces)
+            self._ops_informer.start()
+
+    async def stop_ops_informer(self):
+        if self._ops_informer is not None:
+            await self._ops_informer.close()
+            self._ops_informer = None
+
+    async def iter_ops(self, namespace: str = None) -> AsyncIterator[Dict]:
+        if self._ops_informer:
+            ops = self._ops_informer.list_ops(namespace=namespace or self.namespace)
+            if ops is not None:
+                for op in ops:
+                    yield op
+                return
         for mixin in self._get_operation_resource_mixins():
-            ops += await self.manager.list_custom_objects(
+            mixin_ops = self.manager.iter_custom_objects(
                 group=mixin.GROUP,
                 version=mixin.API_VERSION,
                 plural=mixin.PLURAL,
                 namespace=namespace,
             )
+            async for op in mixin_ops:
+                yield op
+
+    async def list_ops(self, namespace: str = None):
+        return [op async for op in self.iter_ops(namespace=namespace)]
+
+    async def list_ops_in_namespaces(
+        self,
+        namespaces: List[str],
+        transform: Optional[Callable[[Dict, str], Any]] = None,
+    ) -> Dict[str, List]:
+        transform = transform or (lambda op, _: op)
+        ops = {}
+        if self._ops_informer:
+            for namespace in namespaces:
+                _ops = self._ops_informer.list_ops(namespace=namespace)
+                if _ops is not None:
+                    ops[namespace] = [transform(op, namespace) for op in _ops]
+        namespaces = [n for n in namespaces if n not in ops]
+        for namespace in namespaces:
+            ops[namespace] = []
+        for mixin in self._get_operation_resource_mixins():
+            if not namespaces:
+                break
+            results, timings = await self.manager.list_in_namespaces(
+                "custom_objects",
+                namespaces=namespaces,
+                transform=transform,
+                group=mixin.GROUP,
+                version=mixin.API_VERSION,
+                plural=mixin.PLURAL,
+            )
+            logger.debug("Listed {} in namespaces: {}".format(mixin.PLURAL, timings))
+            for namespace, _ops in results.items():
+                ops[namespace] += _ops
         return ops
 
     @classmethod
@@ -41,8 +98,11 @@ class AsyncExecutor(BaseExecutor):
         default_auth: bool,
         agent_content: Optional[str] = None,
     ) -> Dict:
-        return await run_sync(
-            super(AsyncExecutor, cls).convert,
+        # Compiled outside of the event loop, in the configured conversion pool,
+        # the base method is used since it returns a serialized (picklable) resource
+        return await arun_in_pool(
+            get_conversion_pool(),
+            BaseExecutor.convert,
             owner_name=owner_name,
             project_name=project_name,
             run_name=run_name,
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from kubernetes import client as k8s_client
 from kubernetes.client import Configuration
@@ -9,6 +9,7 @@ from polyaxon._k8s.converter.mixins import MIXIN_MAPPING
 from polyaxon._runner.executor import BaseExecutor as _BaseExecutor
 from polyaxon._runner.kinds import RunnerKind
 from polyaxon._utils.fqn_utils import get_resource_name
+from polyaxon.logger import logger
 
 
 class BaseExecutor(_BaseExecutor):
@@ -127,13 +128,34 @@ class BaseExecutor(_BaseExecutor):
                 mixins.append(mixin)
         return mixins
 
-    def list_ops(self, namespace: str = None):
-        ops = []
+    def iter_ops(self, namespace: str = None) -> Iterator[Dict]:
         for mixin in self._get_operation_resource_mixins():
-            ops += self.manager.list_custom_objects(
+            yield from self.manager.iter_custom_objects(
                 group=mixin.GROUP,
                 version=mixin.API_VERSION,
                 plural=mixin.PLURAL,
                 namespace=namespace,
             )
+
+    def list_ops(self, namespace: str = None):
+        return list(self.iter_ops(namespace=namespace))
+
+    def list_ops_in_namespaces(
+        self,
+        namespaces: List[str],
+        transform: Optional[Callable[[Dict, str], Any]] = None,
+    ) -> Dict[str, List]:
+        ops = {namespace: [] for namespace in namespaces}
+        for mixin in self._get_operation_resource_mixins():
+            results, timings = self.manager.list_in_namespaces(
+                "custom_objects",
+                namespaces=namespaces,
+                transform=transform or (lambda op, _: op),
+                group=mixin.GROUP,
+                version=mixin.API_VERSION,
+                plural=mixin.PLURAL,
+            )
+            logger.debug("Listed {} in namespaces: {}".format(mixin.PLURAL, timings))
+            for namespace, _ops in results.items():
+                ops[namespace] += _ops
         return ops
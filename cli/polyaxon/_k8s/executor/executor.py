@@ -1,11 +1,78 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
 from polyaxon._k8s.executor.base import BaseExecutor
+from polyaxon._k8s.executor.informer import SyncOpsInformer
 from polyaxon._k8s.manager.manager import K8sManager
+from polyaxon._runner.pool import get_conversion_pool, run_in_pool
 
 
 class Executor(BaseExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._ops_informer = None
+
     def _get_manager(self):
         return K8sManager(
             k8s_config=self.k8s_config,
             namespace=self.namespace,
             in_cluster=self.in_cluster,
         )
+
+    def start_ops_informer(self, namespaces: List[str]):
+        if self._ops_informer is None:
+            self._ops_informer = SyncOpsInformer(executor=self, namespaces=namespaces)
+            self._ops_informer.start()
+
+    def stop_ops_informer(self):
+        if self._ops_informer is not None:
+            self._ops_informer.close()
+            self._ops_informer = None
+
+    def iter_ops(self, namespace: str = None) -> Iterator[Dict]:
+        if self._ops_informer:
+            ops = self._ops_informer.list_ops(namespace=namespace or self.namespace)
+            if ops is not None:
+                yield from ops
+                return
+        yield from super().iter_ops(namespace=namespace)
+
+    def list_ops_in_namespaces(
+        self,
+        namespaces: List[str],
+        transform: Optional[Callable[[Dict, str], Any]] = None,
+    ) -> Dict[str, List]:
+        transform = transform or (lambda op, _: op)
+        ops = {}
+        if self._ops_informer:
+            for namespace in namespaces:
+                _ops = self._ops_informer.list_ops(namespace=namespace)
+                if _ops is not None:
+                    ops[namespace] = [transform(op, namespace) for op in _ops]
+        namespaces = [n for n in namespaces if n not in ops]
+        if namespaces:
+            ops.update(super().list_ops_in_namespaces(namespaces, transform=transform))
+        return ops
+
+    @classmethod
+    def convert(
+        cls,
+        owner_name: str,
+        project_name: str,
+        run_name: str,
+        run_uuid: str,
+        content: str,
+        default_auth: bool,
+        agent_content: Optional[str] = None,
+    ) -> Dict:
+        # Runs in a process pool if configured, the agent's threads are limited by the GIL
+        return run_in_pool(
+            get_conversion_pool(process_only=True),
+            BaseExecutor.convert,
+            owner_name=owner_name,
+            project_name=project_name,
+            run_name=run_name,
+            run_uuid=run_uuid,
+            content=content,
+            default_auth=default_auth,
+            agent_content=agent_content,
+        )
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from polyaxon.logger import logger
+
+
+class BaseOpsInformer:
+    """Local cache of the operations custom objects, kept current with watches.
+
+    Every custom resource of every namespace is listed once, page by page,
+    then watched from the list's resource version.
+    The cache is listed again if the watch expires, and every `resync_interval`.
+
+    Args:
+        executor: the executor used to list and watch the operations.
+        namespaces: List[str], the namespaces to watch.
+        resync_interval: int, optional, seconds between full lists.
+    """
+
+    WATCH_TIMEOUT = 60 * 5
+    RESYNC_INTERVAL = 60 * 60
+    MAX_RETRY_SLEEP = 60
+    MAX_RETRIES = 3
+
+    def __init__(
+        self,
+        executor,
+        namespaces: List[str],
+        resync_interval: Optional[int] = None,
+    ):
+        self.executor = executor
+        self.namespaces = namespaces
+        self.resync_interval = resync_interval or self.RESYNC_INTERVAL
+        self._cache: Dict[Tuple, Dict[str, Dict]] = {}
+        self._synced = set()
+        # The sync informer updates the cache from its watch threads
+        self._lock = threading.Lock()
+
+    def _get_keys(self, namespace: str) -> List[Tuple]:
+        return [
+            (namespace, mixin.GROUP, mixin.API_VERSION, mixin.PLURAL)
+            for mixin in self.executor._get_operation_resource_mixins()
+        ]
+
+    def is_synced(self, namespace: str) -> bool:
+        return all(key in self._synced for key in self._get_keys(namespace))
+
+    def list_ops(self, namespace: str) -> Optional[List[Dict]]:
+        """Returns the cached operations, `None` if the cache is not synced."""
+        if not self.is_synced(namespace):
+            return None
+        ops = []
+        with self._lock:
+            for key in self._get_keys(namespace):
+                ops += list(self._cache.get(key, {}).values())
+        return ops
+
+    def _get_list_kwargs(self, key: Tuple) -> Dict:
+        namespace, group, version, plural = key
+        return dict(group=group, version=version, plural=plural, namespace=namespace)
+
+    def _get_watch_kwargs(self, key: Tuple, resource_version: Optional[str]) -> Dict:
+        kwargs = self._get_list_kwargs(key)
+        kwargs["resource_version"] = resource_version
+        kwargs["timeout_seconds"] = self.WATCH_TIMEOUT
+        return kwargs
+
+    def _set_ops(self, key: Tuple, items: List[Dict]):
+        with self._lock:
+            self._cache[key] = {item["metadata"]["name"]: item for item in items}
+        self._synced.add(key)
+
+    def _apply_event(self, key: Tuple, event_type: str, obj: Dict):
+        if event_type == "BOOKMARK":
+            return
+        name = obj["metadata"]["name"]
+        with self._lock:
+            ops = self._cache.setdefault(key, {})
+            if event_type == "DELETED":
+                ops.pop(name, None)
+            else:
+                ops[name] = obj
+
+    def _should_list(self, resource_version: Optional[str], listed_at) -> bool:
+        return (
+            resource_version is None
+            or time.monotonic() - listed_at > self.resync_interval
+        )
+
+    @staticmethod
+    def _is_expired(e: Exception) -> bool:
+        return getattr(e, "status", None) == 410
+
+    def _get_retry_sleep(self, key: Tuple, retry: int) -> int:
+        """Returns the time to wait before retrying the watch of a resource."""
+        if retry >= self.MAX_RETRIES:
+            # The cache could be stale, fallback to listing the operations
+            self._synced.discard(key)
+        return min(retry**2, self.MAX_RETRY_SLEEP)
+
+    def _clear(self):
+        self._synced = set()
+        with self._lock:
+            self._cache = {}
+
+
+class OpsInformer(BaseOpsInformer):
+    """Operations informer of the async executor, every resource is watched in a task."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tasks = []
+
+    def start(self):
+        for namespace in self.namespaces:
+            for key in self._get_keys(namespace):
+                self._tasks.append(asyncio.ensure_future(self._inform(key)))
+
+    async def _list(self, key: Tuple) -> Optional[str]:
+        manager = self.executor.manager
+        items, resource_version = await manager.list_custom_objects_with_version(
+            **self._get_list_kwargs(key)
+        )
+        self._set_ops(key, items)
+        return resource_version
+
+    async def _inform(self, key: Tuple):
+        resource_version = None
+        listed_at = None
+        retry = 0
+        while True:
+            try:
+                if self._should_list(resource_version, listed_at):
+                    resource_version = await self._list(key)
+                    listed_at = time.monotonic()
+                events = self.executor.manager.watch_custom_objects(
+                    **self._get_watch_kwargs(key, resource_version)
+                )
+                async for event_type, obj, event_version in events:
+                    retry = 0
+                    resource_version = event_version or resource_version
+                    self._apply_event(key, event_type, obj)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._is_expired(e):
+                    logger.debug("Operations watch expired, listing again.")
+                    resource_version = None
+                    continue
+                retry += 1
+                logger.info("Operations watch error %s" % repr(e))
+            if retry:
+                if retry >= self.MAX_RETRIES:
+                    resource_version = None
+                await asyncio.sleep(self._get_retry_sleep(key, retry))
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._clear()
+
+
+class SyncOpsInformer(BaseOpsInformer):
+    """Operations informer of the sync executor, every resource is watched in a thread.
+
+    The watch threads are daemons, they check the stop event between the watch events,
+    and stop at the latest when the current watch times out.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._threads = []
+        self._stopped = threading.Event()
+
+    def start(self):
+        self._stopped = threading.Event()
+        for namespace in self.namespaces:
+            for key in self._get_keys(namespace):
+                thread = threading.Thread(
+                    target=self._inform,
+                    args=(key, self._stopped),
+                    name="polyaxon.OpsInformer",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _list(self, key: Tuple) -> Optional[str]:
+        manager = self.executor.manager
+        items, resource_version = manager.list_custom_objects_with_version(
+            **self._get_list_kwargs(key)
+        )
+        self._set_ops(key, items)
+        return resource_version
+
+    def _inform(self, key: Tuple, stopped: threading.Event):
+        resource_version = None
+        listed_at = None
+        retry = 0
+        while not stopped.is_set():
+            try:
+                if self._should_list(resource_version, listed_at):
+                    resource_version = self._list(key)
+                    listed_at = time.monotonic()
+                events = self.executor.manager.watch_custom_objects(
+                    **self._get_watch_kwargs(key, resource_version)
+                )
+                for event_type, obj, event_version in events:
+                    if stopped.is_set():
+                        return
+                    retry = 0
+                    resource_version = event_version or resource_version
+                    self._apply_event(key, event_type, obj)
+            except Exception as e:
+                if self._is_expired(e):
+                    logger.debug("Operations watch expired, listing again.")
+                    resource_version = None
+                    continue
+                retry += 1
+                logger.info("Operations watch error %s" % repr(e))
+            if retry:
+                if retry >= self.MAX_RETRIES:
+                    resource_version = None
+                stopped.wait(self._get_retry_sleep(key, retry))
+
+    def close(self):
+        self._stopped.set()
+        self._threads = []
+        self._clear()
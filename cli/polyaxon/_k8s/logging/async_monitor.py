@@ -1,6 +1,8 @@
+import asyncio
 import datetime
+import heapq
 import logging
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
 from kubernetes_asyncio.client.models import V1Pod
 from kubernetes_asyncio.client.rest import ApiException
@@ -13,6 +15,26 @@ from traceml.logging import V1Log, V1Logs
 
 _logger = logging.getLogger("haupt.k8s.logs")
 
+MAX_CONCURRENCY = 10
+
+
+async def gather_with_concurrency(
+    coros: List[Awaitable], max_concurrency: int = MAX_CONCURRENCY
+) -> List:
+    """Gathers coroutines with at most `max_concurrency` running at once."""
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[run(coro) for coro in coros])
+
+
+def merge_logs(logs_lists: List[List[V1Log]]) -> List[V1Log]:
+    """Merges the logs of several containers, each sorted by timestamp."""
+    return list(heapq.merge(*logs_lists, key=lambda log: log.timestamp))
+
 
 async def handle_container_logs(
     k8s_manager: AsyncK8sManager, pod: V1Pod, container_name: str, **params
@@ -57,19 +79,138 @@ async def handle_container_logs(
     return logs
 
 
-async def handle_pod_logs(
-    k8s_manager: AsyncK8sManager, pod: V1Pod, **params
+class LogsCursor:
+    """Resumable position in the logs of a container.
+
+    The logs API can only resume from a number of seconds,
+    so the cursor keeps the last timestamp and the number of lines
+    collected with that timestamp, to drop the lines already collected
+    without losing lines that share the same timestamp.
+
+    Args:
+        timestamp: datetime, optional, timestamp of the last collected line.
+        count: int, optional, number of lines collected with that timestamp.
+    """
+
+    def __init__(self, timestamp: Optional[datetime.datetime] = None, count: int = 0):
+        self.timestamp = timestamp
+        self.count = count
+        self._skip = 0
+
+    def get_params(self) -> Dict:
+        if not self.timestamp:
+            return {}
+        since_seconds = (now() - self.timestamp).total_seconds()
+        # Rounded up, the lines already collected are dropped by `update`
+        return {"since_seconds": max(int(since_seconds) + 1, 1)}
+
+    def start(self):
+        """Must be called before processing the lines of a new request."""
+        self._skip = self.count
+
+    def update(self, log: V1Log) -> bool:
+        """Advances the cursor, returns `False` if the line was already collected."""
+        if self.timestamp and log.timestamp < self.timestamp:
+            return False
+        if self.timestamp and log.timestamp == self.timestamp:
+            if self._skip > 0:
+                self._skip -= 1
+                return False
+            self.count += 1
+            return True
+        self.timestamp = log.timestamp
+        self.count = 1
+        self._skip = 0
+        return True
+
+
+async def read_container_logs(
+    k8s_manager: AsyncK8sManager, pod: V1Pod, container_name: str, cursor: LogsCursor
 ) -> List[V1Log]:
-    logs = []
-    for container in pod.spec.init_containers or []:
-        logs += await handle_container_logs(
-            k8s_manager=k8s_manager, pod=pod, container_name=container.name, **params
+    """Collects the logs of a container that are after the cursor."""
+    logs = await handle_container_logs(
+        k8s_manager=k8s_manager,
+        pod=pod,
+        container_name=container_name,
+        **cursor.get_params(),
+    )
+    cursor.start()
+    return [log for log in logs if cursor.update(log)]
+
+
+async def stream_container_logs(
+    k8s_manager: AsyncK8sManager,
+    pod: V1Pod,
+    container_name: str,
+    cursor: LogsCursor,
+    chunk_size: int = 64 * 1024,
+) -> AsyncIterator[V1Log]:
+    """Follows the logs of a container from the cursor.
+
+    The response is parsed incrementally, the stream ends when the container stops
+    or the connection is closed, and can be resumed with the same cursor.
+    """
+    resp = await k8s_manager.k8s_api.read_namespaced_pod_log(
+        pod.metadata.name,
+        k8s_manager.namespace,
+        container=container_name,
+        timestamps=True,
+        follow=True,
+        _preload_content=False,
+        **cursor.get_params(),
+    )
+    cursor.start()
+
+    def process_line(line: bytes) -> Optional[V1Log]:
+        if not line.strip():
+            return None
+        log = V1Log.process_log_line(
+            value=line.decode("utf-8", errors="replace"),
+            node=pod.spec.node_name,
+            pod=pod.metadata.name,
+            container=container_name,
         )
-    for container in pod.spec.containers or []:
-        logs += await handle_container_logs(
+        return log if cursor.update(log) else None
+
+    buffer = b""
+    try:
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            lines = (buffer + chunk).split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                log = process_line(line)
+                if log:
+                    yield log
+        log = process_line(buffer)
+        if log:
+            yield log
+    finally:
+        resp.release()
+
+
+def get_pod_containers_logs(
+    k8s_manager: AsyncK8sManager, pod: V1Pod, **params
+) -> List[Awaitable[List[V1Log]]]:
+    containers = (pod.spec.init_containers or []) + (pod.spec.containers or [])
+    return [
+        handle_container_logs(
             k8s_manager=k8s_manager, pod=pod, container_name=container.name, **params
         )
-    return logs
+        for container in containers
+    ]
+
+
+async def handle_pod_logs(
+    k8s_manager: AsyncK8sManager,
+    pod: V1Pod,
+    max_concurrency: int = MAX_CONCURRENCY,
+    **params,
+) -> List[V1Log]:
+    logs_lists = await gather_with_concurrency(
+        get_pod_containers_logs(k8s_manager=k8s_manager, pod=pod, **params),
+        max_concurrency=max_concurrency,
+    )
+    return merge_logs(logs_lists)
 
 
 async def query_k8s_operation_logs(
@@ -77,6 +218,7 @@ async def query_k8s_operation_logs(
     instance: str,
     last_time: Optional[datetime.datetime],
     stream: bool = False,
+    max_concurrency: int = MAX_CONCURRENCY,
 ) -> Tuple[List[V1Log], Optional[datetime.datetime]]:
     new_time = now()
     params = {}
@@ -86,22 +228,26 @@ async def query_k8s_operation_logs(
         params["since_seconds"] = since_seconds
     if stream:
         params["tail_lines"] = V1Logs._CHUNK_SIZE
-    logs = []
 
     pods = await k8s_manager.list_pods(
         label_selector=k8s_manager.get_managed_by_polyaxon(instance)
     )
 
+    # All containers of all replicas are collected concurrently
+    containers_logs = []
     for pod in pods:
-        logs += await handle_pod_logs(
-            k8s_manager=k8s_manager,
-            pod=pod,
-            **params,
+        containers_logs += get_pod_containers_logs(
+            k8s_manager=k8s_manager, pod=pod, **params
         )
-
-    if logs and last_time:
+    logs_lists = await gather_with_concurrency(
+        containers_logs, max_concurrency=max_concurrency
+    )
+    if last_time:
         # make sure to filter logs larger than last_time
-        logs = [log for log in logs if log.timestamp > last_time]
+        logs_lists = [
+            [log for log in logs if log.timestamp > last_time] for logs in logs_lists
+        ]
+    logs = merge_logs(logs_lists)
     if logs and logs[-1].timestamp:
         new_time = logs[-1].timestamp
     return logs, new_time
@@ -1,6 +1,8 @@
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
-from kubernetes_asyncio import client, config
+from kubernetes_asyncio import client, config, watch
 from kubernetes_asyncio.client import Configuration
 from kubernetes_asyncio.client.rest import ApiException
 
@@ -99,22 +101,272 @@ class AsyncK8sManager(BaseK8sManager):
         )  # type: ignore[attr-defined]
         return is_pod_running(event, container_id)
 
+    async def _watch_namespace_resource(
+        self,
+        resource_api,
+        resource_version: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+        namespace: str = None,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, Any, Optional[str]]]:
+        resource_watch = watch.Watch()
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+        if timeout_seconds:
+            kwargs["timeout_seconds"] = timeout_seconds
+        try:
+            async for event in resource_watch.stream(
+                resource_api, namespace=namespace or self.namespace, **kwargs
+            ):
+                yield event["type"], event["object"], resource_watch.resource_version
+        finally:
+            await resource_watch.close()
+
+    async def watch_pod(
+        self,
+        name: str,
+        resource_version: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+        namespace: str = None,
+    ) -> AsyncIterator[Tuple[str, client.V1Pod, Optional[str]]]:
+        """Watches a single pod using a field selector.
+
+        Yields the event type, the pod, and the resource version to resume from.
+        The stream ends when the server side timeout expires,
+        an `ApiException` with status 410 is raised if the resource version is too old.
+        """
+        async for event in self._watch_namespace_resource(
+            resource_api=self.k8s_api.list_namespaced_pod,  # type: ignore[attr-defined]
+            resource_version=resource_version,
+            timeout_seconds=timeout_seconds,
+            namespace=namespace,
+            field_selector="metadata.name={}".format(name),
+        ):
+            yield event
+
+    async def watch_custom_objects(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        resource_version: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+        namespace: str = None,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[str, Dict, Optional[str]]]:
+        """Watches custom objects, see `watch_pod`, bookmark events are also yielded."""
+        async for event in self._watch_namespace_resource(
+            resource_api=self.k8s_custom_object_api.list_namespaced_custom_object,  # type: ignore[attr-defined]
+            resource_version=resource_version,
+            timeout_seconds=timeout_seconds,
+            namespace=namespace,
+            group=group,
+            version=version,
+            plural=plural,
+            allow_watch_bookmarks=True,
+            **kwargs,
+        ):
+            yield event
+
+    async def list_custom_objects_with_version(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Lists custom objects page by page and returns the resource version to watch from.
+
+        The pages are a consistent snapshot, if a `continue` token expires
+        the listing restarts, any other error is raised.
+        """
+        limit = limit or self.LIST_PAGE_SIZE
+        items, resource_version = [], None
+        restarts = 0
+        while True:
+            try:
+                res = await self.k8s_custom_object_api.list_namespaced_custom_object(  # type: ignore[attr-defined]
+                    group=group,
+                    version=version,
+                    plural=plural,
+                    namespace=namespace or self.namespace,
+                    limit=limit,
+                    **kwargs,
+                )
+            except ApiException as e:
+                if not self._should_restart_listing(e, kwargs, restarts):
+                    raise e
+                logger.info("K8S listing expired, listing again.")
+                restarts += 1
+                kwargs.pop("_continue")
+                items, resource_version = [], None
+                continue
+            page, _continue = self._get_list_page(res)
+            items += page
+            resource_version = resource_version or (res.get("metadata") or {}).get(
+                "resourceVersion"
+            )
+            if not _continue:
+                return items, resource_version
+            kwargs["_continue"] = _continue
+
     async def _list_namespace_resource(
         self, resource_api, reraise: bool = False, namespace: str = None, **kwargs
     ) -> List:
         try:
-            res = await resource_api(namespace=namespace or self.namespace, **kwargs)
-            if isinstance(res, dict):
-                items = res["items"]
-            else:
-                items = res.items
-            return [p for p in items]
+            items = []
+            while True:
+                res = await resource_api(
+                    namespace=namespace or self.namespace, **kwargs
+                )
+                page, _continue = self._get_list_page(res)
+                items += page
+                # Pages are followed only if the listing is paginated with a `limit`
+                if not kwargs.get("limit") or not _continue:
+                    return items
+                kwargs["_continue"] = _continue
         except ApiException as e:
             logger.error("K8S error: {}".format(e))
             if reraise:
                 raise e
             return []
 
+    async def _iter_namespace_resource(
+        self,
+        resource_api,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator:
+        """Yields the resources page by page, following the `continue` tokens.
+
+        If a `continue` token expires, the listing restarts
+        and skips the resources already yielded,
+        any other error is raised, a partial listing is never returned silently.
+        """
+        limit = limit or self.LIST_PAGE_SIZE
+        keys = set()
+        restarts = 0
+        while True:
+            try:
+                res = await resource_api(
+                    namespace=namespace or self.namespace, limit=limit, **kwargs
+                )
+            except ApiException as e:
+                if not self._should_restart_listing(e, kwargs, restarts):
+                    logger.error("K8S error: {}".format(e))
+                    raise e
+                logger.info("K8S listing expired, listing again.")
+                restarts += 1
+                kwargs.pop("_continue")
+                continue
+            page, _continue = self._get_list_page(res)
+            for item in page:
+                key = self._get_item_key(item)
+                if key is not None:
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                yield item
+            if not _continue:
+                return
+            kwargs["_continue"] = _continue
+
+    async def _run_in_namespaces(
+        self,
+        func: Callable,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> Tuple[Dict[str, List], Dict[str, float]]:
+        semaphore = asyncio.Semaphore(
+            max_concurrency or self.NAMESPACES_MAX_CONCURRENCY
+        )
+
+        async def run(namespace: str):
+            async with semaphore:
+                started_at = time.monotonic()
+                results = []
+                for label_selector in label_selectors or [None]:
+                    _kwargs = dict(kwargs)
+                    if label_selector:
+                        _kwargs["label_selector"] = label_selector
+                    results += await func(namespace=namespace, **_kwargs) or []
+                return results, time.monotonic() - started_at
+
+        namespaces_results = await asyncio.gather(*[run(n) for n in namespaces])
+        results, timings = {}, {}
+        for namespace, (result, timing) in zip(namespaces, namespaces_results):
+            results[namespace] = result
+            timings[namespace] = timing
+        return results, timings
+
+    async def list_in_namespaces(
+        self,
+        resource: str,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        transform: Optional[Callable[[Any, str], Any]] = None,
+        **kwargs,
+    ) -> Tuple[Dict[str, List], Dict[str, float]]:
+        """Lists a resource concurrently in several namespaces.
+
+        Args:
+            resource: str, the resource to list, e.g. `pods`, `jobs`, `custom_objects`.
+            namespaces: List[str], the namespaces to list.
+            label_selectors: List[str], optional, the selectors to list,
+                see `get_label_selectors`.
+            max_concurrency: int, optional, the number of namespaces listed at once.
+            transform: Callable, optional, if provided, the resources are
+                streamed page by page and only `transform(item, namespace)` is kept.
+            kwargs: the kwargs of the list function, e.g. `limit` to paginate.
+
+        Returns:
+            The resources and the duration in seconds of each namespace.
+        """
+        if transform:
+            iter_func = self._get_resource_func("iter", resource)
+
+            async def func(namespace: str, **_kwargs):
+                items = iter_func(namespace=namespace, **_kwargs)
+                return [transform(item, namespace) async for item in items]
+        else:
+            func = self._get_resource_func("list", resource)
+
+        return await self._run_in_namespaces(
+            func=func,
+            namespaces=namespaces,
+            label_selectors=label_selectors,
+            max_concurrency=max_concurrency,
+            **kwargs,
+        )
+
+    async def delete_in_namespaces(
+        self,
+        resource: str,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, float]:
+        """Deletes a resource concurrently in several namespaces.
+
+        Returns:
+            The duration in seconds of each namespace.
+        """
+        _, timings = await self._run_in_namespaces(
+            func=self._get_resource_func("delete", resource),
+            namespaces=namespaces,
+            label_selectors=label_selectors,
+            max_concurrency=max_concurrency,
+            **kwargs,
+        )
+        return timings
+
     async def list_pods(
         self, reraise: bool = False, namespace: str = None, **kwargs
     ) -> List[client.V1Pod]:
@@ -154,6 +406,27 @@ class AsyncK8sManager(BaseK8sManager):
             **kwargs,
         )
 
+    async def iter_custom_objects(
+        self,
+        group,
+        version,
+        plural,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> AsyncIterator[Dict]:
+        items = self._iter_namespace_resource(
+            resource_api=self.k8s_custom_object_api.list_namespaced_custom_object,  # type: ignore[attr-defined]
+            group=group,
+            version=version,
+            plural=plural,
+            namespace=namespace,
+            limit=limit,
+            **kwargs,
+        )
+        async for item in items:
+            yield item
+
     async def list_services(
         self, reraise: bool = False, namespace: str = None, **kwargs
     ) -> List[client.V1Service]:
@@ -1,11 +1,17 @@
 import re
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from kubernetes.client import Configuration
 
+from polyaxon.exceptions import PolyaxonK8sError
+
 
 class BaseK8sManager:
     CLIENT = None
+    NAMESPACES_MAX_CONCURRENCY = 10
+    LABEL_SELECTOR_BATCH_SIZE = 50
+    LIST_PAGE_SIZE = 500
+    LIST_MAX_RESTARTS = 3
 
     def __init__(self, namespace="default", in_cluster=False):
         self.namespace = namespace
@@ -31,6 +37,63 @@ class BaseK8sManager:
     def get_core_polyaxon() -> str:
         return "app.kubernetes.io/part-of=polyaxon-core"
 
+    @classmethod
+    def get_label_selectors(
+        cls,
+        key: str,
+        values: List[str],
+        label_selector: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[str]:
+        """Batches the values of a label in set-based selectors.
+
+        e.g. `app.kubernetes.io/instance in (uuid1,uuid2)` to list or delete
+        the resources of several runs with a single request.
+        """
+        batch_size = batch_size or cls.LABEL_SELECTOR_BATCH_SIZE
+        selectors = []
+        for i in range(0, len(values), batch_size):
+            selector = "{} in ({})".format(key, ",".join(values[i : i + batch_size]))
+            if label_selector:
+                selector = "{},{}".format(label_selector, selector)
+            selectors.append(selector)
+        return selectors
+
+    @staticmethod
+    def _get_list_page(res) -> Tuple[List, Optional[str]]:
+        if isinstance(res, dict):
+            return res["items"], (res.get("metadata") or {}).get("continue")
+        return res.items, getattr(res.metadata, "_continue", None)
+
+    @staticmethod
+    def _get_item_key(item) -> Optional[str]:
+        if isinstance(item, dict):
+            metadata = item.get("metadata")
+        else:
+            metadata = getattr(item, "metadata", None)
+        if metadata is None:
+            return None
+        if isinstance(metadata, dict):
+            return metadata.get("uid") or metadata.get("name")
+        return getattr(metadata, "uid", None) or getattr(metadata, "name", None)
+
+    @classmethod
+    def _should_restart_listing(cls, e: Exception, kwargs: Dict, restarts: int) -> bool:
+        """Whether a paginated listing should restart after an expired `continue`."""
+        return (
+            getattr(e, "status", None) == 410
+            and bool(kwargs.get("_continue"))
+            and restarts < cls.LIST_MAX_RESTARTS
+        )
+
+    def _get_resource_func(self, action: str, resource: str) -> Callable:
+        func = getattr(self, "{}_{}".format(action, resource), None)
+        if not func:
+            raise PolyaxonK8sError(
+                "The manager does not support `{}` for `{}`.".format(action, resource)
+            )
+        return func
+
     @classmethod
     def get_config_auth(cls, k8s_config: Optional[Configuration] = None) -> str:
         if not k8s_config or not k8s_config.api_key:
@@ -1,6 +1,8 @@
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client import Configuration
 from kubernetes.client.rest import ApiException
 
@@ -48,18 +50,157 @@ class K8sManager(BaseK8sManager):
         self, resource_api, reraise: bool = False, namespace: str = None, **kwargs
     ):
         try:
-            res = resource_api(namespace=namespace or self.namespace, **kwargs)
-            if isinstance(res, dict):
-                items = res["items"]
-            else:
-                items = res.items
-            return [p for p in items]
+            items = []
+            while True:
+                res = resource_api(namespace=namespace or self.namespace, **kwargs)
+                page, _continue = self._get_list_page(res)
+                items += page
+                # Pages are followed only if the listing is paginated with a `limit`
+                if not kwargs.get("limit") or not _continue:
+                    return items
+                kwargs["_continue"] = _continue
         except ApiException as e:
             logger.error("K8S error: {}".format(e))
             if reraise:
                 raise e
             return []
 
+    def _iter_namespace_resource(
+        self,
+        resource_api,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator:
+        """Yields the resources page by page, following the `continue` tokens.
+
+        If a `continue` token expires, the listing restarts
+        and skips the resources already yielded,
+        any other error is raised, a partial listing is never returned silently.
+        """
+        limit = limit or self.LIST_PAGE_SIZE
+        keys = set()
+        restarts = 0
+        while True:
+            try:
+                res = resource_api(
+                    namespace=namespace or self.namespace, limit=limit, **kwargs
+                )
+            except ApiException as e:
+                if not self._should_restart_listing(e, kwargs, restarts):
+                    logger.error("K8S error: {}".format(e))
+                    raise e
+                logger.info("K8S listing expired, listing again.")
+                restarts += 1
+                kwargs.pop("_continue")
+                continue
+            page, _continue = self._get_list_page(res)
+            for item in page:
+                key = self._get_item_key(item)
+                if key is not None:
+                    if key in keys:
+                        continue
+                    keys.add(key)
+                yield item
+            if not _continue:
+                return
+            kwargs["_continue"] = _continue
+
+    def _run_in_namespaces(
+        self,
+        func: Callable,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> Tuple[Dict[str, List], Dict[str, float]]:
+        def run(namespace: str):
+            started_at = time.monotonic()
+            results = []
+            for label_selector in label_selectors or [None]:
+                _kwargs = dict(kwargs)
+                if label_selector:
+                    _kwargs["label_selector"] = label_selector
+                results += func(namespace=namespace, **_kwargs) or []
+            return results, time.monotonic() - started_at
+
+        results, timings = {}, {}
+        if not namespaces:
+            return results, timings
+        max_concurrency = max_concurrency or self.NAMESPACES_MAX_CONCURRENCY
+        with ThreadPoolExecutor(min(max_concurrency, len(namespaces))) as pool:
+            for namespace, (result, timing) in zip(
+                namespaces, pool.map(run, namespaces)
+            ):
+                results[namespace] = result
+                timings[namespace] = timing
+        return results, timings
+
+    def list_in_namespaces(
+        self,
+        resource: str,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        transform: Optional[Callable[[Any, str], Any]] = None,
+        **kwargs,
+    ) -> Tuple[Dict[str, List], Dict[str, float]]:
+        """Lists a resource concurrently in several namespaces.
+
+        Args:
+            resource: str, the resource to list, e.g. `pods`, `jobs`, `custom_objects`.
+            namespaces: List[str], the namespaces to list.
+            label_selectors: List[str], optional, the selectors to list,
+                see `get_label_selectors`.
+            max_concurrency: int, optional, the number of namespaces listed at once.
+            transform: Callable, optional, if provided, the resources are
+                streamed page by page and only `transform(item, namespace)` is kept.
+            kwargs: the kwargs of the list function, e.g. `limit` to paginate.
+
+        Returns:
+            The resources and the duration in seconds of each namespace.
+        """
+        if transform:
+            iter_func = self._get_resource_func("iter", resource)
+
+            def func(namespace: str, **_kwargs):
+                return [
+                    transform(item, namespace)
+                    for item in iter_func(namespace=namespace, **_kwargs)
+                ]
+        else:
+            func = self._get_resource_func("list", resource)
+
+        return self._run_in_namespaces(
+            func=func,
+            namespaces=namespaces,
+            label_selectors=label_selectors,
+            max_concurrency=max_concurrency,
+            **kwargs,
+        )
+
+    def delete_in_namespaces(
+        self,
+        resource: str,
+        namespaces: List[str],
+        label_selectors: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, float]:
+        """Deletes a resource concurrently in several namespaces.
+
+        Returns:
+            The duration in seconds of each namespace.
+        """
+        _, timings = self._run_in_namespaces(
+            func=self._get_resource_func("delete", resource),
+            namespaces=namespaces,
+            label_selectors=label_selectors,
+            max_concurrency=max_concurrency,
+            **kwargs,
+        )
+        return timings
+
     def list_nodes(self, reraise: bool = False):
         try:
             res = self.k8s_api.list_node()
@@ -117,6 +258,105 @@ class K8sManager(BaseK8sManager):
             **kwargs,
         )
 
+    def iter_custom_objects(
+        self,
+        group,
+        version,
+        plural,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Dict]:
+        return self._iter_namespace_resource(
+            resource_api=self.k8s_custom_object_api.list_namespaced_custom_object,
+            group=group,
+            version=version,
+            plural=plural,
+            namespace=namespace,
+            limit=limit,
+            **kwargs,
+        )
+
+    def watch_custom_objects(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        resource_version: Optional[str] = None,
+        timeout_seconds: Optional[int] = None,
+        namespace: str = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, Dict, Optional[str]]]:
+        """Watches custom objects.
+
+        Yields the event type, the object, and the resource version to resume from,
+        bookmark events are also yielded.
+        The stream ends when the server side timeout expires,
+        an `ApiException` with status 410 is raised if the resource version is too old.
+        """
+        resource_watch = watch.Watch()
+        if resource_version:
+            kwargs["resource_version"] = resource_version
+        if timeout_seconds:
+            kwargs["timeout_seconds"] = timeout_seconds
+        try:
+            for event in resource_watch.stream(
+                self.k8s_custom_object_api.list_namespaced_custom_object,
+                namespace=namespace or self.namespace,
+                group=group,
+                version=version,
+                plural=plural,
+                allow_watch_bookmarks=True,
+                **kwargs,
+            ):
+                yield event["type"], event["object"], resource_watch.resource_version
+        finally:
+            resource_watch.stop()
+
+    def list_custom_objects_with_version(
+        self,
+        group: str,
+        version: str,
+        plural: str,
+        namespace: str = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Lists custom objects page by page and returns the resource version to watch from.
+
+        The pages are a consistent snapshot, if a `continue` token expires
+        the listing restarts, any other error is raised.
+        """
+        limit = limit or self.LIST_PAGE_SIZE
+        items, resource_version = [], None
+        restarts = 0
+        while True:
+            try:
+                res = self.k8s_custom_object_api.list_namespaced_custom_object(
+                    group=group,
+                    version=version,
+                    plural=plural,
+                    namespace=namespace or self.namespace,
+                    limit=limit,
+                    **kwargs,
+                )
+            except ApiException as e:
+                if not self._should_restart_listing(e, kwargs, restarts):
+                    raise e
+                logger.info("K8S listing expired, listing again.")
+                restarts += 1
+                kwargs.pop("_continue")
+                items, resource_version = [], None
+                continue
+            page, _continue = self._get_list_page(res)
+            items += page
+            resource_version = resource_version or (res.get("metadata") or {}).get(
+                "resourceVersion"
+            )
+            if not _continue:
+                return items, resource_version
+            kwargs["_continue"] = _continue
+
     def list_services(self, reraise: bool = False, namespace: str = None, **kwargs):
         return self._list_namespace_resource(
             resource_api=self.k8s_api.list_namespaced_service,
@@ -780,7 +1020,7 @@ class K8sManager(BaseK8sManager):
                 logger.debug("Jobs were not found. kwargs: `{}` ".format(kwargs))
 
     def delete_services(self, reraise: bool = False, namespace: str = None, **kwargs):
-        objs = self.list_services(reraise=reraise, **kwargs)
+        objs = self.list_services(reraise=reraise, namespace=namespace, **kwargs)
         for obj in objs:
             self.delete_service(
                 name=obj.metadata.name, reraise=reraise, namespace=namespace
@@ -1,6 +1,8 @@
 import asyncio
+from collections import defaultdict
+import time
 import traceback
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from kubernetes_asyncio.client.rest import ApiException
 from urllib3.exceptions import HTTPError
@@ -11,9 +13,9 @@ from clipped.utils.workers import async_exit_context, get_wait
 from polyaxon import pkg, settings
 from polyaxon._env_vars.getters import get_run_info
 from polyaxon._runner.agent.base_agent import BaseAgent
+from polyaxon._runner.agent.reconcile import get_op_reconcile_data
 from polyaxon._sdk.schemas.v1_agent import V1Agent
 from polyaxon._sdk.schemas.v1_agent_state_response import V1AgentStateResponse
-from polyaxon._utils.fqn_utils import get_run_instance
 from polyaxon.exceptions import (
     ApiException as SDKApiException,
     PolyaxonAgentError,
@@ -51,6 +53,7 @@ class BaseAsyncAgent(BaseAgent):
             raise PolyaxonAgentError from e
 
     async def _exit(self):
+        await self.executor.stop_ops_informer()
         if not self.client._is_managed:
             return
         if not self._graceful_shutdown:
@@ -99,75 +102,67 @@ class BaseAsyncAgent(BaseAgent):
         # Update reconcile
         namespaces = [settings.AGENT_CONFIG.namespace]
         namespaces += settings.AGENT_CONFIG.additional_namespaces or []
-        ops = []
-        for namespace in namespaces:
-            _ops = await self.executor.list_ops(namespace=namespace)
-            if _ops:
-                ops += [
-                    (
-                        get_run_instance(
-                            owner=op["metadata"]["annotations"][
-                                "operation.polyaxon.com/owner"
-                            ],
-                            project=op["metadata"]["annotations"][
-                                "operation.polyaxon.com/project"
-                            ],
-                            run_uuid=op["metadata"]["labels"][
-                                "app.kubernetes.io/instance"
-                            ],
-                        ),
-                        op["metadata"]["annotations"]["operation.polyaxon.com/kind"],
-                        op["metadata"]["annotations"]["operation.polyaxon.com/name"],
-                        namespace,
-                    )
-                    for op in _ops
-                ]
-        if not ops:
+        # The operations are cached and kept current by watches after the first call
+        await self.executor.start_ops_informer(namespaces)
+        # The operations are streamed, only their reconcile data is kept
+        try:
+            namespaces_ops = await self.executor.list_ops_in_namespaces(
+                namespaces, transform=get_op_reconcile_data
+            )
+        except Exception as e:
+            # A partial listing would report the missing operations as removed
+            logger.warning("Could not list the cluster operations: %s" % repr(e))
+            return None
+        ops = [op for _ops in namespaces_ops.values() for op in _ops]
+
+        reconcile = self._reconcile_state.get_reconcile(ops)
+        if not reconcile:
+            self._reconcile_state.acknowledge(ops, reconcile)
             return None
 
         logger.info("Reconcile agent.")
-        return await self.client.reconcile_agent(
-            reconcile={"ops": ops},
-        )
+        result = await self.client.reconcile_agent(reconcile=reconcile)
+        self._reconcile_state.acknowledge(ops, reconcile)
+        return result
 
     async def start(self):
         try:
             async with async_exit_context() as exit_event:
-                index = 0
-                timeout = get_wait(index, max_interval=self.max_interval)
+                timeout = get_wait(0, max_interval=self.max_interval)
 
                 while True:
                     try:
                         await asyncio.wait_for(exit_event.wait(), timeout=timeout)
                         break  # If exit_event is set, we break out of the loop
                     except asyncio.TimeoutError:
-                        index += 1
                         await self.refresh_executor()
                         if self._default_auth:
                             await self.reconcile()
                         else:
                             await self.cron()
                         agent_state = await self.process()
+                        await self.client.flush_statuses()
                         if not agent_state:
                             logger.warning(
                                 "Agent state is empty, waiting for next check."
                             )
-                            index = self.max_interval
+                            timeout = self.scheduler.update(None)
                             continue
                         self._check_status(agent_state)
-                        if agent_state.state.full:
-                            index = 2
                         self.ping()
-                        timeout = get_wait(index, max_interval=self.max_interval)
+                        timeout = self.scheduler.update(agent_state)
                         logger.info("Sleeping for {} seconds".format(timeout))
         except Exception as e:
             logger.warning("Agent failed to start: {}".format(repr(e)))
         finally:
+            await self.client.flush_statuses()
             self.end()
 
     async def process(self, **kwargs) -> V1AgentStateResponse:
         try:
-            agent_state = await self.client.get_state()
+            agent_state = await self.client.get_state(
+                wait=self.scheduler.get_wait_for_changes()
+            )
             if agent_state.compatible_updates:
                 self.sync_compatible_updates(agent_state.compatible_updates)
 
@@ -180,29 +175,99 @@ class BaseAsyncAgent(BaseAgent):
             state = agent_state.state
             if not state:
                 return agent_state
-            for run_data in state.schedules or []:
-                await self.submit_run(run_data)
-            for run_data in state.queued or []:
-                await self.submit_run(run_data)
-            for run_data in state.checks or []:
-                await self.check_run(run_data)
-            for run_data in state.stopping or []:
-                await self.stop_run(run_data)
-            for run_data in state.apply or []:
-                await self.apply_run(run_data)
-            for run_data in state.deleting or []:
-                await self.delete_run(run_data)
-            for run_data in state.hooks or []:
-                await self.make_and_create_run(run_data)
-            for run_data in state.watchdogs or []:
-                await self.make_and_create_run(run_data)
-            for run_data in state.tuners or []:
-                await self.make_and_create_run(run_data, True)
+            await self.process_state(state)
             return agent_state
         except Exception as exc:
             logger.error(exc)
             return V1AgentStateResponse.model_construct()
 
+    def get_state_actions(self, state) -> Dict[str, List[Tuple[str, Callable, Tuple]]]:
+        """Groups the actions of the agent state by run.
+
+        The actions of the same run are kept in the state's order
+        and duplicate actions are dropped.
+        """
+        actions = [
+            ("submit", self.submit_run, state.schedules, ()),
+            ("submit", self.submit_run, state.queued, ()),
+            ("check", self.check_run, state.checks, ()),
+            ("stop", self.stop_run, state.stopping, ()),
+            ("apply", self.apply_run, state.apply, ()),
+            ("delete", self.delete_run, state.deleting, ()),
+            ("create", self.make_and_create_run, state.hooks, ()),
+            ("create", self.make_and_create_run, state.watchdogs, ()),
+            ("create", self.make_and_create_run, state.tuners, (True,)),
+        ]
+        runs_actions = defaultdict(list)
+        seen = set()
+        for category, handler, items, args in actions:
+            for run_data in items or []:
+                key = (category, run_data[0])
+                if key in seen:
+                    logger.debug(
+                        "Skipping duplicate {} action for run {}.".format(
+                            category, run_data[0]
+                        )
+                    )
+                    continue
+                seen.add(key)
+                runs_actions[run_data[0]].append(
+                    (category, handler, (run_data,) + args)
+                )
+        return runs_actions
+
+    async def process_state(self, state) -> Dict[str, Dict]:
+        """Processes the runs of the agent state concurrently.
+
+        The runs are processed in parallel, the actions of every run are sequential,
+        and every category of actions is limited to `max_concurrency` concurrent runs.
+
+        Returns the latency metrics of the tick by category.
+        """
+        max_concurrency = settings.AGENT_CONFIG.get_max_concurrency()
+        semaphores = defaultdict(lambda: asyncio.Semaphore(max_concurrency))
+        latencies = defaultdict(list)
+
+        async def process_run(actions: List[Tuple[str, Callable, Tuple]]):
+            for category, handler, args in actions:
+                async with semaphores[category]:
+                    started_at = time.monotonic()
+                    try:
+                        await handler(*args)
+                    except Exception as e:
+                        logger.error(
+                            "Agent failed processing {} action for run {}: {}".format(
+                                category, args[0][0], repr(e)
+                            )
+                        )
+                    latencies[category].append(time.monotonic() - started_at)
+
+        started_at = time.monotonic()
+        runs_actions = self.get_state_actions(state)
+        await asyncio.gather(
+            *[process_run(actions) for actions in runs_actions.values()]
+        )
+        self.tick_metrics = {
+            category: {
+                "count": len(values),
+                "max": max(values),
+                "mean": sum(values) / len(values),
+            }
+            for category, values in latencies.items()
+        }
+        if runs_actions:
+            logger.info(
+                "Processed {} runs in {:.2f} seconds: {}".format(
+                    len(runs_actions),
+                    time.monotonic() - started_at,
+                    ", ".join(
+                        "{} {} (max {:.2f}s)".format(v["count"], k, v["max"])
+                        for k, v in self.tick_metrics.items()
+                    ),
+                )
+            )
+        return self.tick_metrics
+
     async def prepare_run_resource(
         self,
         owner_name: str,
@@ -9,7 +9,10 @@ from polyaxon._auxiliaries import V1PolyaxonInitContainer, V1PolyaxonSidecarCont
 from polyaxon._connections import V1Connection
 from polyaxon._constants.globals import DEFAULT
 from polyaxon._runner.agent.client import AgentClient, AsyncAgentClient
+from polyaxon._runner.agent.reconcile import ReconcileState
+from polyaxon._runner.agent.scheduler import PollingScheduler
 from polyaxon._runner.executor import BaseExecutor
+from polyaxon._runner.pool import close_conversion_pool
 from polyaxon._schemas.checks import ChecksConfig
 from polyaxon._schemas.lifecycle import LiveState, V1Statuses
 from polyaxon.client import V1AgentStateResponse
@@ -44,8 +47,15 @@ class BaseAgent:
         self._graceful_shutdown = False
         self._last_data_collected_at = last_hour
         self._last_reconciled_at = last_hour
+        self.tick_metrics = {}
+        self._reconcile_state = ReconcileState(
+            partial=bool(settings.AGENT_CONFIG.partial_reconcile)
+        )
+        self.scheduler = PollingScheduler(max_interval=self.max_interval)
         agent_client_cls = AsyncAgentClient if self.IS_ASYNC else AgentClient
-        self.client = agent_client_cls(owner=owner, agent_uuid=agent_uuid)
+        self.client = agent_client_cls(
+            owner=owner, agent_uuid=agent_uuid, buffer_statuses=True
+        )
         self.executor = self.EXECUTOR()
         self.content = settings.AGENT_CONFIG.to_json()
 
@@ -124,6 +134,7 @@ class BaseAgent:
 
     def end(self, sleep: Optional[int] = None):
         self._graceful_shutdown = True
+        close_conversion_pool()
         if sleep:
             time.sleep(sleep)
         else:
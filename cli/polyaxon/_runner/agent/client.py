@@ -1,14 +1,22 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 import traceback
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from polyaxon._schemas.lifecycle import V1StatusCondition, V1Statuses
 from polyaxon.client import PolyaxonClient, V1Agent, V1AgentStateResponse
-from polyaxon.exceptions import PolyaxonClientException
+from polyaxon.exceptions import ApiException, PolyaxonClientException
 from polyaxon.logger import logger
 
 
 class _AgentClientBase:
     _IS_ASYNC = False
+    LONG_POLL_HEADER = "X-Polyaxon-Long-Poll"
+    LONG_POLL_TIMEOUT_MARGIN = 30
+    STATUS_RETRIES = 3
+    STATUS_MAX_CONCURRENCY = 10
 
     def __init__(
         self,
@@ -16,9 +24,14 @@ class _AgentClientBase:
         agent_uuid: Optional[str] = None,
         client: Optional[PolyaxonClient] = None,
         internal_client: Optional[PolyaxonClient] = None,
+        buffer_statuses: bool = False,
     ):
         self.owner = owner
         self.agent_uuid = agent_uuid
+        # Runs statuses are sent in bulk with `flush_statuses` if buffered
+        self.buffer_statuses = buffer_statuses
+        self._statuses: Dict[Tuple[str, str, str], List[Dict]] = {}
+        self._statuses_lock = threading.Lock()
         self._validate_client_mode(client, "client")
         self._validate_client_mode(internal_client, "internal_client")
         self._client = client
@@ -63,12 +76,22 @@ class _AgentClientBase:
     def get_info(self) -> V1Agent:
         return self.client.agents_v1.get_agent(owner=self.owner, uuid=self.agent_uuid)
 
-    def get_state(self) -> V1AgentStateResponse:
+    def get_state(self, wait: Optional[int] = None) -> V1AgentStateResponse:
+        """Gets the agent state.
+
+        Args:
+            wait: int, optional, seconds the server can hold the request
+                until the state changes, only used if the server advertises long-polling.
+        """
+        kwargs = {}
+        if wait:
+            kwargs["_headers"] = {self.LONG_POLL_HEADER: str(wait)}
+            kwargs["_request_timeout"] = wait + self.LONG_POLL_TIMEOUT_MARGIN
         if self._is_managed:
             return self.client.agents_v1.get_agent_state(
-                owner=self.owner, uuid=self.agent_uuid
+                owner=self.owner, uuid=self.agent_uuid, **kwargs
             )
-        return self.client.agents_v1.get_global_state(owner=self.owner)
+        return self.client.agents_v1.get_global_state(owner=self.owner, **kwargs)
 
     def log_agent_status(
         self, status: str, reason: Optional[str] = None, message: Optional[str] = None
@@ -193,15 +216,70 @@ class _AgentClientBase:
         status_condition = V1StatusCondition.get_condition(
             type=status, status=True, reason=reason, message=message
         )
+        if self.buffer_statuses:
+            with self._statuses_lock:
+                self._statuses.setdefault(
+                    (run_owner, run_project, run_uuid), []
+                ).append(status_condition)
+            return None
+        return self._create_run_status(
+            run=(run_owner, run_project, run_uuid), status_condition=status_condition
+        )
+
+    def _create_run_status(self, run: Tuple[str, str, str], status_condition):
         return self.client.runs_v1.create_run_status(
-            owner=run_owner,
-            project=run_project,
-            uuid=run_uuid,
+            owner=run[0],
+            project=run[1],
+            uuid=run[2],
             body={"condition": status_condition},
         )
 
+    def _pop_statuses(self) -> Dict[Tuple[str, str, str], List[Dict]]:
+        with self._statuses_lock:
+            statuses, self._statuses = self._statuses, {}
+        return statuses
+
+    @classmethod
+    def _should_retry(cls, exc: Exception, retry: int) -> bool:
+        if retry >= cls.STATUS_RETRIES:
+            return False
+        # The run was deleted or the condition is invalid
+        status = getattr(exc, "status", None)
+        return not (isinstance(exc, ApiException) and status and status < 500)
+
+    @staticmethod
+    def _log_status_error(run: Tuple[str, str, str], exc: Exception):
+        logger.warning(
+            "Agent failed reporting the status of run {}: {}".format(run[2], repr(exc))
+        )
+
 
 class AgentClient(_AgentClientBase):
+    def _send_run_statuses(self, run: Tuple[str, str, str], conditions: List[Dict]):
+        # The conditions of a run are sent in order
+        for status_condition in conditions:
+            retry = 0
+            while True:
+                try:
+                    self._create_run_status(run=run, status_condition=status_condition)
+                    break
+                except Exception as e:
+                    retry += 1
+                    if not self._should_retry(e, retry):
+                        self._log_status_error(run, e)
+                        break
+                    time.sleep(0.5 * 2**retry)
+
+    def flush_statuses(self):
+        """Sends the buffered runs statuses, runs are reported concurrently."""
+        statuses = self._pop_statuses()
+        if not statuses:
+            return
+        workers = min(self.STATUS_MAX_CONCURRENCY, len(statuses))
+        with ThreadPoolExecutor(workers) as pool:
+            for run, conditions in statuses.items():
+                pool.submit(self._send_run_statuses, run, conditions)
+
     def close(self):
         if self._created_client is not None:
             self._created_client.close()
@@ -212,6 +290,60 @@ class AgentClient(_AgentClientBase):
 class AsyncAgentClient(_AgentClientBase):
     _IS_ASYNC = True
 
+    async def log_run_status(
+        self,
+        run_owner: str,
+        run_project: str,
+        run_uuid: str,
+        status: str,
+        reason: Optional[str] = None,
+        message: Optional[str] = None,
+    ):
+        result = super().log_run_status(
+            run_owner=run_owner,
+            run_project=run_project,
+            run_uuid=run_uuid,
+            status=status,
+            reason=reason,
+            message=message,
+        )
+        if result is not None:
+            return await result
+
+    async def _send_run_statuses(
+        self, run: Tuple[str, str, str], conditions: List[Dict]
+    ):
+        # The conditions of a run are sent in order
+        for status_condition in conditions:
+            retry = 0
+            while True:
+                try:
+                    await self._create_run_status(
+                        run=run, status_condition=status_condition
+                    )
+                    break
+                except Exception as e:
+                    retry += 1
+                    if not self._should_retry(e, retry):
+                        self._log_status_error(run, e)
+                        break
+                    await asyncio.sleep(0.5 * 2**retry)
+
+    async def flush_statuses(self):
+        """Sends the buffered runs statuses, runs are reported concurrently."""
+        statuses = self._pop_statuses()
+        if not statuses:
+            return
+        semaphore = asyncio.Semaphore(self.STATUS_MAX_CONCURRENCY)
+
+        async def send(run, conditions):
+            async with semaphore:
+                await self._send_run_statuses(run, conditions)
+
+        await asyncio.gather(
+            *[send(run, conditions) for run, conditions in statuses.items()]
+        )
+
     async def aclose(self):
         if self._created_client is not None:
             await self._created_client.aclose()
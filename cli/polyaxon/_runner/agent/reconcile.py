@@ -0,0 +1,66 @@
+from typing import Dict, List, Optional, Tuple
+
+from clipped.utils.tz import now
+from polyaxon._utils.fqn_utils import get_run_instance
+
+
+def get_op_reconcile_data(op: Dict, namespace: str) -> Tuple[str, str, str, str]:
+    return (
+        get_run_instance(
+            owner=op["metadata"]["annotations"]["operation.polyaxon.com/owner"],
+            project=op["metadata"]["annotations"]["operation.polyaxon.com/project"],
+            run_uuid=op["metadata"]["labels"]["app.kubernetes.io/instance"],
+        ),
+        op["metadata"]["annotations"]["operation.polyaxon.com/kind"],
+        op["metadata"]["annotations"]["operation.polyaxon.com/name"],
+        namespace,
+    )
+
+
+class ReconcileState:
+    """The operations last acknowledged by the API.
+
+    By default, the complete operations list is sent on every reconcile.
+    With `partial`, only if the API supports it, a full reconcile is sent first
+    and every `full_interval` seconds, in between, only the operations added,
+    changed, or removed are sent, and nothing is sent if the cluster state did not change.
+    The operations must come from a complete listing of the cluster,
+    a failed listing must not be reconciled.
+
+    Args:
+        partial: bool, optional, to send only the changes.
+        full_interval: int, optional, seconds between full reconciles.
+    """
+
+    FULL_INTERVAL = 60 * 60
+
+    def __init__(self, partial: bool = False, full_interval: Optional[int] = None):
+        self.partial = partial
+        self.full_interval = full_interval or self.FULL_INTERVAL
+        self.ops: Optional[Dict[str, Tuple]] = None
+        self.last_full_at = None
+
+    def should_send_full(self) -> bool:
+        return (
+            not self.partial
+            or self.ops is None
+            or self.last_full_at is None
+            or (now() - self.last_full_at).total_seconds() > self.full_interval
+        )
+
+    def get_reconcile(self, ops: List[Tuple]) -> Optional[Dict]:
+        if self.should_send_full():
+            return {"ops": ops} if ops else None
+        current_ops = {op[0]: op for op in ops}
+        changed_ops = [op for k, op in current_ops.items() if self.ops.get(k) != op]
+        removed_ops = [op for k, op in self.ops.items() if k not in current_ops]
+        if not changed_ops and not removed_ops:
+            return None
+        return {"ops": changed_ops, "removed": removed_ops, "partial": True}
+
+    def acknowledge(self, ops: List[Tuple], reconcile: Optional[Dict]):
+        if not self.partial:
+            return
+        if reconcile is not None and not reconcile.get("partial"):
+            self.last_full_at = now()
+        self.ops = {op[0]: tuple(op) for op in ops}
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from clipped.utils.workers import get_wait
+from polyaxon._sdk.schemas.v1_agent_state_response import V1AgentStateResponse
+
+
+STATE_QUEUES = (
+    "schedules",
+    "queued",
+    "checks",
+    "stopping",
+    "apply",
+    "deleting",
+    "hooks",
+    "watchdogs",
+    "tuners",
+)
+
+
+def get_state_size(agent_state: Optional[V1AgentStateResponse]) -> int:
+    state = agent_state.state if agent_state else None
+    if not state:
+        return 0
+    return sum(len(getattr(state, queue, None) or []) for queue in STATE_QUEUES)
+
+
+def get_long_poll(agent_state: Optional[V1AgentStateResponse]) -> Optional[int]:
+    """Returns the seconds the server can hold a state request, if advertised."""
+    long_poll = getattr(agent_state, "long_poll", None) if agent_state else None
+    if isinstance(long_poll, int) and not isinstance(long_poll, bool):
+        return long_poll if long_poll > 0 else None
+    return None
+
+
+class PollingScheduler:
+    """Adaptive interval between two checks of the agent state.
+
+    The interval is reset to the minimum while the state has runs to act on,
+    and backs off exponentially, up to `max_interval`, while the agent is idle.
+    While the agent is full, the interval does not go below the third step.
+    If the server advertises long-polling, idle checks wait on the server instead.
+
+    Args:
+        max_interval: int, the number of backoff steps, see `get_wait`.
+    """
+
+    FULL_INDEX = 2
+
+    def __init__(self, max_interval: int):
+        self.max_interval = max_interval
+        self.index = 0
+        self.long_poll = None
+
+    def update(self, agent_state: Optional[V1AgentStateResponse]) -> float:
+        """Updates the scheduler with the last state and returns the next wait."""
+        if not agent_state or not agent_state.state:
+            self.index = self.max_interval
+            self.long_poll = None
+        else:
+            self.long_poll = get_long_poll(agent_state)
+            if get_state_size(agent_state):
+                self.index = 0
+            else:
+                self.index += 1
+            if agent_state.state.full:
+                self.index = max(self.index, self.FULL_INDEX)
+        if self.get_wait_for_changes():
+            return get_wait(0, max_interval=self.max_interval)
+        return get_wait(self.index, max_interval=self.max_interval)
+
+    def get_wait_for_changes(self) -> Optional[int]:
+        """Returns the seconds the next state request should wait for changes."""
+        if self.long_poll and self.index > 0:
+            return self.long_poll
+        return None
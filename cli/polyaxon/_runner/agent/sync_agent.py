@@ -1,7 +1,8 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
 import time
 import traceback
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from kubernetes.client.rest import ApiException
 from urllib3.exceptions import HTTPError
@@ -12,7 +13,7 @@ from clipped.utils.workers import get_pool_workers, get_wait, sync_exit_context
 from polyaxon import pkg, settings
 from polyaxon._env_vars.getters import get_run_info
 from polyaxon._runner.agent.base_agent import BaseAgent
-from polyaxon._utils.fqn_utils import get_run_instance
+from polyaxon._runner.agent.reconcile import get_op_reconcile_data
 from polyaxon.client import V1Agent, V1AgentStateResponse
 from polyaxon.exceptions import (
     ApiException as SDKApiException,
@@ -25,6 +26,12 @@ from polyaxon.logger import logger
 class BaseSyncAgent(BaseAgent):
     IS_ASYNC = False
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Runs handled by the pool, a run is not handled again until its task is done
+        self._runs_in_flight: Dict[str, Future] = {}
+        self._runs_in_flight_lock = threading.Lock()
+
     def _enter(self):
         if not self.client._is_managed:
             return self
@@ -50,6 +57,7 @@ class BaseSyncAgent(BaseAgent):
             raise PolyaxonAgentError(f"Unexpected error: {str(e)}") from e
 
     def _exit(self):
+        self.executor.stop_ops_informer()
         if not self.client._is_managed:
             return
         if not self._graceful_shutdown:
@@ -97,72 +105,86 @@ class BaseSyncAgent(BaseAgent):
         self._last_reconciled_at = now()
         namespaces = [settings.AGENT_CONFIG.namespace]
         namespaces += settings.AGENT_CONFIG.additional_namespaces or []
-        ops = []
-        for namespace in namespaces:
-            _ops = self.executor.list_ops(namespace=namespace)
-            if _ops:
-                ops += [
-                    (
-                        get_run_instance(
-                            owner=op["metadata"]["annotations"][
-                                "operation.polyaxon.com/owner"
-                            ],
-                            project=op["metadata"]["annotations"][
-                                "operation.polyaxon.com/project"
-                            ],
-                            run_uuid=op["metadata"]["labels"][
-                                "app.kubernetes.io/instance"
-                            ],
-                        ),
-                        op["metadata"]["annotations"]["operation.polyaxon.com/kind"],
-                        op["metadata"]["annotations"]["operation.polyaxon.com/name"],
-                        namespace,
-                    )
-                    for op in _ops
-                ]
-        if not ops:
+        # The operations are cached and kept current by watches after the first call
+        self.executor.start_ops_informer(namespaces)
+        # The operations are streamed, only their reconcile data is kept
+        try:
+            namespaces_ops = self.executor.list_ops_in_namespaces(
+                namespaces, transform=get_op_reconcile_data
+            )
+        except Exception as e:
+            # A partial listing would report the missing operations as removed
+            logger.warning("Could not list the cluster operations: %s" % repr(e))
+            return None
+        ops = [op for _ops in namespaces_ops.values() for op in _ops]
+
+        reconcile = self._reconcile_state.get_reconcile(ops)
+        if not reconcile:
+            self._reconcile_state.acknowledge(ops, reconcile)
             return None
 
         logger.info("Reconcile agent.")
-        return self.client.reconcile_agent(
-            reconcile={"ops": ops},
-        )
+        result = self.client.reconcile_agent(reconcile=reconcile)
+        self._reconcile_state.acknowledge(ops, reconcile)
+        return result
 
     def start(self):
         try:
             with sync_exit_context() as exit_event:
-                index = 0
                 workers = get_pool_workers()
 
                 with ThreadPoolExecutor(workers) as pool:
                     logger.debug("Thread pool Workers: {}".format(workers))
-                    timeout = get_wait(index, max_interval=self.max_interval)
+                    timeout = get_wait(0, max_interval=self.max_interval)
                     while not exit_event.wait(timeout=timeout):
-                        index += 1
                         self.refresh_executor()
                         if self._default_auth:
                             self.reconcile()
                         else:
                             self.cron()
                         agent_state = self.process(pool)
+                        self.client.flush_statuses()
                         if not agent_state:
                             logger.warning(
                                 "Agent state is empty, waiting for next check."
                             )
-                            index = self.max_interval
+                            timeout = self.scheduler.update(None)
                             continue
                         self._check_status(agent_state)
-                        if agent_state.state.full:
-                            index = 2
                         self.ping()
-                        timeout = get_wait(index, max_interval=self.max_interval)
+                        timeout = self.scheduler.update(agent_state)
                         logger.info("Sleeping for {} seconds".format(timeout))
         finally:
+            self.client.flush_statuses()
             self.end()
 
+    def _release_run(self, key: str, future: Future):
+        with self._runs_in_flight_lock:
+            if self._runs_in_flight.get(key) is future:
+                self._runs_in_flight.pop(key)
+
+    def _submit_run_task(
+        self, pool: "ThreadPoolExecutor", func: Callable, run_data: Tuple, *args
+    ) -> Optional[Future]:
+        """Submits a run's task, unless a previous task of the run is still running."""
+        key = run_data[0]
+        with self._runs_in_flight_lock:
+            if key in self._runs_in_flight:
+                logger.debug("Run {} is still being handled.".format(key))
+                return None
+            future = pool.submit(func, run_data, *args)
+            self._runs_in_flight[key] = future
+        future.add_done_callback(lambda f: self._release_run(key, f))
+        return future
+
     def process(self, pool: "ThreadPoolExecutor") -> V1AgentStateResponse:
+        # The statuses buffered by the tasks done since the last tick
+        # are sent before getting the next state
+        self.client.flush_statuses()
         try:
-            agent_state = self.client.get_state()
+            agent_state = self.client.get_state(
+                wait=self.scheduler.get_wait_for_changes()
+            )
             if agent_state.compatible_updates:
                 self.sync_compatible_updates(agent_state.compatible_updates)
 
@@ -176,23 +198,23 @@ class BaseSyncAgent(BaseAgent):
             if not state:
                 return agent_state
             for run_data in state.schedules or []:
-                pool.submit(self.submit_run, run_data)
+                self._submit_run_task(pool, self.submit_run, run_data)
             for run_data in state.queued or []:
-                pool.submit(self.submit_run, run_data)
+                self._submit_run_task(pool, self.submit_run, run_data)
             for run_data in state.checks or []:
-                pool.submit(self.check_run, run_data)
+                self._submit_run_task(pool, self.check_run, run_data)
             for run_data in state.stopping or []:
-                pool.submit(self.stop_run, run_data)
+                self._submit_run_task(pool, self.stop_run, run_data)
             for run_data in state.apply or []:
-                pool.submit(self.apply_run, run_data)
+                self._submit_run_task(pool, self.apply_run, run_data)
             for run_data in state.deleting or []:
-                pool.submit(self.delete_run, run_data)
+                self._submit_run_task(pool, self.delete_run, run_data)
             for run_data in state.hooks or []:
-                pool.submit(self.make_and_create_run, run_data)
+                self._submit_run_task(pool, self.make_and_create_run, run_data)
             for run_data in state.watchdogs or []:
-                pool.submit(self.make_and_create_run, run_data)
+                self._submit_run_task(pool, self.make_and_create_run, run_data)
             for run_data in state.tuners or []:
-                pool.submit(self.make_and_create_run, run_data, True)
+                self._submit_run_task(pool, self.make_and_create_run, run_data, True)
             return agent_state
         except Exception as exc:
             logger.error(exc)
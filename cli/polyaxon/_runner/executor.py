@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from clipped.utils.enums import get_enum_value
 from clipped.utils.paths import delete_path
@@ -232,3 +232,28 @@ class BaseExecutor:
 
     def list_ops(self, namespace: str = None):
         raise NotImplementedError
+
+    def list_ops_in_namespaces(
+        self,
+        namespaces: List[str],
+        transform: Optional[Callable[[Dict, str], Any]] = None,
+    ) -> Dict[str, List]:
+        """Lists the operations of each namespace.
+
+        If `transform` is provided, only `transform(op, namespace)` is kept.
+        """
+        transform = transform or (lambda op, _: op)
+        return {
+            namespace: [
+                transform(op, namespace)
+                for op in self.list_ops(namespace=namespace) or []
+            ]
+            for namespace in namespaces
+        }
+
+    def start_ops_informer(self, namespaces: List[str]):
+        """Keeps a local cache of the operations used by `list_ops`, optional."""
+        return None
+
+    def stop_ops_informer(self):
+        return None
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import threading
+from typing import Any, Callable, Optional
+
+from clipped.utils.coroutine import run_sync
+from polyaxon import settings
+from polyaxon._schemas.agent import ConversionPoolKind
+from polyaxon.logger import logger
+
+
+_POOL: Optional[Executor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_conversion_pool(process_only: bool = False) -> Optional[Executor]:
+    """Returns the pool configured to compile and convert runs.
+
+    Returns `None` if no pool is configured,
+    or if `process_only` is set and the configured pool uses threads.
+    """
+    global _POOL
+
+    agent_config = settings.AGENT_CONFIG
+    kind = agent_config.conversion_pool if agent_config else None
+    if not kind or (process_only and kind != ConversionPoolKind.PROCESS):
+        return None
+    with _POOL_LOCK:
+        if _POOL is None:
+            workers = agent_config.get_conversion_workers()
+            logger.debug("Conversion {} pool workers: {}".format(kind, workers))
+            if kind == ConversionPoolKind.PROCESS:
+                _POOL = ProcessPoolExecutor(max_workers=workers)
+            else:
+                _POOL = ThreadPoolExecutor(max_workers=workers)
+        return _POOL
+
+
+def close_conversion_pool():
+    global _POOL
+
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False)
+        _POOL = None
+
+
+def run_in_pool(pool: Optional[Executor], func: Callable, **kwargs) -> Any:
+    if pool is None:
+        return func(**kwargs)
+    return pool.submit(partial(func, **kwargs)).result()
+
+
+async def arun_in_pool(pool: Optional[Executor], func: Callable, **kwargs) -> Any:
+    if pool is None:
+        return await run_sync(func, **kwargs)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(pool, partial(func, **kwargs))
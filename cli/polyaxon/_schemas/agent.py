@@ -9,6 +9,7 @@ from clipped.compact.pydantic import (
     validation_before,
 )
 from clipped.config.schema import skip_partial, to_partial
+from clipped.utils.enums import PEnum
 from polyaxon._auxiliaries import (
     V1DefaultScheduling,
     V1PolyaxonCleaner,
@@ -25,12 +26,16 @@ from polyaxon._env_vars.keys import (
     ENV_KEYS_AGENT_ARTIFACTS_STORE,
     ENV_KEYS_AGENT_CLEANER,
     ENV_KEYS_AGENT_CONNECTIONS,
+    ENV_KEYS_AGENT_CONVERSION_POOL,
+    ENV_KEYS_AGENT_CONVERSION_WORKERS,
     ENV_KEYS_AGENT_DEFAULT_IMAGE_PULL_SECRETS,
     ENV_KEYS_AGENT_DEFAULT_SCHEDULING,
     ENV_KEYS_AGENT_ENABLE_HEALTH_CHECKS,
     ENV_KEYS_AGENT_EXECUTOR_REFRESH_INTERVAL,
     ENV_KEYS_AGENT_INIT,
+    ENV_KEYS_AGENT_MAX_CONCURRENCY,
     ENV_KEYS_AGENT_NOTIFIER,
+    ENV_KEYS_AGENT_PARTIAL_RECONCILE,
     ENV_KEYS_AGENT_RUNS_SA,
     ENV_KEYS_AGENT_SECRET_NAME,
     ENV_KEYS_AGENT_SIDECAR,
@@ -190,6 +195,11 @@ class BaseAgentConfig(ConnectionCatalog, BaseSchemaModel):
             os.environ[ENV_KEYS_ARTIFACTS_STORE_NAME] = self.artifacts_store.name
 
 
+class ConversionPoolKind(str, PEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 class AgentConfig(BaseAgentConfig):
     _IDENTIFIER = "agent"
     _CUSTOM_DUMP_FIELDS = {
@@ -242,6 +252,19 @@ class AgentConfig(BaseAgentConfig):
     executor_refresh_interval: Optional[int] = Field(
         default=None, alias=ENV_KEYS_AGENT_EXECUTOR_REFRESH_INTERVAL
     )
+    max_concurrency: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_AGENT_MAX_CONCURRENCY
+    )
+    conversion_pool: Optional[ConversionPoolKind] = Field(
+        default=None, alias=ENV_KEYS_AGENT_CONVERSION_POOL
+    )
+    conversion_workers: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_AGENT_CONVERSION_WORKERS
+    )
+    # Only enable if the API supports reconciling the changes, see `ReconcileState`
+    partial_reconcile: Optional[bool] = Field(
+        default=None, alias=ENV_KEYS_AGENT_PARTIAL_RECONCILE
+    )
 
     @model_validator(**validation_before)
     def handle_camel_case_agent(cls, values):
@@ -317,6 +340,30 @@ class AgentConfig(BaseAgentConfig):
             values[ENV_KEYS_AGENT_EXECUTOR_REFRESH_INTERVAL] = values[
                 "executorRefreshInterval"
             ]
+        if (
+            not values.get("max_concurrency")
+            and not values.get(ENV_KEYS_AGENT_MAX_CONCURRENCY)
+            and "maxConcurrency" in values
+        ):
+            values[ENV_KEYS_AGENT_MAX_CONCURRENCY] = values["maxConcurrency"]
+        if (
+            not values.get("conversion_pool")
+            and not values.get(ENV_KEYS_AGENT_CONVERSION_POOL)
+            and "conversionPool" in values
+        ):
+            values[ENV_KEYS_AGENT_CONVERSION_POOL] = values["conversionPool"]
+        if (
+            not values.get("partial_reconcile")
+            and not values.get(ENV_KEYS_AGENT_PARTIAL_RECONCILE)
+            and "partialReconcile" in values
+        ):
+            values[ENV_KEYS_AGENT_PARTIAL_RECONCILE] = values["partialReconcile"]
+        if (
+            not values.get("conversion_workers")
+            and not values.get(ENV_KEYS_AGENT_CONVERSION_WORKERS)
+            and "conversionWorkers" in values
+        ):
+            values[ENV_KEYS_AGENT_CONVERSION_WORKERS] = values["conversionWorkers"]
         return values
 
     def __init__(
@@ -377,5 +424,11 @@ class AgentConfig(BaseAgentConfig):
     def get_executor_refresh_interval(self) -> int:
         return self.executor_refresh_interval or 60 * 5
 
+    def get_max_concurrency(self) -> int:
+        return max(self.max_concurrency or 20, 1)
+
+    def get_conversion_workers(self) -> int:
+        return max(self.conversion_workers or os.cpu_count() or 1, 1)
+
 
 PartialAgentConfig = to_partial(AgentConfig)
@@ -4,6 +4,7 @@ from typing import Dict, Optional, Union
 import urllib3
 
 from clipped.compact.pydantic import Field, StrictStr
+from clipped.utils.enums import PEnum
 from clipped.utils.http import clean_host
 from polyaxon._contexts import paths as ctx_paths
 from polyaxon._env_vars.keys import (
@@ -13,8 +14,12 @@ from polyaxon._env_vars.keys import (
     ENV_KEYS_AUTHENTICATION_TYPE,
     ENV_KEYS_CERT_FILE,
     ENV_KEYS_CONNECTION_POOL_MAXSIZE,
+    ENV_KEYS_CONNECTION_POOL_SHARED,
+    ENV_KEYS_CONNECTION_POOLS,
     ENV_KEYS_DEBUG,
     ENV_KEYS_DISABLE_ERRORS_REPORTING,
+    ENV_KEYS_DOWNLOAD_SEGMENT_SIZE,
+    ENV_KEYS_DOWNLOAD_THREADS,
     ENV_KEYS_HEADER,
     ENV_KEYS_HEADER_SERVICE,
     ENV_KEYS_HOST,
@@ -29,13 +34,21 @@ from polyaxon._env_vars.keys import (
     ENV_KEYS_NO_API,
     ENV_KEYS_NO_OP,
     ENV_KEYS_RETRIES,
+    ENV_KEYS_RUN_JOURNAL,
     ENV_KEYS_SECRET_INTERNAL_TOKEN,
     ENV_KEYS_SSL_CA_CERT,
     ENV_KEYS_TIME_ZONE,
     ENV_KEYS_TIMEOUT,
     ENV_KEYS_TRACKING_TIMEOUT,
+    ENV_KEYS_UPLOAD_PART_SIZE,
+    ENV_KEYS_UPLOAD_THREADS,
     ENV_KEYS_VERIFY_SSL,
     ENV_KEYS_WATCH_INTERVAL,
+    ENV_KEYS_WORKER_BATCH_INTERVAL,
+    ENV_KEYS_WORKER_BATCH_SIZE,
+    ENV_KEYS_WORKER_QUEUE_POLICY,
+    ENV_KEYS_WORKER_QUEUE_SIZE,
+    ENV_KEYS_WORKER_THREADS,
 )
 from polyaxon._schemas.base import BaseSchemaModel
 from polyaxon._sdk.configuration import Configuration
@@ -47,6 +60,13 @@ from polyaxon.exceptions import PolyaxonClientException
 from polyaxon.pkg import VERSION
 
 
+class QueuePolicy(str, PEnum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    SPILL = "spill"
+
+
 class ClientConfig(BaseSchemaModel):
     _IDENTIFIER = "global"
 
@@ -81,6 +101,12 @@ class ClientConfig(BaseSchemaModel):
     connection_pool_maxsize: Optional[int] = Field(
         default=None, alias=ENV_KEYS_CONNECTION_POOL_MAXSIZE
     )
+    connection_pools: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_CONNECTION_POOLS
+    )
+    connection_pool_shared: Optional[bool] = Field(
+        default=True, alias=ENV_KEYS_CONNECTION_POOL_SHARED
+    )
     archives_root: Optional[StrictStr] = Field(
         default=ctx_paths.CONTEXT_ARCHIVES_ROOT, alias=ENV_KEYS_ARCHIVES_ROOT
     )
@@ -99,6 +125,30 @@ class ClientConfig(BaseSchemaModel):
         default=None, alias=ENV_KEYS_INTERVALS_COMPATIBILITY_CHECK
     )
     retries: Optional[int] = Field(default=None, alias=ENV_KEYS_RETRIES)
+    worker_batch_size: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_WORKER_BATCH_SIZE
+    )
+    worker_batch_interval: Optional[float] = Field(
+        default=None, alias=ENV_KEYS_WORKER_BATCH_INTERVAL
+    )
+    worker_threads: Optional[int] = Field(default=None, alias=ENV_KEYS_WORKER_THREADS)
+    worker_queue_size: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_WORKER_QUEUE_SIZE
+    )
+    worker_queue_policy: Optional[QueuePolicy] = Field(
+        default=None, alias=ENV_KEYS_WORKER_QUEUE_POLICY
+    )
+    run_journal: Optional[bool] = Field(default=False, alias=ENV_KEYS_RUN_JOURNAL)
+    upload_part_size: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_UPLOAD_PART_SIZE
+    )
+    upload_threads: Optional[int] = Field(default=None, alias=ENV_KEYS_UPLOAD_THREADS)
+    download_segment_size: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_DOWNLOAD_SEGMENT_SIZE
+    )
+    download_threads: Optional[int] = Field(
+        default=None, alias=ENV_KEYS_DOWNLOAD_THREADS
+    )
     token: Optional[StrictStr] = None
     client_header: Optional[Dict] = None
 
@@ -189,6 +239,9 @@ class ClientConfig(BaseSchemaModel):
         config.assert_hostname = self.assert_hostname
         if self.connection_pool_maxsize:
             config.connection_pool_maxsize = self.connection_pool_maxsize
+        if self.connection_pools:
+            config.connection_pools = self.connection_pools
+        config.connection_pool_shared = self.connection_pool_shared
         if self.token:
             config.api_key["ApiKey"] = token or self.token
             config.api_key_prefix["ApiKey"] = (
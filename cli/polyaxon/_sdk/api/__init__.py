@@ -1,19 +1,63 @@
-from polyaxon._sdk.api.agents_v1_api import AgentsV1Api
-from polyaxon._sdk.api.artifacts_stores_v1_api import ArtifactsStoresV1Api
-from polyaxon._sdk.api.auth_v1_api import AuthV1Api
-from polyaxon._sdk.api.connections_v1_api import ConnectionsV1Api
-from polyaxon._sdk.api.dashboards_v1_api import DashboardsV1Api
-from polyaxon._sdk.api.organizations_v1_api import OrganizationsV1Api
-from polyaxon._sdk.api.presets_v1_api import PresetsV1Api
-from polyaxon._sdk.api.project_dashboards_v1_api import ProjectDashboardsV1Api
-from polyaxon._sdk.api.project_searches_v1_api import ProjectSearchesV1Api
-from polyaxon._sdk.api.projects_v1_api import ProjectsV1Api
-from polyaxon._sdk.api.queues_v1_api import QueuesV1Api
-from polyaxon._sdk.api.runs_v1_api import RunsV1Api
-from polyaxon._sdk.api.sandbox_v1_api import SandboxV1Api
-from polyaxon._sdk.api.searches_v1_api import SearchesV1Api
-from polyaxon._sdk.api.service_accounts_v1_api import ServiceAccountsV1Api
-from polyaxon._sdk.api.tags_v1_api import TagsV1Api
-from polyaxon._sdk.api.teams_v1_api import TeamsV1Api
-from polyaxon._sdk.api.users_v1_api import UsersV1Api
-from polyaxon._sdk.api.versions_v1_api import VersionsV1Api
+import importlib
+
+from typing import TYPE_CHECKING, Any, List
+
+
+if TYPE_CHECKING:
+    from polyaxon._sdk.api.agents_v1_api import AgentsV1Api
+    from polyaxon._sdk.api.artifacts_stores_v1_api import ArtifactsStoresV1Api
+    from polyaxon._sdk.api.auth_v1_api import AuthV1Api
+    from polyaxon._sdk.api.connections_v1_api import ConnectionsV1Api
+    from polyaxon._sdk.api.dashboards_v1_api import DashboardsV1Api
+    from polyaxon._sdk.api.organizations_v1_api import OrganizationsV1Api
+    from polyaxon._sdk.api.presets_v1_api import PresetsV1Api
+    from polyaxon._sdk.api.project_dashboards_v1_api import ProjectDashboardsV1Api
+    from polyaxon._sdk.api.project_searches_v1_api import ProjectSearchesV1Api
+    from polyaxon._sdk.api.projects_v1_api import ProjectsV1Api
+    from polyaxon._sdk.api.queues_v1_api import QueuesV1Api
+    from polyaxon._sdk.api.runs_v1_api import RunsV1Api
+    from polyaxon._sdk.api.sandbox_v1_api import SandboxV1Api
+    from polyaxon._sdk.api.searches_v1_api import SearchesV1Api
+    from polyaxon._sdk.api.service_accounts_v1_api import ServiceAccountsV1Api
+    from polyaxon._sdk.api.tags_v1_api import TagsV1Api
+    from polyaxon._sdk.api.teams_v1_api import TeamsV1Api
+    from polyaxon._sdk.api.users_v1_api import UsersV1Api
+    from polyaxon._sdk.api.versions_v1_api import VersionsV1Api
+
+
+_LAZY_IMPORTS = {
+    "AgentsV1Api": "polyaxon._sdk.api.agents_v1_api",
+    "ArtifactsStoresV1Api": "polyaxon._sdk.api.artifacts_stores_v1_api",
+    "AuthV1Api": "polyaxon._sdk.api.auth_v1_api",
+    "ConnectionsV1Api": "polyaxon._sdk.api.connections_v1_api",
+    "DashboardsV1Api": "polyaxon._sdk.api.dashboards_v1_api",
+    "OrganizationsV1Api": "polyaxon._sdk.api.organizations_v1_api",
+    "PresetsV1Api": "polyaxon._sdk.api.presets_v1_api",
+    "ProjectDashboardsV1Api": "polyaxon._sdk.api.project_dashboards_v1_api",
+    "ProjectSearchesV1Api": "polyaxon._sdk.api.project_searches_v1_api",
+    "ProjectsV1Api": "polyaxon._sdk.api.projects_v1_api",
+    "QueuesV1Api": "polyaxon._sdk.api.queues_v1_api",
+    "RunsV1Api": "polyaxon._sdk.api.runs_v1_api",
+    "SandboxV1Api": "polyaxon._sdk.api.sandbox_v1_api",
+    "SearchesV1Api": "polyaxon._sdk.api.searches_v1_api",
+    "ServiceAccountsV1Api": "polyaxon._sdk.api.service_accounts_v1_api",
+    "TagsV1Api": "polyaxon._sdk.api.tags_v1_api",
+    "TeamsV1Api": "polyaxon._sdk.api.teams_v1_api",
+    "UsersV1Api": "polyaxon._sdk.api.users_v1_api",
+    "VersionsV1Api": "polyaxon._sdk.api.versions_v1_api",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
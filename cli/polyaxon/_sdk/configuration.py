@@ -178,6 +178,14 @@ class Configuration(object):
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.connection_pools = None
+        """urllib3 pool manager's number of host pools.
+        """
+
+        self.connection_pool_shared = False
+        """Use a process-wide pool manager shared with other clients.
+        """
+
         self.proxy = None
         """Proxy URL
         """
@@ -1,146 +1,301 @@
-from polyaxon._sdk.schemas.v1_activity import V1Activity
-from polyaxon._sdk.schemas.v1_agent import V1Agent
-from polyaxon._sdk.schemas.v1_agent_reconcile_body_request import (
-    V1AgentReconcileBodyRequest,
-)
-from polyaxon._sdk.schemas.v1_agent_resources_request import V1AgentResourcesRequest
-from polyaxon._sdk.schemas.v1_agent_state_response import V1AgentStateResponse
-from polyaxon._sdk.schemas.v1_agent_state_response_agent_state import (
-    V1AgentStateResponseAgentState,
-)
-from polyaxon._sdk.schemas.v1_agent_status_body_request import V1AgentStatusBodyRequest
-from polyaxon._sdk.schemas.v1_analytics_spec import V1AnalyticsSpec
-from polyaxon._sdk.schemas.v1_artifact_tree import V1ArtifactTree
-from polyaxon._sdk.schemas.v1_auth import V1Auth
-from polyaxon._sdk.schemas.v1_automation import (
-    AutomationStateKind,
-    AutomationActionKind,
-    AutomationExecutionKind,
-    AutomationTargetKind,
-    AutomationExecutionStatus,
-    AutomationFailStrategy,
-    AutomationTriggerStateKind,
-    MetricTriggerConfigCondition,
-    TriggerConfig,
-    AutomationTriggerPosture,
-    AutomationTriggerKind,
-    V1Automation,
-    V1AutomationAction,
-    V1CompoundTriggerConfig,
-    V1EventTriggerConfig,
-    V1MetricTriggerConfig,
-    V1QueryTriggerConfig,
-    V1SequenceTriggerConfig,
-    V1SubTriggerConfig,
-)
-from polyaxon._sdk.schemas.v1_automation_test_request import V1AutomationTestRequest
-from polyaxon._sdk.schemas.v1_cloning import V1Cloning
-from polyaxon._sdk.schemas.v1_connection_response import V1ConnectionResponse
-from polyaxon._sdk.schemas.v1_dashboard import V1Dashboard
-from polyaxon._sdk.schemas.v1_dashboard_spec import V1DashboardSpec
-from polyaxon._sdk.schemas.v1_entities_tags import V1EntitiesTags
-from polyaxon._sdk.schemas.v1_owner_sub_entity_resource_promote_request import (
-    V1OwnerSubEntityResourcePromoteRequest,
-)
-from polyaxon._sdk.schemas.v1_list_automation_executions_response import (
-    V1ListAutomationExecutionsResponse,
-)
-from polyaxon._sdk.schemas.v1_policy import V1Policy
-from polyaxon._sdk.schemas.v1_list_policies_response import V1ListPoliciesResponse
-from polyaxon._sdk.schemas.v1_entities_transfer import V1EntitiesTransfer
-from polyaxon._sdk.schemas.v1_entity_notification_body import V1EntityNotificationBody
-from polyaxon._sdk.schemas.v1_entity_stage_body_request import V1EntityStageBodyRequest
-from polyaxon._sdk.schemas.v1_entity_status_body_request import (
-    V1EntityStatusBodyRequest,
-)
-from polyaxon._sdk.schemas.v1_events_response import (
-    V1EventsResponse,
-    V1MultiEventsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_activities_response import V1ListActivitiesResponse
-from polyaxon._sdk.schemas.v1_list_agents_response import V1ListAgentsResponse
-from polyaxon._sdk.schemas.v1_list_bookmarks_response import V1ListBookmarksResponse
-from polyaxon._sdk.schemas.v1_list_connections_response import V1ListConnectionsResponse
-from polyaxon._sdk.schemas.v1_list_dashboards_response import V1ListDashboardsResponse
-from polyaxon._sdk.schemas.v1_list_organization_members_response import (
-    V1ListOrganizationMembersResponse,
-)
-from polyaxon._sdk.schemas.v1_list_organizations_response import (
-    V1ListOrganizationsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_presets_response import V1ListPresetsResponse
-from polyaxon._sdk.schemas.v1_list_project_versions_response import (
-    V1ListProjectVersionsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_projects_response import V1ListProjectsResponse
-from polyaxon._sdk.schemas.v1_list_queues_response import V1ListQueuesResponse
-from polyaxon._sdk.schemas.v1_list_run_artifacts_response import (
-    V1ListRunArtifactsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_run_connections_response import (
-    V1ListRunConnectionsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_run_edges_response import V1ListRunEdgesResponse
-from polyaxon._sdk.schemas.v1_list_runs_response import V1ListRunsResponse
-from polyaxon._sdk.schemas.v1_list_searches_response import V1ListSearchesResponse
-from polyaxon._sdk.schemas.v1_list_service_accounts_response import (
-    V1ListServiceAccountsResponse,
-)
-from polyaxon._sdk.schemas.v1_list_tags_response import V1ListTagsResponse
-from polyaxon._sdk.schemas.v1_list_team_members_response import (
-    V1ListTeamMembersResponse,
-)
-from polyaxon._sdk.schemas.v1_entity_level import V1EntityLevel
-from polyaxon._sdk.schemas.v1_list_teams_response import V1ListTeamsResponse
-from polyaxon._sdk.schemas.v1_list_token_response import V1ListTokenResponse
-from polyaxon._sdk.schemas.v1_operation_body import V1OperationBody
-from polyaxon._sdk.schemas.v1_organization import V1Organization
-from polyaxon._sdk.schemas.v1_organization_member import V1OrganizationMember
-from polyaxon._sdk.schemas.v1_password_change import V1PasswordChange
-from polyaxon._sdk.schemas.v1_pipeline import V1Pipeline
-from polyaxon._sdk.schemas.v1_preset import V1Preset
-from polyaxon._sdk.schemas.v1_project import V1Project
-from polyaxon._sdk.schemas.v1_project_settings import V1ProjectSettings
-from polyaxon._sdk.schemas.v1_project_version import V1ProjectVersion
-from polyaxon._sdk.schemas.v1_queue import V1Queue
-from polyaxon._sdk.schemas.v1_run import V1Run
-from polyaxon._sdk.schemas.v1_run_connection import V1RunConnection
-from polyaxon._sdk.schemas.v1_run_edge import V1RunEdge
-from polyaxon._sdk.schemas.v1_run_edge_lineage import V1RunEdgeLineage
-from polyaxon._sdk.schemas.v1_run_edges_graph import V1RunEdgesGraph
-from polyaxon._sdk.schemas.v1_run_reference_catalog import V1RunReferenceCatalog
-from polyaxon._sdk.schemas.v1_run_settings import V1RunSettings
-from polyaxon._sdk.schemas.v1_search import V1Search
-from polyaxon._sdk.schemas.v1_search_spec import V1SearchSpec
-from polyaxon._sdk.schemas.v1_section_spec import V1SectionSpec
-from polyaxon._sdk.schemas.v1_service_account import V1ServiceAccount
-from polyaxon._sdk.schemas.v1_settings_catalog import V1SettingsCatalog
-from polyaxon._sdk.schemas.v1_tag import V1Tag
-from polyaxon._sdk.schemas.v1_team import V1Team
-from polyaxon._sdk.schemas.v1_team_member import V1TeamMember
-from polyaxon._sdk.schemas.v1_team_settings import V1TeamSettings
-from polyaxon._sdk.schemas.v1_token import V1Token
-from polyaxon._sdk.schemas.v1_trial_start import V1TrialStart
-from polyaxon._sdk.schemas.v1_user import V1User
-from polyaxon._sdk.schemas.v1_user_access import V1UserAccess
-from polyaxon._sdk.schemas.v1_user_email import V1UserEmail
-from polyaxon._sdk.schemas.v1_user_singup import V1UserSingup
-from polyaxon._sdk.schemas.v1_uuids import V1Uuids
-from polyaxon._sdk.schemas.v1_create_pty_request import V1CreatePtyRequest
-from polyaxon._sdk.schemas.v1_exec_bg_list import V1ExecBgList
-from polyaxon._sdk.schemas.v1_exec_bg_logs import V1ExecBgLogs
-from polyaxon._sdk.schemas.v1_exec_bg_request import V1ExecBgRequest
-from polyaxon._sdk.schemas.v1_exec_bg_start import V1ExecBgStart
-from polyaxon._sdk.schemas.v1_exec_bg_status import V1ExecBgStatus
-from polyaxon._sdk.schemas.v1_exec_request import V1ExecRequest
-from polyaxon._sdk.schemas.v1_exec_result import V1ExecResult
-from polyaxon._sdk.schemas.v1_fs_entry import V1FsEntry
-from polyaxon._sdk.schemas.v1_fs_list_result import V1FsListResult
-from polyaxon._sdk.schemas.v1_fs_mkdir_request import V1FsMkdirRequest
-from polyaxon._sdk.schemas.v1_fs_path_result import V1FsPathResult
-from polyaxon._sdk.schemas.v1_fs_stat_result import V1FsStatResult
-from polyaxon._sdk.schemas.v1_ping_response import V1PingResponse
-from polyaxon._sdk.schemas.v1_pty import V1Pty
-from polyaxon._sdk.schemas.v1_pty_list import V1PtyList
-from polyaxon._sdk.schemas.v1_resize_pty_request import V1ResizePtyRequest
-from polyaxon._sdk.schemas.v1_signal_request import V1SignalRequest
+import importlib
+
+from typing import TYPE_CHECKING, Any, List
+
+
+if TYPE_CHECKING:
+    from polyaxon._sdk.schemas.v1_activity import V1Activity
+    from polyaxon._sdk.schemas.v1_agent import V1Agent
+    from polyaxon._sdk.schemas.v1_agent_reconcile_body_request import (
+        V1AgentReconcileBodyRequest,
+    )
+    from polyaxon._sdk.schemas.v1_agent_resources_request import V1AgentResourcesRequest
+    from polyaxon._sdk.schemas.v1_agent_state_response import V1AgentStateResponse
+    from polyaxon._sdk.schemas.v1_agent_state_response_agent_state import (
+        V1AgentStateResponseAgentState,
+    )
+    from polyaxon._sdk.schemas.v1_agent_status_body_request import (
+        V1AgentStatusBodyRequest,
+    )
+    from polyaxon._sdk.schemas.v1_analytics_spec import V1AnalyticsSpec
+    from polyaxon._sdk.schemas.v1_artifact_tree import V1ArtifactTree
+    from polyaxon._sdk.schemas.v1_auth import V1Auth
+    from polyaxon._sdk.schemas.v1_automation import (
+        AutomationStateKind,
+        AutomationActionKind,
+        AutomationExecutionKind,
+        AutomationTargetKind,
+        AutomationExecutionStatus,
+        AutomationFailStrategy,
+        AutomationTriggerStateKind,
+        MetricTriggerConfigCondition,
+        TriggerConfig,
+        AutomationTriggerPosture,
+        AutomationTriggerKind,
+        V1Automation,
+        V1AutomationAction,
+        V1CompoundTriggerConfig,
+        V1EventTriggerConfig,
+        V1MetricTriggerConfig,
+        V1QueryTriggerConfig,
+        V1SequenceTriggerConfig,
+        V1SubTriggerConfig,
+    )
+    from polyaxon._sdk.schemas.v1_automation_test_request import V1AutomationTestRequest
+    from polyaxon._sdk.schemas.v1_cloning import V1Cloning
+    from polyaxon._sdk.schemas.v1_connection_response import V1ConnectionResponse
+    from polyaxon._sdk.schemas.v1_dashboard import V1Dashboard
+    from polyaxon._sdk.schemas.v1_dashboard_spec import V1DashboardSpec
+    from polyaxon._sdk.schemas.v1_entities_tags import V1EntitiesTags
+    from polyaxon._sdk.schemas.v1_owner_sub_entity_resource_promote_request import (
+        V1OwnerSubEntityResourcePromoteRequest,
+    )
+    from polyaxon._sdk.schemas.v1_list_automation_executions_response import (
+        V1ListAutomationExecutionsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_policy import V1Policy
+    from polyaxon._sdk.schemas.v1_list_policies_response import V1ListPoliciesResponse
+    from polyaxon._sdk.schemas.v1_entities_transfer import V1EntitiesTransfer
+    from polyaxon._sdk.schemas.v1_entity_notification_body import (
+        V1EntityNotificationBody,
+    )
+    from polyaxon._sdk.schemas.v1_entity_stage_body_request import (
+        V1EntityStageBodyRequest,
+    )
+    from polyaxon._sdk.schemas.v1_entity_status_body_request import (
+        V1EntityStatusBodyRequest,
+    )
+    from polyaxon._sdk.schemas.v1_events_response import (
+        V1EventsResponse,
+        V1MultiEventsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_activities_response import (
+        V1ListActivitiesResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_agents_response import V1ListAgentsResponse
+    from polyaxon._sdk.schemas.v1_list_bookmarks_response import V1ListBookmarksResponse
+    from polyaxon._sdk.schemas.v1_list_connections_response import (
+        V1ListConnectionsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_dashboards_response import (
+        V1ListDashboardsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_organization_members_response import (
+        V1ListOrganizationMembersResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_organizations_response import (
+        V1ListOrganizationsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_presets_response import V1ListPresetsResponse
+    from polyaxon._sdk.schemas.v1_list_project_versions_response import (
+        V1ListProjectVersionsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_projects_response import V1ListProjectsResponse
+    from polyaxon._sdk.schemas.v1_list_queues_response import V1ListQueuesResponse
+    from polyaxon._sdk.schemas.v1_list_run_artifacts_response import (
+        V1ListRunArtifactsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_run_connections_response import (
+        V1ListRunConnectionsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_run_edges_response import V1ListRunEdgesResponse
+    from polyaxon._sdk.schemas.v1_list_runs_response import V1ListRunsResponse
+    from polyaxon._sdk.schemas.v1_list_searches_response import V1ListSearchesResponse
+    from polyaxon._sdk.schemas.v1_list_service_accounts_response import (
+        V1ListServiceAccountsResponse,
+    )
+    from polyaxon._sdk.schemas.v1_list_tags_response import V1ListTagsResponse
+    from polyaxon._sdk.schemas.v1_list_team_members_response import (
+        V1ListTeamMembersResponse,
+    )
+    from polyaxon._sdk.schemas.v1_entity_level import V1EntityLevel
+    from polyaxon._sdk.schemas.v1_list_teams_response import V1ListTeamsResponse
+    from polyaxon._sdk.schemas.v1_list_token_response import V1ListTokenResponse
+    from polyaxon._sdk.schemas.v1_operation_body import V1OperationBody
+    from polyaxon._sdk.schemas.v1_organization import V1Organization
+    from polyaxon._sdk.schemas.v1_organization_member import V1OrganizationMember
+    from polyaxon._sdk.schemas.v1_password_change import V1PasswordChange
+    from polyaxon._sdk.schemas.v1_pipeline import V1Pipeline
+    from polyaxon._sdk.schemas.v1_preset import V1Preset
+    from polyaxon._sdk.schemas.v1_project import V1Project
+    from polyaxon._sdk.schemas.v1_project_settings import V1ProjectSettings
+    from polyaxon._sdk.schemas.v1_project_version import V1ProjectVersion
+    from polyaxon._sdk.schemas.v1_queue import V1Queue
+    from polyaxon._sdk.schemas.v1_run import V1Run
+    from polyaxon._sdk.schemas.v1_run_connection import V1RunConnection
+    from polyaxon._sdk.schemas.v1_run_edge import V1RunEdge
+    from polyaxon._sdk.schemas.v1_run_edge_lineage import V1RunEdgeLineage
+    from polyaxon._sdk.schemas.v1_run_edges_graph import V1RunEdgesGraph
+    from polyaxon._sdk.schemas.v1_run_reference_catalog import V1RunReferenceCatalog
+    from polyaxon._sdk.schemas.v1_run_settings import V1RunSettings
+    from polyaxon._sdk.schemas.v1_search import V1Search
+    from polyaxon._sdk.schemas.v1_search_spec import V1SearchSpec
+    from polyaxon._sdk.schemas.v1_section_spec import V1SectionSpec
+    from polyaxon._sdk.schemas.v1_service_account import V1ServiceAccount
+    from polyaxon._sdk.schemas.v1_settings_catalog import V1SettingsCatalog
+    from polyaxon._sdk.schemas.v1_tag import V1Tag
+    from polyaxon._sdk.schemas.v1_team import V1Team
+    from polyaxon._sdk.schemas.v1_team_member import V1TeamMember
+    from polyaxon._sdk.schemas.v1_team_settings import V1TeamSettings
+    from polyaxon._sdk.schemas.v1_token import V1Token
+    from polyaxon._sdk.schemas.v1_trial_start import V1TrialStart
+    from polyaxon._sdk.schemas.v1_user import V1User
+    from polyaxon._sdk.schemas.v1_user_access import V1UserAccess
+    from polyaxon._sdk.schemas.v1_user_email import V1UserEmail
+    from polyaxon._sdk.schemas.v1_user_singup import V1UserSingup
+    from polyaxon._sdk.schemas.v1_uuids import V1Uuids
+    from polyaxon._sdk.schemas.v1_create_pty_request import V1CreatePtyRequest
+    from polyaxon._sdk.schemas.v1_exec_bg_list import V1ExecBgList
+    from polyaxon._sdk.schemas.v1_exec_bg_logs import V1ExecBgLogs
+    from polyaxon._sdk.schemas.v1_exec_bg_request import V1ExecBgRequest
+    from polyaxon._sdk.schemas.v1_exec_bg_start import V1ExecBgStart
+    from polyaxon._sdk.schemas.v1_exec_bg_status import V1ExecBgStatus
+    from polyaxon._sdk.schemas.v1_exec_request import V1ExecRequest
+    from polyaxon._sdk.schemas.v1_exec_result import V1ExecResult
+    from polyaxon._sdk.schemas.v1_fs_entry import V1FsEntry
+    from polyaxon._sdk.schemas.v1_fs_list_result import V1FsListResult
+    from polyaxon._sdk.schemas.v1_fs_mkdir_request import V1FsMkdirRequest
+    from polyaxon._sdk.schemas.v1_fs_path_result import V1FsPathResult
+    from polyaxon._sdk.schemas.v1_fs_stat_result import V1FsStatResult
+    from polyaxon._sdk.schemas.v1_ping_response import V1PingResponse
+    from polyaxon._sdk.schemas.v1_pty import V1Pty
+    from polyaxon._sdk.schemas.v1_pty_list import V1PtyList
+    from polyaxon._sdk.schemas.v1_resize_pty_request import V1ResizePtyRequest
+    from polyaxon._sdk.schemas.v1_signal_request import V1SignalRequest
+
+
+_LAZY_IMPORTS = {
+    "V1Activity": "polyaxon._sdk.schemas.v1_activity",
+    "V1Agent": "polyaxon._sdk.schemas.v1_agent",
+    "V1AgentReconcileBodyRequest": "polyaxon._sdk.schemas.v1_agent_reconcile_body_request",
+    "V1AgentResourcesRequest": "polyaxon._sdk.schemas.v1_agent_resources_request",
+    "V1AgentStateResponse": "polyaxon._sdk.schemas.v1_agent_state_response",
+    "V1AgentStateResponseAgentState": "polyaxon._sdk.schemas.v1_agent_state_response_agent_state",
+    "V1AgentStatusBodyRequest": "polyaxon._sdk.schemas.v1_agent_status_body_request",
+    "V1AnalyticsSpec": "polyaxon._sdk.schemas.v1_analytics_spec",
+    "V1ArtifactTree": "polyaxon._sdk.schemas.v1_artifact_tree",
+    "V1Auth": "polyaxon._sdk.schemas.v1_auth",
+    "AutomationStateKind": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationActionKind": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationExecutionKind": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationTargetKind": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationExecutionStatus": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationFailStrategy": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationTriggerStateKind": "polyaxon._sdk.schemas.v1_automation",
+    "MetricTriggerConfigCondition": "polyaxon._sdk.schemas.v1_automation",
+    "TriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationTriggerPosture": "polyaxon._sdk.schemas.v1_automation",
+    "AutomationTriggerKind": "polyaxon._sdk.schemas.v1_automation",
+    "V1Automation": "polyaxon._sdk.schemas.v1_automation",
+    "V1AutomationAction": "polyaxon._sdk.schemas.v1_automation",
+    "V1CompoundTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1EventTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1MetricTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1QueryTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1SequenceTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1SubTriggerConfig": "polyaxon._sdk.schemas.v1_automation",
+    "V1AutomationTestRequest": "polyaxon._sdk.schemas.v1_automation_test_request",
+    "V1Cloning": "polyaxon._sdk.schemas.v1_cloning",
+    "V1ConnectionResponse": "polyaxon._sdk.schemas.v1_connection_response",
+    "V1Dashboard": "polyaxon._sdk.schemas.v1_dashboard",
+    "V1DashboardSpec": "polyaxon._sdk.schemas.v1_dashboard_spec",
+    "V1EntitiesTags": "polyaxon._sdk.schemas.v1_entities_tags",
+    "V1OwnerSubEntityResourcePromoteRequest": "polyaxon._sdk.schemas.v1_owner_sub_entity_resource_promote_request",
+    "V1ListAutomationExecutionsResponse": "polyaxon._sdk.schemas.v1_list_automation_executions_response",
+    "V1Policy": "polyaxon._sdk.schemas.v1_policy",
+    "V1ListPoliciesResponse": "polyaxon._sdk.schemas.v1_list_policies_response",
+    "V1EntitiesTransfer": "polyaxon._sdk.schemas.v1_entities_transfer",
+    "V1EntityNotificationBody": "polyaxon._sdk.schemas.v1_entity_notification_body",
+    "V1EntityStageBodyRequest": "polyaxon._sdk.schemas.v1_entity_stage_body_request",
+    "V1EntityStatusBodyRequest": "polyaxon._sdk.schemas.v1_entity_status_body_request",
+    "V1EventsResponse": "polyaxon._sdk.schemas.v1_events_response",
+    "V1MultiEventsResponse": "polyaxon._sdk.schemas.v1_events_response",
+    "V1ListActivitiesResponse": "polyaxon._sdk.schemas.v1_list_activities_response",
+    "V1ListAgentsResponse": "polyaxon._sdk.schemas.v1_list_agents_response",
+    "V1ListBookmarksResponse": "polyaxon._sdk.schemas.v1_list_bookmarks_response",
+    "V1ListConnectionsResponse": "polyaxon._sdk.schemas.v1_list_connections_response",
+    "V1ListDashboardsResponse": "polyaxon._sdk.schemas.v1_list_dashboards_response",
+    "V1ListOrganizationMembersResponse": "polyaxon._sdk.schemas.v1_list_organization_members_response",
+    "V1ListOrganizationsResponse": "polyaxon._sdk.schemas.v1_list_organizations_response",
+    "V1ListPresetsResponse": "polyaxon._sdk.schemas.v1_list_presets_response",
+    "V1ListProjectVersionsResponse": "polyaxon._sdk.schemas.v1_list_project_versions_response",
+    "V1ListProjectsResponse": "polyaxon._sdk.schemas.v1_list_projects_response",
+    "V1ListQueuesResponse": "polyaxon._sdk.schemas.v1_list_queues_response",
+    "V1ListRunArtifactsResponse": "polyaxon._sdk.schemas.v1_list_run_artifacts_response",
+    "V1ListRunConnectionsResponse": "polyaxon._sdk.schemas.v1_list_run_connections_response",
+    "V1ListRunEdgesResponse": "polyaxon._sdk.schemas.v1_list_run_edges_response",
+    "V1ListRunsResponse": "polyaxon._sdk.schemas.v1_list_runs_response",
+    "V1ListSearchesResponse": "polyaxon._sdk.schemas.v1_list_searches_response",
+    "V1ListServiceAccountsResponse": "polyaxon._sdk.schemas.v1_list_service_accounts_response",
+    "V1ListTagsResponse": "polyaxon._sdk.schemas.v1_list_tags_response",
+    "V1ListTeamMembersResponse": "polyaxon._sdk.schemas.v1_list_team_members_response",
+    "V1EntityLevel": "polyaxon._sdk.schemas.v1_entity_level",
+    "V1ListTeamsResponse": "polyaxon._sdk.schemas.v1_list_teams_response",
+    "V1ListTokenResponse": "polyaxon._sdk.schemas.v1_list_token_response",
+    "V1OperationBody": "polyaxon._sdk.schemas.v1_operation_body",
+    "V1Organization": "polyaxon._sdk.schemas.v1_organization",
+    "V1OrganizationMember": "polyaxon._sdk.schemas.v1_organization_member",
+    "V1PasswordChange": "polyaxon._sdk.schemas.v1_password_change",
+    "V1Pipeline": "polyaxon._sdk.schemas.v1_pipeline",
+    "V1Preset": "polyaxon._sdk.schemas.v1_preset",
+    "V1Project": "polyaxon._sdk.schemas.v1_project",
+    "V1ProjectSettings": "polyaxon._sdk.schemas.v1_project_settings",
+    "V1ProjectVersion": "polyaxon._sdk.schemas.v1_project_version",
+    "V1Queue": "polyaxon._sdk.schemas.v1_queue",
+    "V1Run": "polyaxon._sdk.schemas.v1_run",
+    "V1RunConnection": "polyaxon._sdk.schemas.v1_run_connection",
+    "V1RunEdge": "polyaxon._sdk.schemas.v1_run_edge",
+    "V1RunEdgeLineage": "polyaxon._sdk.schemas.v1_run_edge_lineage",
+    "V1RunEdgesGraph": "polyaxon._sdk.schemas.v1_run_edges_graph",
+    "V1RunReferenceCatalog": "polyaxon._sdk.schemas.v1_run_reference_catalog",
+    "V1RunSettings": "polyaxon._sdk.schemas.v1_run_settings",
+    "V1Search": "polyaxon._sdk.schemas.v1_search",
+    "V1SearchSpec": "polyaxon._sdk.schemas.v1_search_spec",
+    "V1SectionSpec": "polyaxon._sdk.schemas.v1_section_spec",
+    "V1ServiceAccount": "polyaxon._sdk.schemas.v1_service_account",
+    "V1SettingsCatalog": "polyaxon._sdk.schemas.v1_settings_catalog",
+    "V1Tag": "polyaxon._sdk.schemas.v1_tag",
+    "V1Team": "polyaxon._sdk.schemas.v1_team",
+    "V1TeamMember": "polyaxon._sdk.schemas.v1_team_member",
+    "V1TeamSettings": "polyaxon._sdk.schemas.v1_team_settings",
+    "V1Token": "polyaxon._sdk.schemas.v1_token",
+    "V1TrialStart": "polyaxon._sdk.schemas.v1_trial_start",
+    "V1User": "polyaxon._sdk.schemas.v1_user",
+    "V1UserAccess": "polyaxon._sdk.schemas.v1_user_access",
+    "V1UserEmail": "polyaxon._sdk.schemas.v1_user_email",
+    "V1UserSingup": "polyaxon._sdk.schemas.v1_user_singup",
+    "V1Uuids": "polyaxon._sdk.schemas.v1_uuids",
+    "V1CreatePtyRequest": "polyaxon._sdk.schemas.v1_create_pty_request",
+    "V1ExecBgList": "polyaxon._sdk.schemas.v1_exec_bg_list",
+    "V1ExecBgLogs": "polyaxon._sdk.schemas.v1_exec_bg_logs",
+    "V1ExecBgRequest": "polyaxon._sdk.schemas.v1_exec_bg_request",
+    "V1ExecBgStart": "polyaxon._sdk.schemas.v1_exec_bg_start",
+    "V1ExecBgStatus": "polyaxon._sdk.schemas.v1_exec_bg_status",
+    "V1ExecRequest": "polyaxon._sdk.schemas.v1_exec_request",
+    "V1ExecResult": "polyaxon._sdk.schemas.v1_exec_result",
+    "V1FsEntry": "polyaxon._sdk.schemas.v1_fs_entry",
+    "V1FsListResult": "polyaxon._sdk.schemas.v1_fs_list_result",
+    "V1FsMkdirRequest": "polyaxon._sdk.schemas.v1_fs_mkdir_request",
+    "V1FsPathResult": "polyaxon._sdk.schemas.v1_fs_path_result",
+    "V1FsStatResult": "polyaxon._sdk.schemas.v1_fs_stat_result",
+    "V1PingResponse": "polyaxon._sdk.schemas.v1_ping_response",
+    "V1Pty": "polyaxon._sdk.schemas.v1_pty",
+    "V1PtyList": "polyaxon._sdk.schemas.v1_pty_list",
+    "V1ResizePtyRequest": "polyaxon._sdk.schemas.v1_resize_pty_request",
+    "V1SignalRequest": "polyaxon._sdk.schemas.v1_signal_request",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
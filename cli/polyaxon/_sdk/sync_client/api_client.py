@@ -10,7 +10,8 @@ from urllib.parse import quote
 from dateutil.parser import parse
 
 from clipped.utils.json import orjson_dumps, orjson_loads
-from polyaxon import pkg, schemas
+from polyaxon import pkg
+from polyaxon._sdk import schemas as sdk_schemas
 from polyaxon._sdk.configuration import Configuration
 from polyaxon.exceptions import ApiException, ApiValueError
 
@@ -347,7 +348,11 @@ class ApiClient(object):
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
+            elif klass in sdk_schemas.__all__:
+                klass = getattr(sdk_schemas, klass)
             else:
+                from polyaxon import schemas
+
                 klass = getattr(schemas, klass)
 
         if klass in self.PRIMITIVE_TYPES:
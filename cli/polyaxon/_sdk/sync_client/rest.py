@@ -59,14 +59,31 @@ class RESTClientObject(object):
         if configuration.socket_options is not None:
             addition_pool_args["socket_options"] = configuration.socket_options
 
+        pool_maxsize = maxsize
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
                 maxsize = configuration.connection_pool_maxsize
             else:
                 maxsize = 4
 
+        self._shared_pool_manager = configuration.connection_pool_shared
+        if self._shared_pool_manager:
+            from polyaxon._client.transport.pool_manager import (
+                get_pool_manager,
+                get_pool_options,
+            )
+
+            pool_options = get_pool_options(configuration)
+            if pool_maxsize is not None:
+                pool_options["maxsize"] = pool_maxsize
+            self.pool_manager = get_pool_manager(
+                proxy_url=configuration.proxy,
+                proxy_headers=configuration.proxy_headers,
+                **pool_options,
+            )
+            self._pool_manager_released = False
         # https pool manager
-        if configuration.proxy:
+        elif configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
                 num_pools=pools_size,
                 maxsize=maxsize,
@@ -95,6 +112,16 @@ class RESTClientObject(object):
         # the container's dispose callback. Idempotent. Matches urllib3's own
         # context-manager __exit__ behavior. Subsequent requests re-allocate
         # pools on demand.
+        # A shared pool manager is only cleared once its last client is closed.
+        if self._shared_pool_manager:
+            if not self._pool_manager_released:
+                from polyaxon._client.transport.pool_manager import (
+                    release_pool_manager,
+                )
+
+                self._pool_manager_released = True
+                release_pool_manager(self.pool_manager)
+            return
         self.pool_manager.clear()
 
     def request(
@@ -12,10 +12,16 @@ from polyaxon._fs.fs import (
     get_artifacts_connection,
     get_async_fs_from_connection,
 )
+from polyaxon._fs.notify import PathsMonitor
 from polyaxon._fs.watcher import FSWatcher
 from polyaxon._k8s.manager.async_manager import AsyncK8sManager
 from polyaxon._sidecar.container.intervals import get_sync_interval
-from polyaxon._sidecar.container.monitors import sync_artifacts, sync_logs, sync_spec
+from polyaxon._sidecar.container.liveness import PodLiveness
+from polyaxon._sidecar.container.monitors import (
+    LogsStreamer,
+    sync_artifacts,
+    sync_spec,
+)
 from polyaxon._sidecar.ignore import IGNORE_FOLDERS
 from polyaxon.client import RunClient
 from polyaxon.exceptions import PolyaxonClientException, PolyaxonContainerException
@@ -37,6 +43,10 @@ async def start_sidecar(
     fs_refresh_interval = get_sync_interval(
         interval=60 * 60 * 2, sleep_interval=sleep_interval
     )
+    # Slow status poll in case the watch misses the container's termination
+    liveness_check_interval = get_sync_interval(
+        interval=60 * 5, sleep_interval=sleep_interval
+    )
     try:
         pod_id = os.environ[ENV_KEYS_K8S_POD_ID]
     except KeyError as e:
@@ -54,21 +64,34 @@ async def start_sidecar(
     k8s_manager = AsyncK8sManager(namespace=CLIENT_CONFIG.namespace, in_cluster=True)
     await k8s_manager.setup()
     pod = await k8s_manager.get_pod(pod_id, reraise=True)
+    liveness = PodLiveness(
+        k8s_manager=k8s_manager, pod_id=pod_id, container_id=container_id
+    )
+    liveness.start(resource_version=pod.metadata.resource_version)
     connection = get_artifacts_connection()
     fs = await get_async_fs_from_connection(connection=connection)
     if os.path.exists(ctx_paths.CONTEXT_MOUNT_FILE_WATCHER):
         fw = FSWatcher.read(ctx_paths.CONTEXT_MOUNT_FILE_WATCHER)
     else:
         fw = FSWatcher()
+    # Only changed paths are synced when inotify is available
+    paths_monitor = PathsMonitor(exclude=IGNORE_FOLDERS) if monitor_outputs else None
 
     retry = 0
     is_running = True
     counter = 0
     fs_refresh_counter = 0
+    liveness_check_counter = 0
     state = {
         "last_artifacts_check": None,
-        "last_logs_check": None,
     }
+    # Logs are followed continuously instead of being collected every sync
+    logs_streamer = None
+    if monitor_logs:
+        logs_streamer = LogsStreamer(
+            run_uuid=run_uuid, k8s_manager=k8s_manager, pod=pod
+        )
+        logs_streamer.start()
 
     async def monitor():
         if monitor_spec and pod.metadata.annotations:
@@ -77,19 +100,6 @@ async def start_sidecar(
                 run_uuid=run_uuid,
                 run_kind=pod.metadata.annotations.get("operation.polyaxon.com/kind"),
             )
-        if monitor_logs:
-            try:
-                state["last_logs_check"] = await sync_logs(
-                    run_uuid=run_uuid,
-                    k8s_manager=k8s_manager,
-                    pod=pod,
-                    last_time=state["last_logs_check"],
-                    stream=False,
-                )
-            except Exception as exp:
-                logger.log(
-                    "An error occurred while syncing logs, Exception %s" % repr(exp)
-                )
         if monitor_outputs:
             try:
                 await sync_artifacts(
@@ -98,6 +108,7 @@ async def start_sidecar(
                     store_path=connection.store_path,
                     run_uuid=run_uuid,
                     exclude=IGNORE_FOLDERS,
+                    monitor=paths_monitor,
                 )
             except Exception as e:
                 logger.debug(
@@ -127,16 +138,25 @@ async def start_sidecar(
                 state["last_artifacts_check"] = now()
 
     while is_running:
-        await asyncio.sleep(sleep_interval)
+        # Returns early if the watch reports the container's termination
+        await liveness.wait(sleep_interval)
         if retry:
             await asyncio.sleep(retry**2)
-        try:
-            is_running = await k8s_manager.is_pod_running(pod_id, container_id)
-        except ApiException as e:
-            retry += 1
-            logger.info("Exception %s" % repr(e))
-            logger.info("Sleeping ...")
-            continue
+        liveness_check_counter += 1
+        if (
+            not liveness.is_watching
+            or liveness_check_counter >= liveness_check_interval
+        ):
+            liveness_check_counter = 0
+            try:
+                is_running = await liveness.check()
+            except ApiException as e:
+                retry += 1
+                logger.info("Exception %s" % repr(e))
+                logger.info("Sleeping ...")
+                continue
+        else:
+            is_running = liveness.is_running
 
         logger.debug("Syncing ...")
         if is_running:
@@ -157,12 +177,21 @@ async def start_sidecar(
             except Exception as e:
                 logger.warning("Polyaxon sidecar error: %s" % repr(e))
 
+    await liveness.close()
+    if logs_streamer:
+        try:
+            await logs_streamer.close()
+        except Exception as e:
+            logger.warning("An error occurred while syncing logs: %s" % repr(e))
     await monitor()
     logger.info("Cleaning non main containers")
     if k8s_manager:
         logger.info("Cleaning k8s manager")
         await k8s_manager.close()
 
+    if paths_monitor:
+        paths_monitor.close()
+
     logger.info("Cleaning fs connection")
     await close_fs(fs)
     # Ensures that the monitors are closed
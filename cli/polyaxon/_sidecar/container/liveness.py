@@ -0,0 +1,112 @@
+import asyncio
+from typing import Optional
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from polyaxon._k8s.manager.async_manager import AsyncK8sManager
+from polyaxon._k8s.monitor import is_pod_running
+from polyaxon.logger import logger
+
+
+class PodLiveness:
+    """Tracks the main container of the sidecar's pod using a watch stream.
+
+    The watch is resumed from the last seen resource version,
+    and restarted from the current state if that version expired.
+    While the watch is not connected, `is_watching` is `False`
+    and the caller should fallback to polling the pod status with `check`.
+
+    Args:
+        k8s_manager: AsyncK8sManager, the k8s manager.
+        pod_id: str, the pod to watch.
+        container_id: str, the main container of the pod.
+        watch_timeout: int, optional, server side timeout of every watch request.
+    """
+
+    WATCH_TIMEOUT = 60 * 5
+    MAX_RETRY_SLEEP = 60
+
+    def __init__(
+        self,
+        k8s_manager: AsyncK8sManager,
+        pod_id: str,
+        container_id: str,
+        watch_timeout: Optional[int] = None,
+    ):
+        self.k8s_manager = k8s_manager
+        self.pod_id = pod_id
+        self.container_id = container_id
+        self.watch_timeout = watch_timeout or self.WATCH_TIMEOUT
+        self.resource_version = None
+        self.is_running = True
+        self.is_watching = False
+        self._terminated = asyncio.Event()
+        self._task = None
+
+    def _set_running(self, is_running: bool):
+        self.is_running = is_running
+        if not is_running:
+            self._terminated.set()
+
+    def start(self, resource_version: Optional[str] = None):
+        self.resource_version = resource_version
+        self._task = asyncio.ensure_future(self._watch())
+
+    async def _watch(self):
+        retry = 0
+        while self.is_running:
+            try:
+                self.is_watching = True
+                events = self.k8s_manager.watch_pod(
+                    self.pod_id,
+                    resource_version=self.resource_version,
+                    timeout_seconds=self.watch_timeout,
+                )
+                async for event_type, pod, resource_version in events:
+                    retry = 0
+                    self.resource_version = resource_version or self.resource_version
+                    if event_type == "DELETED" or not is_pod_running(
+                        pod, self.container_id
+                    ):
+                        self._set_running(False)
+                        return
+            except ApiException as e:
+                if e.status == 410:
+                    logger.debug("Pod watch expired, restarting from current state.")
+                    self.resource_version = None
+                else:
+                    retry += 1
+                    logger.info("Pod watch error %s" % repr(e))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                retry += 1
+                logger.info("Pod watch error %s" % repr(e))
+            self.is_watching = False
+            if retry:
+                await asyncio.sleep(min(retry**2, self.MAX_RETRY_SLEEP))
+
+    async def check(self) -> bool:
+        """Polls the pod status, used as a fallback for the watch."""
+        is_running = await self.k8s_manager.is_pod_running(
+            self.pod_id, self.container_id
+        )
+        self._set_running(is_running)
+        return is_running
+
+    async def wait(self, timeout: float):
+        """Sleeps for a timeout, or until the container is terminated."""
+        try:
+            await asyncio.wait_for(self._terminated.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def close(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.is_watching = False
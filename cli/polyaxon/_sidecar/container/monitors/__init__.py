@@ -1,3 +1,3 @@
 from polyaxon._sidecar.container.monitors.artifacts import sync_artifacts
-from polyaxon._sidecar.container.monitors.logs import sync_logs
+from polyaxon._sidecar.container.monitors.logs import LogsStreamer, sync_logs
 from polyaxon._sidecar.container.monitors.spec import sync_spec
@@ -5,6 +5,7 @@ from fsspec.asyn import _run_coros_in_chunks  # noqa
 
 from polyaxon._contexts import paths as ctx_paths
 from polyaxon._fs.async_manager import ensure_async_execution
+from polyaxon._fs.notify import PathsMonitor
 from polyaxon._fs.types import FSSystem
 from polyaxon._fs.watcher import FSWatcher
 from polyaxon.logger import logger
@@ -70,16 +71,45 @@ async def sync_fs(
     )
 
 
+def _sync_path(
+    fw: FSWatcher,
+    path: str,
+    exclude: Optional[List[str]] = None,
+    monitor: Optional[PathsMonitor] = None,
+):
+    if not monitor:
+        fw.sync(path, exclude=exclude)
+        return
+    monitor.watch(path)
+    changes = monitor.get_changes(path)
+    if changes is None:
+        fw.resync(path, exclude=exclude)
+    elif changes:
+        fw.sync_changes(path, changes, exclude=exclude)
+
+
 async def sync_artifacts(
     fs: FSSystem,
     fw: FSWatcher,
     store_path: str,
     run_uuid: str,
     exclude: Optional[List[str]] = None,
+    monitor: Optional[PathsMonitor] = None,
 ):
-    fw.init()
+    """Syncs the run's artifacts and the related runs' artifacts to the store.
+
+    If a paths monitor is provided and enabled,
+    only the paths changed since the last sync are checked,
+    otherwise all paths are scanned.
+    """
+    if monitor and not monitor.is_enabled:
+        monitor = None
+    if monitor:
+        fw.init_changes()
+    else:
+        fw.init()
     path_from = ctx_paths.CONTEXT_MOUNT_ARTIFACTS_FORMAT.format(run_uuid)
-    fw.sync(path_from, exclude=exclude)
+    _sync_path(fw, path_from, exclude=exclude, monitor=monitor)
 
     # Check if this run has triggered some related run paths
     if os.path.exists(ctx_paths.CONTEXT_MOUNT_ARTIFACTS_RELATED):
@@ -88,10 +118,16 @@ async def sync_artifacts(
             path_from = ctx_paths.CONTEXT_MOUNT_ARTIFACTS_RELATED_FORMAT.format(
                 sub_path
             )
-            fw.sync(path_from, exclude=exclude)
+            _sync_path(fw, path_from, exclude=exclude, monitor=monitor)
 
+    has_changes = fw.has_changes()
     await sync_fs(
         fs=fs,
         fw=fw,
         store_base_path=store_path,
     )
+    if has_changes:
+        try:
+            fw.write(ctx_paths.CONTEXT_MOUNT_FILE_WATCHER)
+        except OSError as e:
+            logger.debug("Could not persist the file watcher state: %s", e)
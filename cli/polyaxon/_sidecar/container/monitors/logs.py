@@ -1,15 +1,22 @@
+import asyncio
 import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
 import aiofiles
 from kubernetes_asyncio.client.models import V1Pod
 
 from clipped.utils.paths import check_or_create_path, set_permissions
 from polyaxon._contexts import paths as ctx_paths
-from polyaxon._k8s.logging.async_monitor import query_k8s_pod_logs
+from polyaxon._k8s.logging.async_monitor import (
+    LogsCursor,
+    query_k8s_pod_logs,
+    read_container_logs,
+    stream_container_logs,
+)
 from polyaxon._k8s.manager.async_manager import AsyncK8sManager
+from polyaxon.logger import logger
 from traceml.events import get_logs_path
-from traceml.logging import V1Logs
+from traceml.logging import V1Log, V1Logs
 
 
 async def sync_logs(
@@ -28,6 +35,11 @@ async def sync_logs(
     if not logs:
         return last_time
 
+    await write_logs(run_uuid=run_uuid, pod=pod, logs=logs)
+    return last_time
+
+
+async def write_logs(run_uuid: str, pod: V1Pod, logs: List[V1Log]):
     path_from = get_logs_path(
         run_path=ctx_paths.CONTEXT_MOUNT_ARTIFACTS_FORMAT.format(run_uuid),
         filename=pod.metadata.name,
@@ -37,4 +49,95 @@ async def sync_logs(
         _logs = V1Logs.model_construct(logs=logs)
         await outfile.write(_logs.get_jsonl_events())
     set_permissions(path_from)
-    return last_time
+
+
+class LogsStreamer:
+    """Follows the logs of all containers of a pod and appends them to the run's logs.
+
+    Every container is followed with a streaming request resumed from its cursor,
+    the collected lines are buffered and appended in batches.
+
+    Args:
+        run_uuid: str, the run uuid.
+        k8s_manager: AsyncK8sManager, the k8s manager.
+        pod: V1Pod, the pod to collect the logs from.
+    """
+
+    FLUSH_INTERVAL = 1
+    FLUSH_SIZE = V1Logs._CHUNK_SIZE
+    RECONNECT_INTERVAL = 2
+    MAX_RECONNECT_INTERVAL = 60
+
+    def __init__(self, run_uuid: str, k8s_manager: AsyncK8sManager, pod: V1Pod):
+        self.run_uuid = run_uuid
+        self.k8s_manager = k8s_manager
+        self.pod = pod
+        containers = (pod.spec.init_containers or []) + (pod.spec.containers or [])
+        self.cursors: Dict[str, LogsCursor] = {c.name: LogsCursor() for c in containers}
+        self._buffer: List[V1Log] = []
+        self._lock = asyncio.Lock()
+        self._tasks = []
+
+    def start(self):
+        self._tasks = [
+            asyncio.ensure_future(self._follow(container_name))
+            for container_name in self.cursors
+        ]
+        self._tasks.append(asyncio.ensure_future(self._flush_periodically()))
+
+    async def _follow(self, container_name: str):
+        interval = self.RECONNECT_INTERVAL
+        while True:
+            has_logs = False
+            try:
+                async for log in stream_container_logs(
+                    k8s_manager=self.k8s_manager,
+                    pod=self.pod,
+                    container_name=container_name,
+                    cursor=self.cursors[container_name],
+                ):
+                    has_logs = True
+                    self._buffer.append(log)
+                    if len(self._buffer) >= self.FLUSH_SIZE:
+                        await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(
+                    "Logs stream of container %s closed: %s", container_name, repr(e)
+                )
+            # The container stopped, or the connection was closed, e.g. timeout
+            if has_logs:
+                interval = self.RECONNECT_INTERVAL
+            else:
+                interval = min(interval * 2, self.MAX_RECONNECT_INTERVAL)
+            await asyncio.sleep(interval)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.debug("An error occurred while writing logs: %s", repr(e))
+
+    async def flush(self):
+        async with self._lock:
+            logs, self._buffer = self._buffer, []
+            if logs:
+                await write_logs(run_uuid=self.run_uuid, pod=self.pod, logs=logs)
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        # Collect the lines that were not received by the streams
+        for container_name, cursor in self.cursors.items():
+            self._buffer += await read_container_logs(
+                k8s_manager=self.k8s_manager,
+                pod=self.pod,
+                container_name=container_name,
+                cursor=cursor,
+            )
+        await self.flush()
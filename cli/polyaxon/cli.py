@@ -2,35 +2,73 @@ import os
 
 import click
 
-from clipped.formatting import Printer
 from clipped.utils.bools import to_bool
-from polyaxon import settings
-from polyaxon._cli.admin import admin
-from polyaxon._cli.artifacts import artifacts
-from polyaxon._cli.auth import login, logout, whoami
-from polyaxon._cli.check import check
-from polyaxon._cli.completion import completion
-from polyaxon._cli.components import components
-from polyaxon._cli.config import config
-from polyaxon._cli.dashboard import dashboard
-from polyaxon._cli.init import init
-from polyaxon._cli.models import models
-from polyaxon._cli.operations import ops
-from polyaxon._cli.port_forward import port_forward
-from polyaxon._cli.projects import project
-from polyaxon._cli.run import run
-from polyaxon._cli.sandbox import sandbox
-from polyaxon._cli.session import set_versions_config
-from polyaxon._cli.ssh import ssh
-from polyaxon._cli.version import check_cli_version, upgrade, version
+from polyaxon._cli.lazy import LazyGroup
 from polyaxon._services.values import PolyaxonServices
-from polyaxon.logger import clean_outputs, configure_logger
+from polyaxon.logger import clean_outputs, configure_base_logger, configure_logger
 
 
 DOCS_GEN = to_bool(os.environ.get("POLYAXON_DOCS_GEN", False))
 
-
-@click.group()
+# The commands are imported on demand, most commands pull in the sdk and the schemas
+COMMANDS = {
+    "login": "polyaxon._cli.auth:login",
+    "logout": "polyaxon._cli.auth:logout",
+    "whoami": "polyaxon._cli.auth:whoami",
+    "upgrade": "polyaxon._cli.version:upgrade",
+    "version": "polyaxon._cli.version:version",
+    "config": "polyaxon._cli.config:config",
+    "check": "polyaxon._cli.check:check",
+    "init": "polyaxon._cli.init:init",
+    "project": "polyaxon._cli.projects:project",
+    "projects": "polyaxon._cli.projects:project",  # Alias for project command
+    "ops": "polyaxon._cli.operations:ops",
+    "artifacts": "polyaxon._cli.artifacts:artifacts",
+    "components": "polyaxon._cli.components:components",
+    "models": "polyaxon._cli.models:models",
+    "run": "polyaxon._cli.run:run",
+    "sandbox": "polyaxon._cli.sandbox:sandbox",
+    "ssh": "polyaxon._cli.ssh:ssh",
+    "dashboard": "polyaxon._cli.dashboard:dashboard",
+    "admin": "polyaxon._cli.admin:admin",
+    "port-forward": "polyaxon._cli.port_forward:port_forward",
+    "completion": "polyaxon._cli.completion:completion",
+}
+
+# Commands that do not need the cli config, the session, or the version check
+NO_CONFIG_COMMANDS = ["version", "completion"]
+
+
+def get_commands():
+    commands = dict(COMMANDS)
+    if PolyaxonServices.get_service_name() is None:
+        PolyaxonServices.set_service_name()
+    # INIT
+    if PolyaxonServices.is_init():
+        commands.update(
+            {
+                "clean-artifacts": "polyaxon._cli.services.clean_artifacts:clean_artifacts",
+                "docker": "polyaxon._cli.services.docker:docker",
+                "initializer": "polyaxon._cli.services.initializer:initializer",
+                "wait": "polyaxon._cli.services.wait:wait",
+            }
+        )
+    # Events
+    if PolyaxonServices.is_events_handlers():
+        commands["notify"] = "polyaxon._cli.services.notifier:notify"
+    # Sidecar
+    if PolyaxonServices.is_sidecar():
+        commands["sidecar"] = "polyaxon._cli.services.sidecar:sidecar"
+    # Tuner
+    if PolyaxonServices.is_hp_search():
+        commands["tuner"] = "polyaxon._cli.services.tuner:tuner"
+    # Agents
+    if PolyaxonServices.is_agent():
+        commands["agent"] = "polyaxon._cli.services.agent:agent"
+    return commands
+
+
+@click.group(cls=LazyGroup, lazy_commands=get_commands)
 @click.option(
     "-v", "--verbose", is_flag=True, default=False, help="Turn on debug logging"
 )
@@ -106,18 +144,31 @@ def cli(context, verbose, offline):
 
     Check the help available for each command listed below by appending `-h`.
     """
+    context.obj = context.obj or {}
+    context.obj["offline"] = offline
+    if offline:
+        os.environ["POLYAXON_IS_OFFLINE"] = "true"
+    # Avoid loading the settings and the client for commands and help not using them
+    if (
+        context.invoked_subcommand in NO_CONFIG_COMMANDS or "--help" in context.args
+    ) and "--check" not in context.args:
+        configure_base_logger(verbose)
+        return
+
+    from clipped.formatting import Printer
+    from polyaxon import settings
+    from polyaxon._cli.session import set_versions_config
+    from polyaxon._cli.version import check_cli_version
+
     settings.set_cli_config()
     configure_logger(verbose)
     if settings.CLIENT_CONFIG.no_op:
         Printer.warning(
             "POLYAXON_NO_OP is set to `true`, some commands will not function correctly."
         )
-    context.obj = context.obj or {}
     if not settings.CLIENT_CONFIG.client_header:
         settings.CLIENT_CONFIG.set_cli_header()
-    context.obj["offline"] = offline
     if offline:
-        os.environ["POLYAXON_IS_OFFLINE"] = "true"
         settings.CLIENT_CONFIG.is_offline = True
     non_check_cmds = [
         "completion",
@@ -148,62 +199,3 @@ def cli(context, verbose, offline):
         cli_config = set_versions_config(is_cli=False)
         settings.CLI_CONFIG = cli_config
         check_cli_version(cli_config, is_cli=False)
-
-
-cli.add_command(login)
-cli.add_command(logout)
-cli.add_command(whoami)
-cli.add_command(upgrade)
-cli.add_command(version)
-cli.add_command(config)
-cli.add_command(check)
-cli.add_command(init)
-cli.add_command(project)
-cli.add_command(project, name="projects")  # Alias for project command
-cli.add_command(ops)
-cli.add_command(artifacts)
-cli.add_command(components)
-cli.add_command(models)
-cli.add_command(run)
-cli.add_command(sandbox)
-cli.add_command(ssh)
-cli.add_command(dashboard)
-cli.add_command(admin)
-cli.add_command(port_forward)
-cli.add_command(completion)
-
-# INIT
-if PolyaxonServices.is_init():
-    from polyaxon._cli.services.clean_artifacts import clean_artifacts
-    from polyaxon._cli.services.docker import docker
-    from polyaxon._cli.services.initializer import initializer
-    from polyaxon._cli.services.wait import wait
-
-    cli.add_command(clean_artifacts)
-    cli.add_command(docker)
-    cli.add_command(initializer)
-    cli.add_command(wait)
-
-# Events
-if PolyaxonServices.is_events_handlers():
-    from polyaxon._cli.services.notifier import notify
-
-    cli.add_command(notify)
-
-# Sidecar
-if PolyaxonServices.is_sidecar():
-    from polyaxon._cli.services.sidecar import sidecar
-
-    cli.add_command(sidecar)
-
-# Tuner
-if PolyaxonServices.is_hp_search():
-    from polyaxon._cli.services.tuner import tuner
-
-    cli.add_command(tuner)
-
-# Agents
-if PolyaxonServices.is_agent():
-    from polyaxon._cli.services.agent import agent
-
-    cli.add_command(agent)
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from polyaxon._client.client import PolyaxonClient
 from polyaxon._client.decorators import ensure_is_managed
 from polyaxon._client.organization import AsyncOrganizationClient, OrganizationClient
@@ -9,28 +11,234 @@ from polyaxon._schemas.agent import AgentConfig
 from polyaxon._schemas.authentication import AccessTokenConfig
 from polyaxon._schemas.cli import CliConfig
 from polyaxon._schemas.client import ClientConfig
-from polyaxon._sdk.api import (
-    AgentsV1Api,
-    ArtifactsStoresV1Api,
-    AuthV1Api,
-    ConnectionsV1Api,
-    DashboardsV1Api,
-    OrganizationsV1Api,
-    PresetsV1Api,
-    ProjectDashboardsV1Api,
-    ProjectSearchesV1Api,
-    ProjectsV1Api,
-    QueuesV1Api,
-    RunsV1Api,
-    SandboxV1Api,
-    SearchesV1Api,
-    ServiceAccountsV1Api,
-    TagsV1Api,
-    TeamsV1Api,
-    UsersV1Api,
-    VersionsV1Api,
-)
+from polyaxon._sdk import api as sdk_api
+from polyaxon._sdk import schemas as sdk_schemas
 from polyaxon._sdk.async_client.api_client import AsyncApiClient
 from polyaxon._sdk.configuration import Configuration
 from polyaxon._sdk.sync_client.api_client import ApiClient
-from polyaxon.schemas import *
+from polyaxon.schemas import (
+    SDK_SCHEMAS,
+    AcquisitionFunctions,
+    AuthenticationError,
+    AuthenticationTypes,
+    ContainerStatuses,
+    DagOpSpec,
+    dags,
+    GaussianProcessConfig,
+    GaussianProcessesKernels,
+    get_agent_info,
+    get_artifacts_store_name,
+    get_asset_path,
+    get_collect_artifacts,
+    get_collect_resources,
+    get_component_info,
+    get_event_assets_path,
+    get_event_path,
+    get_local_owner,
+    get_log_level,
+    get_model_info,
+    get_project_error_message,
+    get_project_or_local,
+    get_project_run_or_local,
+    get_queue_info,
+    get_resource_path,
+    get_run_info,
+    get_run_or_local,
+    get_versioned_entity_info,
+    LifeCycle,
+    LiveState,
+    LoggedEventListSpec,
+    LoggedEventSpec,
+    ManagedBy,
+    MatrixMixin,
+    ops_params,
+    ParamSpec,
+    PolyaxonServiceHeaders,
+    PolyaxonServices,
+    PullPolicy,
+    RefMixin,
+    resolve_entity_info,
+    RunMixin,
+    ScheduleMixin,
+    StatusColor,
+    UtilityFunctionConfig,
+    V1ArtifactKind,
+    V1ArtifactsMount,
+    V1Bayes,
+    V1BucketConnection,
+    V1Build,
+    V1Cache,
+    V1ClaimConnection,
+    V1CleanerJob,
+    V1CleanPodPolicy,
+    V1CloningKind,
+    V1Compatibility,
+    V1CompiledOperation,
+    V1Component,
+    V1Connection,
+    V1ConnectionKind,
+    V1ConnectionResource,
+    V1Credentials,
+    V1CronSchedule,
+    V1Dag,
+    V1DagRef,
+    V1DaskCluster,
+    V1DaskReplica,
+    V1DateTimeSchedule,
+    V1DiffStoppingPolicy,
+    V1Environment,
+    V1Event,
+    V1EventArtifact,
+    V1EventAudio,
+    V1EventChart,
+    V1EventChartKind,
+    V1EventConfusionMatrix,
+    V1EventCurve,
+    V1EventCurveKind,
+    V1EventDataframe,
+    V1EventHistogram,
+    V1EventImage,
+    V1EventKind,
+    V1EventModel,
+    V1Events,
+    V1EventTrigger,
+    V1EventVideo,
+    V1FailureEarlyStopping,
+    V1GitConnection,
+    V1GridSearch,
+    V1Hook,
+    V1HostConnection,
+    V1HostPathConnection,
+    V1HpChoice,
+    V1HpDateRange,
+    V1HpDateTimeRange,
+    V1HpGeomSpace,
+    V1HpLinSpace,
+    V1HpLogNormal,
+    V1HpLogSpace,
+    V1HpLogUniform,
+    V1HpNormal,
+    V1HpPChoice,
+    V1HpQLogNormal,
+    V1HpQLogUniform,
+    V1HpQNormal,
+    V1HpQUniform,
+    V1HpRange,
+    V1HpUniform,
+    V1HubRef,
+    V1Hyperband,
+    V1Hyperopt,
+    V1Init,
+    V1Installation,
+    V1IntervalSchedule,
+    V1IO,
+    V1Iterative,
+    V1Job,
+    V1Join,
+    V1JoinParam,
+    V1KFReplica,
+    V1Log,
+    V1LogHandler,
+    V1Logs,
+    V1Mapping,
+    V1Matrix,
+    V1MatrixKind,
+    V1MedianStoppingPolicy,
+    V1MetricEarlyStopping,
+    V1MPIJob,
+    V1Notification,
+    V1NotifierJob,
+    V1Operation,
+    V1Optimization,
+    V1OptimizationMetric,
+    V1OptimizationResource,
+    V1Param,
+    V1PatchStrategy,
+    V1PathRef,
+    V1PipelineKind,
+    V1Plugins,
+    V1PolyaxonCleaner,
+    V1PolyaxonInitContainer,
+    V1PolyaxonNotifier,
+    V1PolyaxonSidecarContainer,
+    V1ProjectFeature,
+    V1ProjectVersionKind,
+    V1PytorchJob,
+    V1RandomSearch,
+    V1RayCluster,
+    V1RayReplica,
+    V1ResourceType,
+    V1RunArtifact,
+    V1RunArtifacts,
+    V1RunEdgeKind,
+    V1RunKind,
+    V1RunPending,
+    V1RunResources,
+    V1Runtime,
+    V1ScheduleKind,
+    V1SchedulingPolicy,
+    V1Service,
+    V1Stage,
+    V1StageCondition,
+    V1Stages,
+    V1Status,
+    V1StatusCondition,
+    V1Statuses,
+    V1Template,
+    V1Termination,
+    V1TFJob,
+    V1TriggerPolicy,
+    V1TruncationStoppingPolicy,
+    V1Tuner,
+    V1TunerJob,
+    V1UrlRef,
+    V1Version,
+    validate_pchoice,
+    validate_run_patch,
+)
+from polyaxon.types import *
+
+
+if TYPE_CHECKING:
+    from polyaxon._sdk.api import (
+        AgentsV1Api,
+        ArtifactsStoresV1Api,
+        AuthV1Api,
+        ConnectionsV1Api,
+        DashboardsV1Api,
+        OrganizationsV1Api,
+        PresetsV1Api,
+        ProjectDashboardsV1Api,
+        ProjectSearchesV1Api,
+        ProjectsV1Api,
+        QueuesV1Api,
+        RunsV1Api,
+        SandboxV1Api,
+        SearchesV1Api,
+        ServiceAccountsV1Api,
+        TagsV1Api,
+        TeamsV1Api,
+        UsersV1Api,
+        VersionsV1Api,
+    )
+
+
+__all__ = (
+    [
+        name
+        for name in globals()
+        if not name.startswith("_")
+        and name not in ("TYPE_CHECKING", "sdk_api", "sdk_schemas", "SDK_SCHEMAS")
+    ]
+    + list(sdk_api.__all__)
+    + list(SDK_SCHEMAS)
+)
+
+
+def __getattr__(name: str) -> Any:
+    # The generated API classes and schemas are only loaded on first access
+    if name in sdk_api.__all__:
+        return getattr(sdk_api, name)
+    if name in SDK_SCHEMAS:
+        return getattr(sdk_schemas, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
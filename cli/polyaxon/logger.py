@@ -10,6 +10,18 @@ from polyaxon._env_vars.keys import ENV_KEYS_DEBUG, ENV_KEYS_LOG_LEVEL
 logger = logging.getLogger("polyaxon.cli")
 
 
+def configure_base_logger(verbose):
+    """Configures the logger without loading the settings, e.g. for `polyaxon version`."""
+    log_level = (
+        logging.DEBUG
+        if verbose
+        or os.environ.get(ENV_KEYS_DEBUG, False)
+        or os.environ.get(ENV_KEYS_LOG_LEVEL) in ["debug", "DEBUG"]
+        else logging.INFO
+    )
+    logging.basicConfig(format="%(message)s", level=log_level, stream=sys.stdout)
+
+
 def configure_logger(verbose):
     # DO NOT MOVE OUTSIDE THE FUNCTION!
     from polyaxon import settings
@@ -44,9 +56,9 @@ def clean_outputs(fn):
 
     @wraps(fn)
     def clean_outputs_wrapper(*args, **kwargs):
-        from polyaxon import settings
-
-        cli_config = settings.CLI_CONFIG
+        # The sentry client is only set once the settings are loaded
+        settings = sys.modules.get("polyaxon.settings")
+        cli_config = settings.CLI_CONFIG if settings else None
         if cli_config and cli_config.log_handler and cli_config.log_handler.dsn:
             import sentry_sdk
 
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from clipped.config.patch_strategy import PatchStrategy as V1PatchStrategy
 
 from polyaxon._auxiliaries import (
@@ -157,97 +159,7 @@ from polyaxon._schemas.lifecycle import (
 )
 from polyaxon._schemas.log_handler import V1LogHandler
 from polyaxon._schemas.version import V1Version
-from polyaxon._sdk.schemas import (
-    V1Activity,
-    V1Agent,
-    V1AgentStateResponse,
-    V1AgentStateResponseAgentState,
-    V1AgentStatusBodyRequest,
-    V1AnalyticsSpec,
-    V1ArtifactTree,
-    V1Auth,
-    V1Cloning,
-    V1ConnectionResponse,
-    V1CreatePtyRequest,
-    V1Dashboard,
-    V1DashboardSpec,
-    V1EntitiesTags,
-    V1EntitiesTransfer,
-    V1EntityNotificationBody,
-    V1EntityStageBodyRequest,
-    V1EntityStatusBodyRequest,
-    V1ExecBgList,
-    V1ExecBgLogs,
-    V1ExecBgRequest,
-    V1ExecBgStart,
-    V1ExecBgStatus,
-    V1ExecRequest,
-    V1ExecResult,
-    V1EventsResponse,
-    V1FsEntry,
-    V1FsListResult,
-    V1FsMkdirRequest,
-    V1FsPathResult,
-    V1FsStatResult,
-    V1ListActivitiesResponse,
-    V1ListAgentsResponse,
-    V1ListBookmarksResponse,
-    V1ListConnectionsResponse,
-    V1ListDashboardsResponse,
-    V1ListOrganizationMembersResponse,
-    V1ListOrganizationsResponse,
-    V1ListPresetsResponse,
-    V1ListProjectsResponse,
-    V1ListProjectVersionsResponse,
-    V1ListQueuesResponse,
-    V1ListRunArtifactsResponse,
-    V1ListRunConnectionsResponse,
-    V1ListRunEdgesResponse,
-    V1ListRunsResponse,
-    V1ListSearchesResponse,
-    V1ListServiceAccountsResponse,
-    V1ListTagsResponse,
-    V1ListTeamMembersResponse,
-    V1ListTeamsResponse,
-    V1ListTokenResponse,
-    V1MultiEventsResponse,
-    V1OperationBody,
-    V1Organization,
-    V1OrganizationMember,
-    V1PasswordChange,
-    V1PingResponse,
-    V1Pipeline,
-    V1Preset,
-    V1Project,
-    V1ProjectSettings,
-    V1ProjectVersion,
-    V1Pty,
-    V1PtyList,
-    V1Queue,
-    V1ResizePtyRequest,
-    V1Run,
-    V1RunConnection,
-    V1RunEdge,
-    V1RunReferenceCatalog,
-    V1RunSettings,
-    V1Search,
-    V1SearchSpec,
-    V1SectionSpec,
-    V1ServiceAccount,
-    V1SettingsCatalog,
-    V1SignalRequest,
-    V1Tag,
-    V1Team,
-    V1TeamMember,
-    V1TeamSettings,
-    V1Token,
-    V1TrialStart,
-    V1User,
-    V1UserAccess,
-    V1UserEmail,
-    V1UserSingup,
-    V1Uuids,
-)
+from polyaxon._sdk import schemas as sdk_schemas
 from polyaxon._services import (
     AuthenticationError,
     AuthenticationTypes,
@@ -279,3 +191,204 @@ from traceml.events import (
     get_resource_path,
 )
 from traceml.logging.schemas import V1Log, V1Logs
+
+
+if TYPE_CHECKING:
+    from polyaxon._sdk.schemas import (
+        V1Activity,
+        V1Agent,
+        V1AgentStateResponse,
+        V1AgentStateResponseAgentState,
+        V1AgentStatusBodyRequest,
+        V1AnalyticsSpec,
+        V1ArtifactTree,
+        V1Auth,
+        V1Cloning,
+        V1ConnectionResponse,
+        V1CreatePtyRequest,
+        V1Dashboard,
+        V1DashboardSpec,
+        V1EntitiesTags,
+        V1EntitiesTransfer,
+        V1EntityNotificationBody,
+        V1EntityStageBodyRequest,
+        V1EntityStatusBodyRequest,
+        V1ExecBgList,
+        V1ExecBgLogs,
+        V1ExecBgRequest,
+        V1ExecBgStart,
+        V1ExecBgStatus,
+        V1ExecRequest,
+        V1ExecResult,
+        V1EventsResponse,
+        V1FsEntry,
+        V1FsListResult,
+        V1FsMkdirRequest,
+        V1FsPathResult,
+        V1FsStatResult,
+        V1ListActivitiesResponse,
+        V1ListAgentsResponse,
+        V1ListBookmarksResponse,
+        V1ListConnectionsResponse,
+        V1ListDashboardsResponse,
+        V1ListOrganizationMembersResponse,
+        V1ListOrganizationsResponse,
+        V1ListPresetsResponse,
+        V1ListProjectsResponse,
+        V1ListProjectVersionsResponse,
+        V1ListQueuesResponse,
+        V1ListRunArtifactsResponse,
+        V1ListRunConnectionsResponse,
+        V1ListRunEdgesResponse,
+        V1ListRunsResponse,
+        V1ListSearchesResponse,
+        V1ListServiceAccountsResponse,
+        V1ListTagsResponse,
+        V1ListTeamMembersResponse,
+        V1ListTeamsResponse,
+        V1ListTokenResponse,
+        V1MultiEventsResponse,
+        V1OperationBody,
+        V1Organization,
+        V1OrganizationMember,
+        V1PasswordChange,
+        V1PingResponse,
+        V1Pipeline,
+        V1Preset,
+        V1Project,
+        V1ProjectSettings,
+        V1ProjectVersion,
+        V1Pty,
+        V1PtyList,
+        V1Queue,
+        V1ResizePtyRequest,
+        V1Run,
+        V1RunConnection,
+        V1RunEdge,
+        V1RunReferenceCatalog,
+        V1RunSettings,
+        V1Search,
+        V1SearchSpec,
+        V1SectionSpec,
+        V1ServiceAccount,
+        V1SettingsCatalog,
+        V1SignalRequest,
+        V1Tag,
+        V1Team,
+        V1TeamMember,
+        V1TeamSettings,
+        V1Token,
+        V1TrialStart,
+        V1User,
+        V1UserAccess,
+        V1UserEmail,
+        V1UserSingup,
+        V1Uuids,
+    )
+
+
+SDK_SCHEMAS = (
+    "V1Activity",
+    "V1Agent",
+    "V1AgentStateResponse",
+    "V1AgentStateResponseAgentState",
+    "V1AgentStatusBodyRequest",
+    "V1AnalyticsSpec",
+    "V1ArtifactTree",
+    "V1Auth",
+    "V1Cloning",
+    "V1ConnectionResponse",
+    "V1CreatePtyRequest",
+    "V1Dashboard",
+    "V1DashboardSpec",
+    "V1EntitiesTags",
+    "V1EntitiesTransfer",
+    "V1EntityNotificationBody",
+    "V1EntityStageBodyRequest",
+    "V1EntityStatusBodyRequest",
+    "V1ExecBgList",
+    "V1ExecBgLogs",
+    "V1ExecBgRequest",
+    "V1ExecBgStart",
+    "V1ExecBgStatus",
+    "V1ExecRequest",
+    "V1ExecResult",
+    "V1EventsResponse",
+    "V1FsEntry",
+    "V1FsListResult",
+    "V1FsMkdirRequest",
+    "V1FsPathResult",
+    "V1FsStatResult",
+    "V1ListActivitiesResponse",
+    "V1ListAgentsResponse",
+    "V1ListBookmarksResponse",
+    "V1ListConnectionsResponse",
+    "V1ListDashboardsResponse",
+    "V1ListOrganizationMembersResponse",
+    "V1ListOrganizationsResponse",
+    "V1ListPresetsResponse",
+    "V1ListProjectsResponse",
+    "V1ListProjectVersionsResponse",
+    "V1ListQueuesResponse",
+    "V1ListRunArtifactsResponse",
+    "V1ListRunConnectionsResponse",
+    "V1ListRunEdgesResponse",
+    "V1ListRunsResponse",
+    "V1ListSearchesResponse",
+    "V1ListServiceAccountsResponse",
+    "V1ListTagsResponse",
+    "V1ListTeamMembersResponse",
+    "V1ListTeamsResponse",
+    "V1ListTokenResponse",
+    "V1MultiEventsResponse",
+    "V1OperationBody",
+    "V1Organization",
+    "V1OrganizationMember",
+    "V1PasswordChange",
+    "V1PingResponse",
+    "V1Pipeline",
+    "V1Preset",
+    "V1Project",
+    "V1ProjectSettings",
+    "V1ProjectVersion",
+    "V1Pty",
+    "V1PtyList",
+    "V1Queue",
+    "V1ResizePtyRequest",
+    "V1Run",
+    "V1RunConnection",
+    "V1RunEdge",
+    "V1RunReferenceCatalog",
+    "V1RunSettings",
+    "V1Search",
+    "V1SearchSpec",
+    "V1SectionSpec",
+    "V1ServiceAccount",
+    "V1SettingsCatalog",
+    "V1SignalRequest",
+    "V1Tag",
+    "V1Team",
+    "V1TeamMember",
+    "V1TeamSettings",
+    "V1Token",
+    "V1TrialStart",
+    "V1User",
+    "V1UserAccess",
+    "V1UserEmail",
+    "V1UserSingup",
+    "V1Uuids",
+)
+
+__all__ = [
+    name
+    for name in globals()
+    if not name.startswith("_")
+    and name not in ("TYPE_CHECKING", "sdk_schemas", "SDK_SCHEMAS")
+] + list(SDK_SCHEMAS)
+
+
+def __getattr__(name: str) -> Any:
+    # The generated API schemas are only loaded on first access
+    if name in SDK_SCHEMAS:
+        return getattr(sdk_schemas, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,86 @@
+import json
+import pytest
+import subprocess
+import sys
+import time
+
+from polyaxon.cli import COMMANDS, cli
+from tests.test_cli.utils import BaseCommandTestCase
+
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import polyaxon.cli
+duration = time.perf_counter() - start
+print(json.dumps({"duration": duration, "modules": sorted(sys.modules)}))
+"""
+
+VERSION_SCRIPT = """
+import json, sys
+from polyaxon.cli import cli
+cli(["version"], standalone_mode=False)
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+HEAVY_MODULES = [
+    "polyaxon.settings",
+    "polyaxon._sdk.api",
+    "kubernetes",
+    "rich",
+]
+
+
+VERSION_HEAVY_MODULES = [
+    "polyaxon.settings",
+    "polyaxon.client",
+    "polyaxon._cli.session",
+    "polyaxon._k8s.k8s_schemas",
+    "kubernetes",
+]
+
+
+@pytest.mark.cli_mark
+class TestCliImport(BaseCommandTestCase):
+    def test_import_does_not_load_the_commands(self):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        data = json.loads(result.stdout.splitlines()[-1])
+        modules = set(data["modules"])
+        for module in HEAVY_MODULES:
+            assert module not in modules
+        # Generous budget, the import takes a few tens of milliseconds
+        assert data["duration"] < 2
+
+    def test_version_does_not_load_the_settings(self):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "polyaxon", "version"],
+            capture_output=True,
+            check=True,
+        )
+        # Loading the settings and the client alone takes around 2 seconds
+        assert time.perf_counter() - start < 1.5
+
+        result = subprocess.run(
+            [sys.executable, "-c", VERSION_SCRIPT],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        data = json.loads(result.stdout.splitlines()[-1])
+        modules = set(data["modules"])
+        # The version is printed with rich, the settings and the client are not needed
+        for module in VERSION_HEAVY_MODULES:
+            assert module not in modules
+
+    def test_commands_are_resolved_on_demand(self):
+        assert set(COMMANDS).issubset(cli.list_commands(None))
+        command = cli.get_command(None, "version")
+        assert command.name == "version"
+        assert cli.commands["version"] is command
+        assert cli.get_command(None, "foo") is None
@@ -1,7 +1,10 @@
-from mock import patch
+from mock import mock, patch
+import os
 import pytest
+import tempfile
 
 from polyaxon._cli.operations import ops
+from polyaxon.exceptions import PolyaxonClientException
 from tests.test_cli.utils import BaseCommandTestCase
 
 
@@ -266,3 +269,58 @@ class TestCliRuns(BaseCommandTestCase):
             stderr=True,
             tty=False,
         )
+
+    @patch("polyaxon._cli.operations.get_project_or_local")
+    @patch("polyaxon._cli.operations.RunClient")
+    def test_pull_runs_concurrently(self, run_client, get_project):
+        get_project.return_value = ("admin", None, "foo")
+        run_client.return_value.list.return_value.results = [
+            mock.MagicMock(uuid="uid{}".format(i)) for i in range(4)
+        ]
+        run_client.return_value.pull_remote_run.side_effect = [
+            "/tmp/uid",
+            "/tmp/uid",
+            PolyaxonClientException("failed"),
+            "/tmp/uid",
+        ]
+
+        result = self.runner.invoke(
+            ops, ["pull", "-p", "admin/foo", "-a", "--workers", "2"]
+        )
+
+        assert result.exit_code == 1
+        assert "1/4 runs failed" in result.output
+        assert run_client.return_value.pull_remote_run.call_count == 4
+        for call in run_client.return_value.pull_remote_run.call_args_list:
+            assert call[1]["show_progress"] is False
+
+    @patch("polyaxon._cli.operations.ctx_paths.get_offline_base_path")
+    @patch("polyaxon._cli.operations.get_project_or_local")
+    @patch("polyaxon._cli.operations.RunClient")
+    def test_push_runs_concurrently(self, run_client, get_project, get_offline_path):
+        get_project.return_value = ("admin", None, "foo")
+        offline_path = tempfile.mkdtemp()
+        get_offline_path.return_value = offline_path
+        for i in range(4):
+            os.mkdir(os.path.join(offline_path, "uid{}".format(i)))
+
+        def push_offline_run(path, **kwargs):
+            if path.endswith("uid2"):
+                raise PolyaxonClientException("upload failed")
+
+        run_client.return_value.push_offline_run.side_effect = push_offline_run
+
+        result = self.runner.invoke(ops, ["push", "-a", "--workers", "2"])
+
+        assert result.exit_code == 1
+        assert "1/4 runs failed" in result.output
+        # The failures are summarized with their errors
+        assert "uid2" in result.output
+        assert "upload failed" in result.output
+        assert run_client.return_value.load_offline_run.call_count == 4
+        assert run_client.return_value.push_offline_run.call_count == 4
+        pushed_paths = set()
+        for call in run_client.return_value.push_offline_run.call_args_list:
+            assert call[1]["show_progress"] is False
+            pushed_paths.add(call[1]["path"])
+        assert pushed_paths == {"{}/uid{}".format(offline_path, i) for i in range(4)}
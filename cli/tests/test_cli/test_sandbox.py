@@ -67,7 +67,7 @@ class TestCliSandbox(BaseCommandTestCase):
     def test_command_is_registered(self):
         from polyaxon.cli import cli
 
-        assert cli.commands["sandbox"].name == "sandbox"
+        assert cli.get_command(None, "sandbox").name == "sandbox"
 
     def test_ping(self):
         result = self.runner.invoke(
@@ -90,7 +90,7 @@ class TestCliSsh(BaseCommandTestCase):
     def test_commands_are_registered(self):
         from polyaxon.cli import cli
 
-        assert cli.commands["ssh"].name == "ssh"
+        assert cli.get_command(None, "ssh").name == "ssh"
         assert ssh.commands["connect"].name == "connect"
 
     def test_group_options_are_not_supported(self):
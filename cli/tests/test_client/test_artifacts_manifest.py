@@ -0,0 +1,73 @@
+from mock import patch
+import os
+import pytest
+import tempfile
+
+from polyaxon._client.manifest import ArtifactsManifest, get_artifact_relpath
+from polyaxon._sdk.schemas.v1_artifact_tree import V1ArtifactTree
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+@pytest.mark.client_mark
+class TestArtifactsManifest(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dirpath = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.dirpath, "sub"))
+        self.files = []
+        for name in ["a", "b", "sub/c"]:
+            filepath = os.path.join(self.dirpath, name)
+            with open(filepath, "w") as f:
+                f.write(name)
+            self.files.append(filepath)
+        self.path = os.path.join(tempfile.mkdtemp(), "manifest.plx.json")
+
+    def test_get_artifact_relpath(self):
+        assert get_artifact_relpath("/tmp/foo/bar", "/tmp") == "foo/bar"
+        assert get_artifact_relpath("/tmp/foo/bar") == "tmp/foo/bar"
+
+    def test_get_remote_files(self):
+        trees = {
+            "out": V1ArtifactTree(files={"a": 1, "b": 1}, dirs=["sub"]),
+            "out/sub": V1ArtifactTree(files={"c": 5}, dirs=[]),
+        }
+        assert ArtifactsManifest.get_remote_files(trees.get, "out") == {
+            "a": 1,
+            "b": 1,
+            "sub/c": 5,
+        }
+
+    def test_get_changed_files(self):
+        manifest = ArtifactsManifest(self.path)
+        files, entries = manifest.get_changed_files(
+            self.files, remote_files={}, relative_to=self.dirpath
+        )
+        assert files == self.files
+        assert set(entries.keys()) == {"a", "b", "sub/c"}
+        manifest.update(entries)
+
+        # Same files uploaded and found on the tree
+        manifest = ArtifactsManifest(self.path)
+        remote_files = {"a": 1, "b": 1, "sub/c": 5}
+        with patch("polyaxon._client.manifest.hash_file") as hash_file:
+            files, _ = manifest.get_changed_files(
+                self.files, remote_files=remote_files, relative_to=self.dirpath
+            )
+        assert files == []
+        # Unchanged files are not hashed again
+        assert hash_file.call_count == 0
+
+        # Missing on the tree
+        files, _ = manifest.get_changed_files(
+            self.files, remote_files={"a": 1, "b": 1}, relative_to=self.dirpath
+        )
+        assert files == self.files[2:]
+
+        # Changed locally
+        with open(self.files[0], "w") as f:
+            f.write("A")
+        os.utime(self.files[0], (0, 0))
+        files, _ = manifest.get_changed_files(
+            self.files, remote_files=remote_files, relative_to=self.dirpath
+        )
+        assert files == self.files[:1]
@@ -1,11 +1,16 @@
+import json
 from mock import patch
 import pytest
+import subprocess
+import sys
 import tempfile
 
 from polyaxon import settings
 from polyaxon._client.client import PolyaxonClient
 from polyaxon._constants.globals import NO_AUTH
+from polyaxon._flow import V1Operation
 from polyaxon._schemas.client import ClientConfig
+from polyaxon._schemas.lifecycle import V1Statuses
 from polyaxon._sdk.api import (
     AgentsV1Api,
     AuthV1Api,
@@ -15,6 +20,7 @@ from polyaxon._sdk.api import (
     UsersV1Api,
     VersionsV1Api,
 )
+from polyaxon._sdk.schemas import V1ListRunsResponse, V1Run
 from polyaxon._utils.test_utils import BaseTestCase, patch_settings
 from polyaxon.exceptions import PolyaxonClientException
 
@@ -204,6 +210,40 @@ class TestPolyaxonClient(BaseTestCase):
             with client:
                 pass
 
+    def test_sdk_api_and_schemas_are_loaded_lazily(self):
+        script = (
+            "import json, sys; import polyaxon.client; "
+            "print(json.dumps(sorted(sys.modules)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        )
+        modules = set(json.loads(result.stdout.splitlines()[-1]))
+        assert "polyaxon._sdk.api.runs_v1_api" not in modules
+        assert "polyaxon._sdk.schemas.v1_automation" not in modules
+
+        from polyaxon import client as public_client, schemas
+        from polyaxon._sdk import schemas as sdk_schemas
+
+        assert public_client.RunsV1Api is RunsV1Api
+        assert public_client.V1Run is schemas.V1Run is sdk_schemas.V1Run
+        assert "V1Run" in dir(sdk_schemas)
+        with pytest.raises(AttributeError):
+            sdk_schemas.V1Foo
+
+    def test_star_imports_export_the_lazy_sdk_names(self):
+        import polyaxon_sdk
+
+        assert polyaxon_sdk.V1Run is V1Run
+        assert polyaxon_sdk.RunsV1Api is RunsV1Api
+        assert polyaxon_sdk.V1Operation is V1Operation
+
+        namespace = {}
+        exec("from polyaxon.schemas import *", namespace)
+        assert namespace["V1ListRunsResponse"] is V1ListRunsResponse
+        assert namespace["V1Statuses"] is V1Statuses
+        assert "sdk_schemas" not in namespace
+
 
 @pytest.mark.client_mark
 @pytest.mark.asyncio
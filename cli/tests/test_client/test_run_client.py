@@ -1,14 +1,26 @@
+import asyncio
 from mock import MagicMock, mock, patch
+import os
 import pytest
+import shutil
+import tempfile
+import time
 from types import SimpleNamespace
 import uuid
 
+from fsspec.implementations.local import LocalFileSystem
+
+from polyaxon import settings
+from polyaxon._client.journal import RunJournal
 from polyaxon._client.run import RunClient, _serialize_event_names
+from polyaxon._client.store import PolyaxonStore
+from polyaxon._fs.async_manager import upload_dir
 from polyaxon._schemas.lifecycle import (
     V1ProjectVersionKind,
     V1StatusCondition,
     V1Statuses,
 )
+from polyaxon._sdk.schemas.v1_artifact_tree import V1ArtifactTree
 from polyaxon._sdk.schemas.v1_list_runs_response import V1ListRunsResponse
 from polyaxon._sdk.schemas.v1_project_version import V1ProjectVersion
 from polyaxon._sdk.schemas.v1_run import V1Run
@@ -217,6 +229,76 @@ class TestRunClient(BaseTestCase):
         call_args = mock_transfer.call_args
         assert call_args[1]["body"]["project"] == to_project
 
+    def test_dedup_upload_keeps_unchanged_files(self):
+        dirpath = tempfile.mkdtemp()
+        store_path = tempfile.mkdtemp()
+        local_store_path = tempfile.mkdtemp()
+        files = []
+        for name in ["a", "b", "sub/c"]:
+            filepath = os.path.join(dirpath, name)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "w") as f:
+                f.write(name)
+            files.append(filepath)
+        client = RunClient(
+            owner=self.owner, project=self.project, run_uuid=self.run_uuid
+        )
+        client._run_data.settings = V1RunSettings()
+        uploads = []
+
+        def _get_artifacts_tree(path=""):
+            full_path = os.path.join(store_path, path)
+            if not os.path.isdir(full_path):
+                return None
+            names = os.listdir(full_path)
+            return V1ArtifactTree(
+                files={
+                    n: os.path.getsize(os.path.join(full_path, n))
+                    for n in names
+                    if os.path.isfile(os.path.join(full_path, n))
+                },
+                dirs=[n for n in names if os.path.isdir(os.path.join(full_path, n))],
+            )
+
+        def _upload_dir(url, path, files, overwrite, relative_to, **kwargs):
+            # The streams service extracts the files and puts them on the store
+            uploads.append(sorted(os.path.relpath(f, relative_to) for f in files))
+            local_path = os.path.join(local_store_path, path)
+            for filepath in files:
+                to_path = os.path.join(
+                    local_path, os.path.relpath(filepath, relative_to)
+                )
+                os.makedirs(os.path.dirname(to_path), exist_ok=True)
+                shutil.copy(filepath, to_path)
+            agent_config = MagicMock()
+            agent_config.get_local_path.return_value = local_path
+            with patch.object(settings, "AGENT_CONFIG", agent_config):
+                asyncio.run(upload_dir(LocalFileSystem(), store_path, path))
+            shutil.rmtree(local_path)
+            return MagicMock(status_code=200)
+
+        manifest_path = os.path.join(tempfile.mkdtemp(), "manifest.plx.json")
+        with (
+            patch.object(
+                RunClient, "_get_artifacts_manifest_path", return_value=manifest_path
+            ),
+            patch.object(
+                RunClient, "get_artifacts_tree", side_effect=_get_artifacts_tree
+            ),
+            patch.object(PolyaxonStore, "upload_dir", side_effect=_upload_dir),
+        ):
+            client.upload_artifacts(files, path="out", relative_to=dirpath, dedup=True)
+            with open(files[0], "w") as f:
+                f.write("A")
+            os.utime(files[0], (0, 0))
+            client.upload_artifacts(files, path="out", relative_to=dirpath, dedup=True)
+
+        assert uploads == [["a", "b", "sub/c"], ["a"]]
+        # The partial upload only replaced the changed file
+        for name, content in [("a", "A"), ("b", "b"), ("sub/c", "sub/c")]:
+            with open(os.path.join(store_path, "out", name)) as f:
+                assert f.read() == content
+
     def test_promote_versions_use_injected_client(self):
         sdk_client = SyncPolyaxonClientMock()
         sdk_client.projects_v1.get_version.side_effect = AttributeError("missing")
@@ -258,6 +340,7 @@ class TestRunClient(BaseTestCase):
             owner=self.owner, project=self.project, run_uuid=self.run_uuid
         )
         client.set_name("new-run-name")
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.name == "new-run-name"
@@ -269,6 +352,7 @@ class TestRunClient(BaseTestCase):
             owner=self.owner, project=self.project, run_uuid=self.run_uuid
         )
         client.set_description("New description")
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.description == "New description"
@@ -282,6 +366,7 @@ class TestRunClient(BaseTestCase):
         assert client.run_data.tags is None
 
         client.log_tags(["foo", "bar"])
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.tags == ["foo", "bar"]
@@ -295,6 +380,7 @@ class TestRunClient(BaseTestCase):
         client.run_data.tags = ["old-tag"]
 
         client.log_tags(["new-tag"], reset=True)
+        client._wait_for_updates()
 
         assert client.run_data.tags == ["new-tag"]
 
@@ -306,6 +392,7 @@ class TestRunClient(BaseTestCase):
         )
 
         client.log_meta(foo="bar", baz=123)
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.meta_info["foo"] == "bar"
@@ -320,6 +407,7 @@ class TestRunClient(BaseTestCase):
         )
 
         client.log_inputs(learning_rate=0.01, batch_size=32)
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.inputs["learning_rate"] == 0.01
@@ -333,11 +421,38 @@ class TestRunClient(BaseTestCase):
         )
 
         client.log_outputs(accuracy=0.95, loss=0.05)
+        client._wait_for_updates()
 
         assert mock_patch.call_count == 1
         assert client.run_data.outputs["accuracy"] == 0.95
         assert client.run_data.outputs["loss"] == 0.05
 
+    @mock.patch("polyaxon._sdk.api.RunsV1Api.patch_run")
+    def test_log_outputs_are_merged_into_fewer_requests(self, mock_patch):
+        """Test that queued updates of a run are merged before being sent"""
+        mock_patch.side_effect = lambda *args, **kwargs: time.sleep(0.05)
+        client = RunClient(
+            owner=self.owner, project=self.project, run_uuid=self.run_uuid
+        )
+
+        for i in range(50):
+            client.log_outputs(**{"step_{}".format(i): i})
+        client.log_tags("foo")
+        client.log_tags("bar")
+        client._wait_for_updates()
+
+        assert 1 <= mock_patch.call_count < 50
+        outputs = {}
+        tags = []
+        for call in mock_patch.call_args_list:
+            assert call[1]["run_uuid"] == self.run_uuid
+            body = call[1]["body"]
+            assert body["merge"] is True
+            outputs.update(body.get("outputs", {}))
+            tags += body.get("tags", [])
+        assert outputs == {"step_{}".format(i): i for i in range(50)}
+        assert tags == ["foo", "bar"]
+
     @mock.patch("polyaxon._sdk.api.RunsV1Api.get_run")
     def test_get_inputs(self, mock_get):
         """Test getting run inputs"""
@@ -636,3 +751,46 @@ class TestRunClient(BaseTestCase):
         assert ("command", ["sh", "-lc", "echo hi"]) in query_params
         assert ("stdin", False) in query_params
         assert ("tty", False) in query_params
+
+    def test_offline_run_journal_replay(self):
+        path = tempfile.mkdtemp()
+        with patch("polyaxon._client.run.ctx_paths.get_offline_path") as get_path:
+            get_path.return_value = path
+            client = RunClient(
+                owner=self.owner,
+                project=self.project,
+                run_uuid=self.run_uuid,
+                is_offline=True,
+            )
+            client._use_journal = True
+            client.log_status(V1Statuses.CREATED)
+            client.log_status(V1Statuses.RUNNING)
+            client.log_inputs(lr=0.1)
+            client.log_outputs(loss=1)
+            client.log_outputs(acc=0.9)
+            client.log_artifact_lineage(
+                V1RunArtifact(name="model", kind="model", path="model.pt")
+            )
+        assert os.path.exists(os.path.join(path, "journal.plx.jsonl"))
+
+        # No persisted run, e.g. the process was killed
+        loaded = RunClient.load_offline_run(path=path)
+        assert loaded.run_uuid == self.run_uuid
+        assert loaded.run_data.status == V1Statuses.RUNNING
+        assert loaded.run_data.inputs == {"lr": 0.1}
+        assert loaded.run_data.outputs == {"loss": 1, "acc": 0.9}
+        assert len(loaded.run_data.status_conditions) == 2
+        assert list(loaded.artifacts_lineage.keys()) == ["model"]
+
+        # Replaying is idempotent
+        loaded._apply_journal_entries(
+            RunJournal(os.path.join(path, "journal.plx.jsonl")).read()
+        )
+        assert len(loaded.run_data.status_conditions) == 2
+        assert loaded.run_data.outputs == {"loss": 1, "acc": 0.9}
+
+        # Persisting the run clears the journal
+        client.persist_run(path)
+        assert not os.path.exists(os.path.join(path, "journal.plx.jsonl"))
+        loaded = RunClient.load_offline_run(path=path)
+        assert loaded.run_data.outputs == {"loss": 1, "acc": 0.9}
@@ -0,0 +1,88 @@
+import os
+import pytest
+import tempfile
+
+from polyaxon._client.journal import JournalEntryKind, RunJournal
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+@pytest.mark.client_mark
+class TestRunJournal(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(tempfile.mkdtemp(), "run", "journal.plx.jsonl")
+
+    def test_append_and_read(self):
+        journal = RunJournal(self.path)
+        assert journal.exists() is False
+        assert journal.read() == []
+        journal.append(JournalEntryKind.RUN, {"uuid": "uid"})
+        journal.append(JournalEntryKind.UPDATE, {"name": "foo"})
+        journal.close()
+        assert journal.read() == [
+            {"kind": "run", "data": {"uuid": "uid"}},
+            {"kind": "update", "data": {"name": "foo"}},
+        ]
+
+    def test_read_skips_partial_entries(self):
+        journal = RunJournal(self.path)
+        journal.append(JournalEntryKind.UPDATE, {"name": "foo"})
+        journal.close()
+        with open(self.path, "a") as f:
+            f.write('{"kind": "upd')
+        assert journal.read() == [{"kind": "update", "data": {"name": "foo"}}]
+
+    def test_fold(self):
+        entries = [
+            {"kind": "run", "data": {"uuid": "uid"}},
+            {"kind": "update", "data": {"outputs": {"loss": 1}, "merge": True}},
+            {"kind": "update", "data": {"outputs": {"acc": 1}, "merge": True}},
+            {"kind": "update", "data": {"inputs": {"lr": 1}}},
+            {"kind": "update", "data": {"inputs": {"bs": 1}, "merge": True}},
+            {"kind": "update", "data": {"tags": ["a"], "merge": True}},
+            {"kind": "update", "data": {"tags": ["a", "b"], "merge": True}},
+            {"kind": "status", "data": {"type": "running", "last_transition_time": 1}},
+            {"kind": "status", "data": {"type": "running", "last_transition_time": 1}},
+            {"kind": "lineage", "data": {"artifacts": [{"name": "a", "path": "1"}]}},
+            {"kind": "lineage", "data": {"artifacts": [{"name": "a", "path": "2"}]}},
+        ]
+        assert RunJournal.fold(entries) == [
+            {"kind": "run", "data": {"uuid": "uid"}},
+            {"kind": "update", "data": {"inputs": {"lr": 1, "bs": 1}}},
+            {
+                "kind": "update",
+                "data": {
+                    "outputs": {"loss": 1, "acc": 1},
+                    "tags": ["a", "b"],
+                    "merge": True,
+                },
+            },
+            {"kind": "status", "data": {"type": "running", "last_transition_time": 1}},
+            {"kind": "lineage", "data": {"artifacts": [{"name": "a", "path": "2"}]}},
+        ]
+
+    def test_compact_bounds_the_journal(self):
+        journal = RunJournal(self.path, compact_entries=10)
+        journal.append(JournalEntryKind.RUN, {"uuid": "uid"})
+        for i in range(100):
+            journal.append(
+                JournalEntryKind.UPDATE, {"outputs": {"step": i}, "merge": True}
+            )
+        assert len(journal.read()) <= 10
+        journal.append(JournalEntryKind.UPDATE, {"outputs": {"loss": 1}, "merge": True})
+        journal.compact()
+        assert journal.read() == [
+            {"kind": "run", "data": {"uuid": "uid"}},
+            {
+                "kind": "update",
+                "data": {"outputs": {"step": 99, "loss": 1}, "merge": True},
+            },
+        ]
+
+    def test_clear(self):
+        journal = RunJournal(self.path)
+        journal.append(JournalEntryKind.UPDATE, {"name": "foo"})
+        journal.clear()
+        assert journal.exists() is False
+        journal.append(JournalEntryKind.UPDATE, {"name": "bar"})
+        assert journal.read() == [{"kind": "update", "data": {"name": "bar"}}]
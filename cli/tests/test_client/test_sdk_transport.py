@@ -1,6 +1,11 @@
 from mock import patch
 import pytest
+import requests
 
+from polyaxon._client.transport.pool_manager import (
+    clear_pool_managers,
+    create_session,
+)
 from polyaxon._schemas.client import ClientConfig
 from polyaxon._sdk.async_client.api_client import AsyncApiClient
 from polyaxon._sdk.async_client.rest import RESTClientObject as AsyncRESTClientObject
@@ -11,6 +16,10 @@ from polyaxon.exceptions import ApiValueError
 
 @pytest.mark.client_mark
 class TestSDKTransport(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        clear_pool_managers()
+
     def test_async_api_client_rejects_async_req(self):
         client = AsyncApiClient(ClientConfig(host="localhost").async_sdk_config)
 
@@ -44,6 +53,45 @@ class TestSDKTransport(BaseTestCase):
 
         assert clear.call_count == 1
 
+    def test_sync_rest_shares_pool_manager(self):
+        client1 = ApiClient(ClientConfig(host="localhost").sdk_config)
+        client2 = ApiClient(ClientConfig(host="localhost").sdk_config)
+        assert client1.rest_client.pool_manager is client2.rest_client.pool_manager
+
+        config = ClientConfig(host="localhost").sdk_config
+        config.connection_pool_shared = False
+        client3 = ApiClient(config)
+        assert client3.rest_client.pool_manager is not client1.rest_client.pool_manager
+
+        # Closing a client keeps the shared connections for the other clients
+        with patch.object(client1.rest_client.pool_manager, "clear") as clear:
+            client1.rest_client.close()
+            client1.rest_client.close()
+            assert clear.call_count == 0
+            client2.rest_client.close()
+            assert clear.call_count == 1
+
+        client4 = ApiClient(ClientConfig(host="localhost").sdk_config)
+        assert client4.rest_client.pool_manager is not client1.rest_client.pool_manager
+
+    def test_sync_rest_and_sessions_share_pool_manager(self):
+        config = ClientConfig(host="localhost", verify_ssl=True)
+        client = ApiClient(config.sdk_config)
+        session = create_session(config=config)
+        adapter = session.get_adapter("https://")
+        assert adapter.poolmanager is client.rest_client.pool_manager
+
+        # Requests verified like the config use the same host pools as the client
+        request = requests.Request("GET", "https://localhost/api/v1").prepare()
+        conn = adapter.get_connection_with_tls_context(request, verify=True)
+        assert conn is client.rest_client.pool_manager.connection_from_url(
+            "https://localhost/api/v1"
+        )
+        conn = adapter.get_connection_with_tls_context(request, verify=False)
+        assert conn is not client.rest_client.pool_manager.connection_from_url(
+            "https://localhost/api/v1"
+        )
+
     def test_sync_api_client_query_bools_are_lowercase(self):
         client = ApiClient(ClientConfig(host="localhost").sdk_config)
 
@@ -0,0 +1,445 @@
+import base64
+import hashlib
+import io
+from mock import MagicMock, patch
+import os
+import pytest
+import tarfile
+import tempfile
+
+from clipped.utils.json import orjson_dumps
+from clipped.utils.paths import untar_file
+from polyaxon._client.store import PolyaxonStore
+from polyaxon._env_vars.keys import ENV_KEYS_UPLOAD_SIZE
+from polyaxon._schemas.client import ClientConfig
+from polyaxon._utils.test_utils import BaseTestCase
+from polyaxon.exceptions import PolyaxonClientException
+
+
+@pytest.mark.client_mark
+class TestPolyaxonStoreUploadParts(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dirpath = tempfile.mkdtemp()
+        self.files = []
+        for i in range(5):
+            filepath = os.path.join(self.dirpath, "file{}".format(i))
+            with open(filepath, "wb") as f:
+                f.write(b"0" * 100)
+            self.files.append(filepath)
+        client = MagicMock()
+        client.client.config = ClientConfig(host="localhost", upload_threads=2)
+        self.store = PolyaxonStore(client)
+        self.state_path = os.path.join(tempfile.mkdtemp(), "upload.plx.json")
+
+    def test_get_upload_parts(self):
+        assert PolyaxonStore.get_upload_parts(self.files, 200) == [
+            self.files[:2],
+            self.files[2:4],
+            self.files[4:],
+        ]
+        # Files larger than a part are uploaded in byte ranges
+        assert PolyaxonStore.get_upload_parts(self.files, 40) == [
+            [(f, offset, size)]
+            for f in self.files
+            for offset, size in [(0, 40), (40, 40), (80, 20)]
+        ]
+        assert PolyaxonStore.get_upload_parts(self.files, 1000) == [self.files]
+
+    def test_upload_dir_uses_parts_for_large_uploads(self):
+        with patch.object(PolyaxonStore, "upload_parts") as upload_parts:
+            with patch.object(PolyaxonStore, "upload") as upload:
+                self.store.upload_dir("url", files=self.files, path="foo")
+        assert upload_parts.call_count == 0
+        assert upload.call_count == 1
+
+        self.store._client.client.config.upload_part_size = 200
+        with patch.object(PolyaxonStore, "upload_parts") as upload_parts:
+            self.store.upload_dir("url", files=self.files, path="foo")
+        assert upload_parts.call_count == 1
+
+    def test_upload_parts(self):
+        with patch.object(PolyaxonStore, "upload") as upload:
+            upload.return_value.status_code = 200
+            response = self.store.upload_parts(
+                "url",
+                files=self.files,
+                path="foo",
+                overwrite=False,
+                part_size=200,
+                show_progress=False,
+                state_path=self.state_path,
+            )
+
+        assert response.status_code == 200
+        assert upload.call_count == 3
+        json_data = [c[1]["json_data"] for c in upload.call_args_list]
+        # The first part is sent first and is the only one checking previous content
+        assert json_data[0] == {"untar": True, "path": "foo", "overwrite": False}
+        assert json_data[1]["overwrite"] is True
+        assert json_data[2]["overwrite"] is True
+        assert os.path.exists(self.state_path) is False
+
+    @patch("polyaxon._client.store.time.sleep")
+    def test_upload_parts_retries_and_resumes(self, _):
+        calls = []
+
+        def _upload(url, files, **kwargs):
+            calls.append(files[0][1][0])
+            response = MagicMock()
+            # The third part always fails
+            response.status_code = 500 if len(calls) > 2 else 200
+            return response
+
+        with patch.object(PolyaxonStore, "upload", side_effect=_upload):
+            with self.assertRaises(PolyaxonClientException):
+                self.store.upload_parts(
+                    "url",
+                    files=self.files,
+                    part_size=200,
+                    max_workers=1,
+                    show_progress=False,
+                    state_path=self.state_path,
+                )
+        # 2 parts uploaded, then the third part is tried and retried
+        assert len(calls) == 2 + 1 + PolyaxonStore.UPLOAD_PART_RETRIES
+        assert len(PolyaxonStore._read_upload_state(self.state_path)) == 2
+
+        with patch.object(PolyaxonStore, "upload") as upload:
+            upload.return_value.status_code = 200
+            self.store.upload_parts(
+                "url",
+                files=self.files,
+                part_size=200,
+                show_progress=False,
+                state_path=self.state_path,
+            )
+        # Only the remaining part is uploaded
+        assert upload.call_count == 1
+        assert os.path.exists(self.state_path) is False
+
+    def test_upload_file_larger_than_the_max_size_in_ranges(self):
+        filepath = os.path.join(self.dirpath, "model.bin")
+        content = os.urandom(1000)
+        with open(filepath, "wb") as f:
+            f.write(content)
+        uploads = []
+        real_upload = PolyaxonStore.upload
+
+        def _upload(store, url, files, files_size, **kwargs):
+            # The real upload rejects anything larger than the max size
+            uploads.append(
+                (files[0][1][0], files[0][1][1].read(), dict(kwargs["json_data"]))
+            )
+            files[0][1][1].seek(0)
+            return real_upload(store, url, files, files_size, **kwargs)
+
+        session = MagicMock()
+        session.post.return_value.status_code = 200
+        with patch.dict(os.environ, {ENV_KEYS_UPLOAD_SIZE: "300"}):
+            with patch("polyaxon._client.store.create_session", return_value=session):
+                with patch.object(
+                    PolyaxonStore, "upload", autospec=True, side_effect=_upload
+                ):
+                    self.store.upload_file(
+                        "url",
+                        filepath,
+                        path="models",
+                        overwrite=False,
+                        show_progress=False,
+                    )
+
+        assert session.post.call_count == 4
+        assert [u[0] for u in uploads] == ["model.bin"] * 4
+        assert all(len(u[1]) <= 300 for u in uploads)
+        json_data = sorted((u[2] for u in uploads), key=lambda j: j["offset"])
+        assert [j["offset"] for j in json_data] == [0, 300, 600, 900]
+        assert json_data[0] == {
+            "untar": False,
+            "path": "models",
+            "overwrite": False,
+            "offset": 0,
+            "total_size": 1000,
+        }
+        # The first range creates the file before the next ranges
+        assert uploads[0][2]["offset"] == 0
+        assert (
+            b"".join(u[1] for u in sorted(uploads, key=lambda u: u[2]["offset"]))
+            == content
+        )
+
+    @patch("polyaxon._client.store.time.sleep")
+    def test_upload_ranges_are_resumed(self, _):
+        filepath = os.path.join(self.dirpath, "model.bin")
+        with open(filepath, "wb") as f:
+            f.write(b"1" * 1000)
+        offsets = []
+
+        def _upload(url, files, **kwargs):
+            offsets.append(kwargs["json_data"]["offset"])
+            response = MagicMock()
+            # The third range always fails
+            response.status_code = 500 if len(offsets) > 2 else 200
+            return response
+
+        with patch.object(PolyaxonStore, "upload", side_effect=_upload):
+            with self.assertRaises(PolyaxonClientException):
+                self.store.upload_parts(
+                    "url",
+                    files=[filepath],
+                    part_size=300,
+                    max_workers=1,
+                    show_progress=False,
+                    state_path=self.state_path,
+                )
+        assert offsets[:2] == [0, 300]
+        assert len(PolyaxonStore._read_upload_state(self.state_path)) == 2
+
+        with patch.object(PolyaxonStore, "upload") as upload:
+            upload.return_value.status_code = 200
+            self.store.upload_parts(
+                "url",
+                files=[filepath],
+                part_size=300,
+                show_progress=False,
+                state_path=self.state_path,
+            )
+        # Only the remaining ranges are uploaded
+        assert sorted(c[1]["json_data"]["offset"] for c in upload.call_args_list) == [
+            600,
+            900,
+        ]
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i : i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class FakeSession:
+    def __init__(self, content, accept_ranges=True, headers=None):
+        self.content = content
+        self.accept_ranges = accept_ranges
+        self.headers = headers or {}
+        self.ranges = []
+
+    def get(self, url, params=None, headers=None, timeout=None, stream=False):
+        headers = headers or {}
+        response_headers = {"Content-Length": str(len(self.content)), **self.headers}
+        if self.accept_ranges:
+            response_headers["Accept-Ranges"] = "bytes"
+        if "Range" in headers:
+            start, end = headers["Range"][len("bytes=") :].split("-")
+            self.ranges.append((int(start), int(end)))
+            return FakeResponse(
+                self.content[int(start) : int(end) + 1],
+                status_code=206,
+                headers=response_headers,
+            )
+        return FakeResponse(self.content, headers=response_headers)
+
+
+@pytest.mark.client_mark
+class TestPolyaxonStoreDownload(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        client = MagicMock()
+        client.client.config = ClientConfig(
+            host="localhost", download_segment_size=100, download_threads=3
+        )
+        self.store = PolyaxonStore(client)
+        self.filename = os.path.join(tempfile.mkdtemp(), "file")
+        self.content = os.urandom(1050)
+
+    def test_download_in_segments(self):
+        session = FakeSession(
+            self.content,
+            headers={
+                "Content-MD5": base64.b64encode(
+                    hashlib.md5(self.content).digest()
+                ).decode()
+            },
+        )
+        filename = self.store.download(
+            "url", self.filename, session=session, show_progress=False
+        )
+        assert filename == self.filename
+        with open(filename, "rb") as f:
+            assert f.read() == self.content
+        assert sorted(session.ranges) == [
+            (i * 100, min(i * 100 + 100, 1050) - 1) for i in range(11)
+        ]
+        assert os.listdir(os.path.dirname(filename)) == ["file"]
+
+    def _write_part(self, content, validator):
+        part_path = "{}.part".format(self.filename)
+        with open(part_path, "wb") as f:
+            f.write(content)
+            f.truncate(1050)
+        with open("{}.json".format(part_path), "w") as f:
+            f.write(
+                orjson_dumps(
+                    {
+                        "length": 1050,
+                        "validator": validator,
+                        "segment_size": 100,
+                        "segments": [0, 1, 2, 3, 4],
+                    }
+                )
+            )
+
+    def test_download_resumes_segments(self):
+        self._write_part(self.content[:500], validator='"v1"')
+        session = FakeSession(self.content, headers={"ETag": '"v1"'})
+        self.store.download("url", self.filename, session=session, show_progress=False)
+        with open(self.filename, "rb") as f:
+            assert f.read() == self.content
+        assert sorted(r[0] for r in session.ranges) == [500, 600, 700, 800, 900, 1000]
+
+    def test_download_without_validator_restarts(self):
+        # A stale part can't be told apart from the current content
+        self._write_part(os.urandom(500), validator="")
+        session = FakeSession(self.content)
+        self.store.download("url", self.filename, session=session, show_progress=False)
+        with open(self.filename, "rb") as f:
+            assert f.read() == self.content
+        assert sorted(r[0] for r in session.ranges) == [i * 100 for i in range(11)]
+
+    def test_download_without_ranges(self):
+        session = FakeSession(self.content, accept_ranges=False)
+        self.store.download("url", self.filename, session=session, show_progress=False)
+        with open(self.filename, "rb") as f:
+            assert f.read() == self.content
+        assert session.ranges == []
+
+    def test_download_checks_integrity(self):
+        session = FakeSession(
+            self.content,
+            accept_ranges=False,
+            headers={"Content-MD5": base64.b64encode(b"0" * 16).decode()},
+        )
+        with self.assertRaises(PolyaxonClientException):
+            self.store.download(
+                "url", self.filename, session=session, show_progress=False
+            )
+        assert os.path.exists(self.filename) is False
+        assert os.path.exists("{}.part".format(self.filename)) is False
+
+    @staticmethod
+    def _create_tar(members):
+        fileobj = io.BytesIO()
+        with tarfile.open(fileobj=fileobj, mode="w:gz") as tar:
+            for name, content in members:
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tar.addfile(info, io.BytesIO(content))
+        return fileobj.getvalue()
+
+    def test_download_stream_untar(self):
+        content = self._create_tar([("run/a", b"a" * 1000), ("run/b/c", b"c" * 10)])
+        session = FakeSession(
+            content,
+            headers={"Content-Disposition": 'attachment; filename="run.tar.gz"'},
+        )
+        extract_path = os.path.dirname(self.filename)
+        path = self.store.download(
+            "url",
+            self.filename,
+            session=session,
+            untar=True,
+            extract_path=extract_path,
+            use_filepath=False,
+            show_progress=False,
+            stream_untar=True,
+        )
+        assert path == extract_path
+        assert sorted(os.listdir(extract_path)) == ["run"]
+        with open(os.path.join(extract_path, "run", "b", "c"), "rb") as f:
+            assert f.read() == b"c" * 10
+        # The archive is extracted from the response, no ranged requests are used
+        assert session.ranges == []
+
+    def test_download_untar_without_streaming(self):
+        content = self._create_tar([("run/a", b"a" * 1000), ("run/b/c", b"c" * 10)])
+        session = FakeSession(
+            content,
+            headers={"Content-Disposition": 'attachment; filename="run.tar.gz"'},
+        )
+        extract_path = os.path.join(os.path.dirname(self.filename), "extract")
+        with (
+            patch("polyaxon._client.store.untar_file", wraps=untar_file) as untar_mock,
+            patch.object(self.store, "stream_untar") as stream_mock,
+        ):
+            path = self.store.download(
+                "url",
+                self.filename,
+                session=session,
+                untar=True,
+                extract_path=extract_path,
+                use_filepath=False,
+                show_progress=False,
+            )
+        # The archive is downloaded in segments, then extracted and deleted
+        assert stream_mock.call_count == 0
+        assert untar_mock.call_count == 1
+        assert session.ranges != []
+        assert path == extract_path
+        assert os.path.exists(self.filename + ".tar.gz") is False
+        with open(os.path.join(extract_path, "run", "b", "c"), "rb") as f:
+            assert f.read() == b"c" * 10
+
+    def test_download_stream_untar_rejects_unsafe_members(self):
+        content = self._create_tar([("run/a", b"a"), ("../evil", b"evil")])
+        session = FakeSession(
+            content, headers={"Content-Disposition": 'attachment; filename="run.tar"'}
+        )
+        extract_path = os.path.join(os.path.dirname(self.filename), "extract")
+        with self.assertRaises(PolyaxonClientException):
+            self.store.download(
+                "url",
+                self.filename,
+                session=session,
+                untar=True,
+                extract_path=extract_path,
+                use_filepath=False,
+                show_progress=False,
+                stream_untar=True,
+            )
+        assert os.path.exists(os.path.join(extract_path, "..", "evil")) is False
+        # The members extracted before the rejected one are not kept
+        assert os.listdir(extract_path) == []
+
+    def test_stream_untar_stops_reading_after_extractor_errors(self):
+        content = self._create_tar([("../evil", b"evil")])
+        chunks = []
+
+        class StreamResponse(FakeResponse):
+            def iter_content(self, chunk_size):
+                yield content
+                for _ in range(100):
+                    chunks.append(chunk_size)
+                    yield b"0" * chunk_size
+
+        response = StreamResponse(b"")
+        extract_path = os.path.join(os.path.dirname(self.filename), "extract")
+        with self.assertRaises(PolyaxonClientException):
+            self.store.stream_untar("url", response, extract_path=extract_path)
+        assert len(chunks) < 100
+        assert response.closed is True
+        assert os.listdir(extract_path) == []
@@ -0,0 +1,200 @@
+from mock import patch
+import os
+import pytest
+import tempfile
+
+from fsspec.implementations.local import LocalFileSystem
+
+from polyaxon._fs.cache import ArtifactsCache
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+@pytest.mark.init_mark
+class TestArtifactsCache(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.remote_path = tempfile.mkdtemp()
+        self.cache_path = tempfile.mkdtemp()
+        self.fs = LocalFileSystem()
+        os.makedirs(os.path.join(self.remote_path, "dataset", "sub"))
+        for name, content in [("f1", "a"), ("sub/f2", "bb")]:
+            with open(os.path.join(self.remote_path, "dataset", name), "w") as f:
+                f.write(content)
+
+    def download(self, cache, path_to, path_from="dataset", is_file=False):
+        with patch.object(self.fs, "download", wraps=self.fs.download) as download:
+            assert cache.download(
+                fs=self.fs,
+                connection_name="store",
+                path_from=os.path.join(self.remote_path, path_from),
+                path_to=path_to,
+                is_file=is_file,
+                check_path=False,
+            )
+        return download.call_count
+
+    def test_fill_once_and_copy(self):
+        cache = ArtifactsCache(path=self.cache_path)
+        run1 = tempfile.mkdtemp()
+        run2 = tempfile.mkdtemp()
+        assert self.download(cache, run1) == 1
+        assert self.download(cache, run2) == 0
+
+        # Materialized with writable copies, the cached content is not altered
+        path = os.path.join(run1, "f1")
+        assert os.stat(path).st_nlink == 1
+        with open(path, "w") as f:
+            f.write("changed")
+        with open(os.path.join(run2, "f1")) as f:
+            assert f.read() == "a"
+        run3 = tempfile.mkdtemp()
+        assert self.download(cache, run3) == 0
+        with open(os.path.join(run3, "f1")) as f:
+            assert f.read() == "a"
+
+    def test_fill_once_and_link(self):
+        cache = ArtifactsCache(path=self.cache_path, hardlinks=True)
+        run1 = tempfile.mkdtemp()
+        run2 = tempfile.mkdtemp()
+        assert self.download(cache, run1) == 1
+        assert self.download(cache, run2) == 0
+
+        for run in [run1, run2]:
+            with open(os.path.join(run, "sub", "f2")) as f:
+                assert f.read() == "bb"
+        # Materialized with hardlinks
+        assert os.stat(os.path.join(run2, "f1")).st_nlink == 3
+
+        # A file is cached separately
+        run3 = tempfile.mkdtemp()
+        path_to = os.path.join(run3, "f1")
+        assert self.download(cache, path_to, path_from="dataset/f1", is_file=True)
+        with open(path_to) as f:
+            assert f.read() == "a"
+
+    def test_remote_changes_invalidate_the_cache(self):
+        cache = ArtifactsCache(path=self.cache_path)
+        assert self.download(cache, tempfile.mkdtemp()) == 1
+        with open(os.path.join(self.remote_path, "dataset", "f1"), "w") as f:
+            f.write("new")
+        run = tempfile.mkdtemp()
+        assert self.download(cache, run) == 1
+        with open(os.path.join(run, "f1")) as f:
+            assert f.read() == "new"
+
+    def test_evict_least_recently_used(self):
+        cache = ArtifactsCache(path=self.cache_path, max_size=5)
+        self.download(cache, tempfile.mkdtemp())
+        os.makedirs(os.path.join(self.remote_path, "other"))
+        with open(os.path.join(self.remote_path, "other", "f"), "w") as f:
+            f.write("ccc")
+        run = tempfile.mkdtemp()
+        self.download(cache, run, path_from="other")
+
+        # Only the last entry fits in the cache
+        entries = cache._get_entries()
+        assert [entry[2] for entry in entries] == [3]
+        with open(os.path.join(run, "f")) as f:
+            assert f.read() == "ccc"
+        assert self.download(cache, tempfile.mkdtemp()) == 1
+
+
+class FakeAsyncFS:
+    async_impl = True
+
+    def __init__(self, files):
+        self.files = files
+        self.ranges = []
+
+    @staticmethod
+    def _strip_protocol(path):
+        return path.replace("s3://", "")
+
+    async def _isfile(self, path):
+        return self._strip_protocol(path) in self.files
+
+    async def _info(self, path):
+        return {"size": len(self.files[self._strip_protocol(path)])}
+
+    async def _find(self, path, detail=False):
+        path = self._strip_protocol(path)
+        return {
+            k: {"type": "file", "size": len(v)}
+            for k, v in self.files.items()
+            if k.startswith(path)
+        }
+
+    async def _get_file(self, rpath, lpath):
+        with open(lpath, "wb") as f:
+            f.write(self.files[rpath])
+
+    async def _cat_file(self, path, start=None, end=None):
+        self.ranges.append((start, end))
+        return self.files[path][start:end]
+
+
+@pytest.mark.asyncio
+async def test_download_paths_concurrently_with_byte_ranges():
+    from polyaxon._fs.async_manager import download_paths
+
+    fs = FakeAsyncFS(
+        {
+            "bucket/data/small": b"abc",
+            "bucket/data/sub/large": b"0123456789",
+        }
+    )
+    path_to = tempfile.mkdtemp()
+    stats = await download_paths(
+        fs=fs,
+        path_from="s3://bucket/data",
+        path_to=path_to,
+        is_file=False,
+        check_path=True,
+        max_concurrency=2,
+        part_size=4,
+    )
+    assert stats["files"] == 2
+    assert stats["size"] == 13
+    with open(os.path.join(path_to, "small"), "rb") as f:
+        assert f.read() == b"abc"
+    with open(os.path.join(path_to, "sub", "large"), "rb") as f:
+        assert f.read() == b"0123456789"
+    assert sorted(fs.ranges) == [(0, 4), (4, 8), (8, 10)]
+
+
+@pytest.mark.init_mark
+class TestDownloadArtifact(BaseTestCase):
+    def test_local_paths_are_downloaded_concurrently(self):
+        from polyaxon._fs import async_manager
+        from polyaxon._init.artifacts import download_artifact
+
+        path_from = tempfile.mkdtemp()
+        for name in ["f1", "f2", "f3"]:
+            with open(os.path.join(path_from, name), "w") as f:
+                f.write(name)
+        path_to = tempfile.mkdtemp()
+        with (
+            patch(
+                "polyaxon._fs.async_manager.download_paths",
+                wraps=async_manager.download_paths,
+            ) as download_paths,
+            patch("polyaxon._fs.cache.ArtifactsCache.from_env") as cache_from_env,
+        ):
+            download_artifact(
+                connection_name=None,
+                connection_kind="host_path",
+                path_from=path_from,
+                path_to=path_to,
+                is_file=False,
+                raise_errors=True,
+                sync_fw=False,
+                check_path=True,
+                max_concurrency=2,
+            )
+        assert download_paths.call_args[1]["max_concurrency"] == 2
+        assert isinstance(download_paths.call_args[1]["fs"], LocalFileSystem)
+        # The shared cache is not used for local stores
+        assert cache_from_env.call_count == 0
+        assert sorted(os.listdir(path_to)) == ["f1", "f2", "f3"]
+        with open(os.path.join(path_to, "f2")) as f:
+            assert f.read() == "f2"
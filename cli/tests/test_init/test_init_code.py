@@ -1,16 +1,22 @@
 import os
 import pytest
+import subprocess
 import tempfile
 
 from polyaxon._env_vars.keys import (
+    ENV_KEYS_GIT_CACHE_PATH,
     ENV_KEYS_GIT_CREDENTIALS,
     ENV_KEYS_GIT_CREDENTIALS_STORE,
     ENV_KEYS_RUN_INSTANCE,
     ENV_KEYS_SSH_PATH,
 )
 from polyaxon._init.git import (
+    clone_and_checkout_git_repo,
     create_code_repo,
+    fetch_git_repo,
+    get_clone_options,
     get_clone_url,
+    get_git_reference,
     has_cred_access,
     has_cred_store_access,
     has_ssh_access,
@@ -106,3 +112,121 @@ class TestInitCode(BaseTestCase):
         assert get_clone_url(url=url) == "git@internal.git.foo.com:test.git"
 
         del os.environ[ENV_KEYS_SSH_PATH]
+
+    def test_get_clone_options(self):
+        options = get_clone_options(
+            ["--shallow", "--partial=blob", "--sparse-paths=src,docs", "--quiet"]
+        )
+        assert options.fetch is True
+        assert options.shallow is True
+        assert options.flags == ["--filter=blob:none", "--quiet"]
+        assert options.sparse_paths == ["src", "docs"]
+
+        options = get_clone_options(["--experimental-fetch"])
+        assert options.fetch is True
+        assert options.shallow is False
+
+        with self.assertRaises(PolyaxonContainerException):
+            get_clone_options(["--partial=foo"])
+
+
+@pytest.mark.init_mark
+class TestInitCodeClone(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.src_path = tempfile.mkdtemp()
+        for cmd in [
+            "git init -q",
+            "mkdir -p src docs",
+            "echo 1 > src/main.py",
+            "echo 2 > docs/index.md",
+            "git add -A",
+            "git -c user.email=a@b.com -c user.name=a commit -q -m first",
+            "echo 3 > src/main.py",
+            "git -c user.email=a@b.com -c user.name=a commit -q -am second",
+        ]:
+            subprocess.check_call(cmd, shell=True, cwd=self.src_path)
+        self.url = "file://{}".format(self.src_path)
+
+    def get_commits(self, repo_path):
+        return subprocess.check_output(
+            "git log --format=%H", shell=True, cwd=repo_path
+        ).split()
+
+    def test_shallow_sparse_fetch(self):
+        repo_path = os.path.join(tempfile.mkdtemp(), "repo")
+        fetch_git_repo(
+            repo_path=repo_path,
+            clone_url=self.url,
+            revision=None,
+            shallow=True,
+            sparse_paths=["src"],
+        )
+        assert len(self.get_commits(repo_path)) == 1
+        assert os.path.exists(os.path.join(repo_path, "src", "main.py"))
+        assert not os.path.exists(os.path.join(repo_path, "docs"))
+
+    def test_clone_with_mirror_cache(self):
+        cache_path = tempfile.mkdtemp()
+        os.environ[ENV_KEYS_GIT_CACHE_PATH] = cache_path
+        try:
+            reference = get_git_reference(url=self.url, clone_url=self.url)
+            assert reference.startswith(cache_path)
+            # The mirror is updated in place
+            assert get_git_reference(url=self.url, clone_url=self.url) == reference
+        finally:
+            del os.environ[ENV_KEYS_GIT_CACHE_PATH]
+
+        repo_path = os.path.join(tempfile.mkdtemp(), "repo")
+        clone_and_checkout_git_repo(
+            repo_path=repo_path,
+            clone_url=self.url,
+            revision=None,
+            sparse_paths=["docs"],
+            reference=reference,
+        )
+        assert len(self.get_commits(repo_path)) == 2
+        assert os.path.exists(os.path.join(repo_path, "docs", "index.md"))
+        assert not os.path.exists(os.path.join(repo_path, "src"))
+        # The clone is dissociated from the mirror
+        alternates = os.path.join(repo_path, ".git", "objects", "info", "alternates")
+        assert not os.path.exists(alternates)
+
+    def test_fetch_with_mirror_cache(self):
+        cache_path = tempfile.mkdtemp()
+        os.environ[ENV_KEYS_GIT_CACHE_PATH] = cache_path
+        try:
+            reference = get_git_reference(url=self.url, clone_url=self.url)
+        finally:
+            del os.environ[ENV_KEYS_GIT_CACHE_PATH]
+
+        for flags in [[], ["--filter=blob:none"]]:
+            repo_path = os.path.join(tempfile.mkdtemp(), "repo")
+            fetch_git_repo(
+                repo_path=repo_path,
+                clone_url=self.url,
+                revision=None,
+                flags=flags,
+                shallow=True,
+                sparse_paths=["src"],
+                reference=reference,
+            )
+            assert len(self.get_commits(repo_path)) == 1
+            assert os.path.exists(os.path.join(repo_path, "src", "main.py"))
+            # The repo is dissociated from the mirror
+            alternates = os.path.join(
+                repo_path, ".git", "objects", "info", "alternates"
+            )
+            assert not os.path.exists(alternates)
+            subprocess.check_call("git fsck --no-progress", shell=True, cwd=repo_path)
+
+    def test_mirror_cache_failure_is_cleaned_up(self):
+        cache_path = tempfile.mkdtemp()
+        url = "file://{}".format(os.path.join(tempfile.mkdtemp(), "missing"))
+        os.environ[ENV_KEYS_GIT_CACHE_PATH] = cache_path
+        try:
+            assert get_git_reference(url=url, clone_url=url) is None
+        finally:
+            del os.environ[ENV_KEYS_GIT_CACHE_PATH]
+        # Neither the partial mirror nor its lock are left in the cache
+        assert os.listdir(cache_path) == []
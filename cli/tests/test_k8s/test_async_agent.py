@@ -1,9 +1,14 @@
+import asyncio
 from mock import MagicMock, patch
 import pytest
 
+from polyaxon import settings
 from polyaxon._k8s.agent.async_agent import AsyncAgent
 from polyaxon._k8s.executor.async_executor import AsyncExecutor
 from polyaxon._runner.agent.client import AsyncAgentClient
+from polyaxon._sdk.schemas.v1_agent_state_response_agent_state import (
+    V1AgentStateResponseAgentState,
+)
 from polyaxon._utils.test_utils import AsyncMock, patch_settings
 
 
@@ -74,3 +79,42 @@ async def test_async_agent_aexit_closes_client_in_finally():
         await agent.__aexit__(None, None, None)
 
     agent.client.aclose.assert_called_once()
+
+
+@pytest.mark.agent_mark
+@pytest.mark.asyncio
+async def test_async_agent_process_state_concurrently():
+    patch_settings()
+    settings.AGENT_CONFIG.max_concurrency = 2
+    agent = AsyncAgent(owner="foo", agent_uuid="uuid")
+    running = {"submit": 0, "max_submit": 0}
+    calls = []
+
+    async def submit_run(run_data):
+        running["submit"] += 1
+        running["max_submit"] = max(running["max_submit"], running["submit"])
+        await asyncio.sleep(0.01)
+        running["submit"] -= 1
+        calls.append(("submit", run_data[0]))
+
+    async def stop_run(run_data):
+        calls.append(("stop", run_data[0]))
+
+    agent.submit_run = submit_run
+    agent.stop_run = stop_run
+    state = V1AgentStateResponseAgentState(
+        schedules=[("o.p.runs.1", "job", "n", "c")],
+        queued=[("o.p.runs.{}".format(i), "job", "n", "c") for i in range(1, 6)],
+        stopping=[("o.p.runs.1", "job")],
+    )
+    metrics = await agent.process_state(state)
+    # The duplicate submit is dropped
+    assert sorted(c for c in calls if c[0] == "submit") == [
+        ("submit", "o.p.runs.{}".format(i)) for i in range(1, 6)
+    ]
+    # The actions of the same run are sequential
+    assert calls.index(("stop", "o.p.runs.1")) > calls.index(("submit", "o.p.runs.1"))
+    assert running["max_submit"] == 2
+    assert metrics["submit"]["count"] == 5
+    assert metrics["stop"]["count"] == 1
+    assert agent.tick_metrics == metrics
@@ -1,3 +1,4 @@
+from mock import MagicMock
 import pytest
 
 from polyaxon._flow.run.enums import V1RunKind
@@ -62,10 +63,11 @@ async def test_start_apply_stop_get():
 @pytest.mark.asyncio
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
 async def test_list_ops_uses_current_polyaxon_crds():
+    async def iter_objects(**kwargs):
+        yield {"plural": kwargs["plural"]}
+
     class k8s_manager:
-        list_custom_objects = AsyncMock(
-            side_effect=lambda **kwargs: [{"plural": kwargs["plural"]}]
-        )
+        iter_custom_objects = MagicMock(side_effect=iter_objects)
 
     executor = AsyncExecutor()
     executor._manager = k8s_manager
@@ -81,11 +83,37 @@ async def test_list_ops_uses_current_polyaxon_crds():
     assert ops == [{"plural": resource[2]} for resource in expected_resources]
     called_resources = [
         (call[1]["group"], call[1]["version"], call[1]["plural"])
-        for call in k8s_manager.list_custom_objects.call_args_list
+        for call in k8s_manager.iter_custom_objects.call_args_list
     ]
     assert called_resources == expected_resources
     assert operation.PLURAL not in [resource[2] for resource in called_resources]
     assert all(
         call[1]["namespace"] == "runs"
-        for call in k8s_manager.list_custom_objects.call_args_list
+        for call in k8s_manager.iter_custom_objects.call_args_list
     )
+
+
+@pytest.mark.asyncio
+async def test_list_ops_in_namespaces_uses_cache_and_fan_out():
+    class k8s_manager:
+        list_in_namespaces = AsyncMock(
+            side_effect=lambda resource, namespaces, **kwargs: (
+                {n: [{"plural": kwargs["plural"]}] for n in namespaces},
+                {n: 0.1 for n in namespaces},
+            )
+        )
+
+    class informer:
+        @staticmethod
+        def list_ops(namespace):
+            return [{"cached": True}] if namespace == "ns1" else None
+
+    executor = AsyncExecutor()
+    executor._manager = k8s_manager
+    executor._ops_informer = informer
+
+    ops = await executor.list_ops_in_namespaces(["ns1", "ns2"])
+    assert ops["ns1"] == [{"cached": True}]
+    assert len(ops["ns2"]) == 4
+    for call in k8s_manager.list_in_namespaces.call_args_list:
+        assert call.kwargs["namespaces"] == ["ns2"]
@@ -33,7 +33,7 @@ class TestExecutor(BaseTestCase):
 
     def test_list_ops_uses_current_polyaxon_crds(self):
         k8s_manager = mock.MagicMock()
-        k8s_manager.list_custom_objects.side_effect = lambda **kwargs: [
+        k8s_manager.iter_custom_objects.side_effect = lambda **kwargs: [
             {"plural": kwargs["plural"]}
         ]
         self.executor._manager = k8s_manager
@@ -49,15 +49,41 @@ class TestExecutor(BaseTestCase):
         assert ops == [{"plural": resource[2]} for resource in expected_resources]
         called_resources = [
             (call[1]["group"], call[1]["version"], call[1]["plural"])
-            for call in k8s_manager.list_custom_objects.call_args_list
+            for call in k8s_manager.iter_custom_objects.call_args_list
         ]
         assert called_resources == expected_resources
         assert operation.PLURAL not in [resource[2] for resource in called_resources]
         assert all(
             call[1]["namespace"] == "runs"
-            for call in k8s_manager.list_custom_objects.call_args_list
+            for call in k8s_manager.iter_custom_objects.call_args_list
         )
 
+    def test_list_ops_in_namespaces_uses_cache(self):
+        k8s_manager = mock.MagicMock()
+        k8s_manager.list_in_namespaces.side_effect = (
+            lambda resource, namespaces, **kwargs: (
+                {n: [{"plural": kwargs["plural"]}] for n in namespaces},
+                {n: 0.1 for n in namespaces},
+            )
+        )
+        informer = mock.MagicMock()
+        informer.list_ops.side_effect = lambda namespace: (
+            [{"cached": True}] if namespace == "ns1" else None
+        )
+        self.executor._manager = k8s_manager
+        self.executor._ops_informer = informer
+
+        ops = self.executor.list_ops_in_namespaces(["ns1", "ns2"])
+        assert ops["ns1"] == [{"cached": True}]
+        assert len(ops["ns2"]) == 4
+        for call in k8s_manager.list_in_namespaces.call_args_list:
+            assert call[1]["namespaces"] == ["ns2"]
+        assert self.executor.list_ops(namespace="ns1") == [{"cached": True}]
+
+        self.executor.stop_ops_informer()
+        assert informer.close.call_count == 1
+        assert self.executor._ops_informer is None
+
     def test_start_apply_stop_get_raises_for_non_recognized_kinds(self):
         with self.assertRaises(PolyaxonAgentError):
             self.executor.create(run_uuid="", run_kind="foo", resource={})
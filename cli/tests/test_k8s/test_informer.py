@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+import time
+
+from kubernetes_asyncio.client.rest import ApiException
+
+from polyaxon._k8s.executor.informer import OpsInformer, SyncOpsInformer
+
+
+class Mixin:
+    GROUP = "core.polyaxon.com"
+    API_VERSION = "v1"
+    PLURAL = "operations"
+
+
+def get_op(name: str, version: str = "1"):
+    return {"metadata": {"name": name, "resourceVersion": version}}
+
+
+class FakeManager:
+    def __init__(self, items, streams):
+        self.items = items
+        self.streams = streams
+        self.list_calls = 0
+        self.watch_versions = []
+
+    async def list_custom_objects_with_version(self, **kwargs):
+        self.list_calls += 1
+        return self.items, "10"
+
+    async def watch_custom_objects(self, resource_version=None, **kwargs):
+        self.watch_versions.append(resource_version)
+        stream = self.streams.pop(0) if self.streams else []
+        if isinstance(stream, Exception):
+            raise stream
+        for event in stream:
+            yield event
+        if not self.streams:
+            await asyncio.sleep(10)
+
+
+class SyncFakeManager(FakeManager):
+    def list_custom_objects_with_version(self, **kwargs):
+        self.list_calls += 1
+        return self.items, "10"
+
+    def watch_custom_objects(self, resource_version=None, **kwargs):
+        self.watch_versions.append(resource_version)
+        stream = self.streams.pop(0) if self.streams else []
+        if isinstance(stream, Exception):
+            raise stream
+        for event in stream:
+            yield event
+        if not self.streams:
+            time.sleep(0.5)
+
+
+class FakeExecutor:
+    def __init__(self, manager):
+        self.manager = manager
+
+    @staticmethod
+    def _get_operation_resource_mixins():
+        return [Mixin]
+
+
+@pytest.mark.asyncio
+async def test_informer_caches_ops():
+    manager = FakeManager(
+        items=[get_op("a"), get_op("b")],
+        streams=[
+            [
+                ("ADDED", get_op("c"), "11"),
+                ("BOOKMARK", {"metadata": {}}, "12"),
+                ("DELETED", get_op("a"), "13"),
+            ],
+            ApiException(status=410),
+            [("MODIFIED", get_op("b", "2"), "14")],
+        ],
+    )
+    informer = OpsInformer(executor=FakeExecutor(manager), namespaces=["ns"])
+    assert informer.list_ops("ns") is None
+    informer.start()
+    await asyncio.sleep(0.05)
+    ops = informer.list_ops("ns")
+    assert sorted(op["metadata"]["name"] for op in ops) == ["a", "b"]
+    # Listed again after the watch expired
+    assert manager.list_calls == 2
+    assert manager.watch_versions == ["10", "13", "10"]
+    assert [
+        op["metadata"]["resourceVersion"] for op in ops if op["metadata"]["name"] == "b"
+    ] == ["2"]
+    await informer.close()
+    assert informer.list_ops("ns") is None
+
+
+def test_sync_informer_caches_ops():
+    manager = SyncFakeManager(
+        items=[get_op("a"), get_op("b")],
+        streams=[
+            [
+                ("ADDED", get_op("c"), "11"),
+                ("BOOKMARK", {"metadata": {}}, "12"),
+                ("DELETED", get_op("a"), "13"),
+            ],
+            ApiException(status=410),
+            [("MODIFIED", get_op("b", "2"), "14")],
+        ],
+    )
+    informer = SyncOpsInformer(executor=FakeExecutor(manager), namespaces=["ns"])
+    assert informer.list_ops("ns") is None
+    informer.start()
+    time.sleep(0.2)
+    ops = informer.list_ops("ns")
+    assert sorted(op["metadata"]["name"] for op in ops) == ["a", "b"]
+    # Listed again after the watch expired
+    assert manager.list_calls == 2
+    assert manager.watch_versions == ["10", "13", "10"]
+    assert [
+        op["metadata"]["resourceVersion"] for op in ops if op["metadata"]["name"] == "b"
+    ] == ["2"]
+    informer.close()
+    assert informer.list_ops("ns") is None
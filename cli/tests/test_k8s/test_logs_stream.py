@@ -0,0 +1,148 @@
+import asyncio
+import pytest
+
+from kubernetes_asyncio import client
+
+from polyaxon._k8s.logging.async_monitor import (
+    LogsCursor,
+    handle_pod_logs,
+    read_container_logs,
+    stream_container_logs,
+)
+
+
+LINES = [
+    b"2024-01-01T10:00:00.000000Z line 1",
+    b"2024-01-01T10:00:01.000000Z line 2",
+    b"2024-01-01T10:00:01.000000Z line 3",
+    b"2024-01-01T10:00:02.000000Z line 4",
+]
+
+
+class FakeContent:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.content), size):
+            yield self.content[i : i + size]
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.content = FakeContent(content)
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+class FakeApi:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    async def read_namespaced_pod_log(self, name, namespace, **kwargs):
+        self.calls.append(kwargs)
+        content = b"\n".join(self.responses.pop(0)) + b"\n"
+        if kwargs.get("follow"):
+            self.response = FakeResponse(content)
+            return self.response
+        return content.decode()
+
+
+class FakeK8sManager:
+    namespace = "ns"
+
+    def __init__(self, responses):
+        self.k8s_api = FakeApi(responses)
+
+
+def get_pod():
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name="pod"),
+        spec=client.V1PodSpec(node_name="node", containers=[]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_container_logs_resumes_from_cursor():
+    manager = FakeK8sManager(responses=[LINES[:3], LINES])
+    cursor = LogsCursor()
+    logs = [
+        log
+        async for log in stream_container_logs(
+            k8s_manager=manager,
+            pod=get_pod(),
+            container_name="main",
+            cursor=cursor,
+            chunk_size=7,
+        )
+    ]
+    assert [log.value for log in logs] == ["line 1", "line 2", "line 3"]
+    assert manager.k8s_api.calls[0]["follow"] is True
+    assert "since_seconds" not in manager.k8s_api.calls[0]
+    assert manager.k8s_api.response.released is True
+    assert cursor.count == 2
+
+    # Lines sharing the last timestamp are not lost or duplicated
+    logs = [
+        log
+        async for log in stream_container_logs(
+            k8s_manager=manager, pod=get_pod(), container_name="main", cursor=cursor
+        )
+    ]
+    assert [log.value for log in logs] == ["line 4"]
+    assert manager.k8s_api.calls[1]["since_seconds"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_read_container_logs_with_cursor():
+    manager = FakeK8sManager(responses=[LINES[:2], LINES])
+    cursor = LogsCursor()
+    logs = await read_container_logs(
+        k8s_manager=manager, pod=get_pod(), container_name="main", cursor=cursor
+    )
+    assert [log.value for log in logs] == ["line 1", "line 2"]
+    logs = await read_container_logs(
+        k8s_manager=manager, pod=get_pod(), container_name="main", cursor=cursor
+    )
+    assert [log.value for log in logs] == ["line 3", "line 4"]
+
+
+class FakeContainersApi:
+    def __init__(self, logs):
+        self.logs = logs
+        self.running = 0
+        self.max_running = 0
+
+    async def read_namespaced_pod_log(self, name, namespace, container, **kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return "\n".join(self.logs[container])
+
+
+@pytest.mark.asyncio
+async def test_handle_pod_logs_merges_containers():
+    manager = FakeK8sManager(responses=[])
+    manager.k8s_api = FakeContainersApi(
+        logs={
+            "init": ["2024-01-01T10:00:00.000000Z init"],
+            "main": [
+                "2024-01-01T10:00:01.000000Z main 1",
+                "2024-01-01T10:00:03.000000Z main 2",
+            ],
+            "sidecar": ["2024-01-01T10:00:02.000000Z sidecar"],
+        }
+    )
+    pod = get_pod()
+    pod.spec.init_containers = [client.V1Container(name="init")]
+    pod.spec.containers = [
+        client.V1Container(name="main"),
+        client.V1Container(name="sidecar"),
+    ]
+    logs = await handle_pod_logs(k8s_manager=manager, pod=pod, max_concurrency=2)
+    assert [log.value for log in logs] == ["init", "main 1", "sidecar", "main 2"]
+    assert manager.k8s_api.max_running == 2
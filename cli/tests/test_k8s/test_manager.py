@@ -0,0 +1,297 @@
+import asyncio
+import pytest
+import time
+
+from kubernetes.client import Configuration
+from kubernetes.client.rest import ApiException
+from kubernetes_asyncio.client.rest import ApiException as AsyncApiException
+
+from polyaxon._k8s.manager.async_manager import AsyncK8sManager
+from polyaxon._k8s.manager.base import BaseK8sManager
+from polyaxon._k8s.manager.manager import K8sManager
+from polyaxon.exceptions import PolyaxonK8sError
+
+
+PODS = {
+    "ns1": ["pod1", "pod2", "pod3"],
+    "ns2": ["pod4"],
+}
+
+
+class FakeApi:
+    def __init__(self):
+        self.calls = []
+        self.deleted = []
+
+    def _list(self, namespace, limit=None, _continue=None, label_selector=None):
+        self.calls.append((namespace, limit, _continue, label_selector))
+        time.sleep(0.05)
+        items = PODS[namespace]
+        start = int(_continue or 0)
+        end = start + limit if limit else len(items)
+        next_page = str(end) if end < len(items) else None
+        return {"items": items[start:end], "metadata": {"continue": next_page}}
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        return self._list(namespace, **kwargs)
+
+    def list_namespaced_custom_object(
+        self, group, version, plural, namespace, **kwargs
+    ):
+        return self._list(namespace, **kwargs)
+
+    def delete_collection_namespaced_pod(self, namespace, **kwargs):
+        self.deleted.append((namespace, kwargs.get("label_selector")))
+
+
+class AsyncFakeApi(FakeApi):
+    async def list_namespaced_pod(self, namespace, **kwargs):
+        await asyncio.sleep(0.05)
+        return self._list(namespace, **kwargs)
+
+    async def delete_collection_namespaced_pod(self, namespace, **kwargs):
+        self.deleted.append((namespace, kwargs.get("label_selector")))
+
+    async def list_namespaced_custom_object(
+        self, group, version, plural, namespace, **kwargs
+    ):
+        return self._list(namespace, **kwargs)
+
+
+def test_get_label_selectors():
+    assert BaseK8sManager.get_label_selectors(
+        "app.kubernetes.io/instance",
+        ["a", "b", "c"],
+        label_selector="app.kubernetes.io/managed-by=polyaxon",
+        batch_size=2,
+    ) == [
+        "app.kubernetes.io/managed-by=polyaxon,app.kubernetes.io/instance in (a,b)",
+        "app.kubernetes.io/managed-by=polyaxon,app.kubernetes.io/instance in (c)",
+    ]
+
+
+def test_list_in_namespaces_paginates_concurrently():
+    manager = K8sManager(k8s_config=Configuration())
+    manager._k8s_api = FakeApi()
+
+    results, timings = manager.list_in_namespaces(
+        "pods", namespaces=["ns1", "ns2"], limit=2
+    )
+    assert results == {"ns1": ["pod1", "pod2", "pod3"], "ns2": ["pod4"]}
+    assert set(timings.keys()) == {"ns1", "ns2"}
+    assert all(t > 0 for t in timings.values())
+    assert ("ns1", 2, "2", None) in manager.k8s_api.calls
+    assert len(manager.k8s_api.calls) == 3
+
+    timings = manager.delete_in_namespaces(
+        "pods", namespaces=["ns1", "ns2"], label_selectors=["a in (1)", "a in (2)"]
+    )
+    assert set(timings.keys()) == {"ns1", "ns2"}
+    assert sorted(manager.k8s_api.deleted) == [
+        ("ns1", "a in (1)"),
+        ("ns1", "a in (2)"),
+        ("ns2", "a in (1)"),
+        ("ns2", "a in (2)"),
+    ]
+
+    with pytest.raises(PolyaxonK8sError):
+        manager.list_in_namespaces("foo", namespaces=["ns1"])
+
+
+@pytest.mark.asyncio
+async def test_async_list_in_namespaces_paginates_concurrently():
+    manager = AsyncK8sManager()
+    manager._k8s_api = AsyncFakeApi()
+
+    results, timings = await manager.list_in_namespaces(
+        "pods", namespaces=["ns1", "ns2"], label_selectors=["a in (1)"], limit=2
+    )
+    assert results == {"ns1": ["pod1", "pod2", "pod3"], "ns2": ["pod4"]}
+    assert set(timings.keys()) == {"ns1", "ns2"}
+    assert ("ns1", 2, "2", "a in (1)") in manager.k8s_api.calls
+
+    timings = await manager.delete_in_namespaces("pods", namespaces=["ns1", "ns2"])
+    assert sorted(manager.k8s_api.deleted) == [("ns1", None), ("ns2", None)]
+
+
+def test_iter_custom_objects_streams_pages():
+    manager = K8sManager(k8s_config=Configuration())
+    manager._k8s_custom_object_api = FakeApi()
+
+    items = manager.iter_custom_objects(
+        group="core.polyaxon.com", version="v1", plural="operations", namespace="ns1"
+    )
+    assert next(items) == "pod1"
+    assert len(manager.k8s_custom_object_api.calls) == 1
+    assert list(items) == ["pod2", "pod3"]
+    assert manager.k8s_custom_object_api.calls == [
+        ("ns1", K8sManager.LIST_PAGE_SIZE, None, None)
+    ]
+
+    items = manager.iter_custom_objects(
+        group="core.polyaxon.com",
+        version="v1",
+        plural="operations",
+        namespace="ns1",
+        limit=1,
+    )
+    assert list(items) == ["pod1", "pod2", "pod3"]
+    assert len(manager.k8s_custom_object_api.calls) == 4
+
+    results, _ = manager.list_in_namespaces(
+        "custom_objects",
+        namespaces=["ns1", "ns2"],
+        transform=lambda item, namespace: (namespace, item),
+        group="core.polyaxon.com",
+        version="v1",
+        plural="operations",
+        limit=2,
+    )
+    assert results == {
+        "ns1": [("ns1", "pod1"), ("ns1", "pod2"), ("ns1", "pod3")],
+        "ns2": [("ns2", "pod4")],
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_iter_custom_objects_streams_pages():
+    manager = AsyncK8sManager()
+    manager._k8s_custom_object_api = AsyncFakeApi()
+
+    items = manager.iter_custom_objects(
+        group="core.polyaxon.com",
+        version="v1",
+        plural="operations",
+        namespace="ns1",
+        limit=2,
+    )
+    assert [item async for item in items] == ["pod1", "pod2", "pod3"]
+    assert [c[2] for c in manager.k8s_custom_object_api.calls] == [None, "2"]
+
+    results, _ = await manager.list_in_namespaces(
+        "custom_objects",
+        namespaces=["ns1", "ns2"],
+        transform=lambda item, namespace: (namespace, item),
+        group="core.polyaxon.com",
+        version="v1",
+        plural="operations",
+    )
+    assert results == {
+        "ns1": [("ns1", "pod1"), ("ns1", "pod2"), ("ns1", "pod3")],
+        "ns2": [("ns2", "pod4")],
+    }
+
+
+class FailingPageApi:
+    """Lists 3 custom objects, 2 per page, the second page fails once."""
+
+    EXCEPTION = ApiException
+
+    def __init__(self, status):
+        self.status = status
+        self.calls = []
+
+    def _list(self, namespace, limit=None, _continue=None, **kwargs):
+        self.calls.append(_continue)
+        if _continue and len(self.calls) == 2:
+            raise self.EXCEPTION(status=self.status)
+        items = [{"metadata": {"uid": uid}} for uid in ["1", "2", "3"]]
+        start = int(_continue or 0)
+        end = start + limit
+        next_page = str(end) if end < len(items) else None
+        return {
+            "items": items[start:end],
+            "metadata": {"continue": next_page, "resourceVersion": "7"},
+        }
+
+    def list_namespaced_custom_object(
+        self, group, version, plural, namespace, **kwargs
+    ):
+        return self._list(namespace, **kwargs)
+
+
+class AsyncFailingPageApi(FailingPageApi):
+    EXCEPTION = AsyncApiException
+
+    async def list_namespaced_custom_object(
+        self, group, version, plural, namespace, **kwargs
+    ):
+        return self._list(namespace, **kwargs)
+
+
+def get_uids(items):
+    return [item["metadata"]["uid"] for item in items]
+
+
+def test_iter_custom_objects_restarts_expired_listings():
+    manager = K8sManager(k8s_config=Configuration())
+    manager._k8s_custom_object_api = FailingPageApi(status=410)
+    kwargs = dict(group="g", version="v1", plural="p", limit=2)
+
+    # The listing restarts without the expired token and skips the yielded items
+    assert get_uids(manager.iter_custom_objects(namespace="ns1", **kwargs)) == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert manager.k8s_custom_object_api.calls == [None, "2", None, "2"]
+
+    # Other errors are raised instead of returning a partial listing
+    manager._k8s_custom_object_api = FailingPageApi(status=500)
+    items = manager.iter_custom_objects(namespace="ns1", **kwargs)
+    assert get_uids([next(items), next(items)]) == ["1", "2"]
+    with pytest.raises(ApiException):
+        next(items)
+    manager._k8s_custom_object_api = FailingPageApi(status=500)
+    with pytest.raises(ApiException):
+        manager.list_in_namespaces(
+            "custom_objects", namespaces=["ns1"], transform=lambda i, n: i, **kwargs
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_iter_custom_objects_restarts_expired_listings():
+    manager = AsyncK8sManager()
+    manager._k8s_custom_object_api = AsyncFailingPageApi(status=410)
+    kwargs = dict(group="g", version="v1", plural="p", limit=2)
+
+    items = manager.iter_custom_objects(namespace="ns1", **kwargs)
+    assert get_uids([item async for item in items]) == ["1", "2", "3"]
+
+    manager._k8s_custom_object_api = AsyncFailingPageApi(status=500)
+    with pytest.raises(AsyncApiException):
+        await manager.list_in_namespaces(
+            "custom_objects", namespaces=["ns1"], transform=lambda i, n: i, **kwargs
+        )
+
+
+def test_list_custom_objects_with_version_paginates():
+    manager = K8sManager(k8s_config=Configuration())
+    manager._k8s_custom_object_api = FailingPageApi(status=410)
+    kwargs = dict(group="g", version="v1", plural="p", namespace="ns1", limit=2)
+
+    # The listing restarts from the first page if the token expires
+    items, resource_version = manager.list_custom_objects_with_version(**kwargs)
+    assert get_uids(items) == ["1", "2", "3"]
+    assert resource_version == "7"
+    assert manager.k8s_custom_object_api.calls == [None, "2", None, "2"]
+
+    manager._k8s_custom_object_api = FailingPageApi(status=500)
+    with pytest.raises(ApiException):
+        manager.list_custom_objects_with_version(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_list_custom_objects_with_version_paginates():
+    manager = AsyncK8sManager()
+    manager._k8s_custom_object_api = AsyncFailingPageApi(status=410)
+    kwargs = dict(group="g", version="v1", plural="p", namespace="ns1", limit=2)
+
+    items, resource_version = await manager.list_custom_objects_with_version(**kwargs)
+    assert get_uids(items) == ["1", "2", "3"]
+    assert resource_version == "7"
+    assert manager.k8s_custom_object_api.calls == [None, "2", None, "2"]
+
+    manager._k8s_custom_object_api = AsyncFailingPageApi(status=500)
+    with pytest.raises(AsyncApiException):
+        await manager.list_custom_objects_with_version(**kwargs)
@@ -129,3 +129,80 @@ def test_agent_client_allows_loose_mocks_without_mode_attribute():
 
     assert client.client is not None
     assert client.internal_client is not None
+
+
+def test_agent_client_get_state_long_poll():
+    public_client = ClientMock(is_async=False)
+    client = AgentClient(owner="foo", agent_uuid="uuid", client=public_client)
+
+    client.get_state()
+    public_client.agents_v1.get_agent_state.assert_called_once_with(
+        owner="foo", uuid="uuid"
+    )
+
+    client.get_state(wait=20)
+    public_client.agents_v1.get_agent_state.assert_called_with(
+        owner="foo",
+        uuid="uuid",
+        _headers={AgentClient.LONG_POLL_HEADER: "20"},
+        _request_timeout=20 + AgentClient.LONG_POLL_TIMEOUT_MARGIN,
+    )
+
+
+@patch("polyaxon._runner.agent.client.time.sleep")
+def test_agent_client_buffers_runs_statuses(_):
+    public_client = ClientMock(is_async=False)
+    sent = []
+
+    def create_run_status(owner, project, uuid, body):
+        if uuid == "run2" and not any(s[0] == "run2" for s in sent):
+            sent.append((uuid, "error"))
+            raise ConnectionError()
+        sent.append((uuid, body["condition"].type))
+
+    public_client.runs_v1.create_run_status.side_effect = create_run_status
+    client = AgentClient(
+        owner="foo", agent_uuid="uuid", client=public_client, buffer_statuses=True
+    )
+    assert client.log_run_scheduled("foo", "bar", "run1") is None
+    client.log_run_running("foo", "bar", "run1")
+    client.log_run_failed("foo", "bar", "run2", exc=ValueError())
+    assert sent == []
+
+    client.flush_statuses()
+    # Statuses are sent in order per run, and failed requests are retried
+    assert [s for s in sent if s[0] == "run1"] == [
+        ("run1", "scheduled"),
+        ("run1", "running"),
+    ]
+    assert [s for s in sent if s[0] == "run2"] == [
+        ("run2", "error"),
+        ("run2", "failed"),
+    ]
+
+    client.flush_statuses()
+    assert len(sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_agent_client_buffers_runs_statuses():
+    public_client = ClientMock(is_async=True)
+    sent = []
+
+    async def create_run_status(owner, project, uuid, body):
+        sent.append((uuid, body["condition"].type))
+
+    public_client.runs_v1.create_run_status = create_run_status
+    client = AsyncAgentClient(
+        owner="foo", agent_uuid="uuid", client=public_client, buffer_statuses=True
+    )
+    assert await client.log_run_scheduled("foo", "bar", "run1") is None
+    await client.log_run_stopped("foo", "bar", "run1")
+    assert sent == []
+
+    await client.flush_statuses()
+    assert sent == [("run1", "scheduled"), ("run1", "stopped")]
+
+    client.buffer_statuses = False
+    await client.log_run_running("foo", "bar", "run2")
+    assert sent[-1] == ("run2", "running")
@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from mock import MagicMock, patch
 import pytest
+import time
+
+from kubernetes.client.rest import ApiException
 
 from polyaxon._constants.globals import DEFAULT
 from polyaxon._runner.agent.client import AgentClient, AsyncAgentClient
 from polyaxon._runner.agent.sync_agent import BaseSyncAgent
+from polyaxon._sdk.schemas import V1AgentStateResponse, V1AgentStateResponseAgentState
 from polyaxon._utils.test_utils import BaseTestCase
 
 
@@ -163,3 +168,50 @@ class TestBaseSyncAgent(BaseTestCase):
             agent.__exit__(None, None, None)
 
         agent.client.close.assert_called_once()
+
+    def test_sync_agent_process_does_not_wait_for_runs(self):
+        agent = DummyAgent(owner="foo", agent_uuid="uuid")
+        pending_statuses = []
+
+        def get_state(**kwargs):
+            pending_statuses.append(list(agent.client._statuses))
+            return V1AgentStateResponse(
+                state=V1AgentStateResponseAgentState(
+                    stopping=[("foo.bar.runs.run1", "job", "ns")]
+                )
+            )
+
+        agent.client.get_state = MagicMock(side_effect=get_state)
+        agent.client._send_run_statuses = MagicMock()
+
+        def stop(**kwargs):
+            time.sleep(0.3)
+            raise ApiException(status=404)
+
+        agent.executor.stop.side_effect = stop
+        with ThreadPoolExecutor(2) as pool:
+            started_at = time.monotonic()
+            agent.process(pool)
+            # The tick does not wait for the slow run
+            assert time.monotonic() - started_at < 0.3
+            # The run is still handled, it's not submitted again
+            agent.process(pool)
+            assert agent.executor.stop.call_count == 1
+            time.sleep(0.5)
+            assert list(agent.client._statuses) == [("foo", "bar", "run1")]
+            assert agent._runs_in_flight == {}
+            # The statuses of the done runs are sent before the next state
+            agent.process(pool)
+        assert agent.client._send_run_statuses.call_count == 1
+        assert pending_statuses[-1] == []
+        assert agent.executor.stop.call_count == 2
+
+    @patch("polyaxon._runner.agent.sync_agent.BaseSyncAgent.collect_agent_data")
+    def test_sync_agent_reconcile_skips_failed_listings(self, _):
+        agent = DummyAgent(owner="foo", agent_uuid="uuid")
+        agent.client = MagicMock()
+        agent.executor.list_ops_in_namespaces.side_effect = ApiException(status=500)
+
+        assert agent.reconcile() is None
+        assert agent.client.reconcile_agent.call_count == 0
+        assert agent._reconcile_state.ops is None
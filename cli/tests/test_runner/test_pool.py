@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import pytest
+
+from polyaxon import settings
+from polyaxon._runner.pool import (
+    arun_in_pool,
+    close_conversion_pool,
+    get_conversion_pool,
+    run_in_pool,
+)
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+def get_pid(offset: int = 0) -> int:
+    return os.getpid() + offset
+
+
+@pytest.mark.agent_mark
+class TestConversionPool(BaseTestCase):
+    SET_AGENT_SETTINGS = True
+
+    def tearDown(self):
+        close_conversion_pool()
+        super().tearDown()
+
+    def test_no_pool_by_default(self):
+        assert get_conversion_pool() is None
+        assert run_in_pool(None, get_pid, offset=1) == os.getpid() + 1
+
+    def test_thread_pool(self):
+        settings.AGENT_CONFIG.conversion_pool = "thread"
+        settings.AGENT_CONFIG.conversion_workers = 2
+        pool = get_conversion_pool()
+        assert isinstance(pool, ThreadPoolExecutor)
+        assert get_conversion_pool() is pool
+        # Threads do not help the sync agent
+        assert get_conversion_pool(process_only=True) is None
+        assert run_in_pool(pool, get_pid) == os.getpid()
+
+    def test_process_pool(self):
+        settings.AGENT_CONFIG.conversion_pool = "process"
+        settings.AGENT_CONFIG.conversion_workers = 1
+        pool = get_conversion_pool(process_only=True)
+        assert isinstance(pool, ProcessPoolExecutor)
+        assert run_in_pool(pool, get_pid) != os.getpid()
+        close_conversion_pool()
+        assert get_conversion_pool() is not pool
+
+
+@pytest.mark.agent_mark
+@pytest.mark.asyncio
+async def test_arun_in_pool():
+    assert await arun_in_pool(None, get_pid, offset=1) == os.getpid() + 1
+    pool = ThreadPoolExecutor(max_workers=1)
+    assert await arun_in_pool(pool, get_pid) == os.getpid()
+    pool.shutdown()
@@ -0,0 +1,74 @@
+import pytest
+
+from polyaxon._runner.agent.reconcile import ReconcileState, get_op_reconcile_data
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+def get_op(run_uuid: str, name: str = "name"):
+    return {
+        "metadata": {
+            "annotations": {
+                "operation.polyaxon.com/owner": "owner",
+                "operation.polyaxon.com/project": "project",
+                "operation.polyaxon.com/kind": "job",
+                "operation.polyaxon.com/name": name,
+            },
+            "labels": {"app.kubernetes.io/instance": run_uuid},
+        }
+    }
+
+
+@pytest.mark.agent_mark
+class TestReconcileState(BaseTestCase):
+    def test_get_op_reconcile_data(self):
+        assert get_op_reconcile_data(get_op("uuid"), "ns") == (
+            "owner.project.runs.uuid",
+            "job",
+            "name",
+            "ns",
+        )
+
+    def test_get_reconcile_full(self):
+        state = ReconcileState()
+        op1 = get_op_reconcile_data(get_op("uuid1"), "ns")
+        op2 = get_op_reconcile_data(get_op("uuid2"), "ns")
+
+        assert state.get_reconcile([]) is None
+        # The complete list is sent on every reconcile
+        for ops in [[op1, op2], [op1, op2], [op2]]:
+            reconcile = state.get_reconcile(ops)
+            assert reconcile == {"ops": ops}
+            state.acknowledge(ops, reconcile)
+
+    def test_get_reconcile_partial(self):
+        state = ReconcileState(partial=True)
+        op1 = get_op_reconcile_data(get_op("uuid1"), "ns")
+        op2 = get_op_reconcile_data(get_op("uuid2"), "ns")
+        op3 = get_op_reconcile_data(get_op("uuid3"), "ns")
+
+        # Nothing to send
+        assert state.get_reconcile([]) is None
+        state.acknowledge([], None)
+
+        # The first reconcile is complete
+        reconcile = state.get_reconcile([op1, op2])
+        assert reconcile == {"ops": [op1, op2]}
+        state.acknowledge([op1, op2], reconcile)
+
+        # No changes
+        assert state.get_reconcile([op1, op2]) is None
+
+        # Only the changes are sent
+        op2_renamed = get_op_reconcile_data(get_op("uuid2", name="new"), "ns")
+        reconcile = state.get_reconcile([op2_renamed, op3])
+        assert reconcile == {
+            "ops": [op2_renamed, op3],
+            "removed": [op1],
+            "partial": True,
+        }
+        state.acknowledge([op2_renamed, op3], reconcile)
+        assert state.get_reconcile([op2_renamed, op3]) is None
+
+        # Full reconcile after the interval
+        state.full_interval = -1
+        assert state.get_reconcile([op2_renamed, op3]) == {"ops": [op2_renamed, op3]}
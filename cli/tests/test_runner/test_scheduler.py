@@ -0,0 +1,54 @@
+import pytest
+
+from clipped.utils.workers import get_wait
+from polyaxon._runner.agent.scheduler import PollingScheduler, get_state_size
+from polyaxon._sdk.schemas.v1_agent_state_response import V1AgentStateResponse
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+@pytest.mark.agent_mark
+class TestPollingScheduler(BaseTestCase):
+    def get_state(self, full: bool = False, long_poll=None, **queues):
+        return V1AgentStateResponse.from_dict(
+            {"state": {"full": full, **queues}, "long_poll": long_poll}
+        )
+
+    def test_get_state_size(self):
+        assert get_state_size(None) == 0
+        assert get_state_size(self.get_state()) == 0
+        assert get_state_size(self.get_state(queued=[["a"]], checks=[["b"]])) == 2
+
+    def test_backs_off_when_idle(self):
+        scheduler = PollingScheduler(max_interval=4)
+        waits = [scheduler.update(self.get_state()) for _ in range(5)]
+        assert waits == [get_wait(i, max_interval=4) for i in [1, 2, 3, 3, 3]]
+
+        # Work resets the interval
+        assert scheduler.update(self.get_state(queued=[["a"]])) == get_wait(0)
+        assert scheduler.update(None) == get_wait(3, max_interval=4)
+
+    def test_full_agent_keeps_a_minimum_interval(self):
+        scheduler = PollingScheduler(max_interval=4)
+        assert scheduler.update(self.get_state(queued=[["a"]])) == get_wait(0)
+        waits = [
+            scheduler.update(self.get_state(full=True, queued=[["a"]])),
+            scheduler.update(self.get_state(full=True)),
+            scheduler.update(self.get_state(full=True)),
+        ]
+        assert waits == [get_wait(i, max_interval=4) for i in [2, 3, 3]]
+        assert scheduler.update(self.get_state(queued=[["a"]])) == get_wait(0)
+
+    def test_long_poll(self):
+        scheduler = PollingScheduler(max_interval=4)
+        assert scheduler.update(self.get_state(queued=[["a"]], long_poll=30)) == (
+            get_wait(0)
+        )
+        # No waiting on the server while work is arriving
+        assert scheduler.get_wait_for_changes() is None
+
+        assert scheduler.update(self.get_state(long_poll=30)) == get_wait(0)
+        assert scheduler.get_wait_for_changes() == 30
+
+        # Not advertised anymore
+        assert scheduler.update(self.get_state()) == get_wait(2, max_interval=4)
+        assert scheduler.get_wait_for_changes() is None
@@ -0,0 +1,127 @@
+import os
+import pytest
+import tempfile
+import time
+
+from polyaxon._fs.notify import PathsMonitor
+from polyaxon._fs.watcher import FSWatcher
+from polyaxon._utils.test_utils import BaseTestCase
+
+
+def write_file(path: str, content: str = "content"):
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.mark.sidecar_mark
+class TestFSWatcher(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.base_path = tempfile.mkdtemp()
+        self.path = os.path.join(self.base_path, "uuid")
+        os.makedirs(os.path.join(self.path, "outputs"))
+        write_file(os.path.join(self.path, "outputs", "a"))
+        write_file(os.path.join(self.path, "b"))
+
+    def test_sync_changes(self):
+        fw = FSWatcher()
+        fw.init()
+        fw.sync(self.path)
+        assert fw.get_files_to_put() == {
+            (self.base_path, "uuid/outputs/a"),
+            (self.base_path, "uuid/b"),
+        }
+
+        fw.init_changes()
+        assert fw.get_files_to_put() == set()
+        assert fw.has_changes() is False
+
+        time.sleep(0.01)
+        write_file(os.path.join(self.path, "b"), "new")
+        os.makedirs(os.path.join(self.path, "new", "sub"))
+        write_file(os.path.join(self.path, "new", "sub", "c"))
+        os.remove(os.path.join(self.path, "outputs", "a"))
+        fw.sync_changes(
+            self.path,
+            {
+                os.path.join(self.path, "b"),
+                os.path.join(self.path, "new"),
+                os.path.join(self.path, "outputs", "a"),
+            },
+        )
+        assert fw.has_changes() is True
+        assert fw.get_files_to_put() == {
+            (self.base_path, "uuid/b"),
+            (self.base_path, "uuid/new/sub/c"),
+        }
+        assert fw.get_files_to_rm() == {(self.base_path, "uuid/outputs/a")}
+        assert fw.get_dirs_to_put() == {
+            (self.base_path, "uuid/new"),
+            (self.base_path, "uuid/new/sub"),
+        }
+
+    def test_sync_changes_removed_dir(self):
+        fw = FSWatcher()
+        fw.init()
+        fw.sync(self.path)
+        fw.init_changes()
+        os.remove(os.path.join(self.path, "outputs", "a"))
+        os.rmdir(os.path.join(self.path, "outputs"))
+        fw.sync_changes(self.path, {os.path.join(self.path, "outputs")})
+        assert fw.get_files_to_rm() == {(self.base_path, "uuid/outputs/a")}
+        assert fw.get_dirs_to_rm() == {(self.base_path, "uuid/outputs")}
+        assert fw.get_files_to_put() == set()
+
+    def test_resync_removes_missing_paths(self):
+        fw = FSWatcher()
+        fw.init()
+        fw.sync(self.path)
+        fw.init_changes()
+        os.remove(os.path.join(self.path, "b"))
+        fw.resync(self.path)
+        assert fw.get_files_to_rm() == {(self.base_path, "uuid/b")}
+        assert fw.get_files_to_put() == set()
+
+
+@pytest.mark.sidecar_mark
+class TestPathsMonitor(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = tempfile.mkdtemp()
+        self.monitor = PathsMonitor(exclude=["ignored"])
+        if not self.monitor.is_enabled:
+            pytest.skip("inotify is not available")
+
+    def tearDown(self):
+        self.monitor.close()
+        super().tearDown()
+
+    def test_get_changes(self):
+        # Unknown paths require a full scan
+        assert self.monitor.get_changes(self.path) is None
+        self.monitor.watch(self.path)
+        assert self.monitor.get_changes(self.path) is None
+        assert self.monitor.get_changes(self.path) == set()
+
+        write_file(os.path.join(self.path, "a"))
+        os.makedirs(os.path.join(self.path, "sub"))
+        os.makedirs(os.path.join(self.path, "ignored"))
+        assert self.monitor.get_changes(self.path) == {
+            os.path.join(self.path, "a"),
+            os.path.join(self.path, "sub"),
+        }
+
+        # New directories are watched
+        write_file(os.path.join(self.path, "sub", "b"))
+        write_file(os.path.join(self.path, "ignored", "c"))
+        os.remove(os.path.join(self.path, "a"))
+        assert self.monitor.get_changes(self.path) == {
+            os.path.join(self.path, "a"),
+            os.path.join(self.path, "sub", "b"),
+        }
+
+    def test_closed_monitor_requires_full_scans(self):
+        self.monitor.watch(self.path)
+        self.monitor.close()
+        assert self.monitor.is_enabled is False
+        assert self.monitor.get_changes(self.path) is None
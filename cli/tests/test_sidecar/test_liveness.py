@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+
+from kubernetes_asyncio import client
+from kubernetes_asyncio.client.rest import ApiException
+
+from polyaxon._sidecar.container.liveness import PodLiveness
+
+
+def get_pod(phase: str, terminated: bool = False) -> client.V1Pod:
+    state = client.V1ContainerState(
+        terminated=client.V1ContainerStateTerminated(exit_code=0)
+        if terminated
+        else None
+    )
+    return client.V1Pod(
+        status=client.V1PodStatus(
+            phase=phase,
+            container_statuses=[
+                client.V1ContainerStatus(
+                    name="main",
+                    state=state,
+                    image="image",
+                    image_id="image",
+                    ready=not terminated,
+                    restart_count=0,
+                )
+            ],
+        )
+    )
+
+
+class FakeK8sManager:
+    def __init__(self, streams):
+        self.streams = streams
+        self.resource_versions = []
+        self.status_calls = 0
+
+    async def watch_pod(self, name, resource_version=None, timeout_seconds=None):
+        self.resource_versions.append(resource_version)
+        stream = self.streams.pop(0) if self.streams else []
+        if isinstance(stream, Exception):
+            raise stream
+        for event in stream:
+            yield event
+        if not self.streams:
+            # Keep the watch open
+            await asyncio.sleep(10)
+
+    async def is_pod_running(self, pod_id, container_id):
+        self.status_calls += 1
+        return True
+
+
+@pytest.mark.sidecar_mark
+@pytest.mark.asyncio
+async def test_liveness_detects_termination_and_resumes():
+    manager = FakeK8sManager(
+        streams=[
+            [("MODIFIED", get_pod("Running"), "2")],
+            ApiException(status=410),
+            [
+                ("ADDED", get_pod("Running"), "5"),
+                ("MODIFIED", get_pod("Running", terminated=True), "6"),
+            ],
+        ]
+    )
+    liveness = PodLiveness(k8s_manager=manager, pod_id="pod", container_id="main")
+    liveness.start(resource_version="1")
+    await liveness.wait(timeout=2)
+    assert liveness.is_running is False
+    # Resumed from the last version, then restarted after the version expired
+    assert manager.resource_versions == ["1", "2", None]
+    assert manager.status_calls == 0
+    await liveness.close()
+
+
+@pytest.mark.sidecar_mark
+@pytest.mark.asyncio
+async def test_liveness_check_fallback():
+    manager = FakeK8sManager(streams=[[("ADDED", get_pod("Running"), "2")]])
+    liveness = PodLiveness(k8s_manager=manager, pod_id="pod", container_id="main")
+    liveness.start()
+    await liveness.wait(timeout=0.1)
+    assert liveness.is_running is True
+    assert liveness.is_watching is True
+    assert await liveness.check() is True
+    assert manager.status_calls == 1
+    await liveness.close()
+    assert liveness.is_watching is False
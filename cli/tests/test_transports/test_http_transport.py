@@ -1,6 +1,13 @@
+from mock import patch
 import requests
 
 from polyaxon._client.transport import Transport
+from polyaxon._client.transport.pool_manager import (
+    SharedPoolAdapter,
+    clear_pool_managers,
+    create_session,
+)
+from polyaxon._schemas.client import ClientConfig
 from tests.test_transports.utils import BaseTestCaseTransport
 
 
@@ -14,3 +21,35 @@ class TestHttpTransport(BaseTestCaseTransport):
         assert hasattr(self.transport, "_session") is False
         assert isinstance(self.transport.session, requests.Session)
         assert isinstance(self.transport._session, requests.Session)
+
+    def test_sessions_share_pool_manager(self):
+        retry_transport = Transport()
+        assert isinstance(
+            self.transport.session.get_adapter("https://"), SharedPoolAdapter
+        )
+        assert (
+            self.transport.session.get_adapter("https://").poolmanager
+            is retry_transport.session.get_adapter("https://").poolmanager
+        )
+        assert (
+            self.transport.retry_session.get_adapter("https://").poolmanager
+            is self.transport.session.get_adapter("https://").poolmanager
+        )
+        assert (
+            self.transport.retry_session.get_adapter("https://").max_retries.total == 3
+        )
+
+        session = create_session(config=ClientConfig(connection_pool_shared=False))
+        assert not isinstance(session.get_adapter("https://"), SharedPoolAdapter)
+
+    def test_closing_session_keeps_shared_pool_manager(self):
+        clear_pool_managers()
+        session1 = create_session(config=ClientConfig())
+        session2 = create_session(config=ClientConfig())
+        pool_manager = session1.get_adapter("https://").poolmanager
+        assert session2.get_adapter("https://").poolmanager is pool_manager
+        with patch.object(pool_manager, "clear") as clear:
+            session1.close()
+            assert clear.call_count == 0
+            session2.close()
+            assert clear.call_count == 1
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import threading
+import time
+
+from polyaxon._client.workers.batch_worker import BatchWorker
+from polyaxon._client.workers.queue_worker import QueuePolicy, QueueWorker
+from tests.test_transports.utils import BaseTestCaseTransport
+
+
+class TestQueueWorker(BaseTestCaseTransport):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+    def callback(self, value):
+        self.calls.append(value)
+
+    def test_wrong_policy_raises(self):
+        with self.assertRaises(ValueError):
+            QueueWorker(timeout=0.01, queue_size=2, queue_policy="foo")
+
+        with self.assertRaises(ValueError):
+            QueueWorker(timeout=0.01, queue_size=2, queue_policy=QueuePolicy.SPILL)
+
+    def test_drop_newest(self):
+        worker = QueueWorker(
+            timeout=0.01, queue_size=2, queue_policy=QueuePolicy.DROP_NEWEST
+        )
+        for i in range(5):
+            worker._put((self.callback, (i,), {}))
+        assert worker.dropped == 3
+        assert worker._queue.qsize() == 2
+        assert [worker._queue.get_nowait()[1][0] for _ in range(2)] == [0, 1]
+
+    def test_drop_oldest(self):
+        worker = QueueWorker(
+            timeout=0.01, queue_size=2, queue_policy=QueuePolicy.DROP_OLDEST
+        )
+        for i in range(5):
+            worker._put((self.callback, (i,), {}))
+        assert worker.dropped == 3
+        assert worker._queue.qsize() == 2
+        assert [worker._queue.get_nowait()[1][0] for _ in range(2)] == [3, 4]
+
+    def test_spill_and_replay(self):
+        spill_path = os.path.join(tempfile.mkdtemp(), "runs", "queue.plx.jsonl")
+        worker = QueueWorker(
+            timeout=0.01,
+            queue_size=2,
+            queue_policy=QueuePolicy.SPILL,
+            spill_path=spill_path,
+            spill_callback=self.callback,
+        )
+        for i in range(5):
+            worker._put((self.callback, (), {"value": i}))
+        # Records using a different callback can't be replayed
+        worker._put((print, (), {"value": 5}))
+        assert worker.spilled == 3
+        assert worker.dropped == 1
+        assert os.path.exists(spill_path)
+
+        worker._replay_spilled()
+        assert self.calls == [2, 3, 4]
+        assert os.path.exists(spill_path) is False
+
+    def test_atexit_processes_queue_and_spilled_records(self):
+        spill_path = os.path.join(tempfile.mkdtemp(), "queue.plx.jsonl")
+        worker = QueueWorker(
+            timeout=0.5,
+            queue_size=1,
+            queue_policy=QueuePolicy.SPILL,
+            spill_path=spill_path,
+            spill_callback=self.callback,
+        )
+        worker.start()
+        worker._put((self.callback, (), {"value": 1}))
+        worker._put((self.callback, (), {"value": 2}))
+        worker._put((self.callback, (), {"value": 3}))
+        worker.atexit()
+        assert set(self.calls) == {1, 2, 3}
+        assert worker.is_alive() is False
+        assert os.path.exists(spill_path) is False
+
+    def test_spilled_records_are_replayed_before_newer_ones(self):
+        spill_path = os.path.join(tempfile.mkdtemp(), "queue.plx.jsonl")
+        worker = QueueWorker(
+            timeout=0.01,
+            queue_size=2,
+            queue_policy=QueuePolicy.SPILL,
+            spill_path=spill_path,
+            spill_callback=self.callback,
+        )
+        for i in range(4):
+            worker._put((self.callback, (), {"value": i}))
+        callback, _, kwargs = worker._queue.get_nowait()
+        callback(**kwargs)
+        worker._queue.task_done()
+        # The queue has room again, but newer records wait for the spilled ones
+        worker._put((self.callback, (), {"value": 4}))
+        assert worker.spilled == 3
+        assert worker._put_end_event() is True
+        worker._target()
+        assert self.calls == [0, 1, 2, 3, 4]
+        assert os.path.exists(spill_path) is False
+
+    def test_end_event_does_not_block_on_a_full_queue(self):
+        worker = QueueWorker(
+            timeout=0.01, queue_size=1, queue_policy=QueuePolicy.DROP_NEWEST
+        )
+        worker._put((self.callback, (), {"value": 1}))
+        assert worker._put_end_event() is False
+
+
+class TestBatchWorker(BaseTestCaseTransport):
+    def callback(self, value):
+        pass
+
+    def test_batch_interval_accumulates_records(self):
+        worker = BatchWorker(timeout=0.01, batch_size=10, batch_interval=0.5)
+
+        def put_records():
+            for i in range(3):
+                time.sleep(0.05)
+                worker._put((self.callback, (i,), {}, None, None, False))
+
+        thread = threading.Thread(target=put_records)
+        worker._put((self.callback, (-1,), {}, None, None, False))
+        thread.start()
+        batch = worker._get_batch()
+        thread.join()
+        assert [r[1][0] for r in batch] == [-1, 0, 1, 2]
+
+    def test_batch_is_flushed_when_the_queue_is_drained(self):
+        worker = BatchWorker(timeout=0.01, batch_size=10)
+        worker._put((self.callback, (0,), {}, None, None, False))
+        worker._put((self.callback, (1,), {}, None, None, False))
+        assert [r[1][0] for r in worker._get_batch()] == [0, 1]
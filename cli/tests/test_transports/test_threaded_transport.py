@@ -3,6 +3,7 @@ import time
 
 from polyaxon import settings
 from polyaxon._client.transport.threaded_transport import ThreadedTransportMixin
+from polyaxon._client.workers.batch_worker import BatchWorker
 from polyaxon._client.workers.queue_worker import QueueWorker
 from tests.test_transports.utils import BaseTestCaseTransport
 
@@ -183,3 +184,122 @@ class TestThreadedTransport(BaseTestCaseTransport):
         assert self.exception_transport.threaded_done == 1
         assert self.exception_transport.threaded_exceptions == 1
         assert self.exception_transport._worker.is_alive() is False
+
+    def test_async_patches_are_merged(self):
+        calls = []
+
+        class PatchTransport(DummyTransport):
+            def patch(self, url, json_data=None, **kwargs):
+                time.sleep(self.delay)
+                calls.append((url, json_data))
+
+        transport = PatchTransport()
+        transport.delay = 0.1
+        transport.async_post(url="url_post")
+        time.sleep(0.03)
+        # Queued while the post is being processed
+        transport.async_patch(
+            url="url_run",
+            json_data={"outputs": {"loss": 1}, "merge": True},
+            group="run",
+        )
+        transport.async_patch(
+            url="url_run",
+            json_data={"outputs": {"acc": 1}, "merge": True},
+            group="run",
+        )
+        transport.async_patch(url="url_other", json_data={"name": "foo"}, group="other")
+        transport.async_patch(
+            url="url_run",
+            json_data={"outputs": {"loss": 2}, "merge": True},
+            group="run",
+        )
+        transport.async_patch(
+            url="url_run", json_data={"inputs": {}, "merge": False}, group="run"
+        )
+        transport.worker.atexit()
+        assert transport.queue == [("post", "url_post")]
+        assert sorted(calls, key=lambda c: c[0]) == [
+            ("url_other", {"name": "foo"}),
+            ("url_run", {"outputs": {"loss": 2, "acc": 1}, "merge": True}),
+            ("url_run", {"inputs": {}, "merge": False}),
+        ]
+        assert calls.index(
+            ("url_run", {"outputs": {"loss": 2, "acc": 1}, "merge": True})
+        ) < calls.index(("url_run", {"inputs": {}, "merge": False}))
+        assert transport.threaded_done == 4
+
+    def test_async_requests_are_grouped_by_url_by_default(self):
+        calls = []
+
+        class PatchTransport(DummyTransport):
+            def patch(self, url, json_data=None, **kwargs):
+                if url == "url_slow":
+                    time.sleep(self.delay)
+                calls.append((url, json_data))
+
+        transport = PatchTransport()
+        transport.delay = 0.5
+        # Collect both requests in the same batch
+        transport._worker = BatchWorker(batch_interval=0.2)
+        transport._worker.start()
+        transport.async_patch(url="url_slow", json_data={"name": "foo"})
+        transport.async_patch(url="url_fast", json_data={"name": "bar"})
+        transport.worker.atexit()
+        # The requests to different urls are not waiting for each other
+        assert calls == [("url_fast", {"name": "bar"}), ("url_slow", {"name": "foo"})]
+        assert transport.threaded_exceptions == 0
+
+    def test_async_patches_are_not_merged_across_other_requests(self):
+        calls = []
+
+        class PatchTransport(DummyTransport):
+            def patch(self, url, json_data=None, **kwargs):
+                time.sleep(self.delay)
+                calls.append(("patch", url, json_data))
+
+            def post(self, url, json_data=None, **kwargs):
+                time.sleep(self.delay)
+                calls.append(("post", url, json_data))
+
+        transport = PatchTransport()
+        transport.delay = 0.1
+        transport.async_post(url="url_wait")
+        time.sleep(0.03)
+        transport.async_patch(url="url_run", json_data={"name": "foo"})
+        transport.async_post(url="url_run", json_data={"status": "running"})
+        transport.async_patch(url="url_run", json_data={"name": "bar"})
+        transport.worker.atexit()
+        assert calls == [
+            ("post", "url_wait", None),
+            ("patch", "url_run", {"name": "foo"}),
+            ("post", "url_run", {"status": "running"}),
+            ("patch", "url_run", {"name": "bar"}),
+        ]
+        assert transport.threaded_done == 4
+
+    def test_async_requests_of_a_group_are_sent_in_order(self):
+        calls = []
+
+        class PatchTransport(DummyTransport):
+            def patch(self, url, json_data=None, **kwargs):
+                time.sleep(self.delay)
+                calls.append((url, json_data))
+
+        transport = PatchTransport()
+        transport.delay = 0.1
+        transport.async_patch(url="url_wait", group="run")
+        time.sleep(0.03)
+        transport.async_patch(url="url_outputs", json_data={"name": "foo"}, group="run")
+        transport.async_patch(
+            url="url_statuses", json_data={"status": "done"}, group="run"
+        )
+        transport.async_patch(url="url_outputs", json_data={"name": "bar"}, group="run")
+        transport.worker.atexit()
+        assert calls == [
+            ("url_wait", None),
+            ("url_outputs", {"name": "foo"}),
+            ("url_statuses", {"status": "done"}),
+            ("url_outputs", {"name": "bar"}),
+        ]
+        assert transport.threaded_done == 4